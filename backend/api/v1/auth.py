@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from core.models.auth import LoginRequest, LoginResponse, TokenRefreshRequest, TokenResponse, User
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials
+from core.models.auth import LoginRequest, LoginResponse, LogoutRequest, TokenRefreshRequest, TokenResponse, User, Principal
 from core.services.auth_service import AuthService
-from shared.dependencies.auth import get_auth_service, get_current_user, get_current_admin_user
+from core.services.rate_limit_service import RateLimitService
+from shared.dependencies.auth import get_auth_service, get_current_user, get_current_admin_user, security
+from shared.dependencies.rate_limit import client_address, enforce_rate_limit, get_rate_limit_service
+from shared.utils.password_hasher import PasswordHasherBusyError
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -10,10 +15,25 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @router.post("/login", response_model=LoginResponse)
 async def login(
     login_request: LoginRequest,
-    auth_service: AuthService = Depends(get_auth_service)
+    request: Request,
+    auth_service: AuthService = Depends(get_auth_service),
+    rate_limiter: RateLimitService = Depends(get_rate_limit_service)
 ):
-    """Authenticate user and return JWT tokens"""
-    result = await auth_service.login(login_request)
+    """Authenticate user and return JWT tokens (rate limited per client IP and username)"""
+    await enforce_rate_limit(
+        rate_limiter,
+        "login",
+        ip=client_address(request),
+        username=login_request.username.lower()
+    )
+    try:
+        result = await auth_service.login(login_request)
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins, please retry",
+            headers={"Retry-After": "1"}
+        )
     if not result:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -25,9 +45,12 @@ async def login(
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     refresh_request: TokenRefreshRequest,
-    auth_service: AuthService = Depends(get_auth_service)
+    request: Request,
+    auth_service: AuthService = Depends(get_auth_service),
+    rate_limiter: RateLimitService = Depends(get_rate_limit_service)
 ):
-    """Refresh access token using refresh token"""
+    """Refresh access token using refresh token (rate limited per client IP when configured)"""
+    await enforce_rate_limit(rate_limiter, "refresh", ip=client_address(request))
     result = await auth_service.refresh_token(refresh_request.refresh_token)
     if not result:
         raise HTTPException(
@@ -46,17 +69,26 @@ async def get_current_user_info(
 
 
 @router.post("/logout")
-async def logout():
-    """Logout user (client should discard tokens)"""
-    # In a full implementation, you might want to blacklist the token
-    # For JWT, typically handled client-side by discarding tokens
+async def logout(
+    logout_request: Optional[LogoutRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    auth_service: AuthService = Depends(get_auth_service)
+):
+    """Logout user by revoking the bearer access token and the optional refresh token"""
+    refresh_token = logout_request.refresh_token if logout_request else None
+    if not await auth_service.logout(credentials.credentials, refresh_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return {"message": "Successfully logged out"}
 
 
 # Admin-only endpoint example
 @router.get("/admin/users")
 async def get_all_users(
-    admin_user: User = Depends(get_current_admin_user)
+    admin_user: Principal = Depends(get_current_admin_user)
 ):
     """Get all users (admin only)"""
     # This would call a user repository to get all users
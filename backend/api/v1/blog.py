@@ -0,0 +1,104 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from core.models.auth import Principal
+from core.models.blog import BlogPost, BlogPostCreateRequest, BlogPostPage, BlogPostUpdateRequest
+from core.services.blog_service import BlogService, MAX_PAGE_SIZE
+from shared.dependencies.auth import get_current_admin_user
+from shared.dependencies.blog import get_blog_service
+from shared.utils.cursor import InvalidCursorError
+from shared.utils.etag import etag_matches, make_etag, not_modified
+from shared.utils.json_response import FastJSONResponse
+from shared.utils.markdown_renderer import RENDERER_VERSION
+
+
+router = APIRouter(prefix="/posts", tags=["Blog"])
+
+
+@router.get("", response_model=BlogPostPage, response_class=FastJSONResponse)
+async def list_posts(
+    request: Request,
+    response: Response,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """List posts newest first - follow next_cursor for the next page"""
+    try:
+        page = await blog_service.list_posts(limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    
+    etag = make_etag("posts", *(f"{post.id}:{post.version}" for post in page.items), page.next_cursor)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    
+    response.headers["ETag"] = etag
+    return page
+
+
+@router.get("/{post_id}", response_model=BlogPost, response_class=FastJSONResponse)
+async def get_post(
+    post_id: str,
+    request: Request,
+    response: Response,
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """Get post with its rendered HTML"""
+    post = await blog_service.get_post(post_id)
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found"
+        )
+    
+    # Renderer version is part of the ETag so an upgrade reaches clients holding old HTML
+    etag = make_etag("post", post_id, post.version, RENDERER_VERSION)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    
+    response.headers["ETag"] = etag
+    return post
+
+
+@router.post("", response_model=BlogPost, status_code=status.HTTP_201_CREATED)
+async def create_post(
+    request: BlogPostCreateRequest,
+    admin_user: Principal = Depends(get_current_admin_user),
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """Create post (admin only)"""
+    return await blog_service.create_post(request)
+
+
+@router.put("/{post_id}", response_model=BlogPost)
+async def update_post(
+    post_id: str,
+    request: BlogPostUpdateRequest,
+    admin_user: Principal = Depends(get_current_admin_user),
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """Update post (admin only)"""
+    post = await blog_service.update_post(post_id, request)
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found"
+        )
+    return post
+
+
+@router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_post(
+    post_id: str,
+    admin_user: Principal = Depends(get_current_admin_user),
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """Delete post (admin only)"""
+    if not await blog_service.delete_post(post_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found"
+        )
@@ -0,0 +1,150 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from core.models.auth import Principal
+from core.models.gallery import (
+    Gallery, GalleryCategory, GalleryCreateRequest, GalleryDetail, GalleryImage,
+    GalleryImageCreateRequest, GalleryPage, GalleryUpdateRequest
+)
+from core.services.gallery_service import GalleryService, MAX_PAGE_SIZE
+from shared.dependencies.auth import get_current_admin_user
+from shared.dependencies.gallery import get_gallery_service
+from shared.utils.cursor import InvalidCursorError
+from shared.utils.etag import etag_matches, make_etag, not_modified
+from shared.utils.json_response import FastJSONResponse
+
+
+router = APIRouter(prefix="/galleries", tags=["Galleries"])
+
+
+@router.get("", response_model=GalleryPage, response_class=FastJSONResponse)
+async def list_galleries(
+    request: Request,
+    response: Response,
+    category: Optional[GalleryCategory] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    gallery_service: GalleryService = Depends(get_gallery_service)
+):
+    """List galleries newest first - follow next_cursor for the next page"""
+    try:
+        page = await gallery_service.list_galleries(category, limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    
+    # ETag from item versions, so a revalidation skips JSON encoding
+    etag = make_etag("galleries", *(f"{gallery.id}:{gallery.version}" for gallery in page.items), page.next_cursor)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    
+    response.headers["ETag"] = etag
+    return page
+
+
+@router.get("/{gallery_id}", response_model=GalleryDetail, response_class=FastJSONResponse)
+async def get_gallery(
+    gallery_id: str,
+    request: Request,
+    response: Response,
+    gallery_service: GalleryService = Depends(get_gallery_service)
+):
+    """Get gallery with its images"""
+    # Revalidations are answered from the version alone - no image reads, no serialization
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        version = await gallery_service.get_gallery_version(gallery_id)
+        if version is not None:
+            etag = make_etag("gallery", gallery_id, version)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+    
+    gallery = await gallery_service.get_gallery_detail(gallery_id)
+    if not gallery:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gallery not found"
+        )
+    
+    response.headers["ETag"] = make_etag("gallery", gallery_id, gallery.version)
+    return gallery
+
+
+@router.post("", response_model=Gallery, status_code=status.HTTP_201_CREATED)
+async def create_gallery(
+    request: GalleryCreateRequest,
+    admin_user: Principal = Depends(get_current_admin_user),
+    gallery_service: GalleryService = Depends(get_gallery_service)
+):
+    """Create gallery (admin only)"""
+    return await gallery_service.create_gallery(request)
+
+
+@router.put("/{gallery_id}", response_model=Gallery)
+async def update_gallery(
+    gallery_id: str,
+    request: GalleryUpdateRequest,
+    admin_user: Principal = Depends(get_current_admin_user),
+    gallery_service: GalleryService = Depends(get_gallery_service)
+):
+    """Update gallery (admin only) - image_ids may only reorder the gallery's images"""
+    try:
+        gallery = await gallery_service.update_gallery(gallery_id, request)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if not gallery:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gallery not found"
+        )
+    return gallery
+
+
+@router.delete("/{gallery_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_gallery(
+    gallery_id: str,
+    admin_user: Principal = Depends(get_current_admin_user),
+    gallery_service: GalleryService = Depends(get_gallery_service)
+):
+    """Delete gallery (admin only)"""
+    if not await gallery_service.delete_gallery(gallery_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gallery not found"
+        )
+
+
+@router.post("/{gallery_id}/images", response_model=GalleryImage, status_code=status.HTTP_201_CREATED)
+async def add_gallery_image(
+    gallery_id: str,
+    request: GalleryImageCreateRequest,
+    admin_user: Principal = Depends(get_current_admin_user),
+    gallery_service: GalleryService = Depends(get_gallery_service)
+):
+    """Add uploaded content to gallery by its hash (admin only)"""
+    try:
+        image = await gallery_service.add_image(gallery_id, request)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gallery not found"
+        )
+    return image
+
+
+@router.delete("/{gallery_id}/images/{image_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_gallery_image(
+    gallery_id: str,
+    image_id: str,
+    admin_user: Principal = Depends(get_current_admin_user),
+    gallery_service: GalleryService = Depends(get_gallery_service)
+):
+    """Remove image from gallery (admin only)"""
+    if not await gallery_service.remove_image(gallery_id, image_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gallery image not found"
+        )
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, Response
+from core.models.auth import Principal
+from core.services.profiling_service import ProfilingService
+from shared.dependencies.auth import get_current_admin_user
+from shared.dependencies.profiling import get_profiling_service
+
+
+router = APIRouter(prefix="/admin/profiles", tags=["Profiling"])
+
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(
+    profile_id: str,
+    sort: str = "cumulative",
+    limit: int = Query(50, ge=1, le=1000),
+    raw: bool = False,
+    admin_user: Principal = Depends(get_current_admin_user),
+    profiling_service: ProfilingService = Depends(get_profiling_service)
+):
+    """pstats report of a profiled request, or the .prof dump with raw=true (admin only)"""
+    if raw:
+        data = await profiling_service.get_raw(profile_id)
+        if data is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profile not found"
+            )
+        return Response(
+            data,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.prof"'}
+        )
+    
+    try:
+        report = await profiling_service.get_report(profile_id, sort, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    return PlainTextResponse(report)
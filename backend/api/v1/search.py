@@ -0,0 +1,20 @@
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query
+from core.models.search import SearchResponse
+from core.services.search_service import SearchService
+from shared.dependencies.search import get_search_service
+
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    type: Optional[Literal["gallery", "post"]] = None,
+    search_service: SearchService = Depends(get_search_service)
+):
+    """Search galleries (titles, tags, captions) and blog posts - the last word matches as a prefix"""
+    hits = await search_service.search(q, limit, type)
+    return SearchResponse(query=q, hits=hits)
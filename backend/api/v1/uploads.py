@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from core.interfaces.upload_storage import UploadNotFoundError
+from core.models.auth import Principal
+from core.models.upload import UploadCompleteRequest, UploadResult, UploadSession, UploadStartRequest
+from core.services.content_service import ContentService
+from core.services.upload_service import UploadService
+from shared.dependencies.auth import get_current_admin_user
+from shared.dependencies.uploads import get_content_service, get_upload_service
+
+
+router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+
+@router.post("", response_model=UploadSession, status_code=status.HTTP_201_CREATED)
+async def start_upload(
+    request: UploadStartRequest,
+    admin_user: Principal = Depends(get_current_admin_user),
+    upload_service: UploadService = Depends(get_upload_service)
+):
+    """Start a multipart upload - PUT each part to its presigned URL, keeping the returned ETags"""
+    try:
+        return await upload_service.start_upload(request)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.post("/{upload_id}/complete", response_model=UploadResult, status_code=status.HTTP_202_ACCEPTED)
+async def complete_upload(
+    upload_id: str,
+    request: UploadCompleteRequest,
+    admin_user: Principal = Depends(get_current_admin_user),
+    upload_service: UploadService = Depends(get_upload_service)
+):
+    """Assemble the uploaded parts into the final object - poll GET /uploads?key= until it is ready"""
+    try:
+        return await upload_service.complete_upload(upload_id, request)
+    except UploadNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.get("", response_model=UploadResult)
+async def get_upload(
+    key: str,
+    admin_user: Principal = Depends(get_current_admin_user),
+    upload_service: UploadService = Depends(get_upload_service)
+):
+    """Processing state of a completed upload, with its content_hash once ready"""
+    try:
+        result = await upload_service.get_upload(key)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    return result
+
+
+@router.delete("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload(
+    upload_id: str,
+    key: str,
+    admin_user: Principal = Depends(get_current_admin_user),
+    upload_service: UploadService = Depends(get_upload_service)
+):
+    """Abort an upload and discard its parts"""
+    try:
+        await upload_service.abort_upload(upload_id, key)
+    except UploadNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.post("/cleanup")
+async def cleanup_stale_uploads(
+    admin_user: Principal = Depends(get_current_admin_user),
+    upload_service: UploadService = Depends(get_upload_service),
+    content_service: ContentService = Depends(get_content_service)
+):
+    """Abort incomplete uploads older than the configured age and delete long-unreferenced content"""
+    return {
+        "aborted": await upload_service.cleanup_stale_uploads(),
+        "swept": await content_service.sweep_unreferenced()
+    }
@@ -0,0 +1,135 @@
+"""Cold-import benchmark for the Lambda entry point.
+
+Runs ``python -X importtime -c "import lambda_handler"`` in fresh interpreters and fails when the
+median cumulative import time exceeds the budget, or when a module that must stay lazy (jose,
+passlib) shows up on the cold path. email-validator is not listed: fastapi.openapi.models imports it
+whenever it is installed.
+
+    python -m benchmarks.cold_start --runs 5 --budget-ms 1500
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_MODULE = "lambda_handler"
+DEFAULT_BUDGET_MS = float(os.environ.get("COLD_START_BUDGET_MS", "1500"))
+DEFERRED_MODULES = ("jose", "passlib")
+
+# "import time:       486 |       1234 | _frozen_importlib_external"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportProfile:
+    """Parsed -X importtime output of one interpreter run"""
+    total_us: int
+    cumulative_us: Dict[str, int] = field(default_factory=dict)
+    top_level_us: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ColdStartResult:
+    """Aggregated result over several runs"""
+    module: str
+    runs_ms: List[float]
+    slowest_imports: List[tuple]
+    deferred_imported: List[str]
+    
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.runs_ms)
+
+
+def parse_importtime(output: str, module: str) -> ImportProfile:
+    """Parse importtime stderr into per-module cumulative microseconds"""
+    profile = ImportProfile(total_us=0)
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        profile.cumulative_us[name] = cumulative
+        # One leading space marks an import made directly by the measured statement
+        if indent == 1:
+            profile.top_level_us[name] = cumulative
+            if name == module:
+                profile.total_us = cumulative
+    
+    return profile
+
+
+def run_once(module: str, env: Optional[Dict[str, str]] = None) -> ImportProfile:
+    """Import module in a fresh interpreter with -X importtime"""
+    run_env = dict(os.environ if env is None else env)
+    # Settings() requires a secret; any value works for import timing
+    run_env.setdefault("JWT_SECRET_KEY", "cold-start-benchmark")
+    
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=run_env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return parse_importtime(completed.stderr, module)
+
+
+def measure(module: str = DEFAULT_MODULE, runs: int = 5, top: int = 10) -> ColdStartResult:
+    """Median cold import time over several runs (after one untimed run that warms the .pyc cache)"""
+    run_once(module)
+    profiles = [run_once(module) for _ in range(runs)]
+    
+    last = profiles[-1]
+    deferred_imported = sorted(
+        name for name in last.cumulative_us
+        if name.split(".")[0] in DEFERRED_MODULES
+    )
+    slowest = sorted(last.cumulative_us.items(), key=lambda item: item[1], reverse=True)
+    
+    return ColdStartResult(
+        module=module,
+        runs_ms=[profile.total_us / 1000 for profile in profiles],
+        slowest_imports=[(name, us / 1000) for name, us in slowest[:top]],
+        deferred_imported=deferred_imported
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+    
+    result = measure(args.module, args.runs, args.top)
+    
+    print(f"import {result.module}: median {result.median_ms:.1f} ms over {len(result.runs_ms)} runs "
+          f"(min {min(result.runs_ms):.1f}, max {max(result.runs_ms):.1f}, budget {args.budget_ms:.0f})")
+    print("slowest imports (cumulative ms):")
+    for name, ms in result.slowest_imports:
+        print(f"  {ms:9.1f}  {name}")
+    
+    failed = False
+    if result.deferred_imported:
+        print(f"FAIL: lazily-loaded modules imported on the cold path: {', '.join(result.deferred_imported)}")
+        failed = True
+    if result.median_ms > args.budget_ms:
+        print(f"FAIL: cold import over budget by {result.median_ms - args.budget_ms:.1f} ms")
+        failed = True
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
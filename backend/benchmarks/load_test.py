@@ -0,0 +1,289 @@
+"""Load generator for the API - in-process over ASGI, or against a running server.
+
+Virtual users loop over a scripted scenario for a fixed duration. The report gives throughput,
+latency percentiles, status codes, and event-loop lag sampled alongside the run. In-process, lag is
+the app's own loop, which shows when a worker is CPU-bound. Against --url it is the generator's loop,
+which shows whether the generator itself is the bottleneck.
+    
+    python -m benchmarks.load_test browse --concurrency 50 --duration 10
+    python -m benchmarks.load_test admin --concurrency 10
+    python -m benchmarks.load_test login-storm --concurrency 20 --duration 5
+    python -m benchmarks.load_test browse --url http://localhost:8000 --admin-username admin --admin-password ...
+
+In-process runs seed an admin user and --galleries galleries in the memory backends first. Set
+SIMULATION_ENABLED=true (and the other SIMULATION_* settings) to give those backends remote-like latency.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence
+import httpx
+
+
+DEFAULT_ADMIN_USERNAME = "loadtest-admin"
+DEFAULT_ADMIN_PASSWORD = "loadtest-password"
+LOOP_LAG_INTERVAL = 0.01
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values (0.0 when empty)"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+@dataclass
+class LoadReport:
+    """Aggregated result of one scenario run"""
+    scenario: str
+    concurrency: int
+    duration_s: float
+    requests: int
+    errors: int
+    rps: float
+    latency_ms: Dict[str, float]
+    loop_lag_ms: Dict[str, float]
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    
+    def format(self) -> str:
+        latency = self.latency_ms
+        lag = self.loop_lag_ms
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(self.status_counts.items()))
+        return (
+            f"{self.scenario}: {self.requests} requests in {self.duration_s:.1f}s with {self.concurrency} users "
+            f"-> {self.rps:.1f} req/s, {self.errors} errors\n"
+            f"  latency ms   p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  p99 {latency['p99']:.2f}  "
+            f"max {latency['max']:.2f}\n"
+            f"  loop lag ms  p50 {lag['p50']:.2f}  p99 {lag['p99']:.2f}  max {lag['max']:.2f}\n"
+            f"  status       {statuses or '-'}"
+        )
+
+
+class Recorder:
+    """Latency and status of every request in a run"""
+    
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.errors = 0
+    
+    def record(self, seconds: float, status: Optional[int]) -> None:
+        self.latencies.append(seconds)
+        if status is None or status >= 500:
+            self.errors += 1
+        if status is not None:
+            self.statuses[status] += 1
+
+
+class LoopLagMonitor:
+    """Samples how late a periodic sleep wakes up - the time callbacks wait for a busy loop"""
+    
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - expected, 0.0))
+    
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+class LoadSession:
+    """One virtual user - a client, the shared recorder and per-user state (tokens)"""
+    
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, context: Dict[str, Any]):
+        self.client = client
+        self.recorder = recorder
+        self.context = context
+        self.state: Dict[str, Any] = {}
+        self.random = random.Random()
+    
+    async def request(self, method: str, url: str, **kwargs: Any) -> Optional[httpx.Response]:
+        """Timed request; transport errors are recorded and return None"""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(time.perf_counter() - started, None)
+            return None
+        self.recorder.record(time.perf_counter() - started, response.status_code)
+        return response
+
+
+async def browse_galleries(session: LoadSession) -> None:
+    """Anonymous visitor - list, open a gallery (revalidating half the time), search"""
+    listing = await session.request("GET", "/api/v1/galleries", params={"limit": 20})
+    items = listing.json()["items"] if listing is not None and listing.status_code == 200 else []
+    if items:
+        gallery_id = session.random.choice(items)["id"]
+        url = f"/api/v1/galleries/{gallery_id}"
+        etag = session.state.get(url)
+        headers = {"If-None-Match": etag} if etag and session.random.random() < 0.5 else {}
+        detail = await session.request("GET", url, headers=headers)
+        if detail is not None and "etag" in detail.headers:
+            session.state[url] = detail.headers["etag"]
+    
+    await session.request("GET", "/api/v1/search", params={"q": session.random.choice(("flash", "koi", "line"))})
+
+
+async def admin_session(session: LoadSession) -> None:
+    """Signed-in admin - log in once, then /auth/me with an occasional token refresh"""
+    if "tokens" not in session.state:
+        response = await session.request("POST", "/api/v1/auth/login", json=session.context["admin"])
+        if response is None or response.status_code != 200:
+            return
+        session.state["tokens"] = response.json()
+    
+    tokens = session.state["tokens"]
+    await session.request("GET", "/api/v1/auth/me", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+    if session.random.random() < 0.1:
+        refreshed = await session.request("POST", "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        if refreshed is not None and refreshed.status_code == 200:
+            tokens["access_token"] = refreshed.json()["access_token"]
+
+
+async def login_storm(session: LoadSession) -> None:
+    """Every iteration is a password login - exercises the login rate limit (429) and the hashing pool (503)"""
+    await session.request("POST", "/api/v1/auth/login", json=session.context["admin"])
+
+
+SCENARIOS: Dict[str, Callable[[LoadSession], Awaitable[None]]] = {
+    "browse": browse_galleries,
+    "admin": admin_session,
+    "login-storm": login_storm,
+}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: str,
+    concurrency: int = 10,
+    duration: float = 5.0,
+    context: Optional[Dict[str, Any]] = None
+) -> LoadReport:
+    """Run concurrency virtual users through the scenario for duration seconds"""
+    script = SCENARIOS[scenario]
+    recorder = Recorder()
+    monitor = LoopLagMonitor()
+    context = context or {}
+    
+    started = time.perf_counter()
+    deadline = started + duration
+    
+    async def virtual_user() -> None:
+        session = LoadSession(client, recorder, context)
+        while time.perf_counter() < deadline:
+            await script(session)
+    
+    monitor.start()
+    try:
+        await asyncio.gather(*(virtual_user() for _ in range(concurrency)))
+    finally:
+        await monitor.stop()
+    elapsed = time.perf_counter() - started
+    
+    latencies = sorted(seconds * 1000 for seconds in recorder.latencies)
+    lags = sorted(seconds * 1000 for seconds in monitor.samples)
+    return LoadReport(
+        scenario=scenario,
+        concurrency=concurrency,
+        duration_s=elapsed,
+        requests=len(latencies),
+        errors=recorder.errors,
+        rps=len(latencies) / elapsed if elapsed else 0.0,
+        latency_ms={
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+        loop_lag_ms={
+            "p50": percentile(lags, 0.50),
+            "p99": percentile(lags, 0.99),
+            "max": lags[-1] if lags else 0.0,
+        },
+        status_counts=dict(recorder.statuses)
+    )
+
+
+async def seed(container: Any, galleries: int, username: str, password: str) -> Dict[str, Any]:
+    """Admin user and galleries in the app's own backends (in-process runs)"""
+    from core.models.gallery import GalleryCategory, GalleryCreateRequest
+    
+    await container.auth_repository.create_user(username, f"{username}@example.com", password, is_admin=True)
+    categories = list(GalleryCategory)
+    for index in range(galleries):
+        await container.gallery_service.create_gallery(GalleryCreateRequest(
+            title=f"Flash sheet {index}",
+            description="Koi, linework and lettering",
+            category=categories[index % len(categories)],
+            tags=["flash", "koi"] if index % 2 else ["line"]
+        ))
+    return {"admin": {"username": username, "password": password}}
+
+
+@asynccontextmanager
+async def in_process_client(galleries: int = 50) -> AsyncIterator[tuple]:
+    """(client, context) driving main.app over ASGI with its lifespan running and data seeded"""
+    os.environ.setdefault("JWT_SECRET_KEY", "load-test")
+    from main import app
+    
+    async with app.router.lifespan_context(app):
+        context = await seed(app.state.container, galleries, DEFAULT_ADMIN_USERNAME, DEFAULT_ADMIN_PASSWORD)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            yield client, context
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process ASGI)")
+    parser.add_argument("--galleries", type=int, default=50, help="Galleries seeded for in-process runs")
+    parser.add_argument("--admin-username", default=os.environ.get("LOAD_TEST_ADMIN_USERNAME", DEFAULT_ADMIN_USERNAME))
+    parser.add_argument("--admin-password", default=os.environ.get("LOAD_TEST_ADMIN_PASSWORD", DEFAULT_ADMIN_PASSWORD))
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+    
+    async def run() -> LoadReport:
+        if args.url:
+            limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+            async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+                context = {"admin": {"username": args.admin_username, "password": args.admin_password}}
+                return await run_scenario(client, args.scenario, args.concurrency, args.duration, context)
+        
+        async with in_process_client(args.galleries) as (client, context):
+            return await run_scenario(client, args.scenario, args.concurrency, args.duration, context)
+    
+    report = asyncio.run(run())
+    print(json.dumps(asdict(report), indent=2) if args.json else report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
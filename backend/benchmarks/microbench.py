@@ -0,0 +1,140 @@
+"""Microbenchmark harness with a JSON regression baseline.
+
+Every timing is also stored relative to a fixed pure-Python calibration workload measured in the
+same process, and regressions are judged on that ratio - so a baseline recorded on a laptop still
+means something on a CI runner. Used by the pytest "benchmark" suite:
+    
+    python -m pytest -m benchmark                               # compare against the baseline
+    BENCHMARK_UPDATE_BASELINE=1 python -m pytest -m benchmark   # record a new baseline
+    BENCHMARK_MAX_REGRESSION=0.25 python -m pytest -m benchmark # fail at 25% slower (default 50%)
+"""
+import asyncio
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+DEFAULT_MAX_REGRESSION = float(os.environ.get("BENCHMARK_MAX_REGRESSION", "0.5"))
+DEFAULT_ROUNDS = 7
+DEFAULT_MIN_ROUND_SECONDS = 0.02
+
+
+@dataclass
+class BenchmarkResult:
+    """Median / best time per call and the calibrated ratio regressions are judged on"""
+    name: str
+    median_us: float
+    min_us: float
+    iterations: int
+    rounds: int
+    relative: float  # min_us / calibration min_us - the fastest round is the least noisy estimate
+
+
+def _calibration_workload() -> int:
+    total = 0
+    for value in range(2000):
+        total += value * value % 7
+    return total
+
+
+def _time_rounds(run_round: Callable[[int], float], rounds: int, min_round_seconds: float) -> tuple:
+    """(per-call seconds of each round, iterations) - iterations grow until a round is long enough"""
+    run_round(1)  # warm-up: lazy imports, caches, executor threads
+    iterations = 1
+    while True:
+        elapsed = run_round(iterations)
+        if elapsed >= min_round_seconds or iterations >= 1_000_000:
+            break
+        iterations *= 2 if elapsed <= 0 else max(2, min(10, int(min_round_seconds / elapsed) + 1))
+    
+    samples = [run_round(iterations) / iterations for _ in range(rounds)]
+    return samples, iterations
+
+
+def measure(
+    func: Callable[[], Any],
+    rounds: int = DEFAULT_ROUNDS,
+    min_round_seconds: float = DEFAULT_MIN_ROUND_SECONDS
+) -> tuple:
+    """(median µs, min µs, iterations) for a synchronous callable"""
+    def run_round(iterations: int) -> float:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return time.perf_counter() - started
+    
+    samples, iterations = _time_rounds(run_round, rounds, min_round_seconds)
+    return statistics.median(samples) * 1e6, min(samples) * 1e6, iterations
+
+
+def measure_async(
+    func: Callable[[], Awaitable[Any]],
+    rounds: int = DEFAULT_ROUNDS,
+    min_round_seconds: float = DEFAULT_MIN_ROUND_SECONDS
+) -> tuple:
+    """(median µs, min µs, iterations) for a coroutine function, each round on one event loop"""
+    async def timed(iterations: int) -> float:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await func()
+        return time.perf_counter() - started
+    
+    loop = asyncio.new_event_loop()
+    try:
+        samples, iterations = _time_rounds(lambda n: loop.run_until_complete(timed(n)), rounds, min_round_seconds)
+    finally:
+        loop.close()
+    return statistics.median(samples) * 1e6, min(samples) * 1e6, iterations
+
+
+class Baseline:
+    """JSON file of calibrated results; check() reports regressions, record() stages updates"""
+    
+    def __init__(self, path: Path, max_regression: float = DEFAULT_MAX_REGRESSION):
+        self.path = Path(path)
+        self.max_regression = max_regression
+        self.calibration_us = measure(_calibration_workload, rounds=15)[1]
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.baseline: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            self.baseline = json.loads(self.path.read_text())["results"]
+    
+    def run(self, name: str, func: Callable[[], Any], is_async: bool = False, **options: Any) -> BenchmarkResult:
+        """Measure func and stage its result"""
+        median_us, min_us, iterations = (measure_async if is_async else measure)(func, **options)
+        result = BenchmarkResult(
+            name=name,
+            median_us=round(median_us, 3),
+            min_us=round(min_us, 3),
+            iterations=iterations,
+            rounds=options.get("rounds", DEFAULT_ROUNDS),
+            relative=round(min_us / self.calibration_us, 4)
+        )
+        self.results[name] = asdict(result)
+        return result
+    
+    def check(self, result: BenchmarkResult) -> Optional[str]:
+        """Failure message when result regressed past max_regression, None otherwise (or without a baseline)"""
+        previous = self.baseline.get(result.name)
+        if previous is None:
+            return None
+        
+        limit = previous["relative"] * (1 + self.max_regression)
+        if result.relative <= limit:
+            return None
+        return (
+            f"{result.name} regressed: {result.relative:.3f} vs baseline {previous['relative']:.3f} calibrated units "
+            f"(best {result.min_us:.1f} µs vs {previous['min_us']:.1f} µs, allowed +{self.max_regression:.0%})"
+        )
+    
+    def save(self) -> None:
+        """Write staged results (merged over the existing baseline)"""
+        merged = {**self.baseline, **self.results}
+        self.path.write_text(json.dumps({
+            "calibration_us": round(self.calibration_us, 3),
+            "results": dict(sorted(merged.items())),
+        }, indent=2) + "\n")
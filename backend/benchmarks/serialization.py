@@ -0,0 +1,159 @@
+"""Response serialization benchmark for large gallery payloads.
+
+Encodes a gallery listing page and a gallery detail with many images three ways and reports the
+median encode time and peak traced allocation of each:
+
+- fastapi: the stock path - response validation, model to JSON-safe dict, json.dumps (JSONResponse)
+- orjson: the same dict, rendered by FastJSONResponse with orjson (response_model endpoints)
+- model_dump_json: FastJSONResponse(model) - one pass through pydantic's Rust serializer
+    
+    python -m benchmarks.serialization --galleries 100 --images 500 --iterations 50
+"""
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import JSONResponse
+from core.models.gallery import Gallery, GalleryCategory, GalleryDetail, GalleryImage, GalleryPage, ImageMetadata
+from shared.utils.json_response import FastJSONResponse
+
+
+@dataclass
+class EncodeResult:
+    """Timing and allocation for one payload / strategy pair"""
+    payload: str
+    strategy: str
+    body_bytes: int
+    median_ms: float
+    peak_kib: float
+
+
+def make_image(index: int, created_at: datetime) -> GalleryImage:
+    """Image record shaped like a real upload (metadata + a few EXIF fields)"""
+    return GalleryImage(
+        id=f"image-{index:05d}",
+        content_hash=f"{index:064x}",
+        caption=f"Flash sheet {index} - linework and shading study",
+        alt_text=f"Tattoo flash design number {index}",
+        metadata=ImageMetadata(
+            width=3024,
+            height=4032,
+            orientation=6,
+            dominant_color="#3a2f28",
+            blurhash="LEHV6nWB2yk8pyo0adR*.7kCMdnj",
+            exif={"Make": "Canon", "Model": "EOS R6", "FNumber": "2.8", "ExposureTime": "1/125"}
+        ),
+        created_at=created_at
+    )
+
+
+def make_payloads(galleries: int, images: int) -> Dict[str, BaseModel]:
+    """A listing page with covers and a gallery detail with many images"""
+    now = datetime(2024, 1, 1)
+    page = GalleryPage(items=[
+        Gallery(
+            id=f"gallery-{index:05d}",
+            title=f"Gallery {index}",
+            description="Healed work photographed in natural light. " * 3,
+            category=GalleryCategory.TATTOO,
+            tags=["blackwork", "fine-line", "flash"],
+            image_ids=[f"image-{index:05d}-{position}" for position in range(20)],
+            cover_image_id=f"image-{index:05d}",
+            cover_image=make_image(index, now),
+            version=3,
+            created_at=now - timedelta(days=index),
+            updated_at=now
+        )
+        for index in range(galleries)
+    ], next_cursor="eyJzb3J0X2tleSI6ICIyMDI0In0")
+    
+    detail_images = [make_image(index, now) for index in range(images)]
+    detail = GalleryDetail(
+        id="gallery-detail",
+        title="Everything",
+        category=GalleryCategory.TATTOO,
+        image_ids=[image.id for image in detail_images],
+        images=detail_images,
+        created_at=now,
+        updated_at=now
+    )
+    return {f"page[{galleries}]": page, f"detail[{images}]": detail}
+
+
+def strategies(model_type: type) -> Dict[str, Callable[[BaseModel], bytes]]:
+    """Encoders under test, keyed by name"""
+    adapter = TypeAdapter(model_type)
+    stock = JSONResponse.render.__get__(JSONResponse(None))
+    fast = FastJSONResponse.render.__get__(FastJSONResponse(None))
+    
+    def fastapi_default(model: BaseModel) -> bytes:
+        return stock(adapter.dump_python(adapter.validate_python(model), mode="json"))
+    
+    def orjson_dict(model: BaseModel) -> bytes:
+        return fast(adapter.dump_python(adapter.validate_python(model), mode="json"))
+    
+    return {"fastapi": fastapi_default, "orjson": orjson_dict, "model_dump_json": fast}
+
+
+def measure_encoder(encode: Callable[[BaseModel], bytes], model: BaseModel, iterations: int) -> tuple:
+    """(body size, median ms, peak KiB) - allocation traced on a separate run so it does not skew timing"""
+    body = encode(model)
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        encode(model)
+        timings.append((time.perf_counter() - started) * 1000)
+    
+    tracemalloc.start()
+    try:
+        encode(model)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return len(body), statistics.median(timings), peak / 1024
+
+
+def measure(galleries: int = 100, images: int = 500, iterations: int = 50) -> List[EncodeResult]:
+    """Benchmark every strategy against every payload, checking they produce the same JSON"""
+    results = []
+    for payload_name, model in make_payloads(galleries, images).items():
+        encoders = strategies(type(model))
+        reference: Optional[Any] = None
+        for strategy_name, encode in encoders.items():
+            decoded = orjson.loads(encode(model))
+            if reference is None:
+                reference = decoded
+            elif decoded != reference:
+                raise AssertionError(f"{strategy_name} output differs for {payload_name}")
+            
+            body_bytes, median_ms, peak_kib = measure_encoder(encode, model, iterations)
+            results.append(EncodeResult(payload_name, strategy_name, body_bytes, median_ms, peak_kib))
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--galleries", type=int, default=100)
+    parser.add_argument("--images", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args(argv)
+    
+    results = measure(args.galleries, args.images, args.iterations)
+    
+    print(f"{'payload':<14} {'strategy':<16} {'bytes':>9} {'median ms':>10} {'peak KiB':>10} {'speedup':>8}")
+    baselines = {result.payload: result.median_ms for result in results if result.strategy == "fastapi"}
+    for result in results:
+        speedup = baselines[result.payload] / result.median_ms if result.median_ms else float("inf")
+        print(f"{result.payload:<14} {result.strategy:<16} {result.body_bytes:>9} "
+              f"{result.median_ms:>10.2f} {result.peak_kib:>10.1f} {speedup:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,7 @@ class IAuthRepository(Protocol):
         """Get user by username"""
         ...
     
-    async def create_user(self, username: str, email: str, password: str) -> User:
+    async def create_user(self, username: str, email: str, password: str, is_admin: bool = False) -> User:
         """Create new user account"""
         ...
     
@@ -0,0 +1,39 @@
+from typing import List, Optional, Protocol
+from core.models.content import BlobReference
+
+
+class IBlobReferenceStore(Protocol):
+    """Reference counts of content-addressed blobs - implemented by DynamoDB
+    
+    Content is registered when it is ingested and only registered content can be referenced. Each
+    operation is a single conditional write, so concurrent references, releases, ingests and sweeps
+    never delete a blob that is still in use.
+    """
+    
+    async def register(self, content_hash: str) -> bool:
+        """Record freshly ingested content, keeping any existing count; False while it is being deleted"""
+        ...
+    
+    async def increment(self, content_hash: str) -> Optional[int]:
+        """Add a reference and return the new count; None if the content is not registered"""
+        ...
+    
+    async def decrement(self, content_hash: str) -> Optional[BlobReference]:
+        """Drop a reference and return the updated record; None if there was no reference to drop"""
+        ...
+    
+    async def claim(self, reference: BlobReference) -> bool:
+        """Mark unreferenced content for deletion, unless it was referenced or re-ingested since read"""
+        ...
+    
+    async def remove(self, content_hash: str) -> None:
+        """Forget claimed content once its blob is deleted"""
+        ...
+    
+    async def list_unreferenced(self, ingested_before: float) -> List[BlobReference]:
+        """Content with no references, last ingested before the given epoch seconds"""
+        ...
+    
+    async def count(self, content_hash: str) -> int:
+        """Current reference count"""
+        ...
@@ -0,0 +1,29 @@
+from typing import Protocol, AsyncIterator, Optional
+
+
+class IBlobStorage(Protocol):
+    """Object storage for image bytes - implemented by S3"""
+    
+    async def exists(self, key: str) -> bool:
+        """Check whether an object exists"""
+        ...
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Read a whole object, None if it does not exist"""
+        ...
+    
+    async def put(self, key: str, data: bytes, content_type: str, cache_control: Optional[str] = None) -> None:
+        """Create or replace an object"""
+        ...
+    
+    def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Stream an object without holding it in memory (raises FileNotFoundError)"""
+        ...
+    
+    async def copy(self, source_key: str, destination_key: str) -> None:
+        """Copy an object within storage - bytes do not pass through the API"""
+        ...
+    
+    async def delete(self, key: str) -> None:
+        """Delete an object (no error if it does not exist)"""
+        ...
@@ -0,0 +1,22 @@
+from typing import Protocol, Optional
+from core.models.blog import BlogPost, BlogPostPage
+
+
+class IBlogRepository(Protocol):
+    """Blog post repository interface - implemented by DynamoDB"""
+    
+    async def get_post(self, post_id: str) -> Optional[BlogPost]:
+        """Get post by ID"""
+        ...
+    
+    async def list_posts(self, limit: int = 20, cursor: Optional[str] = None) -> BlogPostPage:
+        """List posts newest first, one keyset page at a time (raises InvalidCursorError)"""
+        ...
+    
+    async def save_post(self, post: BlogPost) -> BlogPost:
+        """Create or replace post"""
+        ...
+    
+    async def delete_post(self, post_id: str) -> bool:
+        """Delete post"""
+        ...
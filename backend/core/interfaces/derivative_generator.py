@@ -0,0 +1,18 @@
+from typing import Protocol, Optional, Dict
+from core.models.gallery import ImageMetadata
+
+
+class IDerivativeGenerator(Protocol):
+    """Produces resized renditions (thumbnail, grid, full) and metadata of stored images"""
+    
+    async def generate(self, source_key: str, content_hash: Optional[str] = None) -> Dict[str, str]:
+        """Create missing renditions and return rendition filename -> object key (raises ValueError for non-images)"""
+        ...
+    
+    def planned(self, content_hash: str) -> Dict[str, str]:
+        """Rendition filename -> object key for a content hash, whether or not rendered yet"""
+        ...
+    
+    async def get_metadata(self, content_hash: str) -> Optional[ImageMetadata]:
+        """Metadata extracted by generate, None if not generated yet"""
+        ...
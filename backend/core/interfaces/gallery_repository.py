@@ -0,0 +1,43 @@
+from typing import Protocol, Optional, List
+from core.models.gallery import Gallery, GalleryCategory, GalleryImage, GalleryPage
+
+
+class IGalleryRepository(Protocol):
+    """Gallery repository interface - implemented by DynamoDB"""
+    
+    async def get_gallery(self, gallery_id: str) -> Optional[Gallery]:
+        """Get gallery by ID"""
+        ...
+    
+    async def get_gallery_version(self, gallery_id: str) -> Optional[int]:
+        """Get only the gallery version (cheap read for conditional GETs)"""
+        ...
+    
+    async def list_galleries(
+        self,
+        category: Optional[GalleryCategory] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> GalleryPage:
+        """List galleries newest first, one keyset page at a time (raises InvalidCursorError)"""
+        ...
+    
+    async def save_gallery(self, gallery: Gallery) -> Gallery:
+        """Create or replace gallery"""
+        ...
+    
+    async def delete_gallery(self, gallery_id: str) -> bool:
+        """Delete gallery"""
+        ...
+    
+    async def get_images(self, image_ids: List[str]) -> List[GalleryImage]:
+        """Get images in the requested order in as few round trips as possible (missing IDs are skipped)"""
+        ...
+    
+    async def save_image(self, image: GalleryImage) -> GalleryImage:
+        """Create or replace image"""
+        ...
+    
+    async def delete_image(self, image_id: str) -> bool:
+        """Delete image"""
+        ...
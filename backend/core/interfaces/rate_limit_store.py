@@ -0,0 +1,14 @@
+from typing import Dict, Mapping, Protocol
+from shared.utils.token_bucket import RateLimit
+
+
+class IRateLimitStore(Protocol):
+    """Token buckets by key - in-process, or shared by every instance (DynamoDB)"""
+    
+    async def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        """Take cost tokens from the key's bucket; seconds to wait when it is empty, 0 when allowed"""
+        ...
+    
+    async def consume_all(self, buckets: Mapping[str, RateLimit], cost: float = 1.0) -> Dict[str, float]:
+        """Take cost tokens from every bucket or from none; the wait for each short bucket, empty when allowed"""
+        ...
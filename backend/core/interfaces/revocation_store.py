@@ -0,0 +1,18 @@
+from typing import Protocol, Optional, List
+from datetime import datetime
+
+
+class IRevocationStore(Protocol):
+    """Authoritative store of revoked token IDs (jti) - will be implemented by DynamoDB"""
+    
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Revoke a token ID until the token's own expiry"""
+        ...
+    
+    async def is_revoked(self, jti: str) -> bool:
+        """Check whether a token ID is revoked and not yet expired"""
+        ...
+    
+    async def list_active(self, since: Optional[datetime] = None) -> List[str]:
+        """List unexpired revoked token IDs, optionally only those revoked after since"""
+        ...
@@ -0,0 +1,14 @@
+from typing import Optional, Protocol
+from core.models.upload import UploadResult
+
+
+class IUploadRecordStore(Protocol):
+    """Processing state of completed uploads, keyed by upload key - implemented by DynamoDB"""
+    
+    async def save(self, upload_key: str, result: UploadResult) -> None:
+        """Record (or replace) the state of an upload"""
+        ...
+    
+    async def get(self, upload_key: str) -> Optional[UploadResult]:
+        """State of an upload, None if it was never completed (or has expired)"""
+        ...
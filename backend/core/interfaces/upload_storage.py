@@ -0,0 +1,35 @@
+from typing import Protocol, List
+from datetime import datetime
+from core.models.upload import PendingUpload, UploadedPart
+
+
+class UploadNotFoundError(Exception):
+    """Raised when a multipart upload does not exist (completed, aborted or never started)"""
+
+
+class IUploadStorage(Protocol):
+    """Direct-to-storage multipart uploads - implemented by S3"""
+    
+    async def create_multipart_upload(self, key: str, content_type: str) -> str:
+        """Start a multipart upload and return its upload ID"""
+        ...
+    
+    async def presign_part(self, key: str, upload_id: str, part_number: int, expires_in: int) -> str:
+        """URL the client PUTs one part to without going through the API"""
+        ...
+    
+    async def list_parts(self, key: str, upload_id: str) -> List[UploadedPart]:
+        """Parts received so far, in part number order"""
+        ...
+    
+    async def complete_multipart_upload(self, key: str, upload_id: str, parts: List[UploadedPart]) -> str:
+        """Assemble the parts into the final object and return its ETag"""
+        ...
+    
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Abort the upload and discard its parts"""
+        ...
+    
+    async def list_pending_uploads(self, initiated_before: datetime) -> List[PendingUpload]:
+        """Incomplete uploads started before the given time"""
+        ...
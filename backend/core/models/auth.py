@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
@@ -34,6 +35,11 @@ class TokenRefreshRequest(BaseModel):
     refresh_token: str
 
 
+class LogoutRequest(BaseModel):
+    """Logout request DTO - the refresh token is revoked alongside the bearer access token"""
+    refresh_token: Optional[str] = None
+
+
 class TokenResponse(BaseModel):
     """Token response DTO"""
     access_token: str
@@ -49,3 +55,23 @@ class TokenPayload(BaseModel):
     is_admin: bool = False
     exp: datetime
     iat: datetime
+    type: str = "access"  # access | refresh
+    jti: Optional[str] = None  # token ID used for revocation
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Authenticated caller built from signed claims - no pydantic validation on the hot path"""
+    id: str
+    username: str
+    is_admin: bool = False
+    
+    @classmethod
+    def from_token_payload(cls, token_payload: TokenPayload) -> "Principal":
+        """Build principal from verified JWT claims"""
+        return cls(id=token_payload.sub, username=token_payload.username, is_admin=token_payload.is_admin)
+    
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Build principal from a full user profile"""
+        return cls(id=user.id, username=user.username, is_admin=user.is_admin)
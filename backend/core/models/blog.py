@@ -0,0 +1,63 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
+from datetime import datetime
+
+
+class BlogPost(BaseModel):
+    """Blog post domain model"""
+    id: str
+    title: str
+    summary: str = ""
+    body_markdown: str
+    body_html: Optional[str] = None  # sanitized HTML rendered on write
+    render_key: Optional[str] = None  # content hash + renderer version body_html was rendered from
+    tags: List[str] = Field(default_factory=list)
+    version: int = 1  # incremented on every write
+    created_at: datetime
+    updated_at: datetime
+
+
+def post_sort_key(post: BlogPost) -> str:
+    """Keyset position - creation time with the ID as tie-breaker"""
+    return f"{post.created_at.isoformat()}#{post.id}"
+
+
+class BlogPostSummary(BaseModel):
+    """Listing view of a post - no bodies"""
+    id: str
+    title: str
+    summary: str = ""
+    tags: List[str] = Field(default_factory=list)
+    version: int = 1
+    created_at: datetime
+    updated_at: datetime
+
+
+class BlogPostPage(BaseModel):
+    """One page of posts - pass next_cursor back to get the following page"""
+    items: List[BlogPostSummary]
+    next_cursor: Optional[str] = None
+
+
+class BlogPostCreateRequest(BaseModel):
+    """Blog post create request DTO"""
+    title: str
+    summary: str = ""
+    body_markdown: str
+    tags: List[str] = Field(default_factory=list)
+
+
+class BlogPostUpdateRequest(BaseModel):
+    """Blog post update request DTO - omitted fields are left unchanged"""
+    title: Optional[str] = None
+    summary: Optional[str] = None
+    body_markdown: Optional[str] = None
+    tags: Optional[List[str]] = None
+    
+    @field_validator("title", "summary", "body_markdown", "tags")
+    @classmethod
+    def _not_null(cls, value):
+        """Omit a field to leave it unchanged - none of them can be null"""
+        if value is None:
+            raise ValueError("may not be null")
+        return value
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class StoredBlob(BaseModel):
+    """Content-addressed blob"""
+    content_hash: str  # SHA-256, hex
+    key: str  # storage key derived from the hash
+    size: int  # bytes
+    deduplicated: bool = False  # identical content was already stored
+
+
+class BlobReference(BaseModel):
+    """Reference count of stored content"""
+    content_hash: str
+    refs: int
+    generation: int  # bumped by every ingest, so a stale read can never claim re-ingested content
+    ingested_at: float  # epoch seconds of the latest ingest
+    deleting: bool = False  # claimed for deletion; no new references or ingests until it is removed
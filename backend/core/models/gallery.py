@@ -0,0 +1,98 @@
+from enum import Enum
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Optional
+from datetime import datetime
+
+
+class GalleryCategory(str, Enum):
+    """Portfolio content types"""
+    TATTOO = "tattoo"
+    ILLUSTRATIONS = "illustrations"
+    CODING = "coding"
+    GAME_BOX = "game_box"
+    RETAIL = "retail"
+    SERIES = "series"
+
+
+class ImageMetadata(BaseModel):
+    """Everything the frontend needs to lay out and placeholder an image before fetching it"""
+    width: int  # upright display size of the original
+    height: int
+    orientation: int = 1  # EXIF orientation of the original file
+    dominant_color: str  # "#rrggbb"
+    blurhash: str
+    exif: Dict[str, str] = Field(default_factory=dict)
+
+
+class GalleryImage(BaseModel):
+    """Gallery image domain model"""
+    id: str
+    content_hash: str  # SHA-256 of the stored blob - shared by every gallery showing the same artwork
+    caption: str = ""
+    alt_text: str = ""
+    metadata: Optional[ImageMetadata] = None
+    created_at: datetime
+
+
+class Gallery(BaseModel):
+    """Gallery domain model"""
+    id: str
+    title: str
+    description: str = ""
+    category: GalleryCategory
+    tags: List[str] = Field(default_factory=list)
+    image_ids: List[str] = Field(default_factory=list)  # display order
+    cover_image_id: Optional[str] = None
+    cover_image: Optional[GalleryImage] = None  # denormalized so listings render without image reads
+    version: int = 1  # incremented on every write
+    created_at: datetime
+    updated_at: datetime
+
+
+def gallery_sort_key(gallery: Gallery) -> str:
+    """Keyset position - creation time with the ID as tie-breaker"""
+    return f"{gallery.created_at.isoformat()}#{gallery.id}"
+
+
+class GalleryDetail(Gallery):
+    """Gallery with its images resolved"""
+    images: List[GalleryImage] = Field(default_factory=list)
+
+
+class GalleryPage(BaseModel):
+    """One page of galleries - pass next_cursor back to get the following page"""
+    items: List[Gallery]
+    next_cursor: Optional[str] = None
+
+
+class GalleryCreateRequest(BaseModel):
+    """Gallery create request DTO"""
+    title: str
+    description: str = ""
+    category: GalleryCategory
+    tags: List[str] = Field(default_factory=list)
+
+
+class GalleryUpdateRequest(BaseModel):
+    """Gallery update request DTO - omitted fields are left unchanged"""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[GalleryCategory] = None
+    tags: Optional[List[str]] = None
+    image_ids: Optional[List[str]] = None
+    cover_image_id: Optional[str] = None  # null clears the cover
+    
+    @field_validator("title", "description", "category", "tags", "image_ids")
+    @classmethod
+    def _not_null(cls, value):
+        """Omit a field to leave it unchanged - only cover_image_id can be cleared with null"""
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+
+class GalleryImageCreateRequest(BaseModel):
+    """Add image to gallery request DTO - content_hash comes from the completed upload"""
+    content_hash: str = Field(pattern=r"^[0-9a-f]{64}$")
+    caption: str = ""
+    alt_text: str = ""
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class SearchHit(BaseModel):
+    """One ranked search result"""
+    type: str  # "gallery" | "post"
+    id: str
+    title: str
+    score: float
+    category: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    """Search results DTO"""
+    query: str
+    hits: List[SearchHit]
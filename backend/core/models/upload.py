@@ -0,0 +1,64 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import datetime
+from enum import Enum
+
+
+class UploadStartRequest(BaseModel):
+    """Start multipart upload request DTO"""
+    filename: str
+    content_type: str
+    size: int = Field(gt=0)  # bytes
+
+
+class PresignedPart(BaseModel):
+    """Presigned URL the client PUTs one part to"""
+    part_number: int
+    url: str
+
+
+class UploadSession(BaseModel):
+    """Multipart upload session - the client uploads each part directly to storage"""
+    upload_id: str
+    key: str
+    part_size: int  # bytes, every part except the last
+    parts: List[PresignedPart]
+    expires_at: datetime  # presigned URLs stop working after this
+
+
+class UploadedPart(BaseModel):
+    """Part number and the ETag storage returned for it"""
+    part_number: int
+    etag: str
+
+
+class UploadCompleteRequest(BaseModel):
+    """Complete upload request DTO - parts may be omitted and are then listed from storage"""
+    key: str
+    parts: Optional[List[UploadedPart]] = None
+
+
+class UploadStatus(str, Enum):
+    """Where a completed upload is in content addressing and rendition generation"""
+    PROCESSING = "processing"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class UploadResult(BaseModel):
+    """Completed upload - once ready, reference content_hash when adding the image to a gallery"""
+    key: str
+    etag: str
+    status: UploadStatus = UploadStatus.READY
+    error: Optional[str] = None  # why processing failed
+    content_hash: Optional[str] = None  # SHA-256 of the content, set once it is content-addressed
+    size: Optional[int] = None
+    deduplicated: bool = False  # identical content was already stored
+    derivatives: Dict[str, str] = Field(default_factory=dict)  # rendition filename -> key
+
+
+class PendingUpload(BaseModel):
+    """Incomplete multipart upload found in storage"""
+    key: str
+    upload_id: str
+    initiated_at: datetime
@@ -1,15 +1,33 @@
 from typing import Optional
 from core.interfaces.auth_repository import IAuthRepository
-from core.models.auth import User, LoginRequest, LoginResponse, TokenResponse
+from core.models.auth import User, LoginRequest, LoginResponse, TokenResponse, TokenPayload, Principal
+from core.services.revocation_service import RevocationService
 from shared.utils.jwt_manager import jwt_manager
+from shared.utils.metrics import metrics
 
 
 class AuthService:
     """Authentication business logic service"""
     
-    def __init__(self, auth_repository: IAuthRepository):
+    def __init__(self, auth_repository: IAuthRepository, revocation_service: Optional[RevocationService] = None):
         self.auth_repository = auth_repository
+        self.revocation_service = revocation_service
     
+    @metrics.timed("auth_verify")
+    async def verify_token(self, token: str) -> Optional[TokenPayload]:
+        """Verify JWT token and reject revoked token IDs"""
+        token_payload = jwt_manager.verify_token(token)
+        if not token_payload:
+            return None
+        
+        # Bloom-filter fronted, so non-revoked tokens are answered without I/O
+        if self.revocation_service and token_payload.jti:
+            if await self.revocation_service.is_revoked(token_payload.jti):
+                return None
+        
+        return token_payload
+    
+    @metrics.timed("auth_login")
     async def login(self, login_request: LoginRequest) -> Optional[LoginResponse]:
         """Authenticate user and return tokens"""
         # Authenticate user through repository (will call Cognito)
@@ -28,10 +46,11 @@ class AuthService:
             user=user
         )
     
+    @metrics.timed("auth_refresh")
     async def refresh_token(self, refresh_token: str) -> Optional[TokenResponse]:
         """Refresh access token using refresh token"""
         # Verify refresh token
-        token_payload = jwt_manager.verify_token(refresh_token)
+        token_payload = await self.verify_token(refresh_token)
         if not token_payload:
             return None
         
@@ -51,13 +70,54 @@ class AuthService:
     async def get_current_user(self, token: str) -> Optional[User]:
         """Get current user from JWT token"""
         # Verify token
-        token_payload = jwt_manager.verify_token(token)
+        token_payload = await self.verify_token(token)
         if not token_payload:
             return None
         
         # Get user from repository
         return await self.auth_repository.get_user_by_id(token_payload.sub)
     
+    @metrics.timed("auth_principal")
+    async def get_current_principal(self, token: str, stateless: bool = False) -> Optional[Principal]:
+        """Get caller principal from JWT access token, from claims alone when stateless"""
+        token_payload = await self.verify_token(token)
+        if not token_payload or token_payload.type != "access":
+            return None
+        
+        if stateless:
+            return Principal.from_token_payload(token_payload)
+        
+        # Stateful mode re-reads the user so revoked admin rights take effect immediately
+        user = await self.auth_repository.get_user_by_id(token_payload.sub)
+        if not user:
+            return None
+        
+        return Principal.from_user(user)
+    
     async def create_user(self, username: str, email: str, password: str) -> Optional[User]:
         """Create new user account"""
         return await self.auth_repository.create_user(username, email, password)
+    
+    @metrics.timed("auth_logout")
+    async def logout(self, access_token: str, refresh_token: Optional[str] = None) -> bool:
+        """Revoke the access token and, if it belongs to the same user, the refresh token"""
+        access_payload = await self.verify_token(access_token)
+        if not access_payload:
+            return False
+        
+        # Without a revocation store logout is client-side only (tokens are discarded)
+        if not self.revocation_service:
+            return True
+        
+        revocable = [access_payload]
+        if refresh_token:
+            refresh_payload = await self.verify_token(refresh_token)
+            if refresh_payload and refresh_payload.sub == access_payload.sub:
+                revocable.append(refresh_payload)
+        
+        # Each revocation lives only as long as the token it blocks
+        for token_payload in revocable:
+            if token_payload.jti:
+                await self.revocation_service.revoke(token_payload.jti, token_payload.exp)
+        
+        return True
@@ -0,0 +1,105 @@
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Optional
+from core.interfaces.blog_repository import IBlogRepository
+from core.models.blog import BlogPost, BlogPostCreateRequest, BlogPostPage, BlogPostUpdateRequest
+from core.services.search_service import SearchService
+from shared.utils.markdown_renderer import render_key, render_markdown
+from shared.utils.ttl_cache import TTLCache
+
+
+MAX_PAGE_SIZE = 100
+
+
+class BlogService:
+    """Blog business logic service
+    
+    Markdown is rendered and sanitized once on write and stored with its render key (content hash +
+    renderer version), so reads serve stored HTML. Rows whose key is missing or stale (legacy posts,
+    a renderer upgrade) are rendered lazily through a bounded LRU keyed the same way.
+    """
+    
+    def __init__(
+        self,
+        blog_repository: IBlogRepository,
+        render_cache_size: int = 256,
+        search_service: Optional[SearchService] = None
+    ):
+        self.blog_repository = blog_repository
+        self.search_service = search_service
+        self.render_cache: TTLCache[str, str] = TTLCache(max_size=render_cache_size)
+    
+    async def list_posts(self, limit: int = 20, cursor: Optional[str] = None) -> BlogPostPage:
+        """List one page of posts, newest first"""
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        return await self.blog_repository.list_posts(limit, cursor)
+    
+    async def get_post(self, post_id: str) -> Optional[BlogPost]:
+        """Get post with current rendered HTML"""
+        post = await self.blog_repository.get_post(post_id)
+        if not post:
+            return None
+        
+        key = render_key(post.body_markdown)
+        if post.render_key == key and post.body_html is not None:
+            return post
+        
+        html = self.render_cache.get(key)
+        if html is None:
+            html = await asyncio.to_thread(render_markdown, post.body_markdown)
+            self.render_cache.set(key, html)
+        return post.model_copy(update={"body_html": html, "render_key": key})
+    
+    async def create_post(self, request: BlogPostCreateRequest) -> BlogPost:
+        """Create new post, rendering its body"""
+        now = datetime.utcnow()
+        post = BlogPost(
+            id=str(uuid.uuid4()),
+            created_at=now,
+            updated_at=now,
+            **request.model_dump()
+        )
+        post = await self._render(post)
+        await self.blog_repository.save_post(post)
+        self._reindex(post)
+        return post
+    
+    async def update_post(self, post_id: str, request: BlogPostUpdateRequest) -> Optional[BlogPost]:
+        """Apply a partial update, re-rendering only when the body changed"""
+        post = await self.blog_repository.get_post(post_id)
+        if not post:
+            return None
+        
+        # Validated as a whole, so an update can never store a post the model would reject
+        updated = BlogPost(**{
+            **post.model_dump(),
+            **request.model_dump(exclude_unset=True),
+            "version": post.version + 1,
+            "updated_at": datetime.utcnow(),
+        })
+        updated = await self._render(updated)
+        await self.blog_repository.save_post(updated)
+        self._reindex(updated)
+        return updated
+    
+    async def delete_post(self, post_id: str) -> bool:
+        """Delete post"""
+        deleted = await self.blog_repository.delete_post(post_id)
+        if deleted and self.search_service:
+            self.search_service.remove_post(post_id)
+        return deleted
+    
+    async def _render(self, post: BlogPost) -> BlogPost:
+        """Post with body_html current for its markdown (no work when the render key matches)"""
+        key = render_key(post.body_markdown)
+        if post.render_key == key and post.body_html is not None:
+            return post
+        
+        html = await asyncio.to_thread(render_markdown, post.body_markdown)
+        return post.model_copy(update={"body_html": html, "render_key": key})
+    
+    def _reindex(self, post: BlogPost) -> None:
+        """Refresh the post's search document"""
+        if self.search_service:
+            self.search_service.index_post(post)
@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import logging
+import time
+from datetime import timedelta
+from typing import Optional
+from core.interfaces.blob_reference_store import IBlobReferenceStore
+from core.interfaces.blob_storage import IBlobStorage
+from core.interfaces.derivative_generator import IDerivativeGenerator
+from core.models.content import StoredBlob
+from core.models.gallery import ImageMetadata
+
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "blobs/sha256/"
+HASH_CHUNK_SIZE = 1024 * 1024
+REGISTER_ATTEMPTS = 50  # while a release or sweep finishes deleting the same content
+REGISTER_RETRY_SECONDS = 0.1
+
+
+def blob_key(content_hash: str) -> str:
+    """Storage key of a content hash (two-character fan-out keeps listings and S3 prefixes small)"""
+    return f"{BLOB_PREFIX}{content_hash[:2]}/{content_hash}"
+
+
+class ContentService:
+    """Content-addressed image storage with reference counting
+    
+    Uploads are hashed by streaming the staged object once, in chunks, from the upload processing
+    job, then copied to blobs/sha256/<hash> unless that content is already stored. Gallery images
+    reference the hash. Each reference is counted, and the blob and its renditions are deleted when
+    the last one goes. Content that is never referenced is deleted by sweep_unreferenced once it is
+    older than unreferenced_grace.
+    
+    Hashing cannot happen while the upload streams: parts go from the browser straight to S3, and
+    S3's SHA-256 checksum for a multipart upload is a checksum of the part checksums, not of the
+    content, so it cannot be the content address either.
+    """
+    
+    def __init__(
+        self,
+        storage: IBlobStorage,
+        reference_store: IBlobReferenceStore,
+        derivative_generator: Optional[IDerivativeGenerator] = None,
+        unreferenced_grace: timedelta = timedelta(hours=24)
+    ):
+        self.storage = storage
+        self.reference_store = reference_store
+        self.derivative_generator = derivative_generator
+        self.unreferenced_grace = unreferenced_grace
+    
+    async def ingest(self, staged_key: str) -> StoredBlob:
+        """Move a staged object to its content address, deduplicating identical content (upload job only)"""
+        digest = hashlib.sha256()
+        size = 0
+        async for chunk in self.storage.iter_chunks(staged_key, HASH_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+        
+        content_hash = digest.hexdigest()
+        key = blob_key(content_hash)
+        # Registered before the copy, so a release that read the count earlier can no longer claim it
+        await self._register(content_hash)
+        deduplicated = await self.storage.exists(key)
+        if not deduplicated:
+            await self.storage.copy(staged_key, key)
+        await self.storage.delete(staged_key)
+        
+        return StoredBlob(content_hash=content_hash, key=key, size=size, deduplicated=deduplicated)
+    
+    async def add_reference(self, content_hash: str) -> int:
+        """Reference a stored blob (raises ValueError for unknown content)"""
+        count = await self.reference_store.increment(content_hash)
+        if count is None:
+            raise ValueError(f"Unknown content hash: {content_hash}")
+        return count
+    
+    async def get_metadata(self, content_hash: str) -> Optional[ImageMetadata]:
+        """Dimensions, EXIF, dominant color and blurhash of stored content (extracted on first request)"""
+        if not self.derivative_generator:
+            return None
+        
+        metadata = await self.derivative_generator.get_metadata(content_hash)
+        if metadata is None:
+            await self.derivative_generator.generate(blob_key(content_hash), content_hash)
+            metadata = await self.derivative_generator.get_metadata(content_hash)
+        return metadata
+    
+    async def release(self, content_hash: str) -> int:
+        """Drop a reference; the last one deletes the blob and its renditions"""
+        reference = await self.reference_store.decrement(content_hash)
+        if reference is None:
+            logger.warning("Released content %s had no references", content_hash)
+            return 0
+        if reference.refs == 0 and await self.reference_store.claim(reference):
+            await self._delete(content_hash)
+        return reference.refs
+    
+    async def sweep_unreferenced(self) -> int:
+        """Delete content unreferenced for longer than unreferenced_grace; returns the number deleted
+        
+        Picks up uploads that were never added to a gallery and deletes interrupted by a failure.
+        """
+        swept = 0
+        ingested_before = time.time() - self.unreferenced_grace.total_seconds()
+        for reference in await self.reference_store.list_unreferenced(ingested_before):
+            if reference.deleting or await self.reference_store.claim(reference):
+                if await self._delete(reference.content_hash):
+                    swept += 1
+        return swept
+    
+    async def _register(self, content_hash: str) -> None:
+        """Register ingested content, waiting out an in-flight delete of the same hash"""
+        for _ in range(REGISTER_ATTEMPTS):
+            if await self.reference_store.register(content_hash):
+                return
+            await asyncio.sleep(REGISTER_RETRY_SECONDS)
+        raise RuntimeError(f"Content {content_hash} is still being deleted")
+    
+    async def _delete(self, content_hash: str) -> bool:
+        """Delete claimed content and its renditions; the record stays to be swept again if any key fails"""
+        keys = [blob_key(content_hash)]
+        if self.derivative_generator:
+            keys.extend(self.derivative_generator.planned(content_hash).values())
+        deleted = True
+        for key in keys:
+            try:
+                await self.storage.delete(key)
+            except Exception:
+                logger.exception("Failed to delete unreferenced blob %s", key)
+                deleted = False
+        if deleted:
+            await self.reference_store.remove(content_hash)
+        return deleted
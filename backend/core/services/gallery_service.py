@@ -0,0 +1,173 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+from core.interfaces.gallery_repository import IGalleryRepository
+from core.services.content_service import ContentService
+from core.services.search_service import SearchService
+from core.models.gallery import (
+    Gallery, GalleryCategory, GalleryCreateRequest, GalleryDetail, GalleryImage,
+    GalleryImageCreateRequest, GalleryPage, GalleryUpdateRequest
+)
+
+
+MAX_PAGE_SIZE = 100
+
+
+class GalleryService:
+    """Gallery business logic service"""
+    
+    def __init__(
+        self,
+        gallery_repository: IGalleryRepository,
+        content_service: Optional[ContentService] = None,
+        search_service: Optional[SearchService] = None
+    ):
+        self.gallery_repository = gallery_repository
+        self.content_service = content_service
+        self.search_service = search_service
+    
+    async def list_galleries(
+        self,
+        category: Optional[GalleryCategory] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> GalleryPage:
+        """List one page of galleries, newest first"""
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        return await self.gallery_repository.list_galleries(category, limit, cursor)
+    
+    async def get_gallery_version(self, gallery_id: str) -> Optional[int]:
+        """Current gallery version, used as the ETag before any serialization"""
+        return await self.gallery_repository.get_gallery_version(gallery_id)
+    
+    async def get_gallery_detail(self, gallery_id: str) -> Optional[GalleryDetail]:
+        """Get gallery with its images (one batched image read)"""
+        gallery = await self.gallery_repository.get_gallery(gallery_id)
+        if not gallery:
+            return None
+        
+        images = await self.gallery_repository.get_images(gallery.image_ids)
+        return GalleryDetail(**gallery.model_dump(), images=images)
+    
+    async def create_gallery(self, request: GalleryCreateRequest) -> Gallery:
+        """Create new gallery"""
+        now = datetime.utcnow()
+        gallery = Gallery(
+            id=str(uuid.uuid4()),
+            created_at=now,
+            updated_at=now,
+            **request.model_dump()
+        )
+        await self.gallery_repository.save_gallery(gallery)
+        await self._reindex(gallery)
+        return gallery
+    
+    async def update_gallery(self, gallery_id: str, request: GalleryUpdateRequest) -> Optional[Gallery]:
+        """Apply a partial update and bump the gallery version (raises ValueError for bad image_ids)"""
+        gallery = await self.gallery_repository.get_gallery(gallery_id)
+        if not gallery:
+            return None
+        
+        changes = request.model_dump(exclude_unset=True)
+        # Images are added and removed through add_image / delete_image, which count blob references
+        if "image_ids" in changes and sorted(changes["image_ids"]) != sorted(gallery.image_ids):
+            raise ValueError("image_ids can only reorder the gallery's own images")
+        if "cover_image_id" in changes:
+            changes["cover_image"] = await self._get_image(changes["cover_image_id"])
+        # Validated as a whole, so an update can never store a gallery the model would reject
+        updated = Gallery(**{
+            **gallery.model_dump(),
+            **changes,
+            "version": gallery.version + 1,
+            "updated_at": datetime.utcnow(),
+        })
+        await self.gallery_repository.save_gallery(updated)
+        await self._reindex(updated)
+        return updated
+    
+    async def delete_gallery(self, gallery_id: str) -> bool:
+        """Delete gallery and its images, releasing their blob references"""
+        gallery = await self.gallery_repository.get_gallery(gallery_id)
+        if not gallery:
+            return False
+        
+        images = await self.gallery_repository.get_images(gallery.image_ids)
+        deleted = await self.gallery_repository.delete_gallery(gallery_id)
+        for image in images:
+            await self._delete_image(image)
+        if self.search_service:
+            self.search_service.remove_gallery(gallery_id)
+        return deleted
+    
+    async def add_image(self, gallery_id: str, request: GalleryImageCreateRequest) -> Optional[GalleryImage]:
+        """Create an image and append it to the gallery (raises ValueError for unknown content)"""
+        gallery = await self.gallery_repository.get_gallery(gallery_id)
+        if not gallery:
+            return None
+        
+        metadata = None
+        if self.content_service:
+            await self.content_service.add_reference(request.content_hash)
+            metadata = await self.content_service.get_metadata(request.content_hash)
+        image = GalleryImage(
+            id=str(uuid.uuid4()),
+            metadata=metadata,
+            created_at=datetime.utcnow(),
+            **request.model_dump()
+        )
+        await self.gallery_repository.save_image(image)
+        has_cover = gallery.cover_image_id is not None
+        updated = gallery.model_copy(update={
+            "image_ids": [*gallery.image_ids, image.id],
+            "cover_image_id": gallery.cover_image_id if has_cover else image.id,
+            "cover_image": gallery.cover_image if has_cover else image,
+            "version": gallery.version + 1,
+            "updated_at": datetime.utcnow(),
+        })
+        await self.gallery_repository.save_gallery(updated)
+        await self._reindex(updated)
+        return image
+    
+    async def remove_image(self, gallery_id: str, image_id: str) -> bool:
+        """Remove an image from the gallery and release its blob reference"""
+        gallery = await self.gallery_repository.get_gallery(gallery_id)
+        if not gallery or image_id not in gallery.image_ids:
+            return False
+        
+        image_ids = [existing for existing in gallery.image_ids if existing != image_id]
+        cover_image_id, cover_image = gallery.cover_image_id, gallery.cover_image
+        if cover_image_id == image_id:
+            cover_image_id = image_ids[0] if image_ids else None
+            cover_image = await self._get_image(cover_image_id)
+        updated = gallery.model_copy(update={
+            "image_ids": image_ids,
+            "cover_image_id": cover_image_id,
+            "cover_image": cover_image,
+            "version": gallery.version + 1,
+            "updated_at": datetime.utcnow(),
+        })
+        await self.gallery_repository.save_gallery(updated)
+        
+        images = await self.gallery_repository.get_images([image_id])
+        for image in images:
+            await self._delete_image(image)
+        await self._reindex(updated)
+        return True
+    
+    async def _get_image(self, image_id: Optional[str]) -> Optional[GalleryImage]:
+        """Single image by ID, None for no ID or a missing image"""
+        if not image_id:
+            return None
+        images = await self.gallery_repository.get_images([image_id])
+        return images[0] if images else None
+    
+    async def _reindex(self, gallery: Gallery) -> None:
+        """Refresh the gallery's search document (captions come from its images)"""
+        if self.search_service:
+            images = await self.gallery_repository.get_images(gallery.image_ids)
+            self.search_service.index_gallery(gallery, images)
+    
+    async def _delete_image(self, image: GalleryImage) -> None:
+        """Delete the image record, then drop its reference to the shared blob"""
+        if await self.gallery_repository.delete_image(image.id) and self.content_service:
+            await self.content_service.release(image.content_hash)
@@ -0,0 +1,67 @@
+import io
+import marshal
+import pstats
+import re
+import uuid
+from typing import Any, Dict, Optional
+from core.interfaces.blob_storage import IBlobStorage
+
+
+PROFILE_PREFIX = "profiles/"
+PROFILE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+SORT_KEYS = ("cumulative", "tottime", "calls", "ncalls", "time")
+
+
+class _LoadedStats:
+    """Marshalled cProfile stats in the shape pstats.Stats loads from a Profile object"""
+    
+    def __init__(self, stats: Dict[Any, Any]):
+        self.stats = stats
+    
+    def create_stats(self) -> None:
+        pass
+
+
+class ProfilingService:
+    """Stores per-request cProfile dumps and renders them as pstats reports
+    
+    Dumps are the standard .prof format (marshalled pstats), so the raw download opens in snakeviz
+    or converts to a flamegraph with flameprof. They live in blob storage, so a profile taken on one
+    Lambda instance can be read from any other.
+    """
+    
+    def __init__(self, blob_storage: IBlobStorage):
+        self.blob_storage = blob_storage
+    
+    @staticmethod
+    def new_profile_id() -> str:
+        return uuid.uuid4().hex
+    
+    async def save(self, profile_id: str, profiler: Any) -> None:
+        """Store a finished cProfile.Profile under its ID"""
+        profiler.create_stats()
+        await self.blob_storage.put(
+            f"{PROFILE_PREFIX}{profile_id}.prof",
+            marshal.dumps(profiler.stats),
+            "application/octet-stream"
+        )
+    
+    async def get_raw(self, profile_id: str) -> Optional[bytes]:
+        """The .prof dump, None for unknown or malformed IDs"""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        return await self.blob_storage.get(f"{PROFILE_PREFIX}{profile_id}.prof")
+    
+    async def get_report(self, profile_id: str, sort: str = "cumulative", limit: int = 50) -> Optional[str]:
+        """pstats text report of the top functions (raises ValueError for unknown sort keys)"""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Sort must be one of: {', '.join(SORT_KEYS)}")
+        
+        data = await self.get_raw(profile_id)
+        if data is None:
+            return None
+        
+        stream = io.StringIO()
+        stats = pstats.Stats(_LoadedStats(marshal.loads(data)), stream=stream)
+        stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
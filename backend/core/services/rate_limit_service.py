@@ -0,0 +1,39 @@
+from typing import Dict, Mapping, Optional
+from core.interfaces.rate_limit_store import IRateLimitStore
+from shared.utils.metrics import metrics
+from shared.utils.token_bucket import RateLimit
+
+
+class RateLimitService:
+    """Token-bucket limits per route, with one bucket per dimension value (client IP, username)
+    
+    Checked before any expensive work - a login rejected here never reaches the password hasher.
+    Rejections are counted in rate_limit_rejections_total by route and dimension.
+    """
+    
+    def __init__(self, store: IRateLimitStore, limits: Mapping[str, Mapping[str, RateLimit]]):
+        self.store = store
+        self.limits: Dict[str, Dict[str, RateLimit]] = {route: dict(rules) for route, rules in limits.items()}
+    
+    async def check(self, route: str, **keys: Optional[str]) -> float:
+        """Take a token from each of the route's buckets; seconds to wait when one is empty, 0 when allowed
+        
+        Every bucket is checked before any is debited, so a login rejected by its username bucket
+        does not also spend the client IP's allowance.
+        """
+        dimensions: Dict[str, str] = {}
+        buckets: Dict[str, RateLimit] = {}
+        for dimension, limit in self.limits.get(route, {}).items():
+            value = keys.get(dimension)
+            if value is None:
+                continue
+            key = f"{route}:{dimension}:{value}"
+            dimensions[key] = dimension
+            buckets[key] = limit
+        if not buckets:
+            return 0.0
+        
+        waits = await self.store.consume_all(buckets)
+        for key in waits:
+            metrics.rate_limit_rejections.inc(route, dimensions[key])
+        return max(waits.values(), default=0.0)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+from core.interfaces.revocation_store import IRevocationStore
+from shared.utils.bloom_filter import BloomFilter
+from shared.utils.deadline import detached_task
+
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationService:
+    """Token revocation checks with an in-memory Bloom filter in front of the authoritative store
+    
+    The common (not revoked) case is answered by the Bloom filter without I/O; only Bloom hits -
+    real revocations and rare false positives - are confirmed against the store. Revocations made by
+    other workers reach the local filter through a background sync every sync_interval_seconds.
+    Each sync reaches sync_overlap_seconds further back than the previous one, so revocations stamped
+    by a writer whose clock is behind, or not yet visible to the last read, are still picked up.
+    """
+    
+    def __init__(
+        self,
+        store: IRevocationStore,
+        bloom_capacity: int = 100_000,
+        bloom_error_rate: float = 0.001,
+        sync_interval_seconds: float = 30,
+        sync_overlap_seconds: float = 60
+    ):
+        self.store = store
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.sync_interval_seconds = sync_interval_seconds
+        self.sync_overlap_seconds = sync_overlap_seconds
+        self.bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._last_sync: Optional[float] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self.checks = 0
+        self.store_lookups = 0
+    
+    async def load(self) -> None:
+        """Rebuild the Bloom filter from every active revocation in the store"""
+        synced_at = time.time()
+        bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        for jti in await self.store.list_active():
+            bloom.add(jti)
+        self.bloom = bloom
+        self._last_sync = synced_at
+    
+    async def sync(self) -> None:
+        """Add revocations made since the last sync (full rebuild once the filter is saturated)"""
+        if self._last_sync is None or self.bloom.is_saturated:
+            await self.load()
+            return
+        
+        synced_at = time.time()
+        since = datetime.fromtimestamp(self._last_sync - self.sync_overlap_seconds)
+        for jti in await self.store.list_active(since=since):
+            if jti not in self.bloom:  # the overlap re-reads earlier revocations; don't count them twice
+                self.bloom.add(jti)
+        self._last_sync = synced_at
+    
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Revoke a token ID until its expiry"""
+        await self.store.revoke(jti, expires_at)
+        self.bloom.add(jti)
+    
+    async def is_revoked(self, jti: str) -> bool:
+        """Check revocation - no I/O unless the Bloom filter reports a possible match"""
+        self.checks += 1
+        if self._last_sync is None:
+            # One store round trip per process so a cold worker never trusts an empty filter
+            await self.load()
+        else:
+            self._schedule_sync()
+        
+        if jti not in self.bloom:
+            return False
+        
+        self.store_lookups += 1
+        return await self.store.is_revoked(jti)
+    
+    def _schedule_sync(self) -> None:
+        """Start a background sync when the filter is stale, never blocking the caller"""
+        if time.time() - self._last_sync < self.sync_interval_seconds:
+            return
+        if self._sync_task is not None and not self._sync_task.done():
+            return
+        
+        self._sync_task = detached_task(self._background_sync())
+    
+    async def _background_sync(self) -> None:
+        """Sync, keeping the current filter if the store is unavailable"""
+        try:
+            await self.sync()
+        except Exception:
+            logger.warning("Token revocation sync failed, will retry", exc_info=True)
+    
+    def stats(self) -> dict:
+        """Revocation check counters"""
+        return {
+            "checks": self.checks,
+            "store_lookups": self.store_lookups,
+            "bloom_items": self.bloom.count,
+        }
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, List, Optional
+from core.interfaces.blog_repository import IBlogRepository
+from core.interfaces.gallery_repository import IGalleryRepository
+from core.models.blog import BlogPost
+from core.models.gallery import Gallery, GalleryImage
+from core.models.search import SearchHit
+from shared.utils.deadline import detached_task
+from shared.utils.search_index import SearchIndex
+
+
+logger = logging.getLogger(__name__)
+
+REBUILD_PAGE_SIZE = 100
+
+
+class SearchService:
+    """Full-text search served from an in-process index instead of DynamoDB Scan + contains
+    
+    The index is restored from a snapshot file when one exists (cheap cold starts) or built from the
+    repositories, and is updated in place on admin writes. Writes made by other instances arrive
+    through a background rebuild every refresh_interval_seconds, which also refreshes the snapshot.
+    Admin writes made while a rebuild is reading the repositories are recorded and replayed onto the
+    new index before it is swapped in, so they are never lost to a rebuild that read around them.
+    """
+    
+    def __init__(
+        self,
+        gallery_repository: IGalleryRepository,
+        snapshot_path: Optional[str] = None,
+        refresh_interval_seconds: float = 300,
+        blog_repository: Optional[IBlogRepository] = None
+    ):
+        self.gallery_repository = gallery_repository
+        self.blog_repository = blog_repository
+        self.snapshot_path = snapshot_path
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.index = SearchIndex()
+        self._built_at: Optional[float] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+        self._pending_updates: Optional[List[Callable[[SearchIndex], None]]] = None  # set while rebuilding
+    
+    async def start(self) -> None:
+        """Restore the snapshot, or build the index and write one"""
+        if self.snapshot_path and os.path.isfile(self.snapshot_path):
+            try:
+                data = await asyncio.to_thread(self._read_snapshot)
+                self.index = SearchIndex.from_bytes(data)
+                self._built_at = os.path.getmtime(self.snapshot_path)
+                return
+            except (OSError, ValueError):
+                logger.exception("Search snapshot unreadable, rebuilding")
+        
+        await self.rebuild()
+        if self.snapshot_path:
+            await self.save_snapshot()
+    
+    async def rebuild(self) -> None:
+        """Build a fresh index from the repositories and swap it in"""
+        built_at = time.time()
+        index = SearchIndex()
+        self._pending_updates = []
+        try:
+            await self._build(index)
+            # No awaits from here to the swap, so no write can land between the replay and the swap
+            for update in self._pending_updates:
+                update(index)
+            self.index = index
+            self._built_at = built_at
+        finally:
+            self._pending_updates = None
+    
+    async def _build(self, index: SearchIndex) -> None:
+        """Index every gallery and blog post, page by page"""
+        cursor = None
+        while True:
+            page = await self.gallery_repository.list_galleries(limit=REBUILD_PAGE_SIZE, cursor=cursor)
+            for gallery in page.items:
+                images = await self.gallery_repository.get_images(gallery.image_ids)
+                self._add_gallery(index, gallery, images)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        
+        cursor = None
+        while self.blog_repository:
+            page = await self.blog_repository.list_posts(limit=REBUILD_PAGE_SIZE, cursor=cursor)
+            posts = await asyncio.gather(*(self.blog_repository.get_post(summary.id) for summary in page.items))
+            for post in posts:
+                if post:
+                    self._add_post(index, post)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+    
+    async def save_snapshot(self) -> None:
+        """Write the index to snapshot_path atomically"""
+        data = self.index.to_bytes()
+        await asyncio.to_thread(self._write_snapshot, data)
+    
+    async def search(self, query: str, limit: int = 20, doc_type: Optional[str] = None) -> List[SearchHit]:
+        """Ranked hits for a query, optionally restricted to one document type"""
+        self._refresh_if_stale()
+        filters = {"type": doc_type} if doc_type else {}
+        return [SearchHit(score=round(score, 4), **stored) for _, score, stored in self.index.search(query, limit, **filters)]
+    
+    def index_gallery(self, gallery: Gallery, images: List[GalleryImage]) -> None:
+        """Add or replace a gallery in the index"""
+        self._apply(lambda index: self._add_gallery(index, gallery, images))
+    
+    def remove_gallery(self, gallery_id: str) -> None:
+        """Drop a gallery from the index"""
+        self._apply(lambda index: index.remove(f"gallery:{gallery_id}"))
+    
+    def index_post(self, post: BlogPost) -> None:
+        """Add or replace a blog post in the index"""
+        self._apply(lambda index: self._add_post(index, post))
+    
+    def remove_post(self, post_id: str) -> None:
+        """Drop a blog post from the index"""
+        self._apply(lambda index: index.remove(f"post:{post_id}"))
+    
+    def _apply(self, update: Callable[[SearchIndex], None]) -> None:
+        """Update the live index, and remember the update for the rebuild in progress"""
+        update(self.index)
+        if self._pending_updates is not None:
+            self._pending_updates.append(update)
+    
+    @staticmethod
+    def _add_gallery(index: SearchIndex, gallery: Gallery, images: List[GalleryImage]) -> None:
+        fields = [(gallery.title, 3.0), (" ".join(gallery.tags), 2.0), (gallery.description, 1.0), (gallery.category.value, 1.0)]
+        fields.extend((f"{image.caption} {image.alt_text}", 1.0) for image in images)
+        index.add(
+            f"gallery:{gallery.id}",
+            fields,
+            stored={"type": "gallery", "id": gallery.id, "title": gallery.title, "category": gallery.category.value}
+        )
+    
+    @staticmethod
+    def _add_post(index: SearchIndex, post: BlogPost) -> None:
+        fields = [(post.title, 3.0), (" ".join(post.tags), 2.0), (post.summary, 1.5), (post.body_markdown, 1.0)]
+        index.add(f"post:{post.id}", fields, stored={"type": "post", "id": post.id, "title": post.title})
+    
+    def _refresh_if_stale(self) -> None:
+        """Rebuild in the background once the index is older than the refresh interval"""
+        if self._built_at is None or time.time() - self._built_at < self.refresh_interval_seconds:
+            return
+        if self._rebuild_task is None or self._rebuild_task.done():
+            self._rebuild_task = detached_task(self._background_rebuild())
+    
+    async def _background_rebuild(self) -> None:
+        try:
+            await self.rebuild()
+            if self.snapshot_path:
+                await self.save_snapshot()
+        except Exception:
+            logger.exception("Search index rebuild failed")
+    
+    def _read_snapshot(self) -> bytes:
+        with open(self.snapshot_path, "rb") as snapshot:
+            return snapshot.read()
+    
+    def _write_snapshot(self, data: bytes) -> None:
+        temporary = f"{self.snapshot_path}.tmp"
+        with open(temporary, "wb") as snapshot:
+            snapshot.write(data)
+        os.replace(temporary, self.snapshot_path)
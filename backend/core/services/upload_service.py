@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import mimetypes
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Set
+from core.interfaces.derivative_generator import IDerivativeGenerator
+from core.interfaces.upload_record_store import IUploadRecordStore
+from core.services.content_service import ContentService
+from core.interfaces.upload_storage import IUploadStorage, UploadNotFoundError
+from core.models.upload import (
+    PresignedPart, UploadCompleteRequest, UploadResult, UploadSession, UploadStartRequest, UploadStatus
+)
+from shared.utils.deadline import detached_task
+
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_PREFIX = "uploads/"
+MIN_PART_SIZE = 5 * 1024 * 1024  # S3 minimum for every part except the last
+MAX_PARTS = 10_000  # S3 maximum parts per upload
+ALLOWED_CONTENT_TYPES = frozenset({"image/jpeg", "image/png", "image/webp", "image/avif", "image/gif", "image/tiff"})
+
+
+class UploadService:
+    """Admin image uploads that go straight from the browser to storage
+    
+    The API signs one URL per part, and later completes or aborts the upload. It never sees the image
+    bytes, so Lambda payload limits and memory don't apply to uploads. Completion only assembles the
+    parts and records the upload as processing; hashing and renditions run in process_upload, from the
+    S3 ObjectCreated event in production or a background task where there is no event source.
+    """
+    
+    def __init__(
+        self,
+        storage: IUploadStorage,
+        part_size: int = 8 * 1024 * 1024,
+        max_size: int = 100 * 1024 * 1024,
+        url_expires_seconds: int = 900,
+        stale_after: timedelta = timedelta(hours=24),
+        derivative_generator: Optional[IDerivativeGenerator] = None,
+        content_service: Optional[ContentService] = None,
+        record_store: Optional[IUploadRecordStore] = None,
+        process_in_background: bool = True
+    ):
+        self.storage = storage
+        self.derivative_generator = derivative_generator
+        self.content_service = content_service
+        self.record_store = record_store
+        self.process_in_background = process_in_background
+        self._processing: Set[asyncio.Task] = set()
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.max_size = max_size
+        self.url_expires_seconds = url_expires_seconds
+        self.stale_after = stale_after
+    
+    async def start_upload(self, request: UploadStartRequest) -> UploadSession:
+        """Start a multipart upload and presign every part URL"""
+        if request.content_type not in ALLOWED_CONTENT_TYPES:
+            raise ValueError(f"Unsupported content type: {request.content_type}")
+        if request.size > self.max_size:
+            raise ValueError(f"Upload exceeds the {self.max_size} byte limit")
+        
+        part_size = max(self.part_size, -(-request.size // MAX_PARTS))
+        part_count = -(-request.size // part_size)
+        key = self._new_key(request)
+        
+        upload_id = await self.storage.create_multipart_upload(key, request.content_type)
+        expires_at = datetime.utcnow() + timedelta(seconds=self.url_expires_seconds)
+        # Presigning is local signing work; gather keeps large uploads to a single await
+        urls = await asyncio.gather(*(
+            self.storage.presign_part(key, upload_id, part_number, self.url_expires_seconds)
+            for part_number in range(1, part_count + 1)
+        ))
+        
+        return UploadSession(
+            upload_id=upload_id,
+            key=key,
+            part_size=part_size,
+            parts=[PresignedPart(part_number=number, url=url) for number, url in enumerate(urls, start=1)],
+            expires_at=expires_at
+        )
+    
+    async def complete_upload(self, upload_id: str, request: UploadCompleteRequest) -> UploadResult:
+        """Complete with the client-reported part ETags, or the stored part list if none were reported"""
+        self._check_key(request.key)
+        parts = request.parts
+        if not parts:
+            parts = await self.storage.list_parts(request.key, upload_id)
+        if not parts:
+            raise ValueError("No parts have been uploaded")
+        
+        if not (self.content_service or self.derivative_generator):
+            etag = await self.storage.complete_multipart_upload(request.key, upload_id, parts)
+            return UploadResult(key=request.key, etag=etag)
+        
+        # Recorded first - the ObjectCreated event may finish processing before completion returns
+        await self._record(request.key, UploadResult(key=request.key, etag="", status=UploadStatus.PROCESSING))
+        etag = await self.storage.complete_multipart_upload(request.key, upload_id, parts)
+        result = UploadResult(key=request.key, etag=etag, status=UploadStatus.PROCESSING)
+        if self.process_in_background:
+            task = detached_task(self._process_in_background(request.key, etag))
+            self._processing.add(task)
+            task.add_done_callback(self._processing.discard)
+        return result
+    
+    async def process_upload(self, key: str, etag: str = "") -> UploadResult:
+        """Content-address a completed upload and render its derivatives (outside any request)
+        
+        Safe to run again for the same key - S3 delivers events at least once. The staged object is
+        gone once it is content-addressed, so the content hash is recorded straight after ingest and a
+        retry resumes from it. Failures are recorded for the client and re-raised so the event is retried.
+        """
+        self._check_key(key)
+        recorded = await self.record_store.get(key) if self.record_store else None
+        if recorded and recorded.status == UploadStatus.READY:
+            return recorded
+        etag = etag or (recorded.etag if recorded else "")
+        
+        if recorded and recorded.content_hash:
+            result = recorded.model_copy(update={"status": UploadStatus.PROCESSING, "error": None})
+        else:
+            result = UploadResult(key=key, etag=etag, status=UploadStatus.PROCESSING)
+        try:
+            if self.content_service and not result.content_hash:
+                blob = await self.content_service.ingest(key)
+                result = UploadResult(
+                    key=blob.key,
+                    etag=etag,
+                    status=UploadStatus.PROCESSING,
+                    content_hash=blob.content_hash,
+                    size=blob.size,
+                    deduplicated=blob.deduplicated
+                )
+                await self._record(key, result)
+            if self.derivative_generator:
+                result.derivatives = await self.derivative_generator.generate(result.key, result.content_hash)
+        except Exception as exc:
+            logger.exception("Failed to process upload %s", key)
+            await self._record(key, result.model_copy(update={"status": UploadStatus.FAILED, "error": str(exc)}))
+            raise
+        
+        result.status = UploadStatus.READY
+        await self._record(key, result)
+        return result
+    
+    async def get_upload(self, key: str) -> Optional[UploadResult]:
+        """Processing state of a completed upload, None if it is unknown"""
+        self._check_key(key)
+        if not self.record_store:
+            return None
+        return await self.record_store.get(key)
+    
+    async def abort_upload(self, upload_id: str, key: str) -> None:
+        """Abort an upload and discard its parts"""
+        self._check_key(key)
+        await self.storage.abort_multipart_upload(key, upload_id)
+    
+    async def cleanup_stale_uploads(self) -> int:
+        """Abort uploads left incomplete for longer than stale_after; returns the number aborted"""
+        pending = await self.storage.list_pending_uploads(datetime.utcnow() - self.stale_after)
+        aborted = 0
+        for upload in pending:
+            if not upload.key.startswith(UPLOAD_PREFIX):
+                continue
+            try:
+                await self.storage.abort_multipart_upload(upload.key, upload.upload_id)
+                aborted += 1
+            except UploadNotFoundError:
+                pass  # Completed or aborted since it was listed
+            except Exception:
+                logger.exception("Failed to abort stale upload %s", upload.upload_id)
+        return aborted
+    
+    async def _process_in_background(self, key: str, etag: str) -> None:
+        try:
+            await self.process_upload(key, etag)
+        except Exception:
+            pass  # Logged and recorded as failed; nothing retries in-process
+    
+    async def _record(self, key: str, result: UploadResult) -> None:
+        if self.record_store:
+            await self.record_store.save(key, result)
+    
+    def _new_key(self, request: UploadStartRequest) -> str:
+        """Unique object key - the client filename only contributes its extension"""
+        extension = mimetypes.guess_extension(request.content_type) or ""
+        return f"{UPLOAD_PREFIX}{datetime.utcnow():%Y/%m}/{uuid.uuid4().hex}{extension}"
+    
+    def _check_key(self, key: str) -> None:
+        """Only keys issued by start_upload can be completed or aborted"""
+        if not key.startswith(UPLOAD_PREFIX) or ".." in key:
+            raise ValueError("Invalid upload key")
@@ -0,0 +1,96 @@
+from typing import Optional
+from core.interfaces.auth_repository import IAuthRepository
+from core.models.auth import User, LoginRequest
+from shared.utils.ttl_cache import TTLCache
+
+
+# Stored for user IDs the inner repository reported as unknown (negative caching)
+_NOT_FOUND = object()
+# Returned by the cache when there is no entry at all
+_MISSING = object()
+
+
+class CachedAuthRepository:
+    """Read-through cache decorator for any IAuthRepository
+    
+    Every invalidation bumps a generation counter, and a read only fills the cache when no
+    invalidation happened while it was in flight - so a read racing an update cannot put the
+    stale user back after the update dropped it.
+    """
+    
+    def __init__(
+        self,
+        inner: IAuthRepository,
+        ttl_seconds: float = 60,
+        max_size: int = 1024,
+        negative_ttl_seconds: float = 10
+    ):
+        self.inner = inner
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.cache: TTLCache[str, object] = TTLCache(max_size=max_size, default_ttl=ttl_seconds)
+        self._generation = 0
+    
+    async def authenticate_user(self, login_request: LoginRequest) -> Optional[User]:
+        """Authenticate user credentials (never cached)"""
+        generation = self._generation
+        user = await self.inner.authenticate_user(login_request)
+        if user and generation == self._generation:
+            self.cache.set(user.id, user)
+        return user
+    
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID, served from cache when possible"""
+        cached = self.cache.get(user_id, _MISSING)
+        if cached is _NOT_FOUND:
+            return None
+        if cached is not _MISSING:
+            return cached
+        
+        generation = self._generation
+        user = await self.inner.get_user_by_id(user_id)
+        if generation != self._generation:
+            return user
+        if user:
+            self.cache.set(user_id, user)
+        else:
+            self.cache.set(user_id, _NOT_FOUND, ttl=self.negative_ttl_seconds)
+        return user
+    
+    async def get_user_by_username(self, username: str) -> Optional[User]:
+        """Get user by username (passed through)"""
+        return await self.inner.get_user_by_username(username)
+    
+    async def create_user(self, username: str, email: str, password: str, is_admin: bool = False) -> User:
+        """Create new user account and replace any negative entry for its ID"""
+        user = await self.inner.create_user(username, email, password, is_admin=is_admin)
+        self.cache.set(user.id, user)
+        return user
+    
+    async def update_user(self, user: User) -> User:
+        """Update user information and invalidate the cached copy"""
+        self.invalidate(user.id)
+        try:
+            return await self.inner.update_user(user)
+        finally:
+            self.invalidate(user.id)
+    
+    async def delete_user(self, user_id: str) -> bool:
+        """Delete user account and invalidate the cached copy"""
+        self.invalidate(user_id)
+        try:
+            return await self.inner.delete_user(user_id)
+        finally:
+            self.invalidate(user_id)
+    
+    async def refresh_token(self, refresh_token: str) -> Optional[dict]:
+        """Refresh access token using refresh token (passed through)"""
+        return await self.inner.refresh_token(refresh_token)
+    
+    def invalidate(self, user_id: str) -> None:
+        """Drop a single user from the cache, and keep in-flight reads from refilling it"""
+        self._generation += 1
+        self.cache.pop(user_id)
+    
+    def stats(self) -> dict:
+        """Cache counters"""
+        return self.cache.stats()
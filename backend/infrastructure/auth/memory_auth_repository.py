@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+from core.models.auth import User, LoginRequest
+from shared.utils.jwt_manager import jwt_manager
+
+
+class InMemoryAuthRepository:
+    """In-process IAuthRepository for local development and tests - stores bcrypt hashes, not Cognito"""
+    
+    def __init__(self):
+        self._users: Dict[str, User] = {}
+        self._password_hashes: Dict[str, str] = {}
+        self._user_ids_by_username: Dict[str, str] = {}
+    
+    async def authenticate_user(self, login_request: LoginRequest) -> Optional[User]:
+        """Authenticate user credentials, upgrading the stored hash when its parameters are outdated"""
+        user_id = self._user_ids_by_username.get(login_request.username)
+        if not user_id:
+            await jwt_manager.password_hasher.dummy_verify_async()
+            return None
+        
+        is_valid, new_hash = await jwt_manager.verify_and_update_password_async(
+            login_request.password,
+            self._password_hashes[user_id]
+        )
+        if not is_valid:
+            return None
+        
+        if new_hash:
+            self._password_hashes[user_id] = new_hash
+        
+        return self._users[user_id]
+    
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        return self._users.get(user_id)
+    
+    async def get_user_by_username(self, username: str) -> Optional[User]:
+        """Get user by username"""
+        user_id = self._user_ids_by_username.get(username)
+        return self._users.get(user_id) if user_id else None
+    
+    async def create_user(self, username: str, email: str, password: str, is_admin: bool = False) -> User:
+        """Create new user account"""
+        if username in self._user_ids_by_username:
+            raise ValueError(f"Username '{username}' already exists")
+        
+        now = datetime.utcnow()
+        user = User(
+            id=str(uuid.uuid4()),
+            username=username,
+            email=email,
+            is_admin=is_admin,
+            created_at=now,
+            updated_at=now
+        )
+        self._password_hashes[user.id] = await jwt_manager.hash_password_async(password)
+        self._users[user.id] = user
+        self._user_ids_by_username[username] = user.id
+        return user
+    
+    async def update_user(self, user: User) -> User:
+        """Update user information"""
+        existing = self._users.get(user.id)
+        if not existing:
+            raise KeyError(user.id)
+        
+        if existing.username != user.username:
+            del self._user_ids_by_username[existing.username]
+            self._user_ids_by_username[user.username] = user.id
+        
+        updated = user.model_copy(update={"updated_at": datetime.utcnow()})
+        self._users[user.id] = updated
+        return updated
+    
+    async def delete_user(self, user_id: str) -> bool:
+        """Delete user account"""
+        user = self._users.pop(user_id, None)
+        if not user:
+            return False
+        
+        self._password_hashes.pop(user_id, None)
+        self._user_ids_by_username.pop(user.username, None)
+        return True
+    
+    async def refresh_token(self, refresh_token: str) -> Optional[dict]:
+        """Refresh tokens are handled by JWTManager for local users"""
+        return None
+    
+    def set_password_hash(self, user_id: str, password_hash: str) -> None:
+        """Replace a stored hash directly (seeding and migration tests)"""
+        self._password_hashes[user_id] = password_hash
+    
+    def get_password_hash(self, user_id: str) -> Optional[str]:
+        """Read a stored hash (seeding and migration tests)"""
+        return self._password_hashes.get(user_id)
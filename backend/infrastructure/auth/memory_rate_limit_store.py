@@ -0,0 +1,62 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Mapping
+from shared.utils.token_bucket import RateLimit, take
+
+
+class _Shard:
+    """One lock and LRU of buckets (key -> (tokens, updated_at))"""
+    
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self.lock = threading.Lock()
+        self.buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+
+
+class InMemoryRateLimitStore:
+    """In-process IRateLimitStore - buckets split across independently locked shards
+    
+    Keys hash to one of shards LRUs, so checks from worker threads rarely contend for the same lock
+    and a flood of distinct keys (spoofed usernames) can only evict within its shard. An evicted
+    bucket starts full again, which is the same state it would have refilled to.
+    """
+    
+    def __init__(self, shards: int = 16, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self._shards: List[_Shard] = [_Shard(max(max_keys // shards, 1)) for _ in range(max(shards, 1))]
+        self._clock = clock
+    
+    async def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        """Take cost tokens from the key's bucket; seconds to wait when it is empty, 0 when allowed"""
+        return (await self.consume_all({key: limit}, cost)).get(key, 0.0)
+    
+    async def consume_all(self, buckets: Mapping[str, RateLimit], cost: float = 1.0) -> Dict[str, float]:
+        """Take cost tokens from every bucket or from none; the wait for each short bucket, empty when allowed"""
+        shards = sorted({hash(key) % len(self._shards) for key in buckets})  # fixed lock order
+        for index in shards:
+            self._shards[index].lock.acquire()
+        try:
+            now = self._clock()
+            refilled: Dict[str, float] = {}
+            waits: Dict[str, float] = {}
+            for key, limit in buckets.items():
+                shard = self._shards[hash(key) % len(self._shards)]
+                tokens, updated_at = shard.buckets.get(key, (limit.capacity, now))
+                refilled[key], _ = take(tokens, updated_at, now, limit, 0.0)
+                _, retry_after = take(refilled[key], now, now, limit, cost)
+                if retry_after > 0:
+                    waits[key] = retry_after
+            
+            for key, tokens in refilled.items():
+                shard = self._shards[hash(key) % len(self._shards)]
+                shard.buckets[key] = (tokens if waits else tokens - cost, now)
+                shard.buckets.move_to_end(key)
+                if len(shard.buckets) > shard.max_keys:
+                    shard.buckets.popitem(last=False)
+        finally:
+            for index in reversed(shards):
+                self._shards[index].lock.release()
+        return waits
+    
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
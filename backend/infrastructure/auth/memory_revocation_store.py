@@ -0,0 +1,39 @@
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+class InMemoryRevocationStore:
+    """In-process IRevocationStore - entries disappear once the revoked token would have expired"""
+    
+    def __init__(self):
+        # jti -> (expires_at, revoked_at) as epoch seconds
+        self._entries: Dict[str, Tuple[float, float]] = {}
+    
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Revoke a token ID until the token's own expiry"""
+        self._entries[jti] = (expires_at.timestamp(), time.time())
+    
+    async def is_revoked(self, jti: str) -> bool:
+        """Check whether a token ID is revoked and not yet expired"""
+        entry = self._entries.get(jti)
+        if not entry:
+            return False
+        
+        if entry[0] <= time.time():
+            del self._entries[jti]
+            return False
+        
+        return True
+    
+    async def list_active(self, since: Optional[datetime] = None) -> List[str]:
+        """List unexpired revoked token IDs, optionally only those revoked after since"""
+        now = time.time()
+        for jti in [jti for jti, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[jti]
+        
+        since_ts = since.timestamp() if since else None
+        return [
+            jti for jti, (_, revoked_at) in self._entries.items()
+            if since_ts is None or revoked_at > since_ts
+        ]
@@ -0,0 +1,129 @@
+import time
+from typing import Any, Dict, List, Optional
+from core.models.content import BlobReference
+
+
+class DynamoDBBlobReferenceStore:
+    """IBlobReferenceStore as conditional counters in the gallery table
+    
+    One item per blob, keyed by pk "BLOB#<sha256>", with numeric refs, generation and ingested_at
+    attributes, and a deleting attribute (claim time) while the blob is being deleted. Every change is
+    a single conditional UpdateItem, so a reference can never land on content that is being deleted and
+    a release can never delete content that was referenced or re-ingested in the meantime.
+    """
+    
+    def __init__(self, client: Any, table_name: str):
+        self.client = client  # aioboto3 / aiobotocore DynamoDB client
+        self.table_name = table_name
+    
+    async def register(self, content_hash: str) -> bool:
+        """Record freshly ingested content, keeping any existing count; False while it is being deleted"""
+        return await self._update(
+            content_hash,
+            "SET refs = if_not_exists(refs, :zero), ingested_at = :now ADD generation :one",
+            "attribute_not_exists(deleting)",
+            {":zero": {"N": "0"}, ":one": {"N": "1"}, ":now": {"N": str(time.time())}}
+        ) is not None
+    
+    async def increment(self, content_hash: str) -> Optional[int]:
+        """Add a reference and return the new count; None if the content is not registered"""
+        reference = await self._update(
+            content_hash,
+            "ADD refs :one",
+            "attribute_exists(pk) AND attribute_not_exists(deleting)",
+            {":one": {"N": "1"}}
+        )
+        return reference.refs if reference else None
+    
+    async def decrement(self, content_hash: str) -> Optional[BlobReference]:
+        """Drop a reference and return the updated record; None if there was no reference to drop"""
+        return await self._update(
+            content_hash,
+            "ADD refs :minus_one",
+            "refs > :zero",
+            {":minus_one": {"N": "-1"}, ":zero": {"N": "0"}}
+        )
+    
+    async def claim(self, reference: BlobReference) -> bool:
+        """Mark unreferenced content for deletion, unless it was referenced or re-ingested since read"""
+        values = {":zero": {"N": "0"}, ":now": {"N": str(time.time())}}
+        if reference.generation:
+            generation = "generation = :generation"
+            values[":generation"] = {"N": str(reference.generation)}
+        else:
+            generation = "attribute_not_exists(generation)"  # counted before ingests were registered
+        return await self._update(
+            reference.content_hash,
+            "SET deleting = :now",
+            f"refs = :zero AND {generation} AND attribute_not_exists(deleting)",
+            values
+        ) is not None
+    
+    async def remove(self, content_hash: str) -> None:
+        """Forget claimed content once its blob is deleted"""
+        await self.client.delete_item(TableName=self.table_name, Key={"pk": {"S": f"BLOB#{content_hash}"}})
+    
+    async def list_unreferenced(self, ingested_before: float) -> List[BlobReference]:
+        """Content with no references, last ingested before the given epoch seconds
+        
+        A Scan of the whole table - only the scheduled sweep calls this, never a request.
+        """
+        scan_kwargs: Dict[str, Any] = {
+            "TableName": self.table_name,
+            "FilterExpression": "begins_with(pk, :prefix) AND refs = :zero AND ingested_at < :before",
+            "ExpressionAttributeValues": {
+                ":prefix": {"S": "BLOB#"},
+                ":zero": {"N": "0"},
+                ":before": {"N": str(ingested_before)},
+            },
+        }
+        
+        references: List[BlobReference] = []
+        while True:
+            response = await self.client.scan(**scan_kwargs)
+            references.extend(self._reference(item) for item in response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return references
+            scan_kwargs["ExclusiveStartKey"] = last_key
+    
+    async def count(self, content_hash: str) -> int:
+        """Current reference count"""
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"BLOB#{content_hash}"}},
+            ProjectionExpression="refs"
+        )
+        item = response.get("Item")
+        return int(item["refs"]["N"]) if item else 0
+    
+    async def _update(
+        self,
+        content_hash: str,
+        expression: str,
+        condition: str,
+        values: Dict[str, Any]
+    ) -> Optional[BlobReference]:
+        """Conditional UpdateItem returning the new record, None when the condition fails"""
+        try:
+            response = await self.client.update_item(
+                TableName=self.table_name,
+                Key={"pk": {"S": f"BLOB#{content_hash}"}},
+                UpdateExpression=expression,
+                ConditionExpression=condition,
+                ExpressionAttributeValues=values,
+                ReturnValues="ALL_NEW"
+            )
+        except self.client.exceptions.ConditionalCheckFailedException:
+            return None
+        return self._reference(response["Attributes"])
+    
+    @staticmethod
+    def _reference(item: Dict[str, Any]) -> BlobReference:
+        return BlobReference(
+            content_hash=item["pk"]["S"].removeprefix("BLOB#"),
+            refs=int(item.get("refs", {}).get("N", 0)),
+            generation=int(item.get("generation", {}).get("N", 0)),
+            ingested_at=float(item.get("ingested_at", {}).get("N", 0)),
+            deleting="deleting" in item
+        )
@@ -0,0 +1,71 @@
+from typing import Any, Optional
+from core.models.blog import BlogPost, BlogPostPage, BlogPostSummary, post_sort_key
+from infrastructure.database.dynamodb_gallery_repository import ALL_INDEX, _from_item, _to_item
+from shared.utils.cursor import decode_start_key, encode_cursor
+
+
+# Listings only need the summary - bodies and rendered HTML stay on the table
+SUMMARY_ATTRIBUTES = ("id", "title", "summary", "tags", "version", "created_at", "updated_at")
+
+
+class DynamoDBBlogRepository:
+    """IBlogRepository on the blog DynamoDB table
+    
+    Posts are keyed by pk "POST#<id>" and carry entity "POST" and sort_key ("<created_at>#<id>"), so
+    listings are a projected Query against an entity GSI laid out like the gallery table's.
+    """
+    
+    def __init__(self, client: Any, table_name: str):
+        self.client = client  # aioboto3 / aiobotocore DynamoDB client
+        self.table_name = table_name
+    
+    async def get_post(self, post_id: str) -> Optional[BlogPost]:
+        """Get post by ID"""
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"POST#{post_id}"}}
+        )
+        item = response.get("Item")
+        return BlogPost(**_from_item(item)) if item else None
+    
+    async def list_posts(self, limit: int = 20, cursor: Optional[str] = None) -> BlogPostPage:
+        """List posts newest first with a keyset Query against the entity GSI"""
+        query: dict = {}
+        if cursor:
+            query["ExclusiveStartKey"] = decode_start_key(cursor, {"entity": "POST"}, "POST#")
+        
+        response = await self.client.query(
+            TableName=self.table_name,
+            IndexName=ALL_INDEX,
+            KeyConditionExpression="entity = :partition",
+            ExpressionAttributeValues={":partition": {"S": "POST"}},
+            # Names are aliased - version is a DynamoDB reserved word
+            ProjectionExpression=", ".join(f"#{name}" for name in SUMMARY_ATTRIBUTES),
+            ExpressionAttributeNames={f"#{name}": name for name in SUMMARY_ATTRIBUTES},
+            ScanIndexForward=False,
+            Limit=limit,
+            **query
+        )
+        
+        last_key = response.get("LastEvaluatedKey")
+        return BlogPostPage(
+            items=[BlogPostSummary(**_from_item(item)) for item in response.get("Items", [])],
+            next_cursor=encode_cursor(last_key) if last_key else None
+        )
+    
+    async def save_post(self, post: BlogPost) -> BlogPost:
+        """Create or replace post"""
+        await self.client.put_item(
+            TableName=self.table_name,
+            Item=_to_item(post, pk=f"POST#{post.id}", entity="POST", sort_key=post_sort_key(post))
+        )
+        return post
+    
+    async def delete_post(self, post_id: str) -> bool:
+        """Delete post"""
+        response = await self.client.delete_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"POST#{post_id}"}},
+            ReturnValues="ALL_OLD"
+        )
+        return bool(response.get("Attributes"))
@@ -0,0 +1,171 @@
+import asyncio
+import json
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from pydantic import BaseModel
+from core.models.gallery import Gallery, GalleryCategory, GalleryImage, GalleryPage, gallery_sort_key
+from shared.utils.cursor import decode_start_key, encode_cursor
+
+
+CATEGORY_INDEX = "category-index"  # partition: category, sort: sort_key
+ALL_INDEX = "entity-index"  # partition: entity, sort: sort_key
+BATCH_GET_LIMIT = 100  # DynamoDB BatchGetItem maximum keys per request
+MAX_UNPROCESSED_RETRIES = 5
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _to_item(model: BaseModel, **extra: Any) -> Dict[str, Any]:
+    """Model to DynamoDB attribute map (floats become Decimal as DynamoDB requires)"""
+    data = json.loads(model.model_dump_json(), parse_float=Decimal)
+    data.update(extra)
+    return {key: _serializer.serialize(value) for key, value in data.items() if value is not None}
+
+
+def _from_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """DynamoDB attribute map to plain dict"""
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
+
+
+class DynamoDBGalleryRepository:
+    """IGalleryRepository on a single DynamoDB table
+    
+    Items are keyed by pk ("GALLERY#<id>" / "IMAGE#<id>"). Galleries also carry category, entity and
+    sort_key ("<created_at>#<id>") for the two GSIs, so listings are a Query that reads one page and
+    never a Scan. Cursors are the opaque, base64-encoded LastEvaluatedKey.
+    """
+    
+    def __init__(self, client: Any, table_name: str):
+        self.client = client  # aioboto3 / aiobotocore DynamoDB client
+        self.table_name = table_name
+    
+    async def get_gallery(self, gallery_id: str) -> Optional[Gallery]:
+        """Get gallery by ID"""
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"GALLERY#{gallery_id}"}}
+        )
+        item = response.get("Item")
+        return Gallery(**_from_item(item)) if item else None
+    
+    async def get_gallery_version(self, gallery_id: str) -> Optional[int]:
+        """Get only the gallery version - projected read, no image lookups"""
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"GALLERY#{gallery_id}"}},
+            ProjectionExpression="#version",
+            ExpressionAttributeNames={"#version": "version"}
+        )
+        item = response.get("Item")
+        return int(item["version"]["N"]) if item else None
+    
+    async def list_galleries(
+        self,
+        category: Optional[GalleryCategory] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> GalleryPage:
+        """List galleries newest first with a keyset Query against a GSI"""
+        if category:
+            query: Dict[str, Any] = {
+                "IndexName": CATEGORY_INDEX,
+                "KeyConditionExpression": "category = :partition",
+                "ExpressionAttributeValues": {":partition": {"S": category.value}},
+            }
+            partition_attribute, partition_value = "category", category.value
+        else:
+            query = {
+                "IndexName": ALL_INDEX,
+                "KeyConditionExpression": "entity = :partition",
+                "ExpressionAttributeValues": {":partition": {"S": "GALLERY"}},
+            }
+            partition_attribute, partition_value = "entity", "GALLERY"
+        
+        if cursor:
+            query["ExclusiveStartKey"] = decode_start_key(cursor, {partition_attribute: partition_value}, "GALLERY#")
+        
+        response = await self.client.query(
+            TableName=self.table_name,
+            ScanIndexForward=False,
+            Limit=limit,
+            **query
+        )
+        
+        last_key = response.get("LastEvaluatedKey")
+        return GalleryPage(
+            items=[Gallery(**_from_item(item)) for item in response.get("Items", [])],
+            next_cursor=encode_cursor(last_key) if last_key else None
+        )
+    
+    async def save_gallery(self, gallery: Gallery) -> Gallery:
+        """Create or replace gallery"""
+        await self.client.put_item(
+            TableName=self.table_name,
+            Item=_to_item(
+                gallery,
+                pk=f"GALLERY#{gallery.id}",
+                entity="GALLERY",
+                sort_key=gallery_sort_key(gallery)
+            )
+        )
+        return gallery
+    
+    async def delete_gallery(self, gallery_id: str) -> bool:
+        """Delete gallery"""
+        response = await self.client.delete_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"GALLERY#{gallery_id}"}},
+            ReturnValues="ALL_OLD"
+        )
+        return bool(response.get("Attributes"))
+    
+    async def get_images(self, image_ids: List[str]) -> List[GalleryImage]:
+        """Get images with BatchGetItem - chunks of 100 fetched concurrently, order preserved"""
+        unique_ids = list(dict.fromkeys(image_ids))
+        chunks = [unique_ids[i:i + BATCH_GET_LIMIT] for i in range(0, len(unique_ids), BATCH_GET_LIMIT)]
+        results = await asyncio.gather(*(self._batch_get_images(chunk) for chunk in chunks))
+        
+        images_by_id: Dict[str, GalleryImage] = {}
+        for chunk_images in results:
+            images_by_id.update(chunk_images)
+        return [images_by_id[image_id] for image_id in image_ids if image_id in images_by_id]
+    
+    async def save_image(self, image: GalleryImage) -> GalleryImage:
+        """Create or replace image"""
+        await self.client.put_item(
+            TableName=self.table_name,
+            Item=_to_item(image, pk=f"IMAGE#{image.id}", entity="IMAGE")
+        )
+        return image
+    
+    async def delete_image(self, image_id: str) -> bool:
+        """Delete image"""
+        response = await self.client.delete_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"IMAGE#{image_id}"}},
+            ReturnValues="ALL_OLD"
+        )
+        return bool(response.get("Attributes"))
+    
+    async def _batch_get_images(self, image_ids: List[str]) -> Dict[str, GalleryImage]:
+        """One BatchGetItem call, retrying UnprocessedKeys with exponential backoff"""
+        request_items = {
+            self.table_name: {"Keys": [{"pk": {"S": f"IMAGE#{image_id}"}} for image_id in image_ids]}
+        }
+        images: Dict[str, GalleryImage] = {}
+        
+        for attempt in range(MAX_UNPROCESSED_RETRIES + 1):
+            response = await self.client.batch_get_item(RequestItems=request_items)
+            for item in response.get("Responses", {}).get(self.table_name, []):
+                data = _from_item(item)
+                images[data["id"]] = GalleryImage(**data)
+            
+            request_items = response.get("UnprocessedKeys") or {}
+            if not request_items:
+                return images
+            if attempt < MAX_UNPROCESSED_RETRIES:
+                await asyncio.sleep(0.05 * 2 ** attempt)
+        
+        raise RuntimeError(f"BatchGetItem left keys unprocessed after {MAX_UNPROCESSED_RETRIES} retries")
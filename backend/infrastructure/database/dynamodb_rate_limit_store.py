@@ -0,0 +1,91 @@
+import math
+import time
+from typing import Any, Dict, List, Mapping, Optional
+from shared.utils.token_bucket import RateLimit, take
+
+
+class DynamoDBRateLimitStore:
+    """IRateLimitStore on a DynamoDB table, so limits hold across every Lambda instance
+    
+    Table layout: partition key key (S), tokens (N), updated_at (N, epoch seconds), expires_at (N, TTL
+    attribute - the time the bucket would be full again). Each consume is a strongly consistent read
+    and a write conditioned on the updated_at it read; on a lost race the bucket is re-read, and after
+    max_attempts the call is treated as limited rather than letting a burst through.
+    """
+    
+    def __init__(self, client: Any, table_name: str, max_attempts: int = 3):
+        self.client = client  # aioboto3 / aiobotocore DynamoDB client
+        self.table_name = table_name
+        self.max_attempts = max_attempts
+    
+    async def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        """Take cost tokens from the key's bucket; seconds to wait when it is empty, 0 when allowed"""
+        return (await self.consume_all({key: limit}, cost)).get(key, 0.0)
+    
+    async def consume_all(self, buckets: Mapping[str, RateLimit], cost: float = 1.0) -> Dict[str, float]:
+        """Take cost tokens from every bucket or from none; the wait for each short bucket, empty when allowed
+        
+        Several buckets are written in one transaction, each put conditioned as for a single bucket.
+        """
+        for _ in range(self.max_attempts):
+            now = time.time()
+            puts: List[Dict[str, Any]] = []
+            waits: Dict[str, float] = {}
+            for key, limit in buckets.items():
+                response = await self.client.get_item(
+                    TableName=self.table_name,
+                    Key={"key": {"S": key}},
+                    ConsistentRead=True
+                )
+                item = response.get("Item")
+                if item:
+                    previous = item["updated_at"]["N"]
+                    tokens, updated_at = float(item["tokens"]["N"]), float(previous)
+                else:
+                    previous = None
+                    tokens, updated_at = limit.capacity, now
+                
+                tokens, retry_after = take(tokens, updated_at, now, limit, cost)
+                if retry_after > 0:
+                    waits[key] = retry_after
+                puts.append(self._put(key, tokens, now, limit, previous))
+            
+            if waits:
+                return waits
+            if len(puts) == 1:
+                try:
+                    await self.client.put_item(**puts[0])
+                    return {}
+                except self.client.exceptions.ConditionalCheckFailedException:
+                    continue
+            try:
+                await self.client.transact_write_items(TransactItems=[{"Put": put} for put in puts])
+                return {}
+            except self.client.exceptions.TransactionCanceledException:
+                continue
+        
+        return {key: 1 / limit.refill_per_second for key, limit in buckets.items()}
+    
+    def _put(self, key: str, tokens: float, now: float, limit: RateLimit, previous: Optional[str]) -> Dict[str, Any]:
+        """Put of the bucket's new state, conditioned on the updated_at it was read at (or on it not existing)"""
+        full_at = now + (limit.capacity - tokens) / limit.refill_per_second
+        if previous is None:
+            condition = {
+                "ConditionExpression": "attribute_not_exists(#key)",
+                "ExpressionAttributeNames": {"#key": "key"},
+            }
+        else:
+            condition = {
+                "ConditionExpression": "updated_at = :previous",
+                "ExpressionAttributeValues": {":previous": {"N": previous}},
+            }
+        return {
+            "TableName": self.table_name,
+            "Item": {
+                "key": {"S": key},
+                "tokens": {"N": repr(tokens)},
+                "updated_at": {"N": repr(now)},
+                "expires_at": {"N": str(math.ceil(full_at))},
+            },
+            **condition,
+        }
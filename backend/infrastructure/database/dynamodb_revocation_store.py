@@ -0,0 +1,64 @@
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class DynamoDBRevocationStore:
+    """IRevocationStore on a DynamoDB table with TTL enabled on the expires_at attribute
+    
+    Table layout: partition key jti (S), expires_at (N, epoch seconds, TTL attribute), revoked_at (N).
+    DynamoDB TTL deletion is lazy, so expiry is also checked on read.
+    """
+    
+    def __init__(self, client: Any, table_name: str):
+        self.client = client  # aioboto3 / aiobotocore DynamoDB client
+        self.table_name = table_name
+    
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Revoke a token ID until the token's own expiry"""
+        await self.client.put_item(
+            TableName=self.table_name,
+            Item={
+                "jti": {"S": jti},
+                "expires_at": {"N": str(int(expires_at.timestamp()))},
+                "revoked_at": {"N": str(time.time())},
+            }
+        )
+    
+    async def is_revoked(self, jti: str) -> bool:
+        """Check whether a token ID is revoked and not yet expired"""
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key={"jti": {"S": jti}},
+            ProjectionExpression="expires_at"
+        )
+        item = response.get("Item")
+        if not item:
+            return False
+        
+        return float(item["expires_at"]["N"]) > time.time()
+    
+    async def list_active(self, since: Optional[datetime] = None) -> List[str]:
+        """List unexpired revoked token IDs, optionally only those revoked after since"""
+        filter_expression = "expires_at > :now"
+        values: Dict[str, Any] = {":now": {"N": str(int(time.time()))}}
+        if since:
+            filter_expression += " AND revoked_at > :since"
+            values[":since"] = {"N": str(since.timestamp())}
+        
+        scan_kwargs: Dict[str, Any] = {
+            "TableName": self.table_name,
+            "ProjectionExpression": "jti",
+            "FilterExpression": filter_expression,
+            "ExpressionAttributeValues": values,
+            "ConsistentRead": True,  # a sync must see revocations written just before it
+        }
+        
+        jtis: List[str] = []
+        while True:
+            response = await self.client.scan(**scan_kwargs)
+            jtis.extend(item["jti"]["S"] for item in response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return jtis
+            scan_kwargs["ExclusiveStartKey"] = last_key
@@ -0,0 +1,41 @@
+import time
+from typing import Any, Optional
+from core.models.upload import UploadResult
+
+
+class DynamoDBUploadRecordStore:
+    """IUploadRecordStore in the gallery table
+    
+    One item per upload, keyed by pk "UPLOAD#<key>", holding the UploadResult as JSON. Records are only
+    needed while the client polls for the result, so they expire through the expires_at TTL attribute.
+    """
+    
+    def __init__(self, client: Any, table_name: str, ttl_seconds: int = 7 * 24 * 3600):
+        self.client = client  # aioboto3 / aiobotocore DynamoDB client
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+    
+    async def save(self, upload_key: str, result: UploadResult) -> None:
+        """Record (or replace) the state of an upload"""
+        await self.client.put_item(
+            TableName=self.table_name,
+            Item={
+                "pk": {"S": f"UPLOAD#{upload_key}"},
+                "result": {"S": result.model_dump_json()},
+                "expires_at": {"N": str(int(time.time()) + self.ttl_seconds)},
+            }
+        )
+    
+    async def get(self, upload_key: str) -> Optional[UploadResult]:
+        """State of an upload, None if it was never completed or has expired"""
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key={"pk": {"S": f"UPLOAD#{upload_key}"}},
+            ProjectionExpression="#result, expires_at",
+            ExpressionAttributeNames={"#result": "result"}
+        )
+        item = response.get("Item")
+        # TTL deletion is lazy, so expiry is also checked on read
+        if not item or float(item["expires_at"]["N"]) <= time.time():
+            return None
+        return UploadResult.model_validate_json(item["result"]["S"])
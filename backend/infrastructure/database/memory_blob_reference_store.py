@@ -0,0 +1,64 @@
+import time
+from typing import Dict, List, Optional
+from core.models.content import BlobReference
+
+
+class InMemoryBlobReferenceStore:
+    """In-process IBlobReferenceStore (each operation runs without awaiting, so it is atomic)"""
+    
+    def __init__(self):
+        self._references: Dict[str, BlobReference] = {}
+    
+    async def register(self, content_hash: str) -> bool:
+        """Record freshly ingested content, keeping any existing count; False while it is being deleted"""
+        reference = self._references.get(content_hash)
+        if reference is None:
+            reference = self._references[content_hash] = BlobReference(
+                content_hash=content_hash, refs=0, generation=0, ingested_at=0
+            )
+        elif reference.deleting:
+            return False
+        reference.generation += 1
+        reference.ingested_at = time.time()
+        return True
+    
+    async def increment(self, content_hash: str) -> Optional[int]:
+        """Add a reference and return the new count; None if the content is not registered"""
+        reference = self._references.get(content_hash)
+        if reference is None or reference.deleting:
+            return None
+        reference.refs += 1
+        return reference.refs
+    
+    async def decrement(self, content_hash: str) -> Optional[BlobReference]:
+        """Drop a reference and return the updated record; None if there was no reference to drop"""
+        reference = self._references.get(content_hash)
+        if reference is None or reference.refs <= 0:
+            return None
+        reference.refs -= 1
+        return reference.model_copy()
+    
+    async def claim(self, reference: BlobReference) -> bool:
+        """Mark unreferenced content for deletion, unless it was referenced or re-ingested since read"""
+        current = self._references.get(reference.content_hash)
+        if current is None or current.deleting or current.refs or current.generation != reference.generation:
+            return False
+        current.deleting = True
+        return True
+    
+    async def remove(self, content_hash: str) -> None:
+        """Forget claimed content once its blob is deleted"""
+        self._references.pop(content_hash, None)
+    
+    async def list_unreferenced(self, ingested_before: float) -> List[BlobReference]:
+        """Content with no references, last ingested before the given epoch seconds"""
+        return [
+            reference.model_copy()
+            for reference in self._references.values()
+            if reference.refs == 0 and reference.ingested_at < ingested_before
+        ]
+    
+    async def count(self, content_hash: str) -> int:
+        """Current reference count"""
+        reference = self._references.get(content_hash)
+        return reference.refs if reference else 0
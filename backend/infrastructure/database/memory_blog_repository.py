@@ -0,0 +1,64 @@
+import bisect
+from typing import Dict, List, Optional
+from core.models.blog import BlogPost, BlogPostPage, BlogPostSummary, post_sort_key
+from shared.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class InMemoryBlogRepository:
+    """In-process IBlogRepository with the same keyset-cursor semantics as the DynamoDB one"""
+    
+    def __init__(self):
+        self._posts: Dict[str, BlogPost] = {}
+        self._sort_keys: List[str] = []  # ascending
+    
+    async def get_post(self, post_id: str) -> Optional[BlogPost]:
+        """Get post by ID"""
+        return self._posts.get(post_id)
+    
+    async def list_posts(self, limit: int = 20, cursor: Optional[str] = None) -> BlogPostPage:
+        """List posts newest first, one keyset page at a time"""
+        end = len(self._sort_keys)
+        if cursor:
+            position = decode_cursor(cursor)
+            if set(position) != {"sort_key"}:
+                raise InvalidCursorError("Cursor does not belong to this listing")
+            end = bisect.bisect_left(self._sort_keys, position["sort_key"])
+        
+        start = max(end - limit, 0)
+        page_keys = self._sort_keys[start:end][::-1]
+        items = [
+            BlogPostSummary(**self._posts[sort_key.rsplit("#", 1)[1]].model_dump())
+            for sort_key in page_keys
+        ]
+        
+        next_cursor = None
+        if start > 0 and page_keys:
+            next_cursor = encode_cursor({"sort_key": page_keys[-1]})
+        
+        return BlogPostPage(items=items, next_cursor=next_cursor)
+    
+    async def save_post(self, post: BlogPost) -> BlogPost:
+        """Create or replace post"""
+        existing = self._posts.get(post.id)
+        if existing:
+            self._unindex(existing)
+        
+        self._posts[post.id] = post
+        bisect.insort(self._sort_keys, post_sort_key(post))
+        return post
+    
+    async def delete_post(self, post_id: str) -> bool:
+        """Delete post"""
+        post = self._posts.pop(post_id, None)
+        if not post:
+            return False
+        
+        self._unindex(post)
+        return True
+    
+    def _unindex(self, post: BlogPost) -> None:
+        """Remove post from the sorted index"""
+        sort_key = post_sort_key(post)
+        position = bisect.bisect_left(self._sort_keys, sort_key)
+        if position < len(self._sort_keys) and self._sort_keys[position] == sort_key:
+            del self._sort_keys[position]
@@ -0,0 +1,94 @@
+import bisect
+from typing import Dict, List, Optional
+from core.models.gallery import Gallery, GalleryCategory, GalleryImage, GalleryPage, gallery_sort_key
+from shared.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class InMemoryGalleryRepository:
+    """In-process IGalleryRepository with the same keyset-cursor semantics as the DynamoDB one"""
+    
+    def __init__(self):
+        self._galleries: Dict[str, Gallery] = {}
+        self._images: Dict[str, GalleryImage] = {}
+        # Ascending sort keys per category, plus None for all galleries - pages are bisected, never scanned
+        self._sort_keys: Dict[Optional[GalleryCategory], List[str]] = {None: []}
+    
+    async def get_gallery(self, gallery_id: str) -> Optional[Gallery]:
+        """Get gallery by ID"""
+        return self._galleries.get(gallery_id)
+    
+    async def get_gallery_version(self, gallery_id: str) -> Optional[int]:
+        """Get only the gallery version"""
+        gallery = self._galleries.get(gallery_id)
+        return gallery.version if gallery else None
+    
+    async def list_galleries(
+        self,
+        category: Optional[GalleryCategory] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> GalleryPage:
+        """List galleries newest first, one keyset page at a time"""
+        sort_keys = self._sort_keys.get(category, [])
+        end = len(sort_keys)
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.get("category") != (category.value if category else None) or "sort_key" not in position:
+                raise InvalidCursorError("Cursor does not belong to this listing")
+            end = bisect.bisect_left(sort_keys, position["sort_key"])
+        
+        start = max(end - limit, 0)
+        page_keys = sort_keys[start:end][::-1]
+        items = [self._galleries[sort_key.rsplit("#", 1)[1]] for sort_key in page_keys]
+        
+        next_cursor = None
+        if start > 0 and page_keys:
+            next_cursor = encode_cursor({
+                "category": category.value if category else None,
+                "sort_key": page_keys[-1],
+            })
+        
+        return GalleryPage(items=items, next_cursor=next_cursor)
+    
+    async def save_gallery(self, gallery: Gallery) -> Gallery:
+        """Create or replace gallery"""
+        existing = self._galleries.get(gallery.id)
+        if existing:
+            self._unindex(existing)
+        
+        self._galleries[gallery.id] = gallery
+        sort_key = gallery_sort_key(gallery)
+        for index_key in (None, gallery.category):
+            bisect.insort(self._sort_keys.setdefault(index_key, []), sort_key)
+        return gallery
+    
+    async def delete_gallery(self, gallery_id: str) -> bool:
+        """Delete gallery"""
+        gallery = self._galleries.pop(gallery_id, None)
+        if not gallery:
+            return False
+        
+        self._unindex(gallery)
+        return True
+    
+    async def get_images(self, image_ids: List[str]) -> List[GalleryImage]:
+        """Get images in the requested order (missing IDs are skipped)"""
+        return [self._images[image_id] for image_id in image_ids if image_id in self._images]
+    
+    async def save_image(self, image: GalleryImage) -> GalleryImage:
+        """Create or replace image"""
+        self._images[image.id] = image
+        return image
+    
+    async def delete_image(self, image_id: str) -> bool:
+        """Delete image"""
+        return self._images.pop(image_id, None) is not None
+    
+    def _unindex(self, gallery: Gallery) -> None:
+        """Remove gallery from the sorted indexes"""
+        sort_key = gallery_sort_key(gallery)
+        for index_key in (None, gallery.category):
+            sort_keys = self._sort_keys.get(index_key, [])
+            position = bisect.bisect_left(sort_keys, sort_key)
+            if position < len(sort_keys) and sort_keys[position] == sort_key:
+                del sort_keys[position]
@@ -0,0 +1,18 @@
+from typing import Dict, Optional
+from core.models.upload import UploadResult
+
+
+class InMemoryUploadRecordStore:
+    """In-process IUploadRecordStore"""
+    
+    def __init__(self):
+        self._records: Dict[str, UploadResult] = {}
+    
+    async def save(self, upload_key: str, result: UploadResult) -> None:
+        """Record (or replace) the state of an upload"""
+        self._records[upload_key] = result.model_copy(deep=True)
+    
+    async def get(self, upload_key: str) -> Optional[UploadResult]:
+        """State of an upload, None if it was never completed"""
+        result = self._records.get(upload_key)
+        return result.model_copy(deep=True) if result else None
@@ -0,0 +1 @@
+# Latency-injectable stand-ins for remote backends (benchmarks, resilience tests)
@@ -0,0 +1,82 @@
+import asyncio
+import dataclasses
+import random
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, Optional
+from shared.utils.call_proxy import CallHook
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Delay and failure model of one remote dependency (milliseconds and per-call probabilities)"""
+    latency_ms: float = 0.0  # Every call
+    jitter_ms: float = 0.0  # Uniform 0..jitter on top
+    tail_rate: float = 0.0  # Fraction of calls that also take tail_ms (slow replicas, cold partitions)
+    tail_ms: float = 0.0
+    throttle_rate: float = 0.0  # Fraction rejected at once with SimulatedThrottlingError
+    error_rate: float = 0.0  # Fraction failing after the delay with SimulatedDependencyError
+    
+    def with_overrides(self, overrides: Mapping[str, float]) -> "LatencyProfile":
+        """Copy with some fields replaced (raises TypeError for unknown names)"""
+        return dataclasses.replace(self, **overrides)
+
+
+class SimulatedDependencyError(Exception):
+    """Injected failure standing in for a remote 5xx, timeout or reset connection"""
+    
+    def __init__(self, dependency: str, operation: str):
+        super().__init__(f"Simulated {dependency}.{operation} failure")
+        self.dependency = dependency
+        self.operation = operation
+
+
+class SimulatedThrottlingError(SimulatedDependencyError):
+    """Injected rejection standing in for DynamoDB / Cognito throttling"""
+
+
+class SimulatedLatency(CallHook):
+    """Makes an in-memory / local backend behave like its remote counterpart
+    
+    As a hook on a CallProxy around any repository or storage implementation, it delays every
+    coroutine call (and the first chunk of async iterators) by a draw from the profile, optionally
+    throttling or failing the call. The profile can be swapped at runtime to degrade a dependency
+    mid-run; with a seed the sequence of delays and failures is the same on every run.
+    """
+    streams = True
+    
+    def __init__(self, dependency: str, profile: LatencyProfile, seed: Optional[int] = None):
+        self.dependency = dependency
+        self.profile = profile
+        self.random = random.Random(f"{seed}:{dependency}" if seed is not None else None)
+        self.calls = 0
+        self.throttled = 0
+        self.failures = 0
+    
+    async def __call__(self, operation: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        await self._enter(operation)
+        return await call()
+    
+    def delay(self, profile: LatencyProfile) -> float:
+        """Seconds the next call waits"""
+        milliseconds = profile.latency_ms
+        if profile.jitter_ms:
+            milliseconds += self.random.uniform(0, profile.jitter_ms)
+        if profile.tail_rate and self.random.random() < profile.tail_rate:
+            milliseconds += profile.tail_ms
+        return milliseconds / 1000
+    
+    async def _enter(self, operation: str) -> None:
+        """Throttle, wait, or fail one call according to the current profile"""
+        profile = self.profile
+        self.calls += 1
+        if profile.throttle_rate and self.random.random() < profile.throttle_rate:
+            self.throttled += 1
+            raise SimulatedThrottlingError(self.dependency, operation)
+        
+        delay = self.delay(profile)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        if profile.error_rate and self.random.random() < profile.error_rate:
+            self.failures += 1
+            raise SimulatedDependencyError(self.dependency, operation)
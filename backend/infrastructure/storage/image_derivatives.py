@@ -0,0 +1,213 @@
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+from core.interfaces.blob_storage import IBlobStorage
+from core.models.gallery import ImageMetadata
+
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_PREFIX = "derivatives/"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"  # keys change with the content hash
+METADATA_FILENAME = "metadata.json"
+METADATA_SAMPLE_EDGE = 64  # Decode size when only the metadata is missing
+
+
+@dataclass(frozen=True)
+class DerivativeSpec:
+    """One rendition - longest edge in pixels, output format and encoder quality"""
+    name: str
+    max_edge: int
+    format: str  # Pillow format name
+    quality: int
+    
+    @property
+    def extension(self) -> str:
+        return self.format.lower()
+    
+    @property
+    def content_type(self) -> str:
+        return f"image/{self.extension}"
+    
+    @property
+    def filename(self) -> str:
+        return f"{self.name}.{self.extension}"
+
+
+DEFAULT_SPECS: Tuple[DerivativeSpec, ...] = (
+    DerivativeSpec("thumb", 320, "WEBP", 75),
+    DerivativeSpec("grid", 800, "WEBP", 80),
+    DerivativeSpec("grid", 800, "AVIF", 55),
+    DerivativeSpec("full", 2048, "WEBP", 85),
+    DerivativeSpec("full", 2048, "AVIF", 60),
+)
+
+
+def derivative_key(content_hash: str, spec: DerivativeSpec) -> str:
+    """Deterministic key - the same source always maps to the same renditions"""
+    return f"{DERIVATIVE_PREFIX}{content_hash}/{spec.filename}"
+
+
+def metadata_key(content_hash: str) -> str:
+    """Key of the extracted metadata, stored next to the renditions"""
+    return f"{DERIVATIVE_PREFIX}{content_hash}/{METADATA_FILENAME}"
+
+
+@lru_cache(maxsize=None)
+def supported_formats() -> FrozenSet[str]:
+    """Output formats this Pillow build can encode (AVIF needs libavif)"""
+    from PIL import features
+    formats = {"JPEG", "PNG"}
+    if features.check("webp"):
+        formats.add("WEBP")
+    if features.check("avif"):
+        formats.add("AVIF")
+    return frozenset(formats)
+
+
+def _decode_source(data: bytes, max_edge: int) -> Tuple[str, Tuple[int, int], bytes, Dict[str, Any]]:
+    """Worker: decode once, upright and no larger than the biggest rendition, as raw pixels plus metadata"""
+    from PIL import Image, ImageOps, UnidentifiedImageError
+    from infrastructure.storage.image_metadata import extract_metadata
+    try:
+        image = Image.open(io.BytesIO(data))
+        original_size, exif = image.size, image.getexif()
+        # JPEG DCT scaling decodes straight at a fraction of full size
+        image.draft("RGB", (max_edge, max_edge))
+        image = ImageOps.exif_transpose(image)
+    except (UnidentifiedImageError, Image.DecompressionBombError) as exc:
+        raise ValueError(f"Source is not a decodable image: {exc}") from None
+    
+    has_alpha = "A" in image.getbands() or "transparency" in image.info
+    mode = "RGBA" if has_alpha else "RGB"
+    if image.mode != mode:
+        image = image.convert(mode)
+    image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    return image.mode, image.size, image.tobytes(), extract_metadata(image, original_size, exif)
+
+
+def _render(mode: str, size: Tuple[int, int], pixels: bytes, spec: DerivativeSpec) -> bytes:
+    """Worker: resize the decoded pixels and encode one rendition"""
+    from PIL import Image
+    image = Image.frombytes(mode, size, pixels)
+    image.thumbnail((spec.max_edge, spec.max_edge), Image.Resampling.LANCZOS)  # never upscales
+    if spec.format == "JPEG" and image.mode == "RGBA":
+        image = image.convert("RGB")
+    
+    buffer = io.BytesIO()
+    image.save(buffer, format=spec.format, quality=spec.quality)
+    return buffer.getvalue()
+
+
+class DerivativeGenerator:
+    """Thumbnail and responsive renditions of uploaded images, rendered on a worker pool
+    
+    The source is decoded once in a worker, which also extracts the image metadata. Its pixels are
+    then fanned out to one resize/encode task per missing rendition. Renditions and metadata.json are
+    stored under derivatives/<content hash>/, so an image that was already processed costs only a few
+    existence checks.
+    """
+    
+    def __init__(
+        self,
+        storage: IBlobStorage,
+        specs: Sequence[DerivativeSpec] = DEFAULT_SPECS,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ):
+        self.storage = storage
+        self.specs = tuple(specs)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+    
+    def planned(self, content_hash: str) -> Dict[str, str]:
+        """Filename -> key of the metadata and every rendition this Pillow build can encode"""
+        planned = {spec.filename: derivative_key(content_hash, spec) for spec in self._encodable_specs()}
+        planned[METADATA_FILENAME] = metadata_key(content_hash)
+        return planned
+    
+    async def get_metadata(self, content_hash: str) -> Optional[ImageMetadata]:
+        """Stored metadata, None until generate has run for this content"""
+        data = await self.storage.get(metadata_key(content_hash))
+        return ImageMetadata.model_validate_json(data) if data else None
+    
+    async def generate(self, source_key: str, content_hash: Optional[str] = None) -> Dict[str, str]:
+        """Create any missing renditions of the source and return filename -> key for all of them"""
+        data = None
+        if content_hash is None:
+            data = await self._read_source(source_key)
+            content_hash = (await asyncio.to_thread(hashlib.sha256, data)).hexdigest()
+        
+        specs = self._encodable_specs()
+        has_metadata, *exists = await asyncio.gather(
+            self.storage.exists(metadata_key(content_hash)),
+            *(self.storage.exists(derivative_key(content_hash, spec)) for spec in specs)
+        )
+        missing = [spec for spec, found in zip(specs, exists) if not found]
+        if not missing and has_metadata:
+            return self.planned(content_hash)
+        
+        if data is None:
+            data = await self._read_source(source_key)
+        
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        mode, size, pixels, metadata = await loop.run_in_executor(
+            executor, _decode_source, data, max((spec.max_edge for spec in missing), default=METADATA_SAMPLE_EDGE)
+        )
+        encoded: List[bytes] = await asyncio.gather(*(
+            loop.run_in_executor(executor, _render, mode, size, pixels, spec) for spec in missing
+        ))
+        
+        writes = [
+            self.storage.put(derivative_key(content_hash, spec), body, spec.content_type, IMMUTABLE_CACHE_CONTROL)
+            for spec, body in zip(missing, encoded)
+        ]
+        if not has_metadata:
+            writes.append(self.storage.put(
+                metadata_key(content_hash), json.dumps(metadata).encode(), "application/json", IMMUTABLE_CACHE_CONTROL
+            ))
+        await asyncio.gather(*writes)
+        return self.planned(content_hash)
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def _encodable_specs(self) -> List[DerivativeSpec]:
+        formats = supported_formats()
+        return [spec for spec in self.specs if spec.format in formats]
+    
+    async def _read_source(self, source_key: str) -> bytes:
+        data = await self.storage.get(source_key)
+        if data is None:
+            raise FileNotFoundError(source_key)
+        return data
+    
+    def _get_executor(self) -> Executor:
+        """Process pool sized to the cores, created on first use"""
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    # spawn: forking a process that runs an event loop and threads is unsafe
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                except OSError:
+                    # No /dev/shm (e.g. AWS Lambda) - Pillow releases the GIL while resizing and encoding
+                    logger.warning("Process pool unavailable, rendering image derivatives on threads")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-derivatives")
+        return self._executor
@@ -0,0 +1,125 @@
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+
+SAMPLE_EDGE = 64  # Metadata is computed on a buffer no larger than this
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+# EXIF tags worth showing next to artwork (tag id -> name)
+EXIF_TAGS = {
+    0x010F: "make",
+    0x0110: "model",
+    0x0131: "software",
+    0x0132: "datetime",
+    0x013B: "artist",
+    0x8298: "copyright",
+}
+EXIF_IFD_TAGS = {
+    0x9003: "datetime_original",
+    0x829A: "exposure_time",
+    0x829D: "f_number",
+    0x8827: "iso",
+    0x920A: "focal_length",
+    0xA434: "lens_model",
+}
+
+# sRGB byte -> linear light, one lookup instead of a pow per pixel
+_SRGB_TO_LINEAR = np.where(
+    np.arange(256) / 255 <= 0.04045,
+    np.arange(256) / 255 / 12.92,
+    ((np.arange(256) / 255 + 0.055) / 1.055) ** 2.4
+)
+
+
+def extract_metadata(image: Any, original_size: Tuple[int, int], exif: Any) -> Dict[str, Any]:
+    """Dimensions, EXIF, dominant color and blurhash of an upright (EXIF-transposed) Pillow image
+    
+    original_size and exif come from the file before draft decoding and transposing. Reported width
+    and height are the upright display size of the original.
+    """
+    orientation = int(exif.get(0x0112, 1)) if exif else 1
+    width, height = original_size
+    if orientation in (5, 6, 7, 8):  # 90 degree rotations swap the axes
+        width, height = height, width
+    
+    sample = image.copy()
+    sample.thumbnail((SAMPLE_EDGE, SAMPLE_EDGE))
+    pixels = np.asarray(sample.convert("RGBA"), dtype=np.uint8)
+    rgb = pixels[..., :3]
+    opaque = pixels[..., 3] >= 128
+    
+    x_components, y_components = (4, 3) if width >= height else (3, 4)
+    return {
+        "width": width,
+        "height": height,
+        "orientation": orientation,
+        "dominant_color": dominant_color(rgb, opaque),
+        "blurhash": blurhash(rgb, x_components, y_components),
+        "exif": _exif_fields(exif),
+    }
+
+
+def dominant_color(rgb: np.ndarray, mask: Optional[np.ndarray] = None) -> str:
+    """Mean color of the most populated 4-bit-per-channel histogram bin, as #rrggbb"""
+    colors = rgb.reshape(-1, 3)
+    if mask is not None and mask.any():
+        colors = colors[mask.reshape(-1)]
+    
+    quantized = colors >> 4
+    bins = (quantized[:, 0].astype(np.int32) << 8) | (quantized[:, 1].astype(np.int32) << 4) | quantized[:, 2]
+    winner = np.bincount(bins, minlength=4096).argmax()
+    red, green, blue = colors[bins == winner].mean(axis=0).round().astype(int)
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def blurhash(rgb: np.ndarray, x_components: int = 4, y_components: int = 3) -> str:
+    """BlurHash of an sRGB pixel array (https://blurha.sh), every basis projected in one einsum"""
+    height, width = rgb.shape[:2]
+    linear = _SRGB_TO_LINEAR[rgb]
+    
+    basis_x = np.cos(np.pi * np.arange(x_components)[:, None] * np.arange(width)[None, :] / width)
+    basis_y = np.cos(np.pi * np.arange(y_components)[:, None] * np.arange(height)[None, :] / height)
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    factors[1:, :] *= 2
+    factors[0, 1:] *= 2
+    factors = factors.reshape(-1, 3)
+    
+    dc, ac = factors[0], factors[1:]
+    result = _base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if len(ac):
+        quantized_max = int(max(0, min(82, np.floor(np.abs(ac).max() * 166 - 0.5))))
+        max_value = (quantized_max + 1) / 166
+    else:
+        quantized_max, max_value = 0, 1
+    result += _base83(quantized_max, 1)
+    
+    red, green, blue = (_linear_to_srgb(channel) for channel in dc)
+    result += _base83((red << 16) + (green << 8) + blue, 4)
+    
+    scaled = np.sign(ac) * np.sqrt(np.abs(ac / max_value))
+    quantized = np.clip(np.floor(scaled * 9 + 9.5), 0, 18).astype(int)
+    for red, green, blue in quantized:
+        result += _base83(red * 19 * 19 + green * 19 + blue, 2)
+    return result
+
+
+def _linear_to_srgb(value: float) -> int:
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _base83(value: int, length: int) -> str:
+    return "".join(BASE83[(int(value) // 83 ** (length - position - 1)) % 83] for position in range(length))
+
+
+def _exif_fields(exif: Any) -> Dict[str, str]:
+    """Selected EXIF fields as display strings"""
+    if not exif:
+        return {}
+    
+    fields = {name: exif.get(tag) for tag, name in EXIF_TAGS.items()}
+    exif_ifd = exif.get_ifd(0x8769) if hasattr(exif, "get_ifd") else {}
+    fields.update({name: exif_ifd.get(tag) for tag, name in EXIF_IFD_TAGS.items()})
+    return {name: str(value).strip("\x00 ") for name, value in fields.items() if value not in (None, "", b"")}
@@ -0,0 +1,60 @@
+import asyncio
+import shutil
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+
+class LocalBlobStorage:
+    """Filesystem stand-in for S3BlobStorage (local development and tests)"""
+    
+    def __init__(self, root: Path):
+        self.root = Path(root)
+    
+    async def exists(self, key: str) -> bool:
+        """Check whether the file exists"""
+        return self._path(key).is_file()
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Read a whole file, None if it does not exist"""
+        path = self._path(key)
+        if not path.is_file():
+            return None
+        return await asyncio.to_thread(path.read_bytes)
+    
+    async def put(self, key: str, data: bytes, content_type: str, cache_control: Optional[str] = None) -> None:
+        """Write the file atomically (content type and cache control are not kept locally)"""
+        await asyncio.to_thread(self._write, self._path(key), data)
+    
+    async def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Read the file chunk by chunk"""
+        path = self._path(key)
+        if not path.is_file():
+            raise FileNotFoundError(key)
+        with path.open("rb") as source:
+            while chunk := await asyncio.to_thread(source.read, chunk_size):
+                yield chunk
+    
+    async def copy(self, source_key: str, destination_key: str) -> None:
+        """Copy the file"""
+        source, destination = self._path(source_key), self._path(destination_key)
+        if not source.is_file():
+            raise FileNotFoundError(source_key)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(shutil.copyfile, source, destination)
+    
+    async def delete(self, key: str) -> None:
+        """Delete the file if it exists"""
+        self._path(key).unlink(missing_ok=True)
+    
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Key escapes the storage root: {key}")
+        return path
+    
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_bytes(data)
+        temporary.replace(path)
@@ -0,0 +1,106 @@
+import asyncio
+import hashlib
+import json
+import shutil
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+from core.interfaces.upload_storage import UploadNotFoundError
+from core.models.upload import PendingUpload, UploadedPart
+
+
+class LocalUploadStorage:
+    """Filesystem stand-in for S3UploadStorage (local development and tests)
+    
+    Parts are written by put_part, which plays the role of the client's PUT to a presigned URL.
+    ETags follow S3: MD5 per part, and MD5-of-MD5s plus the part count for the assembled object.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.multipart_root = self.root / ".multipart"
+    
+    async def create_multipart_upload(self, key: str, content_type: str) -> str:
+        """Start a multipart upload and return its upload ID"""
+        upload_id = uuid.uuid4().hex
+        meta = {"key": key, "content_type": content_type, "initiated_at": datetime.now(timezone.utc).isoformat()}
+        await asyncio.to_thread(self._write_meta, upload_id, meta)
+        return upload_id
+    
+    async def presign_part(self, key: str, upload_id: str, part_number: int, expires_in: int) -> str:
+        """File URL of the part - there is no signing locally"""
+        self._upload_dir(upload_id)
+        return (self.multipart_root / upload_id / f"{part_number:05d}.part").resolve().as_uri()
+    
+    async def put_part(self, upload_id: str, part_number: int, data: bytes) -> str:
+        """Receive one part (what S3 does on the presigned PUT) and return its ETag"""
+        upload_dir = self._upload_dir(upload_id)
+        await asyncio.to_thread((upload_dir / f"{part_number:05d}.part").write_bytes, data)
+        return f'"{hashlib.md5(data).hexdigest()}"'
+    
+    async def list_parts(self, key: str, upload_id: str) -> List[UploadedPart]:
+        """Parts received so far, in part number order"""
+        return await asyncio.to_thread(self._list_parts, upload_id)
+    
+    async def complete_multipart_upload(self, key: str, upload_id: str, parts: List[UploadedPart]) -> str:
+        """Concatenate the parts into the final file and return its ETag"""
+        return await asyncio.to_thread(self._complete, key, upload_id, parts)
+    
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Discard the upload and its parts"""
+        await asyncio.to_thread(shutil.rmtree, self._upload_dir(upload_id))
+    
+    async def list_pending_uploads(self, initiated_before: datetime) -> List[PendingUpload]:
+        """Incomplete uploads started before the given time"""
+        if initiated_before.tzinfo is None:
+            initiated_before = initiated_before.replace(tzinfo=timezone.utc)
+        
+        pending = []
+        for meta_path in sorted(self.multipart_root.glob("*/meta.json")):
+            meta = json.loads(meta_path.read_text())
+            initiated_at = datetime.fromisoformat(meta["initiated_at"])
+            if initiated_at < initiated_before:
+                pending.append(PendingUpload(key=meta["key"], upload_id=meta_path.parent.name, initiated_at=initiated_at))
+        return pending
+    
+    def object_path(self, key: str) -> Path:
+        """Filesystem path of a completed object"""
+        return self.root / key
+    
+    def _upload_dir(self, upload_id: str) -> Path:
+        upload_dir = self.multipart_root / upload_id
+        if not (upload_dir / "meta.json").is_file():
+            raise UploadNotFoundError(upload_id)
+        return upload_dir
+    
+    def _write_meta(self, upload_id: str, meta: dict) -> None:
+        upload_dir = self.multipart_root / upload_id
+        upload_dir.mkdir(parents=True)
+        (upload_dir / "meta.json").write_text(json.dumps(meta))
+    
+    def _list_parts(self, upload_id: str) -> List[UploadedPart]:
+        return [
+            UploadedPart(part_number=int(path.stem), etag=f'"{hashlib.md5(path.read_bytes()).hexdigest()}"')
+            for path in sorted(self._upload_dir(upload_id).glob("*.part"))
+        ]
+    
+    def _complete(self, key: str, upload_id: str, parts: List[UploadedPart]) -> str:
+        upload_dir = self._upload_dir(upload_id)
+        received = {part.part_number: part.etag for part in self._list_parts(upload_id)}
+        ordered = sorted(parts, key=lambda part: part.part_number)
+        for part in ordered:
+            if received.get(part.part_number) != part.etag:
+                raise ValueError(f"Part {part.part_number} is missing or its ETag does not match")
+        
+        destination = self.object_path(key)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        combined = hashlib.md5()
+        with destination.open("wb") as output:
+            for part in ordered:
+                data = (upload_dir / f"{part.part_number:05d}.part").read_bytes()
+                output.write(data)
+                combined.update(hashlib.md5(data).digest())
+        
+        shutil.rmtree(upload_dir)
+        return f'"{combined.hexdigest()}-{len(ordered)}"'
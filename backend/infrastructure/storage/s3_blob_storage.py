@@ -0,0 +1,63 @@
+from typing import Any, AsyncIterator, Optional
+from botocore.exceptions import ClientError
+
+
+NOT_FOUND_CODES = ("404", "NoSuchKey", "NotFound")
+
+
+class S3BlobStorage:
+    """IBlobStorage on an S3 bucket"""
+    
+    def __init__(self, client: Any, bucket_name: str):
+        self.client = client  # aioboto3 / aiobotocore S3 client
+        self.bucket_name = bucket_name
+    
+    async def exists(self, key: str) -> bool:
+        """HEAD the object"""
+        try:
+            await self.client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in NOT_FOUND_CODES:
+                return False
+            raise
+        return True
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Read a whole object, None if it does not exist"""
+        try:
+            response = await self.client.get_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in NOT_FOUND_CODES:
+                return None
+            raise
+        async with response["Body"] as body:
+            return await body.read()
+    
+    async def put(self, key: str, data: bytes, content_type: str, cache_control: Optional[str] = None) -> None:
+        """Create or replace an object"""
+        extra = {"CacheControl": cache_control} if cache_control else {}
+        await self.client.put_object(Bucket=self.bucket_name, Key=key, Body=data, ContentType=content_type, **extra)
+    
+    async def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Stream the object body chunk by chunk"""
+        try:
+            response = await self.client.get_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in NOT_FOUND_CODES:
+                raise FileNotFoundError(key) from exc
+            raise
+        async with response["Body"] as body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+    
+    async def copy(self, source_key: str, destination_key: str) -> None:
+        """Server-side CopyObject (keeps content type and metadata)"""
+        await self.client.copy_object(
+            Bucket=self.bucket_name,
+            Key=destination_key,
+            CopySource={"Bucket": self.bucket_name, "Key": source_key}
+        )
+    
+    async def delete(self, key: str) -> None:
+        """Delete an object (S3 deletes are idempotent)"""
+        await self.client.delete_object(Bucket=self.bucket_name, Key=key)
@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from typing import Any, List
+from botocore.exceptions import ClientError
+from core.interfaces.upload_storage import UploadNotFoundError
+from core.models.upload import PendingUpload, UploadedPart
+
+
+# Completion errors caused by the reported part list rather than by S3
+INVALID_PARTS_ERRORS = ("InvalidPart", "InvalidPartOrder", "EntityTooSmall")
+
+
+class S3UploadStorage:
+    """IUploadStorage on S3 multipart uploads with presigned UploadPart URLs
+    
+    Image bytes go from the browser straight to S3; the API only signs URLs and completes the upload.
+    The bucket CORS configuration must allow PUT from the frontend and expose the ETag header.
+    """
+    
+    def __init__(self, client: Any, bucket_name: str):
+        self.client = client  # aioboto3 / aiobotocore S3 client
+        self.bucket_name = bucket_name
+    
+    async def create_multipart_upload(self, key: str, content_type: str) -> str:
+        """Start a multipart upload and return its upload ID"""
+        response = await self.client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            ContentType=content_type
+        )
+        return response["UploadId"]
+    
+    async def presign_part(self, key: str, upload_id: str, part_number: int, expires_in: int) -> str:
+        """Presigned UploadPart URL (signed locally, no request to S3)"""
+        return await self.client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": self.bucket_name,
+                "Key": key,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+            },
+            ExpiresIn=expires_in
+        )
+    
+    async def list_parts(self, key: str, upload_id: str) -> List[UploadedPart]:
+        """Parts received so far, following pagination"""
+        parts: List[UploadedPart] = []
+        request = {"Bucket": self.bucket_name, "Key": key, "UploadId": upload_id}
+        while True:
+            try:
+                response = await self.client.list_parts(**request)
+            except self.client.exceptions.NoSuchUpload as exc:
+                raise UploadNotFoundError(upload_id) from exc
+            
+            parts.extend(
+                UploadedPart(part_number=part["PartNumber"], etag=part["ETag"])
+                for part in response.get("Parts", [])
+            )
+            if not response.get("IsTruncated"):
+                return parts
+            request["PartNumberMarker"] = response["NextPartNumberMarker"]
+    
+    async def complete_multipart_upload(self, key: str, upload_id: str, parts: List[UploadedPart]) -> str:
+        """Assemble the parts into the final object and return its ETag"""
+        try:
+            response = await self.client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": part.part_number, "ETag": part.etag}
+                        for part in sorted(parts, key=lambda part: part.part_number)
+                    ]
+                }
+            )
+        except self.client.exceptions.NoSuchUpload as exc:
+            raise UploadNotFoundError(upload_id) from exc
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in INVALID_PARTS_ERRORS:
+                raise ValueError(exc.response["Error"].get("Message", "Invalid parts")) from exc
+            raise
+        return response["ETag"]
+    
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Abort the upload so S3 stops billing for its parts"""
+        try:
+            await self.client.abort_multipart_upload(Bucket=self.bucket_name, Key=key, UploadId=upload_id)
+        except self.client.exceptions.NoSuchUpload as exc:
+            raise UploadNotFoundError(upload_id) from exc
+    
+    async def list_pending_uploads(self, initiated_before: datetime) -> List[PendingUpload]:
+        """Incomplete uploads started before the given time, following pagination"""
+        if initiated_before.tzinfo is None:
+            initiated_before = initiated_before.replace(tzinfo=timezone.utc)
+        
+        pending: List[PendingUpload] = []
+        request = {"Bucket": self.bucket_name}
+        while True:
+            response = await self.client.list_multipart_uploads(**request)
+            pending.extend(
+                PendingUpload(key=upload["Key"], upload_id=upload["UploadId"], initiated_at=upload["Initiated"])
+                for upload in response.get("Uploads", [])
+                if upload["Initiated"] < initiated_before
+            )
+            if not response.get("IsTruncated"):
+                return pending
+            request["KeyMarker"] = response["NextKeyMarker"]
+            request["UploadIdMarker"] = response["NextUploadIdMarker"]
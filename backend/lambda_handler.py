@@ -0,0 +1,58 @@
+# AWS Lambda entry point (API Gateway -> Mangum -> FastAPI)
+#
+# Everything at module level runs once per execution environment during the Lambda INIT phase and is
+# reused by every warm invocation. Auth-only dependencies (python-jose, passlib) are imported lazily
+# by the code that needs them, so public requests never pay for them.
+# Guard the cold path with: python -m benchmarks.cold_start
+import asyncio
+from urllib.parse import unquote_plus
+from mangum import Mangum
+from core.services.upload_service import UPLOAD_PREFIX
+from main import app, start_container
+
+
+# One event loop per execution environment - loop-bound state (clients, pools) survives warm invocations
+_loop = asyncio.new_event_loop()
+
+# Container is built once during INIT; Lambda never delivers a shutdown, so it is simply reused
+_loop.run_until_complete(start_container(app))
+
+# lifespan="off": Mangum would otherwise run startup/shutdown on every invocation
+_handler = Mangum(app, lifespan="off")
+
+
+def handler(event, context):
+    """Lambda handler - reuses the app and its initialized state across warm invocations"""
+    # Mangum drives the request with asyncio.get_event_loop()
+    asyncio.set_event_loop(_loop)
+    return _handler(event, context)
+
+
+def cleanup_handler(event, context):
+    """Scheduled (EventBridge) handler - aborts stale incomplete uploads and deletes unreferenced content"""
+    container = app.state.container
+    aborted = _loop.run_until_complete(container.upload_service.cleanup_stale_uploads())
+    swept = _loop.run_until_complete(container.content_service.sweep_unreferenced())
+    return {"aborted": aborted, "swept": swept}
+
+
+def upload_event_handler(event, context):
+    """S3 ObjectCreated handler for the uploads/ prefix - content-addresses and renders completed uploads
+    
+    Runs outside any API request, so large images are not bound by the request deadline. A failure
+    raises, and Lambda's asynchronous retries deliver the event again.
+    """
+    upload_service = app.state.container.upload_service
+    uploads = [
+        (unquote_plus(record["s3"]["object"]["key"]), record["s3"]["object"].get("eTag", ""))
+        for record in event.get("Records", [])
+        if record.get("eventName", "").startswith("ObjectCreated:")
+    ]
+    uploads = [(key, f'"{etag}"' if etag else "") for key, etag in uploads if key.startswith(UPLOAD_PREFIX)]
+    
+    async def process():
+        for key, etag in uploads:
+            await upload_service.process_upload(key, etag)
+    
+    _loop.run_until_complete(process())
+    return {"processed": len(uploads)}
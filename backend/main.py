@@ -1,15 +1,88 @@
-from fastapi import FastAPI
+import math
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from api.v1 import auth, blog, galleries, profiles, search, uploads
+from shared.middleware.compression import CompressionMiddleware
+from shared.middleware.deadline import DeadlineMiddleware
+from shared.middleware.etag import CachePolicy, ETagMiddleware
+from shared.middleware.metrics import MetricsMiddleware
+from shared.middleware.profiling import ProfilingMiddleware
 from shared.config.settings import settings
+from shared.dependencies.container import Container
+from shared.utils.json_response import FastJSONResponse
+from shared.utils.metrics import PROMETHEUS_CONTENT_TYPE, metrics
+from shared.utils.resilience import CircuitOpenError
+
+
+async def start_container(app: FastAPI) -> Container:
+    """Build the application-scoped container and attach it to the app"""
+    container = Container(settings)
+    await container.startup()
+    app.state.container = container
+    return container
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create services and client pools once on startup, close them on shutdown"""
+    container = await start_container(app)
+    try:
+        yield
+    finally:
+        await container.aclose()
+
 
 # Create FastAPI app instance
 app = FastAPI(
     title="Falbo Obscura API",
     description="Portfolio website backend API",
     version="1.0.0",
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
+# Per-request deadline, innermost so its 504s are measured, compressed and CORS-decorated like any response
+app.add_middleware(
+    DeadlineMiddleware,
+    timeout_seconds=settings.request_timeout_seconds,
+    margin_seconds=settings.request_deadline_margin_seconds
+)
+
+# Conditional GET + Cache-Control for public reads (added early so CORS stays outermost)
+public_cache_control = (
+    f"public, max-age={settings.http_cache_max_age_seconds}, "
+    f"stale-while-revalidate={settings.http_cache_stale_while_revalidate_seconds}"
+)
+app.add_middleware(
+    ETagMiddleware,
+    policies=[
+        CachePolicy("/api/v1/galleries", public_cache_control),
+        CachePolicy("/api/v1/posts", public_cache_control),
+        CachePolicy("/api/v1/search", public_cache_control),
+    ],
+    max_body_size=settings.etag_max_body_bytes
+)
+
+# Compress outside the ETag middleware so it hashes identity bodies and its ETags key the cache
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+    cache_size=settings.compression_cache_size
+)
+
+# Latency histograms and Server-Timing around everything but CORS
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# Opt-in per-request cProfile for admins (not installed at all unless enabled)
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware, header_name=settings.profiling_header)
+
 # Configure CORS for frontend communication
 app.add_middleware(
     CORSMiddleware,
@@ -19,6 +92,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# A dependency behind an open circuit breaker fails fast with 503 instead of waiting out its timeout
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    return FastJSONResponse(
+        {"detail": "Service temporarily unavailable, please retry"},
+        status_code=503,
+        headers={"Retry-After": str(max(math.ceil(exc.retry_after), 1))}
+    )
+
+# API routers
+app.include_router(auth.router, prefix="/api/v1")
+app.include_router(galleries.router, prefix="/api/v1")
+app.include_router(blog.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
+app.include_router(uploads.router, prefix="/api/v1")
+app.include_router(profiles.router, prefix="/api/v1")
+
 # Basic health check endpoint
 @app.get("/")
 async def root():
@@ -28,6 +118,10 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 # Run the app (for development)
 if __name__ == "__main__":
     import uvicorn
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -15,24 +15,129 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 15
     jwt_refresh_token_expire_days: int = 30
+    jwt_token_cache_size: int = 1024  # Verified-token LRU entries, 0 disables caching
+    
+    # Password hashing - first scheme hashes new passwords, older schemes are upgraded on login
+    password_hash_schemes: str = "bcrypt"  # Comma-separated, e.g. "argon2,bcrypt"
+    password_bcrypt_rounds: int = 12
+    password_argon2_time_cost: int = 3
+    password_argon2_memory_cost: int = 65536  # KiB
+    password_hash_max_workers: int = 2  # Dedicated hashing threads
+    password_hash_max_pending: int = 32  # Queued hashes before rejecting with 503
+    
+    # Rate limiting - token buckets per route and client IP / username, checked before any hashing
+    rate_limit_backend: str = "memory"  # memory | dynamodb (shared by every instance)
+    rate_limits: Dict[str, Dict[str, str]] = {"login": {"ip": "20/minute", "username": "5/minute"}}  # {} disables
+    rate_limit_shards: int = 16
+    rate_limit_max_keys: int = 100_000  # In-memory buckets across all shards (LRU)
+    rate_limit_trusted_proxy_hops: int = 0  # Trusted proxies appending to X-Forwarded-For, 0 ignores the header
+    dynamodb_table_rate_limits: str = "falbo-rate-limits"
+    
+    # Authorize from signed claims alone; the repository is only hit for the full profile
+    auth_stateless_principal: bool = False
     
     # AWS Configuration
     aws_region: str = "us-east-1"
     aws_access_key_id: str = ""
     aws_secret_access_key: str = ""
     
+    # Outbound client pools (created once per process by the app container)
+    aws_max_pool_connections: int = 50
+    http_max_connections: int = 100
+    http_timeout_seconds: float = 10
+    
+    # Request deadlines - one budget per request, spent across every repository / AWS call
+    request_timeout_seconds: float = 25  # Under API Gateway's 29s integration timeout, 0 disables
+    request_deadline_margin_seconds: float = 0.5  # Kept back from Lambda's remaining time to send the 504
+    
+    # Resilience for remote dependencies - circuit breakers and hedged reads
+    circuit_breaker_enabled: bool = True
+    circuit_failure_threshold: int = 5  # Consecutive failures that open a breaker
+    circuit_reset_seconds: float = 30  # Fail-fast period before half-open probing
+    circuit_half_open_probes: int = 1  # Trial calls let through while half-open
+    circuit_slow_call_seconds: float = 5  # Slower calls count as failures, 0 = only errors
+    hedged_reads_enabled: bool = False  # Duplicate slow idempotent lookups (user by ID, gallery, post...)
+    hedge_after_ms: float = 0  # 0 = adaptive, at the p95 of recent reads
+    hedge_min_ms: float = 10
+    hedge_max_ratio: float = 0.1  # Hedges per read, so a slow dependency never gets double the load
+    
     # AWS Cognito
     cognito_user_pool_id: str = ""
     cognito_client_id: str = ""
     cognito_client_secret: str = ""
+    auth_backend: str = "memory"  # memory - Cognito repository not implemented yet
+    
+    # User cache (read-through cache in front of the auth repository)
+    user_cache_ttl_seconds: float = 60
+    user_cache_max_size: int = 1024
+    user_cache_negative_ttl_seconds: float = 10
     
     # AWS DynamoDB
+    gallery_backend: str = "memory"  # memory | dynamodb
     dynamodb_table_galleries: str = "falbo-galleries"
     dynamodb_table_blog: str = "falbo-blog"
     
+    # Token revocation (Bloom filter in front of the revocation store)
+    token_revocation_backend: str = "memory"  # memory | dynamodb
+    dynamodb_table_revocations: str = "falbo-token-revocations"
+    revocation_bloom_capacity: int = 100_000
+    revocation_bloom_error_rate: float = 0.001
+    revocation_sync_interval_seconds: float = 30
+    revocation_sync_overlap_seconds: float = 60  # Re-read window covering writer clock skew and late reads
+    
     # AWS S3
     s3_bucket_name: str = "falbo-images"
     s3_region: str = "us-east-1"
+    storage_backend: str = "local"  # local | s3
+    local_storage_path: str = ".storage"  # Root directory for the local backend
+    
+    # Direct-to-storage multipart uploads (presigned part URLs)
+    upload_part_size_mb: int = 8  # S3 requires at least 5 for every part but the last
+    upload_max_size_mb: int = 100
+    upload_url_expire_seconds: int = 900
+    upload_stale_after_hours: float = 24  # Incomplete uploads older than this are aborted
+    upload_processing: str = "background"  # background (in-process task) | event (S3 ObjectCreated -> upload_event_handler)
+    blob_unreferenced_grace_hours: float = 24  # Stored content never added to a gallery is deleted after this
+    
+    # Image derivatives (thumbnail / grid / full renditions)
+    derivative_max_workers: int = 0  # 0 = one per CPU core
+    derivative_use_processes: bool = True  # Falls back to threads where multiprocessing is unavailable
+    
+    # Blog (Markdown rendered on write; legacy rows render lazily through an LRU)
+    blog_render_cache_size: int = 256
+    
+    # Full-text search (in-process BM25 index)
+    search_snapshot_path: str = ""  # Snapshot file restored at startup instead of a full rebuild
+    search_refresh_interval_seconds: float = 300  # Rebuild picks up writes made by other instances
+    
+    # HTTP caching for public GET endpoints (ETag / If-None-Match, Cache-Control)
+    http_cache_max_age_seconds: int = 60
+    http_cache_stale_while_revalidate_seconds: int = 300
+    etag_max_body_bytes: int = 1024 * 1024  # Larger bodies stream without a hashed ETag
+    
+    # Response compression (gzip / brotli)
+    compression_minimum_size: int = 1024  # Smaller bodies are sent as-is
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5  # 0-11; above ~6 costs far more CPU for little gain on JSON
+    compression_cache_size: int = 256  # Compressed bodies cached by ETag
+    
+    # Instrumentation (latency histograms, Server-Timing, /metrics)
+    metrics_enabled: bool = True  # False removes the timers entirely
+    
+    # On-demand profiling - admins send the header to get one request profiled
+    profiling_enabled: bool = False
+    profiling_header: str = "X-Profile"
+    
+    # Simulated remote latency - memory / local backends behave like Cognito, DynamoDB and S3
+    simulation_enabled: bool = False  # Benchmarks and resilience tests only
+    simulation_latency_ms: float = 0  # Added to every repository / storage call
+    simulation_jitter_ms: float = 0  # Uniform 0..jitter on top
+    simulation_tail_rate: float = 0  # Fraction of calls that also take simulation_tail_ms
+    simulation_tail_ms: float = 0
+    simulation_throttle_rate: float = 0  # Fraction rejected at once, like provisioned-throughput errors
+    simulation_error_rate: float = 0  # Fraction failing after the delay
+    simulation_seed: int = 0  # Non-zero replays the same delays and failures on every run
+    simulation_profiles: Dict[str, Dict[str, float]] = {}  # Per dependency, e.g. {"auth_repository": {"latency_ms": 80}}
     
     # CORS Settings
     allowed_origins: str = "http://localhost:3000"  # Comma-separated for multiple origins
@@ -0,0 +1,8 @@
+from fastapi import Depends
+from core.services.blog_service import BlogService
+from shared.dependencies.container import Container, get_container
+
+
+async def get_blog_service(container: Container = Depends(get_container)) -> BlogService:
+    """Dependency to get the application-scoped blog service"""
+    return container.blog_service
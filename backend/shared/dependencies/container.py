@@ -0,0 +1,438 @@
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from fastapi import Request
+from core.interfaces.auth_repository import IAuthRepository
+from core.interfaces.blob_reference_store import IBlobReferenceStore
+from core.interfaces.blob_storage import IBlobStorage
+from core.interfaces.blog_repository import IBlogRepository
+from core.interfaces.gallery_repository import IGalleryRepository
+from core.interfaces.rate_limit_store import IRateLimitStore
+from core.interfaces.revocation_store import IRevocationStore
+from core.interfaces.upload_record_store import IUploadRecordStore
+from core.interfaces.upload_storage import IUploadStorage, UploadNotFoundError
+from core.services.auth_service import AuthService
+from core.services.blog_service import BlogService
+from core.services.content_service import ContentService
+from core.services.gallery_service import GalleryService
+from core.services.profiling_service import ProfilingService
+from core.services.rate_limit_service import RateLimitService
+from core.services.revocation_service import RevocationService
+from core.services.search_service import SearchService
+from core.services.upload_service import UploadService
+from infrastructure.auth.cached_auth_repository import CachedAuthRepository
+from shared.config.settings import Settings
+from shared.utils.call_proxy import CallHook, with_hooks
+from shared.utils.deadline import DeadlineHook
+from shared.utils.metrics import TimingHook, metrics
+from shared.utils.password_hasher import PasswordHasherBusyError
+from shared.utils.resilience import CircuitBreaker, ResilienceHook
+from shared.utils.token_bucket import parse_rate_limit
+
+
+# Container attributes that talk to Cognito, DynamoDB or S3 in production
+REMOTE_DEPENDENCIES = (
+    "auth_repository", "revocation_store", "gallery_repository", "blog_repository",
+    "blob_reference_store", "upload_storage", "blob_storage", "rate_limit_store", "upload_record_store"
+)
+
+# Idempotent lookups that may be sent twice when hedged reads are enabled
+HEDGED_READS = {
+    "auth_repository": ("get_user_by_id", "get_user_by_username"),
+    "revocation_store": ("is_revoked",),
+    "gallery_repository": ("get_gallery", "get_gallery_version", "list_galleries", "get_images"),
+    "blog_repository": ("get_post", "list_posts"),
+    "blob_reference_store": ("count",),
+    "upload_record_store": ("get",),
+    "blob_storage": ("exists", "get"),
+}
+
+# Errors that are answers from a healthy dependency, not failures that should trip its breaker
+NON_FAILURES = (LookupError, ValueError, UploadNotFoundError, PasswordHasherBusyError)
+
+
+class Container:
+    """Application-scoped services and clients (like IServiceProvider with singleton lifetimes)
+    
+    Built once in the FastAPI lifespan (or once per Lambda execution environment), shared by every
+    request through Depends, and closed on shutdown. Tests can pass ready-made components in, or
+    replace the whole container with app.dependency_overrides[get_container].
+    """
+    
+    def __init__(
+        self,
+        settings: Settings,
+        auth_repository: Optional[IAuthRepository] = None,
+        revocation_store: Optional[IRevocationStore] = None,
+        gallery_repository: Optional[IGalleryRepository] = None,
+        upload_storage: Optional[IUploadStorage] = None,
+        blob_storage: Optional[IBlobStorage] = None,
+        blob_reference_store: Optional[IBlobReferenceStore] = None,
+        blog_repository: Optional[IBlogRepository] = None,
+        rate_limit_store: Optional[IRateLimitStore] = None,
+        upload_record_store: Optional[IUploadRecordStore] = None
+    ):
+        self.settings = settings
+        self.auth_repository = auth_repository
+        self.revocation_store = revocation_store
+        self.gallery_repository = gallery_repository
+        self.upload_storage = upload_storage
+        self.blob_storage = blob_storage
+        self.blob_reference_store = blob_reference_store
+        self.blog_repository = blog_repository
+        self.rate_limit_store = rate_limit_store
+        self.upload_record_store = upload_record_store
+        self.derivative_generator = None
+        self.revocation_service: Optional[RevocationService] = None
+        self.auth_service: Optional[AuthService] = None
+        self.rate_limit_service: Optional[RateLimitService] = None
+        self.content_service: Optional[ContentService] = None
+        self.search_service: Optional[SearchService] = None
+        self.gallery_service: Optional[GalleryService] = None
+        self.blog_service: Optional[BlogService] = None
+        self.upload_service: Optional[UploadService] = None
+        self.profiling_service: Optional[ProfilingService] = None
+        self.simulated: Dict[str, Any] = {}  # SimulatedLatency hook per dependency when simulation is enabled
+        self.resilient: Dict[str, ResilienceHook] = {}  # Circuit breaker hook per dependency
+        self._exit_stack = AsyncExitStack()
+        self._aws_session = None
+        self._aws_clients: Dict[str, Any] = {}
+        self._http_client = None
+    
+    async def startup(self) -> None:
+        """Create repositories, services and caches"""
+        if self.auth_repository is None:
+            self.auth_repository = self._build_auth_repository()
+        if self.revocation_store is None:
+            self.revocation_store = await self._build_revocation_store()
+        if self.gallery_repository is None:
+            self.gallery_repository = await self._build_gallery_repository()
+        if self.upload_storage is None:
+            self.upload_storage = await self._build_upload_storage()
+        if self.blob_storage is None:
+            self.blob_storage = await self._build_blob_storage()
+        if self.blob_reference_store is None:
+            self.blob_reference_store = await self._build_blob_reference_store()
+        if self.blog_repository is None:
+            self.blog_repository = await self._build_blog_repository()
+        if self.rate_limit_store is None:
+            self.rate_limit_store = await self._build_rate_limit_store()
+        if self.upload_record_store is None:
+            self.upload_record_store = await self._build_upload_record_store()
+        self._wrap_dependencies()
+        
+        self.revocation_service = RevocationService(
+            self.revocation_store,
+            bloom_capacity=self.settings.revocation_bloom_capacity,
+            bloom_error_rate=self.settings.revocation_bloom_error_rate,
+            sync_interval_seconds=self.settings.revocation_sync_interval_seconds,
+            sync_overlap_seconds=self.settings.revocation_sync_overlap_seconds
+        )
+        await self.revocation_service.load()
+        
+        self.auth_service = AuthService(self.auth_repository, self.revocation_service)
+        self.rate_limit_service = RateLimitService(
+            self.rate_limit_store,
+            {
+                route: {dimension: parse_rate_limit(spec) for dimension, spec in rules.items()}
+                for route, rules in self.settings.rate_limits.items()
+            }
+        )
+        self.derivative_generator = self._build_derivative_generator()
+        self.content_service = ContentService(
+            self.blob_storage,
+            self.blob_reference_store,
+            self.derivative_generator,
+            unreferenced_grace=timedelta(hours=self.settings.blob_unreferenced_grace_hours)
+        )
+        self.search_service = SearchService(
+            self.gallery_repository,
+            snapshot_path=self.settings.search_snapshot_path or None,
+            refresh_interval_seconds=self.settings.search_refresh_interval_seconds,
+            blog_repository=self.blog_repository
+        )
+        await self.search_service.start()
+        self.gallery_service = GalleryService(self.gallery_repository, self.content_service, self.search_service)
+        self.blog_service = BlogService(
+            self.blog_repository,
+            render_cache_size=self.settings.blog_render_cache_size,
+            search_service=self.search_service
+        )
+        self.upload_service = UploadService(
+            self.upload_storage,
+            part_size=self.settings.upload_part_size_mb * 1024 * 1024,
+            max_size=self.settings.upload_max_size_mb * 1024 * 1024,
+            url_expires_seconds=self.settings.upload_url_expire_seconds,
+            stale_after=timedelta(hours=self.settings.upload_stale_after_hours),
+            derivative_generator=self.derivative_generator,
+            content_service=self.content_service,
+            record_store=self.upload_record_store,
+            process_in_background=self.settings.upload_processing == "background"
+        )
+        if self.settings.profiling_enabled:
+            self.profiling_service = ProfilingService(self.blob_storage)
+    
+    async def aclose(self) -> None:
+        """Close pooled clients and background resources"""
+        await self._exit_stack.aclose()
+        self._aws_clients.clear()
+        self._http_client = None
+        
+        if self.derivative_generator is not None:
+            self.derivative_generator.shutdown()
+        
+        from shared.utils.jwt_manager import jwt_manager
+        jwt_manager.password_hasher.shutdown()
+    
+    async def aws_client(self, service_name: str, **config: Any) -> Any:
+        """Shared aioboto3 client per service - connection pool and credentials resolved once"""
+        client = self._aws_clients.get(service_name)
+        if client is None:
+            import aioboto3
+            from botocore.config import Config
+            
+            if self._aws_session is None:
+                self._aws_session = aioboto3.Session(
+                    aws_access_key_id=self.settings.aws_access_key_id or None,
+                    aws_secret_access_key=self.settings.aws_secret_access_key or None,
+                    region_name=self.settings.aws_region
+                )
+            client = await self._exit_stack.enter_async_context(
+                self._aws_session.client(
+                    service_name,
+                    config=Config(max_pool_connections=self.settings.aws_max_pool_connections, **config)
+                )
+            )
+            self._aws_clients[service_name] = client
+        return client
+    
+    async def http_client(self):
+        """Shared httpx.AsyncClient with keep-alive pooling, created on first use"""
+        if self._http_client is None:
+            import httpx
+            
+            self._http_client = await self._exit_stack.enter_async_context(
+                httpx.AsyncClient(
+                    timeout=self.settings.http_timeout_seconds,
+                    limits=httpx.Limits(max_connections=self.settings.http_max_connections)
+                )
+            )
+        return self._http_client
+    
+    def _wrap_dependencies(self) -> None:
+        """One CallProxy per remote dependency - deadline, timing, circuit breaker, simulated latency
+        
+        The hooks run in that order, outermost first; disabled ones are left out. The auth stack is
+        split around the user cache: the breaker and simulation sit beneath it, so cached users are
+        still served while the repository behind it is failing fast.
+        """
+        for dependency in REMOTE_DEPENDENCIES:
+            target = getattr(self, dependency)
+            if target is None:
+                continue
+            
+            outer: List[CallHook] = [DeadlineHook(dependency)]
+            if self.settings.metrics_enabled and metrics.enabled:
+                outer.append(TimingHook(dependency, metrics))
+            inner: List[CallHook] = []
+            if self.settings.circuit_breaker_enabled:
+                self.resilient[dependency] = self._resilience_hook(dependency)
+                inner.append(self.resilient[dependency])
+            if dependency in self.simulated:
+                inner.append(self.simulated[dependency])
+            
+            if isinstance(target, CachedAuthRepository):
+                target.inner = with_hooks(target.inner, inner)
+                setattr(self, dependency, with_hooks(target, outer))
+            else:
+                setattr(self, dependency, with_hooks(target, outer + inner))
+    
+    def _resilience_hook(self, dependency: str) -> ResilienceHook:
+        """Circuit breaker, and optionally hedged reads, for one remote dependency"""
+        return ResilienceHook(
+            CircuitBreaker(
+                dependency,
+                failure_threshold=self.settings.circuit_failure_threshold,
+                reset_seconds=self.settings.circuit_reset_seconds,
+                half_open_probes=self.settings.circuit_half_open_probes,
+                slow_call_seconds=self.settings.circuit_slow_call_seconds or None,
+                excluded=NON_FAILURES
+            ),
+            hedged_methods=HEDGED_READS.get(dependency, ()) if self.settings.hedged_reads_enabled else (),
+            hedge_after=self.settings.hedge_after_ms / 1000 or None,
+            hedge_min=self.settings.hedge_min_ms / 1000,
+            max_hedge_ratio=self.settings.hedge_max_ratio
+        )
+    
+    def _simulated(self, dependency: str, backend: Any) -> Any:
+        """Register the configured latency / failure model for a local backend (applied by _wrap_dependencies)"""
+        if not self.settings.simulation_enabled:
+            return backend
+        
+        from infrastructure.simulated.simulated_backend import LatencyProfile, SimulatedLatency
+        profile = LatencyProfile(
+            latency_ms=self.settings.simulation_latency_ms,
+            jitter_ms=self.settings.simulation_jitter_ms,
+            tail_rate=self.settings.simulation_tail_rate,
+            tail_ms=self.settings.simulation_tail_ms,
+            throttle_rate=self.settings.simulation_throttle_rate,
+            error_rate=self.settings.simulation_error_rate
+        ).with_overrides(self.settings.simulation_profiles.get(dependency, {}))
+        self.simulated[dependency] = SimulatedLatency(dependency, profile, seed=self.settings.simulation_seed or None)
+        return backend
+    
+    def _build_auth_repository(self) -> IAuthRepository:
+        """Auth repository for the configured backend, behind the read-through user cache"""
+        if self.settings.auth_backend == "memory":
+            from infrastructure.auth.memory_auth_repository import InMemoryAuthRepository
+            repository: IAuthRepository = self._simulated("auth_repository", InMemoryAuthRepository())
+        else:
+            raise ValueError(f"Unsupported auth backend: {self.settings.auth_backend}")
+        
+        if self.settings.user_cache_max_size <= 0:
+            return repository
+        
+        return CachedAuthRepository(
+            repository,
+            ttl_seconds=self.settings.user_cache_ttl_seconds,
+            max_size=self.settings.user_cache_max_size,
+            negative_ttl_seconds=self.settings.user_cache_negative_ttl_seconds
+        )
+    
+    async def _build_revocation_store(self) -> IRevocationStore:
+        """Revocation store for the configured backend"""
+        if self.settings.token_revocation_backend == "memory":
+            from infrastructure.auth.memory_revocation_store import InMemoryRevocationStore
+            return self._simulated("revocation_store", InMemoryRevocationStore())
+        
+        if self.settings.token_revocation_backend == "dynamodb":
+            from infrastructure.database.dynamodb_revocation_store import DynamoDBRevocationStore
+            return DynamoDBRevocationStore(
+                await self.aws_client("dynamodb"),
+                self.settings.dynamodb_table_revocations
+            )
+        
+        raise ValueError(f"Unsupported token revocation backend: {self.settings.token_revocation_backend}")
+    
+    async def _build_rate_limit_store(self) -> IRateLimitStore:
+        """Rate limit buckets for the configured backend"""
+        if self.settings.rate_limit_backend == "memory":
+            from infrastructure.auth.memory_rate_limit_store import InMemoryRateLimitStore
+            return InMemoryRateLimitStore(
+                shards=self.settings.rate_limit_shards,
+                max_keys=self.settings.rate_limit_max_keys
+            )
+        
+        if self.settings.rate_limit_backend == "dynamodb":
+            from infrastructure.database.dynamodb_rate_limit_store import DynamoDBRateLimitStore
+            return DynamoDBRateLimitStore(
+                await self.aws_client("dynamodb"),
+                self.settings.dynamodb_table_rate_limits
+            )
+        
+        raise ValueError(f"Unsupported rate limit backend: {self.settings.rate_limit_backend}")
+    
+    async def _build_gallery_repository(self) -> IGalleryRepository:
+        """Gallery repository for the configured backend"""
+        if self.settings.gallery_backend == "memory":
+            from infrastructure.database.memory_gallery_repository import InMemoryGalleryRepository
+            return self._simulated("gallery_repository", InMemoryGalleryRepository())
+        
+        if self.settings.gallery_backend == "dynamodb":
+            from infrastructure.database.dynamodb_gallery_repository import DynamoDBGalleryRepository
+            return DynamoDBGalleryRepository(
+                await self.aws_client("dynamodb"),
+                self.settings.dynamodb_table_galleries
+            )
+        
+        raise ValueError(f"Unsupported gallery backend: {self.settings.gallery_backend}")
+    
+    async def _build_blob_reference_store(self) -> IBlobReferenceStore:
+        """Blob reference counts, kept alongside the gallery records"""
+        if self.settings.gallery_backend == "memory":
+            from infrastructure.database.memory_blob_reference_store import InMemoryBlobReferenceStore
+            return self._simulated("blob_reference_store", InMemoryBlobReferenceStore())
+        
+        if self.settings.gallery_backend == "dynamodb":
+            from infrastructure.database.dynamodb_blob_reference_store import DynamoDBBlobReferenceStore
+            return DynamoDBBlobReferenceStore(
+                await self.aws_client("dynamodb"),
+                self.settings.dynamodb_table_galleries
+            )
+        
+        raise ValueError(f"Unsupported gallery backend: {self.settings.gallery_backend}")
+    
+    async def _build_upload_record_store(self) -> IUploadRecordStore:
+        """Upload processing state, kept alongside the gallery records"""
+        if self.settings.gallery_backend == "memory":
+            from infrastructure.database.memory_upload_record_store import InMemoryUploadRecordStore
+            return self._simulated("upload_record_store", InMemoryUploadRecordStore())
+        
+        if self.settings.gallery_backend == "dynamodb":
+            from infrastructure.database.dynamodb_upload_record_store import DynamoDBUploadRecordStore
+            return DynamoDBUploadRecordStore(
+                await self.aws_client("dynamodb"),
+                self.settings.dynamodb_table_galleries
+            )
+        
+        raise ValueError(f"Unsupported gallery backend: {self.settings.gallery_backend}")
+    
+    async def _build_blog_repository(self) -> IBlogRepository:
+        """Blog repository for the configured backend (follows the gallery backend)"""
+        if self.settings.gallery_backend == "memory":
+            from infrastructure.database.memory_blog_repository import InMemoryBlogRepository
+            return self._simulated("blog_repository", InMemoryBlogRepository())
+        
+        if self.settings.gallery_backend == "dynamodb":
+            from infrastructure.database.dynamodb_blog_repository import DynamoDBBlogRepository
+            return DynamoDBBlogRepository(
+                await self.aws_client("dynamodb"),
+                self.settings.dynamodb_table_blog
+            )
+        
+        raise ValueError(f"Unsupported gallery backend: {self.settings.gallery_backend}")
+    
+    async def _build_upload_storage(self) -> IUploadStorage:
+        """Upload storage for the configured backend"""
+        if self.settings.storage_backend == "local":
+            from infrastructure.storage.local_upload_storage import LocalUploadStorage
+            return self._simulated("upload_storage", LocalUploadStorage(Path(self.settings.local_storage_path)))
+        
+        if self.settings.storage_backend == "s3":
+            from infrastructure.storage.s3_upload_storage import S3UploadStorage
+            return S3UploadStorage(
+                await self.aws_client("s3", region_name=self.settings.s3_region, signature_version="s3v4"),
+                self.settings.s3_bucket_name
+            )
+        
+        raise ValueError(f"Unsupported storage backend: {self.settings.storage_backend}")
+    
+    async def _build_blob_storage(self) -> IBlobStorage:
+        """Blob storage for the configured backend (same bucket / root as uploads)"""
+        if self.settings.storage_backend == "local":
+            from infrastructure.storage.local_blob_storage import LocalBlobStorage
+            return self._simulated("blob_storage", LocalBlobStorage(Path(self.settings.local_storage_path)))
+        
+        if self.settings.storage_backend == "s3":
+            from infrastructure.storage.s3_blob_storage import S3BlobStorage
+            return S3BlobStorage(
+                await self.aws_client("s3", region_name=self.settings.s3_region, signature_version="s3v4"),
+                self.settings.s3_bucket_name
+            )
+        
+        raise ValueError(f"Unsupported storage backend: {self.settings.storage_backend}")
+    
+    def _build_derivative_generator(self):
+        """Image rendition pipeline - its worker pool starts on first use, not at startup"""
+        from infrastructure.storage.image_derivatives import DerivativeGenerator
+        return DerivativeGenerator(
+            self.blob_storage,
+            max_workers=self.settings.derivative_max_workers or None,
+            use_processes=self.settings.derivative_use_processes
+        )
+
+
+def get_container(request: Request) -> Container:
+    """Dependency to get the application container"""
+    return request.app.state.container
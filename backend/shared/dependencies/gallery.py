@@ -0,0 +1,8 @@
+from fastapi import Depends
+from core.services.gallery_service import GalleryService
+from shared.dependencies.container import Container, get_container
+
+
+async def get_gallery_service(container: Container = Depends(get_container)) -> GalleryService:
+    """Dependency to get the application-scoped gallery service"""
+    return container.gallery_service
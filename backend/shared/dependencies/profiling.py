@@ -0,0 +1,10 @@
+from fastapi import Depends, HTTPException, status
+from core.services.profiling_service import ProfilingService
+from shared.dependencies.container import Container, get_container
+
+
+async def get_profiling_service(container: Container = Depends(get_container)) -> ProfilingService:
+    """Dependency to get the profiling service (404 while profiling is disabled)"""
+    if container.profiling_service is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    return container.profiling_service
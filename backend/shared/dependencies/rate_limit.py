@@ -0,0 +1,35 @@
+import math
+from fastapi import Depends, HTTPException, Request, status
+from core.services.rate_limit_service import RateLimitService
+from shared.config.settings import settings
+from shared.dependencies.container import Container, get_container
+
+
+async def get_rate_limit_service(container: Container = Depends(get_container)) -> RateLimitService:
+    """Dependency to get the application-scoped rate limit service"""
+    return container.rate_limit_service
+
+
+def client_address(request: Request) -> str:
+    """Caller IP - the X-Forwarded-For entry added by the outermost trusted proxy
+    
+    Entries are counted from the right: each trusted proxy appends the address it received from,
+    while anything to the left of them is whatever the client chose to send.
+    """
+    hops = settings.rate_limit_trusted_proxy_hops
+    if hops > 0:
+        forwarded = [entry.strip() for entry in request.headers.get("x-forwarded-for", "").split(",")]
+        if len(forwarded) >= hops and forwarded[-hops]:
+            return forwarded[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+async def enforce_rate_limit(rate_limiter: RateLimitService, route: str, **keys: str) -> None:
+    """Raise 429 with Retry-After when any of the route's buckets is empty"""
+    retry_after = await rate_limiter.check(route, **keys)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": str(max(math.ceil(retry_after), 1))}
+        )
@@ -0,0 +1,8 @@
+from fastapi import Depends
+from core.services.search_service import SearchService
+from shared.dependencies.container import Container, get_container
+
+
+async def get_search_service(container: Container = Depends(get_container)) -> SearchService:
+    """Dependency to get the application-scoped search service"""
+    return container.search_service
@@ -0,0 +1,14 @@
+from fastapi import Depends
+from core.services.content_service import ContentService
+from core.services.upload_service import UploadService
+from shared.dependencies.container import Container, get_container
+
+
+async def get_upload_service(container: Container = Depends(get_container)) -> UploadService:
+    """Dependency to get the application-scoped upload service"""
+    return container.upload_service
+
+
+async def get_content_service(container: Container = Depends(get_container)) -> ContentService:
+    """Dependency to get the application-scoped content service"""
+    return container.content_service
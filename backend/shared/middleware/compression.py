@@ -0,0 +1,228 @@
+import zlib
+from typing import Dict, Optional, Sequence, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared.utils.ttl_cache import TTLCache
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding as {coding: q}, lower-cased (RFC 9110 12.5.3)"""
+    codings: Dict[str, float] = {}
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def choose_encoding(header: Optional[str]) -> Optional[str]:
+    """Best supported coding the client accepts - brotli first, None for identity"""
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get("*", 0.0)
+    for coding in ("br", "gzip"):
+        if coding == "br" and brotli is None:
+            continue
+        if codings.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+
+class _Compressor:
+    """Incremental gzip / brotli encoder with one interface"""
+    
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._gzip = None
+        else:
+            self._brotli = None
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    
+    def compress(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data)
+        return self._gzip.compress(data)
+    
+    def finish(self) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """gzip / brotli response compression (pure ASGI, like ResponseCompression + an output cache)
+    
+    Compressible 200 responses at or over minimum_size are encoded with the best coding the client
+    accepts. Bodies that carry an ETag are compressed once - the encoded bytes are cached by path,
+    ETag and coding, so repeat hits on the same version skip the compressor. The ETag is weakened
+    (W/) because the encoded bytes differ from the identity representation; If-None-Match uses weak
+    comparison, so revalidation keeps working. Streamed bodies are compressed chunk by chunk.
+    
+    A 304 carries no body to judge, so whenever the client negotiated a coding the ETag is weakened
+    on every compressible 200 (small ones too) and on every 304 alike - the validator a client gets
+    on revalidation is always the one it cached. 304s also get Vary: Accept-Encoding.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        cache_size: int = 256,
+        compressible_types: Sequence[str] = COMPRESSIBLE_TYPES
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.compressible_types = tuple(compressible_types)
+        self.cache: TTLCache[Tuple[str, str, str], bytes] = TTLCache(max_size=cache_size)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        await _CompressingResponder(self, scope["path"], encoding, send).run(scope, receive)
+    
+    def compressor(self, encoding: str) -> _Compressor:
+        """Fresh encoder at the configured level"""
+        return _Compressor(encoding, self.gzip_level, self.brotli_quality)
+    
+    def is_compressible(self, headers: MutableHeaders) -> bool:
+        """Text-like content that is not already encoded"""
+        content_type = headers.get("content-type", "")
+        return "content-encoding" not in headers and content_type.startswith(self.compressible_types)
+
+
+class _CompressingResponder:
+    """Per-request send wrapper that buffers small bodies and compresses the rest as they stream"""
+    
+    def __init__(self, middleware: CompressionMiddleware, path: str, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.path = path
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+    
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.send_wrapper)
+    
+    async def send_wrapper(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+        
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(scope=message)
+            if message["status"] == 304:
+                # Stands in for a 200 this middleware handled - repeat its Vary and validator
+                headers.add_vary_header("Accept-Encoding")
+                if self.encoding is not None:
+                    _weaken_etag(headers)
+                self.passthrough = True
+                await self.send(message)
+                return
+            
+            if message["status"] != 200 or not self.middleware.is_compressible(headers):
+                self.passthrough = True
+                await self.send(message)
+                return
+            
+            # The representation depends on Accept-Encoding even when this client gets identity
+            headers.add_vary_header("Accept-Encoding")
+            if self.encoding is None:
+                self.passthrough = True
+                await self.send(message)
+                return
+            
+            self.start_message = message
+            return
+        
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if self.compressor is not None:
+            await self._send_chunk(body, more_body)
+            return
+        
+        if more_body:
+            # Streaming response - no total size or cache, compress as it arrives
+            self._start_encoded(MutableHeaders(scope=self.start_message))
+            self.compressor = self.middleware.compressor(self.encoding)
+            await self.send(self.start_message)
+            await self._send_chunk(body, more_body)
+            return
+        
+        await self._send_whole(body)
+    
+    async def _send_whole(self, body: bytes) -> None:
+        """Single-message body - compress (or reuse the cached encoding) when large enough"""
+        headers = MutableHeaders(scope=self.start_message)
+        if len(body) < self.middleware.minimum_size:
+            _weaken_etag(headers)
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+        
+        etag = headers.get("etag")
+        cache_key = (self.path, etag, self.encoding) if etag else None
+        encoded = self.middleware.cache.get(cache_key) if cache_key else None
+        if encoded is None:
+            compressor = self.middleware.compressor(self.encoding)
+            encoded = compressor.compress(body) + compressor.finish()
+            if cache_key:
+                self.middleware.cache.set(cache_key, encoded)
+        
+        self._start_encoded(headers)
+        headers["content-length"] = str(len(encoded))
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": encoded})
+    
+    async def _send_chunk(self, body: bytes, more_body: bool) -> None:
+        """Compress one streamed chunk, finishing the stream on the last one"""
+        data = self.compressor.compress(body)
+        if not more_body:
+            data += self.compressor.finish()
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+    
+    def _start_encoded(self, headers: MutableHeaders) -> None:
+        """Switch the response headers to the encoded representation"""
+        headers["content-encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["content-length"]
+        _weaken_etag(headers)
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """Mark the ETag weak (W/) - it no longer names these exact bytes"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
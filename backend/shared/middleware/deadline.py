@@ -0,0 +1,63 @@
+import asyncio
+from typing import Optional
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared.utils.deadline import DeadlineExceededError, end_deadline, start_deadline
+from shared.utils.metrics import metrics
+
+
+# The handler guard fires this much after the deadline, so a dependency call cut off at the deadline
+# reports itself first (and is counted under its own name)
+HANDLER_GRACE_SECONDS = 0.05
+
+
+class DeadlineMiddleware:
+    """Per-request time budget shared by every awaited dependency call (pure ASGI)
+    
+    The budget is timeout_seconds, or less when running in Lambda: the invocation's remaining time
+    minus margin_seconds, so the 504 is sent before Lambda (or API Gateway) gives up on the request.
+    Repositories and stores bound their calls by it (shared.utils.deadline); when it runs out the
+    pending call is cancelled and the request is answered 504 instead of waiting on a degraded
+    dependency. The handler as a whole is bounded too, for time spent outside those calls.
+    """
+    
+    def __init__(self, app: ASGIApp, timeout_seconds: float = 25, margin_seconds: float = 0.5):
+        self.app = app
+        self.timeout_seconds = timeout_seconds
+        self.margin_seconds = margin_seconds
+    
+    def budget(self, scope: Scope) -> Optional[float]:
+        """Seconds this request may take, None when unbounded"""
+        budget = self.timeout_seconds if self.timeout_seconds > 0 else None
+        context = scope.get("aws.context")  # set by Mangum
+        if context is not None and hasattr(context, "get_remaining_time_in_millis"):
+            lambda_budget = context.get_remaining_time_in_millis() / 1000 - self.margin_seconds
+            budget = lambda_budget if budget is None else min(budget, lambda_budget)
+        return budget
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        budget = self.budget(scope) if scope["type"] == "http" else None
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        token = start_deadline(budget)
+        try:
+            await asyncio.wait_for(self.app(scope, receive, send_wrapper), max(budget, 0.0) + HANDLER_GRACE_SECONDS)
+        except (DeadlineExceededError, asyncio.TimeoutError) as exc:
+            if response_started:
+                raise  # too late for a clean error - let the server drop the connection
+            dependency = exc.dependency if isinstance(exc, DeadlineExceededError) else "request"
+            metrics.deadline_exceeded.inc(dependency)
+            response = JSONResponse({"detail": "Request deadline exceeded"}, status_code=504)
+            await response(scope, receive, send)
+        finally:
+            end_deadline(token)
@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared.utils.etag import etag_matches, make_etag
+
+
+# Headers a 304 must repeat from the 200 it stands in for
+NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "date", "etag", "expires", "vary")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache-Control for GET responses under a path prefix"""
+    path_prefix: str
+    cache_control: str
+
+
+class ETagMiddleware:
+    """Conditional GET for public read endpoints (pure ASGI, like an ETag-aware output cache)
+    
+    Responses that already carry an ETag (endpoints that derive it from a stored version) stream
+    through untouched. Otherwise the body is buffered and hashed into a strong ETag. Either way a
+    matching If-None-Match turns the response into a 304 and the policy's Cache-Control is applied.
+    Requests with an Authorization header are left alone so personalised responses are never shared.
+    """
+    
+    def __init__(self, app: ASGIApp, policies: Sequence[CachePolicy], max_body_size: int = 1024 * 1024):
+        self.app = app
+        # Longest prefix first so specific routes win over their parents
+        self.policies = sorted(policies, key=lambda policy: len(policy.path_prefix), reverse=True)
+        self.max_body_size = max_body_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        
+        policy = self._policy_for(scope["path"])
+        request_headers = Headers(scope=scope)
+        if policy is None or "authorization" in request_headers:
+            await self.app(scope, receive, send)
+            return
+        
+        await _ConditionalResponder(self, policy, request_headers.get("if-none-match"), send).run(scope, receive)
+    
+    def _policy_for(self, path: str) -> Optional[CachePolicy]:
+        """Most specific policy covering the path"""
+        for policy in self.policies:
+            if path == policy.path_prefix or path.startswith(policy.path_prefix.rstrip("/") + "/"):
+                return policy
+        return None
+
+
+class _ConditionalResponder:
+    """Per-request send wrapper that adds the ETag and answers 304"""
+    
+    def __init__(self, middleware: ETagMiddleware, policy: CachePolicy, if_none_match: Optional[str], send: Send):
+        self.middleware = middleware
+        self.policy = policy
+        self.if_none_match = if_none_match
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.body_parts: List[bytes] = []
+        self.body_size = 0
+        self.passthrough = False
+    
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.send_wrapper)
+    
+    async def send_wrapper(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+        
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = MutableHeaders(scope=message)
+            if message["status"] not in (200, 304):
+                self.passthrough = True
+                await self.send(message)
+                return
+            
+            headers.setdefault("cache-control", self.policy.cache_control)
+            etag = headers.get("etag")
+            if message["status"] == 304 or etag is not None:
+                # Endpoint already decided (version-derived ETag) - no buffering needed
+                if etag is not None and (message["status"] == 304 or etag_matches(self.if_none_match, etag)):
+                    await self._send_not_modified(headers)
+                    self.start_message = None
+                    return
+                self.passthrough = True
+                await self.send(message)
+            return
+        
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+        
+        if self.start_message is None:
+            return  # Body of a response already answered with 304
+        
+        body = message.get("body", b"")
+        self.body_parts.append(body)
+        self.body_size += len(body)
+        
+        if message.get("more_body", False):
+            if self.body_size > self.middleware.max_body_size:
+                await self._flush(more_body=True)
+            return
+        
+        await self._finish()
+    
+    async def _finish(self) -> None:
+        """Whole body buffered - hash it and answer 200 or 304"""
+        body = b"".join(self.body_parts)
+        headers = MutableHeaders(scope=self.start_message)
+        etag = make_etag(body)
+        headers["etag"] = etag
+        
+        if etag_matches(self.if_none_match, etag):
+            await self._send_not_modified(headers)
+            return
+        
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": body})
+    
+    async def _flush(self, more_body: bool) -> None:
+        """Body too large to hash - stream it without an ETag"""
+        self.passthrough = True
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": b"".join(self.body_parts), "more_body": more_body})
+        self.body_parts = []
+    
+    async def _send_not_modified(self, headers: MutableHeaders) -> None:
+        """Empty 304 carrying the validators and caching headers"""
+        await self.send({
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers.items()
+                if name in NOT_MODIFIED_HEADERS
+            ],
+        })
+        await self.send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,59 @@
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared.utils.metrics import MetricsRegistry, metrics
+
+
+def route_template(scope: Scope) -> str:
+    """Matched route path ("/api/v1/galleries/{gallery_id}") so raw IDs never become label values"""
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        # Older Starlette records only the endpoint
+        endpoint, app = scope.get("endpoint"), scope.get("app")
+        for candidate in getattr(app, "routes", ()) if endpoint is not None else ():
+            if getattr(candidate, "endpoint", None) is endpoint:
+                template = candidate.path
+                break
+        else:
+            return "unmatched"
+    
+    # Routes of included routers may be relative to the include prefix - restore it from the path
+    segments = scope["path"].rstrip("/").split("/")
+    prefix = "/".join(segments[:max(len(segments) - template.count("/"), 0)])
+    return prefix + template
+
+
+class MetricsMiddleware:
+    """Per-route latency histograms plus a Server-Timing header (pure ASGI)
+    
+    Server-Timing carries the total time to the response start ("app") and the per-request totals of
+    every timed dependency (jwt_verify, repositories, serialization...), so browser devtools show
+    where a slow request went.
+    """
+    
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        token = self.registry.begin_request()
+        status = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", self.registry.server_timing(time.perf_counter() - started))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.registry.observe_request(scope["method"], route_template(scope), status, time.perf_counter() - started)
+            self.registry.end_request(token)
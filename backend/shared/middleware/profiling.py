@@ -0,0 +1,84 @@
+import asyncio
+import cProfile
+import logging
+from typing import Optional
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared.dependencies.auth import get_current_admin_user, get_current_principal
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """Runs one request under cProfile when an admin asks for it with the profiling header
+    
+    Only installed when PROFILING_ENABLED is set; even then, requests without the header pay one
+    header lookup. The caller is authorized through get_current_admin_user, and non-admins are served
+    normally without any hint that profiling exists. The response carries X-Profile-Id; fetch the
+    report from /api/v1/admin/profiles/{id}. cProfile observes the whole event-loop thread, so
+    requests running concurrently show up in the profile too, and one profile runs at a time.
+    """
+    
+    def __init__(self, app: ASGIApp, header_name: str = "X-Profile"):
+        self.app = app
+        self.header_name = header_name.lower()
+        self._lock = asyncio.Lock()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        headers = Headers(scope=scope)
+        if self.header_name not in headers:
+            await self.app(scope, receive, send)
+            return
+        
+        container = scope["app"].state.container
+        if not await self._is_admin(container, headers.get("authorization")) or self._lock.locked():
+            await self.app(scope, receive, send)
+            return
+        
+        async with self._lock:
+            await self._profile(container.profiling_service, scope, receive, send)
+    
+    async def _profile(self, profiling_service, scope: Scope, receive: Receive, send: Send) -> None:
+        profile_id = profiling_service.new_profile_id()
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = profile_id
+            await send(message)
+        
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # another profiler (debugger, coverage tool) owns the thread
+            await self.app(scope, receive, send)
+            return
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            try:
+                await profiling_service.save(profile_id, profiler)
+            except Exception:
+                logger.exception("Could not store profile %s", profile_id)
+    
+    @staticmethod
+    async def _is_admin(container, authorization: Optional[str]) -> bool:
+        """Same check as the admin-only endpoints"""
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        
+        credentials = HTTPAuthorizationCredentials(scheme=scheme, credentials=token)
+        try:
+            await get_current_admin_user(await get_current_principal(credentials, container.auth_service))
+        except HTTPException:
+            return False
+        return True
@@ -0,0 +1,41 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter - no false negatives, tunable false-positive rate"""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        # Optimal bit count m = -n ln(p) / (ln 2)^2 and hash count k = (m / n) ln 2
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item: str):
+        """Bit positions via double hashing of a single 128-bit digest"""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str) -> None:
+        """Add item to the filter"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        """True if item may have been added, False if it definitely was not"""
+        for position in self._positions(item):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    @property
+    def is_saturated(self) -> bool:
+        """True once more items were added than the filter was sized for"""
+        return self.count > self.capacity
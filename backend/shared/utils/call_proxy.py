@@ -0,0 +1,88 @@
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Sequence, Type, TypeVar
+
+
+H = TypeVar("H", bound="CallHook")
+
+
+class CallHook:
+    """One layer around every coroutine method call of a CallProxy target
+    
+    call runs the rest of the stack - the hooks beneath this one, then the method - and starts a
+    fresh attempt each time it is called, so a hook may retry or duplicate it. Hooks with streams
+    set also run when an async-iterator method starts, before its first item.
+    """
+    streams = False
+    
+    async def __call__(self, operation: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        return await call()
+
+
+class CallProxy:
+    """Forwards attribute access to target, running coroutine methods through hooks (outermost first)
+    
+    Underscore attributes and sync methods pass straight through. Each method is wrapped once, on
+    first access, so the per-call cost is the hooks themselves.
+    """
+    
+    def __init__(self, target: Any, hooks: Sequence[CallHook]):
+        self._target = target
+        self.hooks = tuple(hooks)
+    
+    @property
+    def inner(self) -> Any:
+        return self._target
+    
+    def hook(self, kind: Type[H]) -> Optional[H]:
+        """First hook of the given type in the stack, None when there is none"""
+        return next((hook for hook in self.hooks if isinstance(hook, kind)), None)
+    
+    def __getattr__(self, name: str) -> Any:
+        target = self.__dict__.get("_target")
+        if target is None:  # mid-construction or unpickling
+            raise AttributeError(name)
+        
+        attribute = getattr(target, name)
+        if name.startswith("_"):
+            return attribute
+        
+        if inspect.iscoroutinefunction(attribute):
+            hooks = self.hooks
+            
+            @functools.wraps(attribute)
+            async def call(*args, **kwargs):
+                return await _through(hooks, name, lambda: attribute(*args, **kwargs))
+        elif inspect.isasyncgenfunction(attribute):
+            hooks = tuple(hook for hook in self.hooks if hook.streams)
+            if not hooks:
+                return attribute
+            
+            @functools.wraps(attribute)
+            async def call(*args, **kwargs):
+                await _through(hooks, name, _started)
+                async for item in attribute(*args, **kwargs):
+                    yield item
+        else:
+            return attribute
+        
+        self.__dict__[name] = call  # resolved once per method
+        return call
+
+
+def with_hooks(target: Any, hooks: Sequence[CallHook]) -> Any:
+    """target behind hooks, or target itself when there are none (or no target)"""
+    if target is None or not hooks:
+        return target
+    return CallProxy(target, hooks)
+
+
+def _through(hooks: Sequence[CallHook], operation: str, call: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+    """Run call beneath hooks, hooks[0] outermost"""
+    for hook in reversed(hooks):
+        call = functools.partial(hook, operation, call)
+    return call()
+
+
+async def _started() -> None:
+    """Stands in for the call when streaming hooks run ahead of an async iterator"""
@@ -0,0 +1,47 @@
+import base64
+import json
+from typing import Any, Dict
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor"""
+    raw = json.dumps(position, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+    
+    if not isinstance(position, dict):
+        raise InvalidCursorError("Invalid pagination cursor")
+    
+    return position
+
+
+def decode_start_key(cursor: str, partition: Dict[str, str], pk_prefix: str) -> Dict[str, Dict[str, str]]:
+    """Decode a cursor holding a GSI LastEvaluatedKey, rejecting anything DynamoDB would not accept
+    
+    The key must be exactly pk, sort_key and the index partition attribute, each a string attribute
+    ({"S": str}); the partition must hold the listing's value and pk must be an item of its type.
+    """
+    position = decode_cursor(cursor)
+    attributes = {"pk", "sort_key", *partition}
+    if set(position) != attributes or not all(
+        isinstance(value, dict) and set(value) == {"S"} and isinstance(value["S"], str)
+        for value in position.values()
+    ):
+        raise InvalidCursorError("Invalid pagination cursor")
+    
+    belongs = all(position[name]["S"] == value for name, value in partition.items())
+    if not belongs or not position["pk"]["S"].startswith(pk_prefix):
+        raise InvalidCursorError("Cursor does not belong to this listing")
+    return position
@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+import inspect
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+from shared.utils.call_proxy import CallHook, with_hooks
+
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() by which the current request has to be answered (None = unbounded).
+# Set per request by DeadlineMiddleware; tasks and to_thread workers inherit it with the context,
+# except background work started with detached_task.
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """The request's time budget ran out before a dependency answered"""
+    
+    def __init__(self, dependency: str = "request"):
+        super().__init__(f"Deadline exceeded waiting for {dependency}")
+        self.dependency = dependency
+
+
+def start_deadline(seconds: Optional[float]) -> Token:
+    """Bound the current context to seconds from now - never later than an enclosing deadline"""
+    deadline = None if seconds is None else time.monotonic() + max(seconds, 0.0)
+    current = _deadline.get()
+    if current is not None and (deadline is None or current < deadline):
+        deadline = current
+    return _deadline.set(deadline)
+
+
+def end_deadline(token: Token) -> None:
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current budget, None when unbounded"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check(dependency: str = "request") -> None:
+    """Raise DeadlineExceededError when the budget is already spent (before starting expensive work)"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError(dependency)
+
+
+async def within_deadline(awaitable: Awaitable[T], dependency: str = "request") -> T:
+    """Await with whatever is left of the budget as timeout, cancelling the call when it runs out"""
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()  # never started - avoid the "never awaited" warning
+        raise DeadlineExceededError(dependency)
+    
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError(dependency) from None
+
+
+def detached_task(coroutine: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """Start background work that outlives the request in a fresh context, outside its deadline"""
+    return asyncio.get_running_loop().create_task(coroutine, context=contextvars.Context())
+
+
+def bound_by_deadline(target: Any, dependency: str) -> Any:
+    """Proxy running every coroutine method of target (repositories, stores) within the request deadline"""
+    return with_hooks(target, [DeadlineHook(dependency)])
+
+
+class DeadlineHook(CallHook):
+    """Bounds every call by the current deadline, cancelling it when the budget runs out"""
+    
+    def __init__(self, dependency: str):
+        self.dependency = dependency
+    
+    async def __call__(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        if _deadline.get() is None:
+            return await call()
+        return await within_deadline(call(), self.dependency)
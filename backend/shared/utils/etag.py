@@ -0,0 +1,29 @@
+import hashlib
+from typing import Optional
+from starlette.responses import Response
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag from arbitrary parts (versions, IDs) or raw body bytes"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\x00")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check with weak comparison (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 for a client that already holds this version"""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,34 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+from shared.utils.metrics import metrics
+
+
+def _default(value: Any) -> Any:
+    """orjson fallback for types it does not encode natively"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class - one-pass encoding instead of dict building followed by json.dumps
+    
+    Routes return models and keep response_model, so responses are filtered to the public schema;
+    what FastAPI hands over (and error bodies) is encoded with orjson. Returned model instances are
+    not revalidated (FastAPI only re-serializes them), so services must build their models through
+    validation - never model_copy(update=...) with request data. Models passed straight in are
+    encoded by pydantic's Rust serializer - only for responses with no response_model to filter.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        with metrics.timer("serialization"):
+            if isinstance(content, BaseModel):
+                return content.__pydantic_serializer__.to_json(content)
+            return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,21 +1,33 @@
+import hashlib
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import Optional, Tuple
 from shared.config.settings import settings
+from shared.utils.metrics import metrics
+from shared.utils.password_hasher import PasswordHasher
+from shared.utils.ttl_cache import TTLCache
 from core.models.auth import User, TokenPayload
 
 
+def _jose():
+    """Import python-jose on first use - it pulls in cryptography and is kept off the cold-start path"""
+    import jose.jwt
+    return jose
+
+
 class JWTManager:
     """JWT token management utilities"""
     
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.password_hasher = PasswordHasher.from_settings(settings)
         self.secret_key = settings.jwt_secret_key
         self.algorithm = settings.jwt_algorithm
         self.access_token_expire_minutes = settings.jwt_access_token_expire_minutes
         self.refresh_token_expire_days = settings.jwt_refresh_token_expire_days
+        # Verified payloads keyed by token digest, each entry expires at the token's own exp
+        self.token_cache: TTLCache[bytes, TokenPayload] = TTLCache(max_size=settings.jwt_token_cache_size)
     
+    @metrics.timed("jwt_sign")
     def create_access_token(self, user: User) -> str:
         """Create JWT access token for user"""
         expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
@@ -27,11 +39,13 @@ class JWTManager:
             "is_admin": user.is_admin,
             "exp": int(expire.timestamp()),
             "iat": int(datetime.utcnow().timestamp()),
+            "jti": uuid.uuid4().hex,
             "type": "access"
         }
         
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return _jose().jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
     
+    @metrics.timed("jwt_sign")
     def create_refresh_token(self, user: User) -> str:
         """Create JWT refresh token for user"""
         expire = datetime.utcnow() + timedelta(days=self.refresh_token_expire_days)
@@ -41,39 +55,70 @@ class JWTManager:
             "username": user.username,
             "exp": int(expire.timestamp()),
             "iat": int(datetime.utcnow().timestamp()),
+            "jti": uuid.uuid4().hex,
             "type": "refresh"
         }
         
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return _jose().jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
     
+    @metrics.timed("jwt_verify")
     def verify_token(self, token: str) -> Optional[TokenPayload]:
         """Verify and decode JWT token"""
+        cache_key = hashlib.sha256(token.encode()).digest()
+        cached_payload = self.token_cache.get(cache_key)
+        if cached_payload is not None:
+            return cached_payload
+        
+        jose = _jose()
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jose.jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             
             # Check if token is expired
             exp = payload.get("exp")
             if exp and datetime.fromtimestamp(exp) < datetime.utcnow():
                 return None
             
-            return TokenPayload(
+            token_payload = TokenPayload(
                 sub=payload.get("sub"),
                 username=payload.get("username"),
                 email=payload.get("email", ""),
                 is_admin=payload.get("is_admin", False),
                 exp=datetime.fromtimestamp(exp) if exp else datetime.utcnow(),
-                iat=datetime.fromtimestamp(payload.get("iat", datetime.utcnow().timestamp()))
+                iat=datetime.fromtimestamp(payload.get("iat", datetime.utcnow().timestamp())),
+                type=payload.get("type", "access"),
+                jti=payload.get("jti")
             )
-        except JWTError:
+            
+            # Only tokens with an expiry are cached so entries can never outlive the token
+            if exp:
+                self.token_cache.set(cache_key, token_payload, expires_at=exp)
+            
+            return token_payload
+        except jose.JWTError:
             return None
     
     def hash_password(self, password: str) -> str:
         """Hash password for storage"""
-        return self.pwd_context.hash(password)
+        return self.password_hasher.hash(password)
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify password against hash"""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return self.password_hasher.verify(plain_password, hashed_password)
+    
+    @metrics.timed("password_hash")
+    async def hash_password_async(self, password: str) -> str:
+        """Hash password without blocking the event loop"""
+        return await self.password_hasher.hash_async(password)
+    
+    @metrics.timed("password_hash")
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password without blocking the event loop"""
+        return await self.password_hasher.verify_async(plain_password, hashed_password)
+    
+    @metrics.timed("password_hash")
+    async def verify_and_update_password_async(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify password and return an upgraded hash when the stored one is outdated"""
+        return await self.password_hasher.verify_and_update_async(plain_password, hashed_password)
 
 
 # Global JWT manager instance
@@ -0,0 +1,43 @@
+import hashlib
+import threading
+
+
+# Bump whenever the extensions or the sanitizer allow-list change - every stored and cached render
+# carries the version in its key, so old HTML is re-rendered instead of served
+RENDERER_VERSION = 1
+
+MARKDOWN_EXTENSIONS = ("fenced_code", "tables", "sane_lists")
+ALLOWED_TAGS = {
+    "a", "blockquote", "br", "code", "del", "em", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "img",
+    "li", "ol", "p", "pre", "strong", "table", "tbody", "td", "th", "thead", "tr", "ul",
+}
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title"},
+    "img": {"src", "alt", "title"},
+    "code": {"class"},  # language-* from fenced code blocks
+    "td": {"align"},
+    "th": {"align"},
+}
+
+_local = threading.local()
+
+
+def render_key(markdown_text: str) -> str:
+    """Cache key for a rendering - content hash plus renderer version"""
+    digest = hashlib.sha256(markdown_text.encode("utf-8")).hexdigest()
+    return f"{digest}:v{RENDERER_VERSION}"
+
+
+def render_markdown(markdown_text: str) -> str:
+    """Markdown to sanitized HTML (CPU-bound; call from a worker thread)"""
+    # markdown and nh3 load on first render, keeping them off the cold start
+    import nh3
+    
+    # Markdown instances are reusable after reset() but not thread-safe - one per thread
+    renderer = getattr(_local, "renderer", None)
+    if renderer is None:
+        import markdown
+        renderer = _local.renderer = markdown.Markdown(extensions=list(MARKDOWN_EXTENSIONS))
+    
+    html = renderer.reset().convert(markdown_text)
+    return nh3.clean(html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES)
@@ -0,0 +1,290 @@
+import bisect
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from shared.config.settings import settings
+from shared.utils.call_proxy import CallHook, with_hooks
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Per-request dependency timings (name -> [seconds, calls]) feeding the Server-Timing header.
+# The dict is shared by reference, so work in asyncio.to_thread workers is counted too.
+_request_timings: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar("request_timings", default=None)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter per label set"""
+    
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+    
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, label_values)} {value:g}")
+        return lines
+
+
+class Gauge:
+    """Current value per label set"""
+    
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+    
+    def set(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = value
+    
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, label_values)} {value:g}")
+        return lines
+
+
+class Histogram:
+    """Fixed-bucket latency histogram per label set (cumulative only when rendered)"""
+    
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}  # labels -> [bucket counts, sum, count]
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float, *label_values: str) -> None:
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][position] += 1
+            series[1] += value
+            series[2] += 1
+    
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_values, (bucket_counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip((*self.buckets, "+Inf"), bucket_counts):
+                    cumulative += bucket_count
+                    le = f'le="{bound if isinstance(bound, str) else format(bound, "g")}"'
+                    lines.append(f"{self.name}_bucket{_labels(self.label_names, label_values, le)} {cumulative}")
+                labels = _labels(self.label_names, label_values)
+                lines.append(f"{self.name}_sum{labels} {total:.6f}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Request and dependency metrics, rendered in the Prometheus text format
+    
+    Dependencies are timed with timed() / timer(); each timing is recorded in the
+    dependency_duration_seconds histogram and in the current request's Server-Timing totals. With
+    enabled=False, decorators return the function untouched and timers are no-ops.
+    """
+    
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.requests = Histogram(
+            "http_request_duration_seconds",
+            "Request latency by route template",
+            ("method", "route", "status")
+        )
+        self.requests_total = Counter("http_requests_total", "Requests by route template", ("method", "route", "status"))
+        self.dependencies = Histogram(
+            "dependency_duration_seconds",
+            "Time spent in JWT verification, repositories, serialization and other dependencies",
+            ("dependency",)
+        )
+        self.rate_limit_rejections = Counter(
+            "rate_limit_rejections_total",
+            "Requests rejected with 429 by rate limits",
+            ("route", "dimension")
+        )
+        self.deadline_exceeded = Counter(
+            "deadline_exceeded_total",
+            "Requests answered 504 because their deadline ran out, by the dependency being awaited",
+            ("dependency",)
+        )
+        self.circuit_state = Gauge(
+            "circuit_breaker_state",
+            "Circuit breaker state per dependency (0 closed, 1 half-open, 2 open)",
+            ("dependency",)
+        )
+        self.circuit_trips = Counter("circuit_breaker_trips_total", "Times a circuit breaker opened", ("dependency",))
+        self.circuit_rejections = Counter(
+            "circuit_breaker_rejections_total",
+            "Calls failed fast by an open circuit breaker",
+            ("dependency",)
+        )
+        self.hedged_reads = Counter(
+            "hedged_reads_total",
+            "Duplicate reads sent after the hedge delay, by which request answered first",
+            ("dependency", "winner")
+        )
+    
+    def render(self) -> str:
+        """Prometheus text exposition of every metric"""
+        lines = [
+            *self.requests.render(),
+            *self.requests_total.render(),
+            *self.dependencies.render(),
+            *self.rate_limit_rejections.render(),
+            *self.deadline_exceeded.render(),
+            *self.circuit_state.render(),
+            *self.circuit_trips.render(),
+            *self.circuit_rejections.render(),
+            *self.hedged_reads.render(),
+        ]
+        return "\n".join(lines) + "\n"
+    
+    def record(self, dependency: str, seconds: float) -> None:
+        """Record one dependency call"""
+        self.dependencies.observe(seconds, dependency)
+        timings = _request_timings.get()
+        if timings is not None:
+            entry = timings.get(dependency)
+            if entry is None:
+                timings[dependency] = [seconds, 1]
+            else:
+                entry[0] += seconds
+                entry[1] += 1
+    
+    @contextmanager
+    def timer(self, dependency: str) -> Iterator[None]:
+        """Time a block as one dependency call"""
+        if not self.enabled:
+            yield
+            return
+        
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(dependency, time.perf_counter() - started)
+    
+    def timed(self, dependency: str) -> Callable:
+        """Decorator timing every call of a sync or async function"""
+        def decorator(func: Callable) -> Callable:
+            if not self.enabled:
+                return func
+            
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    started = time.perf_counter()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        self.record(dependency, time.perf_counter() - started)
+                return async_wrapper
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(dependency, time.perf_counter() - started)
+            return wrapper
+        return decorator
+    
+    def instrument(self, target: Any, dependency: str) -> Any:
+        """Proxy timing every coroutine method of target (repositories, stores), or target itself when disabled"""
+        if not self.enabled or target is None:
+            return target
+        return with_hooks(target, [TimingHook(dependency, self)])
+    
+    def begin_request(self) -> Token:
+        """Start collecting Server-Timing entries for the current request"""
+        return _request_timings.set({})
+    
+    def end_request(self, token: Token) -> None:
+        _request_timings.reset(token)
+    
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Record one finished request"""
+        self.requests.observe(seconds, method, route, str(status))
+        self.requests_total.inc(method, route, str(status))
+    
+    def server_timing(self, total_seconds: float) -> str:
+        """Server-Timing header value for the current request (durations in milliseconds)"""
+        entries = [f"app;dur={total_seconds * 1000:.1f}"]
+        for dependency, (seconds, calls) in (_request_timings.get() or {}).items():
+            entries.append(f'{dependency};dur={seconds * 1000:.1f};desc="{calls:g} calls"')
+        return ", ".join(entries)
+
+
+class TimingHook(CallHook):
+    """Times every call under one dependency name"""
+    
+    def __init__(self, dependency: str, registry: MetricsRegistry):
+        self.dependency = dependency
+        self._registry = registry
+    
+    async def __call__(self, operation: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        if not self._registry.enabled:
+            return await call()
+        started = time.perf_counter()
+        try:
+            return await call()
+        finally:
+            self._registry.record(self.dependency, time.perf_counter() - started)
+
+
+# Global registry - METRICS_ENABLED=false removes the instrumentation entirely
+metrics = MetricsRegistry(enabled=settings.metrics_enabled)
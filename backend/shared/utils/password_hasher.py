@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the hashing queue is full - callers should answer 503 and retry later"""
+
+
+class PasswordHasher:
+    """Password hashing with async variants that run on a dedicated, size-limited thread pool"""
+    
+    def __init__(
+        self,
+        schemes: List[str],
+        scheme_options: Optional[Dict[str, Any]] = None,
+        max_workers: int = 2,
+        max_pending: int = 32
+    ):
+        self.schemes = schemes
+        self.scheme_options = scheme_options or {}
+        self._pwd_context = None
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def pwd_context(self):
+        """passlib CryptContext, built (and passlib imported) on first use to keep cold starts cheap"""
+        if self._pwd_context is None:
+            from passlib.context import CryptContext
+            # The first scheme hashes new passwords; the rest are verify-only and flagged by needs_update
+            self._pwd_context = CryptContext(schemes=self.schemes, deprecated="auto", **self.scheme_options)
+        return self._pwd_context
+    
+    @classmethod
+    def from_settings(cls, settings) -> "PasswordHasher":
+        """Build hasher from application settings"""
+        schemes = [scheme.strip() for scheme in settings.password_hash_schemes.split(",") if scheme.strip()]
+        scheme_options: Dict[str, Any] = {}
+        if "bcrypt" in schemes:
+            scheme_options["bcrypt__rounds"] = settings.password_bcrypt_rounds
+        if "argon2" in schemes:
+            scheme_options["argon2__time_cost"] = settings.password_argon2_time_cost
+            scheme_options["argon2__memory_cost"] = settings.password_argon2_memory_cost
+        
+        return cls(
+            schemes=schemes,
+            scheme_options=scheme_options,
+            max_workers=settings.password_hash_max_workers,
+            max_pending=settings.password_hash_max_pending
+        )
+    
+    def hash(self, password: str) -> str:
+        """Hash password for storage (blocking)"""
+        return self.pwd_context.hash(password)
+    
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password against hash (blocking)"""
+        return self.pwd_context.verify(plain_password, hashed_password)
+    
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether a hash uses a deprecated scheme or outdated cost parameters"""
+        return self.pwd_context.needs_update(hashed_password)
+    
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify password and return a replacement hash when the stored one is outdated (blocking)"""
+        return self.pwd_context.verify_and_update(plain_password, hashed_password)
+    
+    async def hash_async(self, password: str) -> str:
+        """Hash password on the hashing pool"""
+        return await self._run(self.hash, password)
+    
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password on the hashing pool"""
+        return await self._run(self.verify, plain_password, hashed_password)
+    
+    async def verify_and_update_async(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify password and compute an upgraded hash on the hashing pool"""
+        return await self._run(self.verify_and_update, plain_password, hashed_password)
+    
+    async def dummy_verify_async(self) -> None:
+        """Spend a verification's worth of time so unknown usernames are not distinguishable by latency"""
+        await self._run(self.pwd_context.dummy_verify)
+    
+    async def _run(self, func: Callable, *args) -> Any:
+        """Run blocking work on the pool, rejecting new work once max_pending jobs are queued"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusyError("Password hashing queue is full")
+            self._pending += 1
+        
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the pool on first use"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="password-hasher"
+                    )
+        return self._executor
+    
+    @property
+    def pending(self) -> int:
+        """Jobs currently queued or running"""
+        return self._pending
+    
+    def shutdown(self) -> None:
+        """Stop the hashing pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
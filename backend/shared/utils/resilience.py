@@ -0,0 +1,221 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Collection, Deque, List, Optional, Tuple, Type, TypeVar
+from shared.utils.call_proxy import CallHook
+from shared.utils.metrics import MetricsRegistry, metrics
+
+
+T = TypeVar("T")
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Latency samples needed before the adaptive hedge delay (p95) is trusted
+MIN_HEDGE_SAMPLES = 20
+
+# AWS error codes caused by the request itself - a healthy service rejecting bad input or a lost race
+CLIENT_ERROR_CODES = frozenset({"ValidationException", "ConditionalCheckFailedException"})
+
+
+def is_client_error(exc: BaseException) -> bool:
+    """botocore ClientError with a CLIENT_ERROR_CODES code (matched by shape, so botocore stays lazy)"""
+    response = getattr(exc, "response", None)
+    return isinstance(response, dict) and response.get("Error", {}).get("Code") in CLIENT_ERROR_CODES
+
+
+class CircuitOpenError(Exception):
+    """The dependency's circuit breaker is open - the call failed fast without reaching it"""
+    
+    def __init__(self, dependency: str, retry_after: float):
+        super().__init__(f"Circuit open for {dependency}")
+        self.dependency = dependency
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one dependency
+    
+    Opens after failure_threshold consecutive failures - errors, or calls slower than
+    slow_call_seconds (including ones cancelled by the request deadline after that long) - and
+    then fails calls fast for reset_seconds. After that up to half_open_probes trial calls go
+    through: a success closes the breaker, a failure opens it again. Exceptions in excluded, and AWS
+    client errors, are answers, not failures (not found, validation). Used from the event loop only, so no locking.
+    """
+    
+    def __init__(
+        self,
+        dependency: str,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30,
+        half_open_probes: int = 1,
+        slow_call_seconds: Optional[float] = None,
+        excluded: Tuple[Type[BaseException], ...] = (),
+        clock: Callable[[], float] = time.monotonic,
+        registry: MetricsRegistry = metrics
+    ):
+        self.dependency = dependency
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.half_open_probes = half_open_probes
+        self.slow_call_seconds = slow_call_seconds
+        self.excluded = excluded
+        self._clock = clock
+        self._registry = registry
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.trips = 0
+        registry.circuit_state.set(_STATE_VALUES[CLOSED], dependency)
+    
+    async def call(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Run func through the breaker (raises CircuitOpenError while open)"""
+        self.before_call()
+        started = self._clock()
+        try:
+            result = await func(*args, **kwargs)
+        except self.excluded:
+            self.record_success(self._clock() - started)
+            raise
+        except asyncio.CancelledError:
+            if self._is_slow(self._clock() - started):
+                self.record_failure()
+            elif self.state == HALF_OPEN:
+                self.probes -= 1
+            raise
+        except Exception as exc:
+            if is_client_error(exc):
+                self.record_success(self._clock() - started)
+            else:
+                self.record_failure()
+            raise
+        self.record_success(self._clock() - started)
+        return result
+    
+    def before_call(self) -> None:
+        """Admit a call, or raise CircuitOpenError"""
+        if self.state == OPEN:
+            retry_after = self.opened_at + self.reset_seconds - self._clock()
+            if retry_after > 0:
+                self._registry.circuit_rejections.inc(self.dependency)
+                raise CircuitOpenError(self.dependency, retry_after)
+            self._transition(HALF_OPEN)
+        
+        if self.state == HALF_OPEN:
+            if self.probes >= self.half_open_probes:
+                self._registry.circuit_rejections.inc(self.dependency)
+                raise CircuitOpenError(self.dependency, 1.0)
+            self.probes += 1
+    
+    def record_success(self, seconds: float) -> None:
+        if self._is_slow(seconds):
+            self.record_failure()
+            return
+        if self.state == HALF_OPEN:
+            self._transition(CLOSED)
+        self.failures = 0
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+            self.opened_at = self._clock()
+            self.trips += 1
+            self._registry.circuit_trips.inc(self.dependency)
+            self._transition(OPEN)
+    
+    def _is_slow(self, seconds: float) -> bool:
+        return self.slow_call_seconds is not None and seconds >= self.slow_call_seconds
+    
+    def _transition(self, state: str) -> None:
+        self.state = state
+        self.probes = 0
+        if state == CLOSED:
+            self.failures = 0
+        self._registry.circuit_state.set(_STATE_VALUES[state], self.dependency)
+
+
+class ResilienceHook(CallHook):
+    """Runs every call through a circuit breaker, hedging idempotent reads
+    
+    A hedged read that has not answered after the hedge delay - hedge_after seconds, or the p95 of
+    recent reads when None - is sent a second time and the first success wins; the slower copy is
+    cancelled. Hedges are capped at max_hedge_ratio of reads so a slow dependency does not get
+    double the load, and stop while the breaker is not closed.
+    """
+    
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        hedged_methods: Collection[str] = (),
+        hedge_after: Optional[float] = None,
+        hedge_min: float = 0.01,
+        max_hedge_ratio: float = 0.1,
+        registry: MetricsRegistry = metrics
+    ):
+        self.breaker = breaker
+        self.hedged_methods = frozenset(hedged_methods)
+        self.hedge_after = hedge_after
+        self.hedge_min = hedge_min
+        self.max_hedge_ratio = max_hedge_ratio
+        self._registry = registry
+        self._latencies: Deque[float] = deque(maxlen=128)
+        self.reads = 0
+        self.hedges = 0
+    
+    async def __call__(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        if operation in self.hedged_methods:
+            return await self.breaker.call(self._hedged, call)
+        return await self.breaker.call(call)
+    
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before duplicating the next read, None to not hedge it"""
+        if self.breaker.state != CLOSED or self.hedges >= self.max_hedge_ratio * self.reads:
+            return None
+        if self.hedge_after is not None:
+            return self.hedge_after
+        if len(self._latencies) < MIN_HEDGE_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return max(ordered[int(0.95 * (len(ordered) - 1))], self.hedge_min)
+    
+    async def _hedged(self, call: Callable[[], Awaitable[T]]) -> T:
+        self.reads += 1
+        started = time.perf_counter()
+        delay = self.hedge_delay()
+        if delay is None:
+            result = await call()
+            self._latencies.append(time.perf_counter() - started)
+            return result
+        
+        tasks: List[asyncio.Future] = [asyncio.ensure_future(call())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self.hedges += 1
+                tasks.append(asyncio.ensure_future(call()))
+            winner = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        if len(tasks) > 1:
+            self._registry.hedged_reads.inc(self.breaker.dependency, "hedge" if winner is tasks[1] else "primary")
+        result = winner.result()  # re-raises when every copy failed
+        self._latencies.append(time.perf_counter() - started)
+        return result
+
+
+async def _first_success(tasks: List[asyncio.Future]) -> asyncio.Future:
+    """First task to succeed, or the last to fail when none does"""
+    pending = set(tasks)
+    while True:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        failed = None
+        for task in done:
+            if task.exception() is None:
+                return task
+            failed = task
+        if not pending:
+            return failed
@@ -0,0 +1,204 @@
+import bisect
+import marshal
+import math
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+SNAPSHOT_MAGIC = b"FOSI"
+SNAPSHOT_VERSION = 1
+MAX_PREFIX_EXPANSIONS = 64
+PREFIX_WEIGHT = 0.7  # completions of a partial word score a little below an exact word
+
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the this to was were will with".split()
+)
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded, accent-stripped word tokens without stop words"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return [token for token in _TOKEN.findall(stripped) if token not in STOP_WORDS]
+
+
+class SearchIndex:
+    """In-memory inverted index with BM25 ranking and prefix matching on the last query word
+    
+    Documents are weighted text fields (title counts more than a caption) plus a small stored dict
+    returned with each hit. Term frequencies are field-weighted (BM25F-style). Documents can be added,
+    replaced and removed one at a time, and the whole index round-trips through a compact
+    marshal + zlib snapshot.
+    """
+    
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[int, float]] = {}  # term -> slot -> weighted term frequency
+        self._slots: Dict[str, int] = {}  # document ID -> slot
+        self._doc_ids: List[Optional[str]] = []  # slot -> document ID, None once removed
+        self._lengths: List[float] = []
+        self._stored: List[Optional[Dict[str, Any]]] = []
+        self._doc_terms: List[Optional[List[str]]] = []  # slot -> its terms, so removal touches only those
+        self._total_length = 0.0
+        self._sorted_terms: Optional[List[str]] = None  # rebuilt lazily for prefix lookups
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._slots
+    
+    def add(self, doc_id: str, fields: Iterable[Tuple[str, float]], stored: Optional[Dict[str, Any]] = None) -> None:
+        """Index (or re-index) a document from (text, weight) fields"""
+        self.remove(doc_id)
+        
+        frequencies: Counter = Counter()
+        for text, weight in fields:
+            for token in tokenize(text or ""):
+                frequencies[token] += weight
+        
+        slot = len(self._doc_ids)
+        self._slots[doc_id] = slot
+        self._doc_ids.append(doc_id)
+        length = sum(frequencies.values())
+        self._lengths.append(length)
+        self._stored.append(stored or {})
+        self._doc_terms.append(list(frequencies))
+        self._total_length += length
+        
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                self._postings[term] = postings = {}
+                self._sorted_terms = None
+            postings[slot] = frequency
+    
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document; its slot stays empty until the next snapshot compacts the index"""
+        slot = self._slots.pop(doc_id, None)
+        if slot is None:
+            return False
+        
+        for term in self._doc_terms[slot]:
+            postings = self._postings[term]
+            del postings[slot]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        
+        self._total_length -= self._lengths[slot]
+        self._doc_ids[slot] = None
+        self._stored[slot] = None
+        self._doc_terms[slot] = None
+        if len(self._doc_ids) > 2 * len(self._slots) + 64:
+            self._compact()
+        return True
+    
+    def search(self, query: str, limit: int = 20, **filters: Any) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """Top documents as (doc_id, score, stored), optionally filtered on stored values"""
+        tokens = tokenize(query)
+        if not tokens or not self._slots:
+            return []
+        
+        # Earlier words match whole terms; the last also matches as a prefix (search as you type)
+        weighted_terms = [(token, 1.0) for token in tokens[:-1]]
+        last = tokens[-1]
+        weighted_terms.append((last, 1.0))
+        weighted_terms.extend((term, PREFIX_WEIGHT) for term in self._expand_prefix(last) if term != last)
+        
+        doc_count = len(self._slots)
+        average_length = self._total_length / doc_count or 1.0
+        scores: Dict[int, float] = {}
+        for term, term_weight in weighted_terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for slot, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[slot] / average_length)
+                scores[slot] = scores.get(slot, 0.0) + term_weight * idf * frequency * (self.k1 + 1) / (frequency + norm)
+        
+        if filters:
+            scores = {
+                slot: score for slot, score in scores.items()
+                if all(self._stored[slot].get(key) == value for key, value in filters.items())
+            }
+        
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self._doc_ids[slot], score, self._stored[slot]) for slot, score in ranked]
+    
+    def to_bytes(self) -> bytes:
+        """Compact snapshot - postings as parallel slot / frequency lists"""
+        self._compact()
+        payload = (
+            SNAPSHOT_VERSION,
+            self.k1,
+            self.b,
+            self._doc_ids,
+            self._lengths,
+            self._stored,
+            {term: (list(postings), list(postings.values())) for term, postings in self._postings.items()},
+        )
+        return SNAPSHOT_MAGIC + zlib.compress(marshal.dumps(payload), 6)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SearchIndex":
+        """Restore a snapshot written by to_bytes (raises ValueError if unreadable)"""
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("Not a search index snapshot")
+        try:
+            version, k1, b, doc_ids, lengths, stored, postings = marshal.loads(zlib.decompress(data[len(SNAPSHOT_MAGIC):]))
+        except (zlib.error, EOFError, TypeError, ValueError) as exc:
+            raise ValueError("Corrupt search index snapshot") from exc
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported search index snapshot version {version}")
+        
+        index = cls(k1=k1, b=b)
+        index._doc_ids = doc_ids
+        index._slots = {doc_id: slot for slot, doc_id in enumerate(doc_ids)}
+        index._lengths = lengths
+        index._stored = stored
+        index._total_length = sum(lengths)
+        index._postings = {term: dict(zip(slots, frequencies)) for term, (slots, frequencies) in postings.items()}
+        index._doc_terms = [[] for _ in doc_ids]
+        for term, (slots, _) in postings.items():
+            for slot in slots:
+                index._doc_terms[slot].append(term)
+        return index
+    
+    def _compact(self) -> None:
+        """Renumber live documents into contiguous slots"""
+        live = [slot for slot, doc_id in enumerate(self._doc_ids) if doc_id is not None]
+        if len(live) == len(self._doc_ids):
+            return
+        
+        remap = {slot: index for index, slot in enumerate(live)}
+        self._doc_ids = [self._doc_ids[slot] for slot in live]
+        self._lengths = [self._lengths[slot] for slot in live]
+        self._stored = [self._stored[slot] for slot in live]
+        self._doc_terms = [self._doc_terms[slot] for slot in live]
+        self._slots = {doc_id: slot for slot, doc_id in enumerate(self._doc_ids)}
+        self._postings = {
+            term: {remap[slot]: frequency for slot, frequency in postings.items()}
+            for term, postings in self._postings.items()
+        }
+    
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Indexed terms starting with prefix (bounded)"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        
+        terms = []
+        position = bisect.bisect_left(self._sorted_terms, prefix)
+        while position < len(self._sorted_terms) and len(terms) < MAX_PREFIX_EXPANSIONS:
+            term = self._sorted_terms[position]
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+            position += 1
+        return terms
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket - holds up to capacity tokens, refilled continuously over period_seconds"""
+    capacity: float
+    period_seconds: float
+    
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+
+def parse_rate_limit(spec: str) -> RateLimit:
+    """Parse "5/minute", "20/hour" or "10/30" (seconds) into a RateLimit (raises ValueError)"""
+    count, _, period = spec.strip().partition("/")
+    period = period.strip().lower()
+    period = PERIODS.get(period) or PERIODS.get(period[:-1]) or period.rstrip("s")  # "minutes", "30s"
+    try:
+        capacity = float(count)
+        period_seconds = float(period or "nan")
+    except ValueError:
+        raise ValueError(f"Invalid rate limit: {spec!r}")
+    if not capacity > 0 or not period_seconds > 0:
+        raise ValueError(f"Invalid rate limit: {spec!r}")
+    return RateLimit(capacity, period_seconds)
+
+
+def take(tokens: float, updated_at: float, now: float, limit: RateLimit, cost: float = 1.0) -> Tuple[float, float]:
+    """Refill a bucket to now and try to take cost tokens
+    
+    Returns (tokens left, seconds until cost tokens are available) - the call is allowed when the
+    wait is 0, and the bucket is left untouched (apart from the refill) when it is not.
+    """
+    tokens = min(limit.capacity, tokens + max(now - updated_at, 0.0) * limit.refill_per_second)
+    if tokens >= cost:
+        return tokens - cost, 0.0
+    return tokens, (cost - tokens) / limit.refill_per_second
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded, thread-safe LRU cache where every entry carries its own expiry"""
+    
+    def __init__(
+        self,
+        max_size: int,
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[V, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: K, default: Any = None) -> Any:
+        """Return cached value, or default when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl: Optional[float] = None,
+        expires_at: Optional[float] = None
+    ) -> None:
+        """Store value until expires_at (absolute clock time) or for ttl seconds"""
+        if self.max_size <= 0:
+            return
+        
+        if expires_at is None:
+            ttl = ttl if ttl is not None else self.default_ttl
+            expires_at = self._clock() + ttl if ttl is not None else None
+        
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def pop(self, key: K) -> None:
+        """Remove a single entry if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of cache counters"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,134 @@
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from core.interfaces.auth_repository import IAuthRepository
+from core.models.auth import User
+from core.services.auth_service import AuthService
+from shared.dependencies.auth import get_current_principal, get_current_admin_user, get_optional_principal
+from shared.utils.jwt_manager import jwt_manager
+
+
+@pytest.fixture
+def mock_auth_repository():
+    """Mock auth repository for testing"""
+    return AsyncMock(spec=IAuthRepository)
+
+
+@pytest.fixture
+def auth_service(mock_auth_repository):
+    """Auth service with mocked repository"""
+    return AuthService(mock_auth_repository)
+
+
+@pytest.fixture
+def admin_user():
+    """Sample admin user for testing"""
+    return User(
+        id="admin123",
+        username="admin",
+        email="admin@example.com",
+        is_admin=True,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.unit
+class TestStatelessPrincipalMode:
+    
+    async def test_admin_authorized_from_claims(self, monkeypatch, auth_service, mock_auth_repository, admin_user):
+        """Test stateless mode authorizes admins without touching the repository"""
+        monkeypatch.setattr("shared.dependencies.auth.settings.auth_stateless_principal", True)
+        token = jwt_manager.create_access_token(admin_user)
+        
+        principal = await get_current_principal(bearer(token), auth_service)
+        admin = await get_current_admin_user(principal)
+        
+        assert admin.id == admin_user.id
+        mock_auth_repository.get_user_by_id.assert_not_called()
+    
+    async def test_stateful_mode_uses_repository(self, monkeypatch, auth_service, mock_auth_repository, admin_user):
+        """Test default mode re-reads the user and rejects demoted admins"""
+        monkeypatch.setattr("shared.dependencies.auth.settings.auth_stateless_principal", False)
+        token = jwt_manager.create_access_token(admin_user)
+        mock_auth_repository.get_user_by_id.return_value = admin_user.model_copy(update={"is_admin": False})
+        
+        principal = await get_current_principal(bearer(token), auth_service)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_admin_user(principal)
+        
+        assert exc_info.value.status_code == 403
+    
+    async def test_invalid_token_rejected(self, auth_service):
+        """Test invalid tokens produce 401"""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_principal(bearer("invalid.jwt.token"), auth_service)
+        
+        assert exc_info.value.status_code == 401
+
+
+@pytest.fixture
+def optional_auth_client(async_client, container):
+    """Client for a route that personalises its answer when a valid token is sent"""
+    from httpx import ASGITransport, AsyncClient
+    app = FastAPI()
+    app.state.container = container
+    
+    @app.get("/whoami")
+    async def whoami(user=Depends(get_optional_principal)):
+        return {"username": user.username if user else None}
+    
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.integration
+class TestOptionalPrincipal:
+    
+    async def test_anonymous_and_authenticated(self, async_client, optional_auth_client, container, fast_password_hasher):
+        """Test requests without a token pass anonymously and valid tokens resolve the user"""
+        from tests.api.test_auth_endpoints import create_user, login
+        await create_user(container, "reader", "password123")
+        tokens = await login(async_client, "reader", "password123")
+        
+        anonymous = await optional_auth_client.get("/whoami")
+        signed_in = await optional_auth_client.get(
+            "/whoami",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"}
+        )
+        
+        assert anonymous.status_code == 200
+        assert anonymous.json() == {"username": None}
+        assert signed_in.json() == {"username": "reader"}
+    
+    async def test_stateless_mode_skips_repository(self, async_client, optional_auth_client, container, fast_password_hasher, monkeypatch):
+        """Test the caller is resolved from claims alone, without a profile read or User validation"""
+        from unittest.mock import AsyncMock
+        from tests.api.test_auth_endpoints import create_user, login
+        await create_user(container, "reader", "password123")
+        tokens = await login(async_client, "reader", "password123")
+        monkeypatch.setattr("shared.dependencies.auth.settings.auth_stateless_principal", True)
+        monkeypatch.setattr(container.auth_repository, "get_user_by_id", AsyncMock(side_effect=AssertionError("profile read")))
+        
+        response = await optional_auth_client.get("/whoami", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+        
+        assert response.json() == {"username": "reader"}
+    
+    async def test_revoked_token_is_anonymous(self, async_client, optional_auth_client, container, fast_password_hasher):
+        """Test a token revoked by logout no longer identifies the caller on optional-auth routes"""
+        from tests.api.test_auth_endpoints import create_user, login
+        await create_user(container, "reader", "password123")
+        tokens = await login(async_client, "reader", "password123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        await async_client.post("/api/v1/auth/logout", json={"refresh_token": tokens["refresh_token"]}, headers=headers)
+        
+        response = await optional_auth_client.get("/whoami", headers=headers)
+        
+        assert response.status_code == 200
+        assert response.json() == {"username": None}
@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import AsyncMock
+
+
+async def create_user(container, username: str, password: str, is_admin: bool = False):
+    """Seed a user through the container's auth repository"""
+    user = await container.auth_repository.create_user(username, f"{username}@example.com", password)
+    if is_admin:
+        user = await container.auth_repository.update_user(user.model_copy(update={"is_admin": True}))
+    return user
+
+
+async def login(async_client, username: str, password: str) -> dict:
+    response = await async_client.post("/api/v1/auth/login", json={"username": username, "password": password})
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.integration
+class TestAuthEndpoints:
+    
+    async def test_login_and_me(self, async_client, container, fast_password_hasher):
+        """Test login returns tokens that authenticate /auth/me"""
+        user = await create_user(container, "testuser", "password123")
+        tokens = await login(async_client, "testuser", "password123")
+        
+        response = await async_client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["id"] == user.id
+    
+    async def test_login_wrong_password(self, async_client, container, fast_password_hasher):
+        """Test bad credentials return 401"""
+        await create_user(container, "testuser", "password123")
+        
+        response = await async_client.post("/api/v1/auth/login", json={"username": "testuser", "password": "nope"})
+        
+        assert response.status_code == 401
+    
+    async def test_refresh(self, async_client, container, fast_password_hasher):
+        """Test refresh token issues a new access token"""
+        await create_user(container, "testuser", "password123")
+        tokens = await login(async_client, "testuser", "password123")
+        
+        response = await async_client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        
+        assert response.status_code == 200
+        assert response.json()["access_token"]
+    
+    async def test_logout_revokes_tokens(self, async_client, container, fast_password_hasher):
+        """Test tokens stop working after logout"""
+        await create_user(container, "testuser", "password123")
+        tokens = await login(async_client, "testuser", "password123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        
+        response = await async_client.post(
+            "/api/v1/auth/logout",
+            json={"refresh_token": tokens["refresh_token"]},
+            headers=headers
+        )
+        assert response.status_code == 200
+        
+        assert (await async_client.get("/api/v1/auth/me", headers=headers)).status_code == 401
+        refresh = await async_client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert refresh.status_code == 401
+    
+    async def test_admin_endpoint_requires_admin(self, async_client, container, fast_password_hasher):
+        """Test admin-only endpoint rejects regular users and accepts admins"""
+        await create_user(container, "regular", "password123")
+        await create_user(container, "admin", "password123", is_admin=True)
+        
+        regular = await login(async_client, "regular", "password123")
+        admin = await login(async_client, "admin", "password123")
+        
+        forbidden = await async_client.get(
+            "/api/v1/auth/admin/users",
+            headers={"Authorization": f"Bearer {regular['access_token']}"}
+        )
+        allowed = await async_client.get(
+            "/api/v1/auth/admin/users",
+            headers={"Authorization": f"Bearer {admin['access_token']}"}
+        )
+        
+        assert forbidden.status_code == 403
+        assert allowed.status_code == 200
+    
+    async def test_container_is_shared_across_requests(self, async_client, container):
+        """Test the auth service is created once per app, not per request"""
+        from shared.dependencies.auth import get_auth_service
+        
+        first = await get_auth_service(container)
+        second = await get_auth_service(container)
+        
+        assert first is second is container.auth_service
+    
+    async def test_login_rate_limited_per_username(self, async_client, container, fast_password_hasher, monkeypatch):
+        """Test excess logins get 429 with Retry-After before any password verification"""
+        from shared.utils.metrics import metrics
+        await create_user(container, "testuser", "password123")
+        for _ in range(5):
+            response = await async_client.post("/api/v1/auth/login", json={"username": "TestUser", "password": "nope"})
+            assert response.status_code == 401
+        
+        verify = AsyncMock()
+        monkeypatch.setattr(container.auth_service, "login", verify)
+        rejected_before = metrics.rate_limit_rejections.value("login", "username")
+        response = await async_client.post("/api/v1/auth/login", json={"username": "testuser", "password": "password123"})
+        
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) >= 1
+        verify.assert_not_called()
+        assert metrics.rate_limit_rejections.value("login", "username") == rejected_before + 1
@@ -0,0 +1,57 @@
+import pytest
+
+
+@pytest.mark.integration
+class TestBlogEndpoints:
+    
+    async def test_create_read_and_search_post(self, async_client, admin_headers):
+        """Test admin posts are served rendered, listed, searchable and revalidated by ETag"""
+        created = await async_client.post(
+            "/api/v1/posts",
+            json={"title": "Healing tips", "body_markdown": "Keep it **moisturized**", "tags": ["aftercare"]},
+            headers=admin_headers
+        )
+        assert created.status_code == 201
+        post_id = created.json()["id"]
+        
+        response = await async_client.get(f"/api/v1/posts/{post_id}")
+        assert response.json()["body_html"] == "<p>Keep it <strong>moisturized</strong></p>"
+        revalidated = await async_client.get(f"/api/v1/posts/{post_id}", headers={"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304
+        
+        listing = (await async_client.get("/api/v1/posts")).json()
+        assert [item["id"] for item in listing["items"]] == [post_id]
+        assert "body_html" not in listing["items"][0]
+        
+        hits = (await async_client.get("/api/v1/search", params={"q": "moistur", "type": "post"})).json()["hits"]
+        assert [(hit["type"], hit["id"]) for hit in hits] == [("post", post_id)]
+    
+    async def test_delete_post(self, async_client, admin_headers):
+        """Test deleted posts are gone and unknown posts 404"""
+        created = await async_client.post(
+            "/api/v1/posts",
+            json={"title": "Draft", "body_markdown": "text"},
+            headers=admin_headers
+        )
+        post_id = created.json()["id"]
+        
+        assert (await async_client.delete(f"/api/v1/posts/{post_id}", headers=admin_headers)).status_code == 204
+        assert (await async_client.get(f"/api/v1/posts/{post_id}")).status_code == 404
+        assert (await async_client.get("/api/v1/search", params={"q": "draft"})).json()["hits"] == []
+    
+    async def test_update_rejects_null_fields(self, async_client, admin_headers):
+        """Test explicit nulls are a validation error rather than a stored null"""
+        created = await async_client.post(
+            "/api/v1/posts",
+            json={"title": "Draft", "body_markdown": "text"},
+            headers=admin_headers
+        )
+        url = f"/api/v1/posts/{created.json()['id']}"
+        
+        for field in ("title", "summary", "body_markdown", "tags"):
+            response = await async_client.put(url, json={field: None}, headers=admin_headers)
+            assert response.status_code == 422, field
+        renamed = await async_client.put(url, json={"title": "Final"}, headers=admin_headers)
+        
+        assert renamed.json()["title"] == "Final"
+        assert (await async_client.get(url)).json()["body_markdown"] == "text"
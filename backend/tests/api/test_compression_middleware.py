@@ -0,0 +1,175 @@
+import gzip
+import brotli
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from shared.middleware import compression
+from shared.middleware.compression import CompressionMiddleware, choose_encoding
+from shared.middleware.etag import CachePolicy, ETagMiddleware
+
+
+PAYLOAD = {"items": [{"title": f"Gallery {index}", "tags": ["flash", "linework"]} for index in range(100)]}
+
+
+@pytest.fixture
+def app():
+    """Small app behind compression and ETag middleware, in production order"""
+    app = FastAPI()
+    app.add_middleware(ETagMiddleware, policies=[CachePolicy("/public", "public, max-age=60")])
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    
+    @app.get("/public/large")
+    async def large():
+        return PAYLOAD
+    
+    @app.get("/public/small")
+    async def small():
+        return {"name": "small"}
+    
+    @app.get("/versioned")
+    async def versioned(response: Response):
+        response.headers["ETag"] = '"v1"'
+        return PAYLOAD
+    
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"a" * 1000, b"b" * 1000]), media_type="text/plain")
+    
+    @app.get("/image")
+    async def image():
+        return Response(b"\x89PNG" * 500, media_type="image/png")
+    
+    return app
+
+
+def get(client: TestClient, path: str, accept_encoding: str, **headers):
+    """GET with an explicit Accept-Encoding, returning the raw (still encoded) bytes"""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding, **headers}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.unit
+class TestChooseEncoding:
+    
+    def test_prefers_brotli_and_honours_q_values(self):
+        """Test brotli wins when accepted and q=0 refuses a coding"""
+        assert choose_encoding("gzip, deflate, br") == "br"
+        assert choose_encoding("gzip, br;q=0") == "gzip"
+        assert choose_encoding("*") == "br"
+        assert choose_encoding("identity") is None
+        assert choose_encoding(None) is None
+    
+    def test_gzip_only_without_brotli(self, monkeypatch):
+        """Test brotli is skipped when the package is unavailable"""
+        monkeypatch.setattr(compression, "brotli", None)
+        
+        assert choose_encoding("br, gzip") == "gzip"
+        assert choose_encoding("br") is None
+
+
+@pytest.mark.unit
+class TestCompressionMiddleware:
+    
+    def test_compresses_large_json(self, app):
+        """Test large bodies are gzip / brotli encoded with weak ETags and Vary"""
+        client = TestClient(app)
+        
+        gzipped, gzip_body = get(client, "/public/large", "gzip")
+        brotlied, brotli_body = get(client, "/public/large", "br")
+        
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert brotlied.headers["content-encoding"] == "br"
+        assert gzip.decompress(gzip_body) == brotli.decompress(brotli_body)
+        assert int(gzipped.headers["content-length"]) == len(gzip_body)
+        assert gzipped.headers["etag"].startswith('W/"')
+        assert gzipped.headers["vary"] == "Accept-Encoding"
+    
+    def test_small_and_identity_responses_untouched(self, app):
+        """Test bodies under the threshold and clients without codings get identity"""
+        client = TestClient(app)
+        
+        small, _ = get(client, "/public/small", "gzip")
+        identity, body = get(client, "/public/large", "identity")
+        image, _ = get(client, "/image", "gzip")
+        
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["vary"] == "Accept-Encoding"
+        assert body.startswith(b'{"items"')
+        assert "content-encoding" not in image.headers
+    
+    def test_weak_etag_revalidates(self, app):
+        """Test the weakened ETag still produces a 304"""
+        client = TestClient(app)
+        first, _ = get(client, "/public/large", "gzip")
+        
+        second, _ = get(client, "/public/large", "gzip", **{"If-None-Match": first.headers["etag"]})
+        
+        assert second.status_code == 304
+    
+    def test_not_modified_repeats_the_compressed_validator(self, app):
+        """Test a 304 carries the same weak ETag as the 200 it revalidates, and Vary"""
+        client = TestClient(app)
+        
+        for path in ("/public/large", "/public/small"):
+            first, _ = get(client, path, "gzip")
+            second, _ = get(client, path, "gzip", **{"If-None-Match": first.headers["etag"]})
+            
+            assert first.headers["etag"].startswith('W/"')
+            assert second.status_code == 304
+            assert second.headers["etag"] == first.headers["etag"]
+            assert second.headers["vary"] == "Accept-Encoding"
+    
+    def test_etag_responses_compressed_once(self, app, monkeypatch):
+        """Test repeat hits for the same ETag reuse the cached encoding"""
+        client = TestClient(app)
+        calls = []
+        original = CompressionMiddleware.compressor
+        
+        def counting_compressor(self, encoding):
+            calls.append(encoding)
+            return original(self, encoding)
+        
+        monkeypatch.setattr(CompressionMiddleware, "compressor", counting_compressor)
+        
+        bodies = {get(client, "/versioned", "gzip")[1] for _ in range(3)}
+        get(client, "/versioned", "br")
+        
+        assert len(bodies) == 1
+        assert calls == ["gzip", "br"]
+    
+    def test_streams_are_compressed_incrementally(self, app):
+        """Test streamed bodies are encoded chunk by chunk without a Content-Length"""
+        client = TestClient(app)
+        
+        response, body = get(client, "/stream", "gzip")
+        
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(body) == b"a" * 1000 + b"b" * 1000
+
+
+@pytest.mark.integration
+class TestCompressedConditionalGet:
+    
+    async def test_gallery_listing_revalidates_compressed(self, async_client, admin_headers):
+        """Test a gzip client revalidating the real gallery listing gets a 304 with the ETag it cached"""
+        for index in range(20):
+            await async_client.post(
+                "/api/v1/galleries",
+                json={"title": f"Flash sheet {index}", "category": "tattoo"},
+                headers=admin_headers
+            )
+        
+        first = await async_client.get("/api/v1/galleries", headers={"Accept-Encoding": "gzip"})
+        second = await async_client.get(
+            "/api/v1/galleries",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]}
+        )
+        
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.json()["items"]
+        assert second.status_code == 304
+        assert second.headers["etag"] == first.headers["etag"]
+        assert "Accept-Encoding" in second.headers["vary"]
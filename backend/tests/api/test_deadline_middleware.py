@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from shared.middleware.deadline import DeadlineMiddleware
+from shared.utils.deadline import bound_by_deadline, remaining
+from shared.utils.metrics import metrics
+
+
+class SlowStore:
+    """Store that takes longer than any test budget"""
+    
+    async def get(self) -> str:
+        await asyncio.sleep(5)
+        return "late"
+
+
+class LambdaContext:
+    """Stand-in for the Lambda context object Mangum puts in the scope"""
+    
+    def get_remaining_time_in_millis(self) -> int:
+        return 800
+
+
+def build_app(timeout_seconds: float) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware, timeout_seconds=timeout_seconds, margin_seconds=0.5)
+    store = bound_by_deadline(SlowStore(), "slow_store")
+    
+    @app.get("/slow")
+    async def slow():
+        return {"value": await store.get()}
+    
+    @app.get("/busy")
+    async def busy():
+        await asyncio.sleep(5)  # not a dependency call - bounded by the handler guard
+        return {}
+    
+    @app.get("/budget")
+    async def budget():
+        return {"remaining": remaining()}
+    
+    return app
+
+
+@pytest.mark.unit
+class TestDeadlineMiddleware:
+    
+    def test_slow_dependency_answers_504(self):
+        """Test a dependency outliving the budget is cancelled and the request gets a clean 504"""
+        before = metrics.deadline_exceeded.value("slow_store")
+        response = TestClient(build_app(0.1)).get("/slow")
+        
+        assert response.status_code == 504
+        assert response.json() == {"detail": "Request deadline exceeded"}
+        assert metrics.deadline_exceeded.value("slow_store") == before + 1
+    
+    def test_slow_handler_answers_504(self):
+        """Test time spent outside dependency calls is bounded too"""
+        assert TestClient(build_app(0.1)).get("/busy").status_code == 504
+    
+    def test_budget_visible_to_handlers(self):
+        """Test the remaining budget is available while handling the request"""
+        remaining_seconds = TestClient(build_app(2)).get("/budget").json()["remaining"]
+        assert 0 < remaining_seconds <= 2
+    
+    def test_lambda_remaining_time_caps_budget(self):
+        """Test the Lambda invocation's remaining time minus the margin bounds the budget"""
+        middleware = DeadlineMiddleware(build_app(25), timeout_seconds=25, margin_seconds=0.5)
+        
+        assert middleware.budget({"type": "http", "aws.context": LambdaContext()}) == pytest.approx(0.3)
+        assert middleware.budget({"type": "http"}) == 25
+        assert DeadlineMiddleware(build_app(0), timeout_seconds=0).budget({"type": "http"}) is None
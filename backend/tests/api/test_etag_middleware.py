@@ -0,0 +1,103 @@
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from shared.middleware.etag import CachePolicy, ETagMiddleware
+from shared.utils.etag import etag_matches, make_etag
+
+
+@pytest.fixture
+def client():
+    """Small app behind the ETag middleware"""
+    app = FastAPI()
+    app.add_middleware(
+        ETagMiddleware,
+        policies=[CachePolicy("/public", "public, max-age=60"), CachePolicy("/public/live", "no-cache")],
+        max_body_size=64
+    )
+    
+    @app.get("/public/item")
+    async def item():
+        return {"name": "item"}
+    
+    @app.get("/public/live")
+    async def live():
+        return {"name": "live"}
+    
+    @app.get("/public/versioned")
+    async def versioned(response: Response):
+        response.headers["ETag"] = '"v7"'
+        return {"name": "versioned"}
+    
+    @app.get("/public/large")
+    async def large():
+        return StreamingResponse(iter([b"x" * 50, b"y" * 50]), media_type="text/plain")
+    
+    @app.get("/private")
+    async def private():
+        return {"name": "private"}
+    
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestETagHelpers:
+    
+    def test_make_etag_is_strong_and_stable(self):
+        """Test ETags are quoted, strong and deterministic"""
+        assert make_etag("gallery", "g1", 3) == make_etag("gallery", "g1", 3)
+        assert make_etag("gallery", "g1", 3) != make_etag("gallery", "g1", 4)
+        assert make_etag(b"body").startswith('"')
+    
+    def test_etag_matches_uses_weak_comparison(self):
+        """Test If-None-Match lists, wildcards and W/ prefixes"""
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
+
+
+@pytest.mark.unit
+class TestETagMiddleware:
+    
+    def test_hashes_body_and_returns_304(self, client):
+        """Test a body-derived ETag is returned and honoured on revalidation"""
+        first = client.get("/public/item")
+        etag = first.headers["etag"]
+        
+        second = client.get("/public/item", headers={"If-None-Match": etag})
+        
+        assert first.headers["cache-control"] == "public, max-age=60"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert second.headers["cache-control"] == "public, max-age=60"
+    
+    def test_most_specific_policy_wins(self, client):
+        """Test longer path prefixes override their parents"""
+        assert client.get("/public/live").headers["cache-control"] == "no-cache"
+    
+    def test_existing_etag_is_kept(self, client):
+        """Test endpoint-provided ETags are used instead of hashing the body"""
+        response = client.get("/public/versioned")
+        
+        assert response.headers["etag"] == '"v7"'
+        assert client.get("/public/versioned", headers={"If-None-Match": '"v7"'}).status_code == 304
+    
+    def test_large_body_streams_without_etag(self, client):
+        """Test bodies over the buffer limit are passed through unhashed"""
+        response = client.get("/public/large")
+        
+        assert response.status_code == 200
+        assert response.content == b"x" * 50 + b"y" * 50
+        assert "etag" not in response.headers
+    
+    def test_unmatched_and_authorized_requests_untouched(self, client):
+        """Test routes without a policy and authenticated requests get no caching headers"""
+        assert "etag" not in client.get("/private").headers
+        
+        response = client.get("/public/item", headers={"Authorization": "Bearer token"})
+        
+        assert "etag" not in response.headers
+        assert "cache-control" not in response.headers
@@ -0,0 +1,202 @@
+import pytest
+from unittest.mock import AsyncMock
+
+
+@pytest.mark.integration
+class TestGalleryEndpoints:
+    
+    async def test_create_and_get_gallery_with_images(self, async_client, admin_headers, stored_image):
+        """Test admin-created galleries are readable publicly with their images"""
+        created = await async_client.post(
+            "/api/v1/galleries",
+            json={"title": "Flash", "category": "tattoo"},
+            headers=admin_headers
+        )
+        assert created.status_code == 201
+        gallery_id = created.json()["id"]
+        
+        image = await async_client.post(
+            f"/api/v1/galleries/{gallery_id}/images",
+            json={"content_hash": stored_image, "caption": "Flash sheet"},
+            headers=admin_headers
+        )
+        assert image.status_code == 201
+        
+        response = await async_client.get(f"/api/v1/galleries/{gallery_id}")
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["version"] == 2
+        assert body["cover_image_id"] == image.json()["id"]
+        assert [item["content_hash"] for item in body["images"]] == [stored_image]
+        assert body["images"][0]["metadata"]["width"] == 64
+        
+        listing = (await async_client.get("/api/v1/galleries")).json()
+        cover = listing["items"][0]["cover_image"]
+        assert cover["metadata"]["height"] == 48
+        assert cover["metadata"]["blurhash"]
+    
+    async def test_list_galleries_paginates(self, async_client, admin_headers):
+        """Test listing follows next_cursor page by page"""
+        for index in range(3):
+            await async_client.post(
+                "/api/v1/galleries",
+                json={"title": f"Gallery {index}", "category": "coding"},
+                headers=admin_headers
+            )
+        
+        first = (await async_client.get("/api/v1/galleries", params={"limit": 2})).json()
+        second = (await async_client.get(
+            "/api/v1/galleries",
+            params={"limit": 2, "cursor": first["next_cursor"]}
+        )).json()
+        
+        assert [item["title"] for item in first["items"]] == ["Gallery 2", "Gallery 1"]
+        assert [item["title"] for item in second["items"]] == ["Gallery 0"]
+        assert second["next_cursor"] is None
+    
+    async def test_invalid_cursor_returns_400(self, async_client):
+        """Test malformed cursors are a client error"""
+        response = await async_client.get("/api/v1/galleries", params={"cursor": "garbage!"})
+        
+        assert response.status_code == 400
+    
+    async def test_writes_require_admin(self, async_client):
+        """Test gallery writes are rejected without credentials"""
+        response = await async_client.post("/api/v1/galleries", json={"title": "Nope", "category": "tattoo"})
+        
+        assert response.status_code in (401, 403)
+    
+    async def test_missing_gallery_returns_404(self, async_client):
+        """Test unknown gallery IDs return 404"""
+        assert (await async_client.get("/api/v1/galleries/missing")).status_code == 404
+    
+    async def test_conditional_get_uses_gallery_version(self, async_client, admin_headers, container, monkeypatch):
+        """Test revalidating a gallery answers 304 without reading its images, until it changes"""
+        created = await async_client.post(
+            "/api/v1/galleries",
+            json={"title": "Flash", "category": "tattoo"},
+            headers=admin_headers
+        )
+        gallery_id = created.json()["id"]
+        first = await async_client.get(f"/api/v1/galleries/{gallery_id}")
+        etag = first.headers["etag"]
+        
+        get_images = AsyncMock(side_effect=AssertionError("images read on revalidation"))
+        monkeypatch.setattr(container.gallery_repository, "get_images", get_images)
+        revalidated = await async_client.get(f"/api/v1/galleries/{gallery_id}", headers={"If-None-Match": etag})
+        monkeypatch.undo()
+        
+        await async_client.put(f"/api/v1/galleries/{gallery_id}", json={"title": "Flash v2"}, headers=admin_headers)
+        changed = await async_client.get(f"/api/v1/galleries/{gallery_id}", headers={"If-None-Match": etag})
+        
+        assert first.headers["cache-control"].startswith("public")
+        assert revalidated.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+    
+    async def test_conditional_get_on_listing(self, async_client, admin_headers):
+        """Test gallery listings revalidate with If-None-Match"""
+        await async_client.post("/api/v1/galleries", json={"title": "One", "category": "coding"}, headers=admin_headers)
+        
+        first = await async_client.get("/api/v1/galleries")
+        second = await async_client.get("/api/v1/galleries", headers={"If-None-Match": first.headers["etag"]})
+        
+        assert second.status_code == 304
+    
+    async def test_responses_filtered_to_public_schema(self, async_client, admin_headers, container, monkeypatch):
+        """Test fields on internal models never leak past the route's response_model"""
+        from core.models.gallery import GalleryDetail
+        
+        class InternalDetail(GalleryDetail):
+            storage_owner: str = "internal"
+        
+        created = await async_client.post("/api/v1/galleries", json={"title": "One", "category": "coding"}, headers=admin_headers)
+        detail = await container.gallery_service.get_gallery_detail(created.json()["id"])
+        monkeypatch.setattr(
+            container.gallery_service,
+            "get_gallery_detail",
+            AsyncMock(return_value=InternalDetail(**detail.model_dump()))
+        )
+        
+        response = await async_client.get(f"/api/v1/galleries/{detail.id}")
+        
+        assert response.status_code == 200
+        assert "storage_owner" not in response.json()
+        assert response.headers["etag"]
+    
+    async def test_shared_content_is_reference_counted(self, async_client, admin_headers, container, stored_image):
+        """Test the same artwork in two galleries is stored once and freed with its last reference"""
+        gallery_ids = []
+        for category in ("tattoo", "series"):
+            created = await async_client.post(
+                "/api/v1/galleries",
+                json={"title": "Koi", "category": category},
+                headers=admin_headers
+            )
+            gallery_ids.append(created.json()["id"])
+            await async_client.post(
+                f"/api/v1/galleries/{created.json()['id']}/images",
+                json={"content_hash": stored_image},
+                headers=admin_headers
+            )
+        assert await container.blob_reference_store.count(stored_image) == 2
+        
+        await async_client.delete(f"/api/v1/galleries/{gallery_ids[0]}", headers=admin_headers)
+        image_id = (await async_client.get(f"/api/v1/galleries/{gallery_ids[1]}")).json()["image_ids"][0]
+        blob_key = f"blobs/sha256/{stored_image[:2]}/{stored_image}"
+        assert await container.blob_storage.exists(blob_key)
+        
+        removed = await async_client.delete(f"/api/v1/galleries/{gallery_ids[1]}/images/{image_id}", headers=admin_headers)
+        
+        assert removed.status_code == 204
+        assert await container.blob_reference_store.count(stored_image) == 0
+        assert not await container.blob_storage.exists(blob_key)
+    
+    async def test_update_rejects_null_fields(self, async_client, admin_headers):
+        """Test explicit nulls cannot blank required fields, while the cover can still be cleared"""
+        created = await async_client.post("/api/v1/galleries", json={"title": "X", "category": "tattoo"}, headers=admin_headers)
+        url = f"/api/v1/galleries/{created.json()['id']}"
+        
+        for field in ("title", "category", "tags", "image_ids"):
+            response = await async_client.put(url, json={field: None}, headers=admin_headers)
+            assert response.status_code == 422, field
+        cleared = await async_client.put(url, json={"cover_image_id": None}, headers=admin_headers)
+        
+        assert cleared.status_code == 200
+        assert (await async_client.get(url)).json()["category"] == "tattoo"
+    
+    async def test_image_ids_only_reorder(self, async_client, admin_headers, container, stored_image):
+        """Test image_ids cannot drop, duplicate or borrow images around the reference counts"""
+        gallery_ids, image_ids = [], []
+        for title in ("One", "Two"):
+            created = await async_client.post("/api/v1/galleries", json={"title": title, "category": "tattoo"}, headers=admin_headers)
+            gallery_ids.append(created.json()["id"])
+        for gallery_id in (gallery_ids[0], gallery_ids[0], gallery_ids[1]):
+            image = await async_client.post(
+                f"/api/v1/galleries/{gallery_id}/images",
+                json={"content_hash": stored_image},
+                headers=admin_headers
+            )
+            image_ids.append(image.json()["id"])
+        url = f"/api/v1/galleries/{gallery_ids[0]}"
+        
+        for bad in ([image_ids[0]], [image_ids[0], image_ids[0]], [image_ids[0], image_ids[2]], image_ids, ["made-up", image_ids[1]]):
+            response = await async_client.put(url, json={"image_ids": bad}, headers=admin_headers)
+            assert response.status_code == 400, bad
+        reordered = await async_client.put(url, json={"image_ids": [image_ids[1], image_ids[0]]}, headers=admin_headers)
+        
+        assert reordered.json()["image_ids"] == [image_ids[1], image_ids[0]]
+        assert await container.blob_reference_store.count(stored_image) == 3
+    
+    async def test_unknown_content_hash_rejected(self, async_client, admin_headers):
+        """Test images must reference stored content"""
+        created = await async_client.post("/api/v1/galleries", json={"title": "X", "category": "tattoo"}, headers=admin_headers)
+        
+        response = await async_client.post(
+            f"/api/v1/galleries/{created.json()['id']}/images",
+            json={"content_hash": "f" * 64},
+            headers=admin_headers
+        )
+        
+        assert response.status_code == 400
@@ -0,0 +1,56 @@
+import json
+import pytest
+from unittest.mock import AsyncMock, call
+from benchmarks import cold_start
+
+
+def api_gateway_event(method: str, path: str) -> dict:
+    """Minimal API Gateway HTTP API (payload v2) event"""
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {"host": "api.example.com"},
+        "requestContext": {
+            "http": {"method": method, "path": path, "protocol": "HTTP/1.1", "sourceIp": "127.0.0.1"},
+            "stage": "$default",
+        },
+        "isBase64Encoded": False,
+    }
+
+
+@pytest.mark.unit
+def test_lambda_handler_serves_health_check():
+    """Test the Lambda entry point routes API Gateway events into the app"""
+    from lambda_handler import handler
+    
+    response = handler(api_gateway_event("GET", "/health"), None)
+    
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"status": "healthy"}
+
+
+@pytest.mark.unit
+def test_upload_event_handler_processes_completed_uploads(monkeypatch):
+    """Test S3 ObjectCreated records under uploads/ are processed, and nothing else"""
+    from lambda_handler import app, upload_event_handler
+    process_upload = AsyncMock()
+    monkeypatch.setattr(app.state.container.upload_service, "process_upload", process_upload)
+    event = {"Records": [
+        {"eventName": "ObjectCreated:CompleteMultipartUpload", "s3": {"object": {"key": "uploads/2024/01/a+b.jpg", "eTag": "abc-2"}}},
+        {"eventName": "ObjectCreated:Copy", "s3": {"object": {"key": "blobs/sha256/ab/abc"}}},
+        {"eventName": "ObjectRemoved:Delete", "s3": {"object": {"key": "uploads/2024/01/c.jpg"}}},
+    ]}
+    
+    assert upload_event_handler(event, None) == {"processed": 1}
+    assert process_upload.call_args_list == [call("uploads/2024/01/a b.jpg", '"abc-2"')]
+
+
+@pytest.mark.slow
+def test_cold_start_import_budget():
+    """Test cold import stays within budget and keeps auth-only modules lazy"""
+    result = cold_start.measure(runs=3)
+    
+    assert result.deferred_imported == []
+    assert result.median_ms <= cold_start.DEFAULT_BUDGET_MS
@@ -0,0 +1,44 @@
+import pytest
+from benchmarks.load_test import LoopLagMonitor, percentile, run_scenario
+
+
+@pytest.mark.unit
+class TestLoadStatistics:
+    
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles over sorted samples"""
+        values = [float(value) for value in range(1, 101)]
+        
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([7.0], 0.95) == 7.0
+        assert percentile([], 0.5) == 0.0
+    
+    async def test_loop_lag_monitor_sees_blocking_work(self):
+        """Test a blocked event loop shows up as lag"""
+        import asyncio
+        import time
+        monitor = LoopLagMonitor(interval=0.001)
+        monitor.start()
+        await asyncio.sleep(0.005)
+        time.sleep(0.05)
+        await asyncio.sleep(0.005)
+        await monitor.stop()
+        
+        assert max(monitor.samples) >= 0.03
+
+
+@pytest.mark.integration
+class TestLoadScenarios:
+    
+    @pytest.mark.parametrize("scenario", ["browse", "admin", "login-storm"])
+    async def test_scenario_runs_in_process(self, async_client, load_context, scenario):
+        """Test each scenario drives the app over ASGI and reports throughput and latency"""
+        report = await run_scenario(async_client, scenario, concurrency=3, duration=0.3, context=load_context)
+        
+        assert report.requests > 0
+        assert report.errors == 0
+        assert report.rps > 0
+        assert report.latency_ms["p50"] <= report.latency_ms["p99"] <= report.latency_ms["max"]
+        assert set(report.status_counts) <= {200, 304, 429}  # login-storm runs into the login rate limit
+        assert scenario in report.format()
@@ -0,0 +1,27 @@
+import pytest
+from shared.utils.metrics import metrics
+
+
+@pytest.mark.integration
+class TestMetricsMiddleware:
+    
+    async def test_server_timing_lists_dependencies(self, async_client, admin_headers):
+        """Test authenticated reads report JWT, repository and serialization time"""
+        response = await async_client.get("/api/v1/auth/me", headers=admin_headers)
+        
+        timing = response.headers["server-timing"]
+        assert timing.startswith("app;dur=")
+        assert "jwt_verify;dur=" in timing
+        assert "serialization;dur=" in timing
+    
+    async def test_metrics_endpoint_uses_route_templates(self, async_client):
+        """Test /metrics exposes per-route histograms labelled by template, not raw path"""
+        await async_client.get("/api/v1/galleries/missing-gallery")
+        
+        response = await async_client.get("/metrics")
+        
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'route="/api/v1/galleries/{gallery_id}",status="404"' in response.text
+        assert "missing-gallery" not in response.text
+        assert "# TYPE dependency_duration_seconds histogram" in response.text
+        assert metrics.requests_total.value("GET", "/api/v1/galleries/{gallery_id}", "404") >= 1
@@ -0,0 +1,70 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from core.services.profiling_service import ProfilingService
+from shared.middleware.profiling import ProfilingMiddleware
+
+
+def slow_fibonacci(n: int) -> int:
+    return n if n < 2 else slow_fibonacci(n - 1) + slow_fibonacci(n - 2)
+
+
+@pytest.fixture
+async def profiled_client(container, monkeypatch):
+    """Small app behind the profiling middleware, sharing the test app's container"""
+    monkeypatch.setattr(container, "profiling_service", ProfilingService(container.blob_storage))
+    app = FastAPI()
+    app.state.container = container
+    app.add_middleware(ProfilingMiddleware)
+    
+    @app.get("/work")
+    async def work():
+        return {"value": slow_fibonacci(15)}
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.integration
+class TestProfiling:
+    
+    async def test_admin_request_is_profiled(self, async_client, profiled_client, admin_headers):
+        """Test admins get a profile ID whose report shows the endpoint's hot function"""
+        response = await profiled_client.get("/work", headers={**admin_headers, "X-Profile": "1"})
+        profile_id = response.headers["x-profile-id"]
+        
+        report = await async_client.get(f"/api/v1/admin/profiles/{profile_id}", headers=admin_headers)
+        raw = await async_client.get(f"/api/v1/admin/profiles/{profile_id}", params={"raw": True}, headers=admin_headers)
+        
+        assert response.json() == {"value": 610}
+        assert report.status_code == 200
+        assert "slow_fibonacci" in report.text
+        assert raw.headers["content-type"] == "application/octet-stream"
+    
+    async def test_requests_without_header_or_admin_are_not_profiled(self, profiled_client, admin_headers):
+        """Test the header alone, or an admin without it, never triggers profiling"""
+        anonymous = await profiled_client.get("/work", headers={"X-Profile": "1"})
+        admin = await profiled_client.get("/work", headers=admin_headers)
+        
+        assert anonymous.status_code == admin.status_code == 200
+        assert "x-profile-id" not in anonymous.headers
+        assert "x-profile-id" not in admin.headers
+    
+    async def test_reports_unavailable_while_disabled(self, async_client, admin_headers):
+        """Test the report endpoint 404s unless profiling is enabled"""
+        response = await async_client.get(f"/api/v1/admin/profiles/{'0' * 32}", headers=admin_headers)
+        
+        assert response.status_code == 404
+    
+    async def test_unknown_profile_and_sort(self, async_client, profiled_client, admin_headers):
+        """Test unknown IDs 404 and unknown sort keys 400"""
+        missing = await async_client.get("/api/v1/admin/profiles/../../secrets", headers=admin_headers)
+        response = await profiled_client.get("/work", headers={**admin_headers, "X-Profile": "1"})
+        bad_sort = await async_client.get(
+            f"/api/v1/admin/profiles/{response.headers['x-profile-id']}",
+            params={"sort": "name; drop"},
+            headers=admin_headers
+        )
+        
+        assert missing.status_code == 404
+        assert bad_sort.status_code == 400
@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.mark.integration
+class TestSearchEndpoint:
+    
+    async def test_search_follows_gallery_writes(self, async_client, admin_headers, stored_image):
+        """Test galleries are searchable by title and caption and vanish once deleted"""
+        created = await async_client.post(
+            "/api/v1/galleries",
+            json={"title": "Koi sleeve", "category": "tattoo", "tags": ["japanese"]},
+            headers=admin_headers
+        )
+        gallery_id = created.json()["id"]
+        await async_client.post(
+            f"/api/v1/galleries/{gallery_id}/images",
+            json={"content_hash": stored_image, "caption": "Healed peony"},
+            headers=admin_headers
+        )
+        
+        by_title = (await async_client.get("/api/v1/search", params={"q": "koi"})).json()
+        by_caption = (await async_client.get("/api/v1/search", params={"q": "peo", "type": "gallery"})).json()
+        
+        assert [hit["id"] for hit in by_title["hits"]] == [gallery_id]
+        assert by_title["hits"][0]["category"] == "tattoo"
+        assert [hit["id"] for hit in by_caption["hits"]] == [gallery_id]
+        
+        await async_client.delete(f"/api/v1/galleries/{gallery_id}", headers=admin_headers)
+        assert (await async_client.get("/api/v1/search", params={"q": "koi"})).json()["hits"] == []
+    
+    async def test_search_validates_query(self, async_client):
+        """Test empty queries and unknown types are rejected"""
+        assert (await async_client.get("/api/v1/search", params={"q": ""})).status_code == 422
+        assert (await async_client.get("/api/v1/search", params={"q": "x", "type": "user"})).status_code == 422
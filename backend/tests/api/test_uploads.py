@@ -0,0 +1,131 @@
+import asyncio
+import pytest
+from core.services.upload_service import UploadService
+from infrastructure.storage.local_upload_storage import LocalUploadStorage
+
+
+@pytest.fixture
+def local_storage(container, tmp_path):
+    """Point the app's upload service at a temporary local storage"""
+    storage = LocalUploadStorage(tmp_path)
+    container.upload_service = UploadService(storage, part_size=5 * 1024 * 1024)
+    return storage
+
+
+async def wait_until_processed(async_client, headers, key: str) -> dict:
+    """Poll an upload until its background processing has finished"""
+    for _ in range(200):
+        result = (await async_client.get("/api/v1/uploads", params={"key": key}, headers=headers)).json()
+        if result["status"] != "processing":
+            return result
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{key} still processing")
+
+
+@pytest.mark.integration
+class TestUploadEndpoints:
+    
+    async def test_upload_flow(self, async_client, admin_headers, local_storage):
+        """Test start, direct part upload, and completion with reported ETags"""
+        size = 6 * 1024 * 1024
+        started = await async_client.post(
+            "/api/v1/uploads",
+            json={"filename": "koi.png", "content_type": "image/png", "size": size},
+            headers=admin_headers
+        )
+        assert started.status_code == 201
+        session = started.json()
+        assert len(session["parts"]) == 2
+        
+        # The browser would PUT these to the presigned URLs
+        data = b"\x89PNG" + b"x" * (size - 4)
+        parts = [
+            {"part_number": 1, "etag": await local_storage.put_part(session["upload_id"], 1, data[:session["part_size"]])},
+            {"part_number": 2, "etag": await local_storage.put_part(session["upload_id"], 2, data[session["part_size"]:])},
+        ]
+        
+        completed = await async_client.post(
+            f"/api/v1/uploads/{session['upload_id']}/complete",
+            json={"key": session["key"], "parts": parts},
+            headers=admin_headers
+        )
+        
+        assert completed.status_code == 202
+        assert local_storage.object_path(session["key"]).read_bytes() == data
+    
+    async def test_abort_then_complete_is_404(self, async_client, admin_headers, local_storage):
+        """Test aborted uploads cannot be completed"""
+        session = (await async_client.post(
+            "/api/v1/uploads",
+            json={"filename": "koi.png", "content_type": "image/png", "size": 10},
+            headers=admin_headers
+        )).json()
+        
+        aborted = await async_client.delete(
+            f"/api/v1/uploads/{session['upload_id']}",
+            params={"key": session["key"]},
+            headers=admin_headers
+        )
+        completed = await async_client.post(
+            f"/api/v1/uploads/{session['upload_id']}/complete",
+            json={"key": session["key"]},
+            headers=admin_headers
+        )
+        
+        assert aborted.status_code == 204
+        assert completed.status_code == 404
+    
+    async def test_rejects_non_images(self, async_client, admin_headers, local_storage):
+        """Test unsupported content types are a client error"""
+        response = await async_client.post(
+            "/api/v1/uploads",
+            json={"filename": "a.sh", "content_type": "text/x-sh", "size": 10},
+            headers=admin_headers
+        )
+        
+        assert response.status_code == 400
+    
+    async def test_requires_admin(self, async_client):
+        """Test uploads are admin only"""
+        response = await async_client.post(
+            "/api/v1/uploads",
+            json={"filename": "koi.png", "content_type": "image/png", "size": 10}
+        )
+        
+        assert response.status_code in (401, 403)
+    
+    async def test_reupload_is_deduplicated(self, async_client, admin_headers, container, monkeypatch):
+        """Test identical uploads land on one content address with renditions"""
+        import io
+        from PIL import Image
+        monkeypatch.setattr(container.derivative_generator, "use_processes", False)
+        buffer = io.BytesIO()
+        Image.new("RGB", (400, 300), (10, 120, 80)).save(buffer, format="JPEG")
+        data = buffer.getvalue()
+        
+        results = []
+        for _ in range(2):
+            session = (await async_client.post(
+                "/api/v1/uploads",
+                json={"filename": "koi.jpg", "content_type": "image/jpeg", "size": len(data)},
+                headers=admin_headers
+            )).json()
+            await container.upload_storage.put_part(session["upload_id"], 1, data)
+            completed = await async_client.post(
+                f"/api/v1/uploads/{session['upload_id']}/complete",
+                json={"key": session["key"]},
+                headers=admin_headers
+            )
+            assert completed.json()["status"] == "processing"
+            results.append(await wait_until_processed(async_client, admin_headers, session["key"]))
+        
+        assert results[0]["content_hash"] == results[1]["content_hash"]
+        assert results[0]["key"] == results[1]["key"]
+        assert [result["deduplicated"] for result in results] == [False, True]
+        assert "thumb.webp" in results[1]["derivatives"]
+    
+    async def test_unknown_upload_is_404(self, async_client, admin_headers):
+        """Test polling a key that was never completed"""
+        response = await async_client.get("/api/v1/uploads", params={"key": "uploads/missing.jpg"}, headers=admin_headers)
+        
+        assert response.status_code == 404
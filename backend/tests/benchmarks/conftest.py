@@ -0,0 +1,31 @@
+import os
+from pathlib import Path
+import pytest
+from benchmarks.microbench import Baseline
+
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+@pytest.fixture(scope="session")
+def baseline():
+    """Session-wide benchmark baseline - rewritten at the end when BENCHMARK_UPDATE_BASELINE is set"""
+    baseline = Baseline(BASELINE_PATH)
+    yield baseline
+    if os.environ.get("BENCHMARK_UPDATE_BASELINE"):
+        baseline.save()
+
+
+@pytest.fixture
+def benchmark(baseline):
+    """Measure a callable and fail when it regressed past the baseline"""
+    updating = bool(os.environ.get("BENCHMARK_UPDATE_BASELINE"))
+    
+    def run(name: str, func, is_async: bool = False, **options):
+        result = baseline.run(name, func, is_async=is_async, **options)
+        failure = None if updating else baseline.check(result)
+        if failure:
+            pytest.fail(failure)
+        return result
+    
+    return run
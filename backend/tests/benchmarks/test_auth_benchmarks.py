@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from core.models.auth import LoginRequest, User
+from core.services.auth_service import AuthService
+from infrastructure.auth.memory_auth_repository import InMemoryAuthRepository
+from shared.utils import jwt_manager as jwt_manager_module
+from shared.utils.jwt_manager import JWTManager, _jose
+from shared.utils.password_hasher import PasswordHasher
+from shared.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture(scope="module")
+def password_hasher():
+    """bcrypt at 4 rounds - the hashing cost itself is set by PASSWORD_BCRYPT_ROUNDS, this guards the overhead around it"""
+    hasher = PasswordHasher(schemes=["bcrypt"], scheme_options={"bcrypt__rounds": 4})
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def manager(password_hasher):
+    """JWT manager with token caching disabled so every verify decodes"""
+    manager = JWTManager()
+    manager.password_hasher = password_hasher
+    manager.token_cache = TTLCache(max_size=0)
+    return manager
+
+
+@pytest.fixture
+def user():
+    """Token subject"""
+    now = datetime.utcnow()
+    return User(id="user-1", username="bench", email="bench@example.com", created_at=now, updated_at=now)
+
+
+@pytest.fixture
+async def auth_service(monkeypatch, password_hasher):
+    """AuthService over the in-memory repository with one seeded user"""
+    monkeypatch.setattr(jwt_manager_module.jwt_manager, "password_hasher", password_hasher)
+    repository = InMemoryAuthRepository()
+    await repository.create_user("bench", "bench@example.com", "password123")
+    return AuthService(repository)
+
+
+@pytest.mark.benchmark
+class TestJWTBenchmarks:
+    
+    def test_create_access_token(self, benchmark, manager, user):
+        benchmark("jwt.create_access_token", lambda: manager.create_access_token(user))
+    
+    def test_create_refresh_token(self, benchmark, manager, user):
+        benchmark("jwt.create_refresh_token", lambda: manager.create_refresh_token(user))
+    
+    def test_verify_valid_token(self, benchmark, manager, user):
+        token = manager.create_access_token(user)
+        assert manager.verify_token(token) is not None
+        
+        benchmark("jwt.verify_token.valid", lambda: manager.verify_token(token))
+    
+    def test_verify_cached_token(self, benchmark, user):
+        cached_manager = JWTManager()
+        token = cached_manager.create_access_token(user)
+        cached_manager.verify_token(token)
+        
+        benchmark("jwt.verify_token.cached", lambda: cached_manager.verify_token(token))
+    
+    def test_verify_expired_token(self, benchmark, manager):
+        expired = int((datetime.utcnow() - timedelta(minutes=5)).timestamp())
+        token = _jose().jwt.encode({"sub": "user-1", "exp": expired}, manager.secret_key, algorithm=manager.algorithm)
+        assert manager.verify_token(token) is None
+        
+        benchmark("jwt.verify_token.expired", lambda: manager.verify_token(token))
+    
+    def test_verify_tampered_token(self, benchmark, manager, user):
+        token = manager.create_access_token(user)
+        tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+        assert manager.verify_token(tampered) is None
+        
+        benchmark("jwt.verify_token.tampered", lambda: manager.verify_token(tampered))
+
+
+@pytest.mark.benchmark
+class TestPasswordBenchmarks:
+    
+    def test_hash_password(self, benchmark, manager):
+        benchmark("password.hash", lambda: manager.hash_password("password123"), rounds=3)
+    
+    def test_verify_password(self, benchmark, manager):
+        hashed = manager.hash_password("password123")
+        
+        benchmark("password.verify", lambda: manager.verify_password("password123", hashed), rounds=3)
+
+
+@pytest.mark.benchmark
+class TestAuthServiceBenchmarks:
+    
+    def test_login(self, benchmark, auth_service):
+        request = LoginRequest(username="bench", password="password123")
+        
+        async def login():
+            assert await auth_service.login(request) is not None
+        
+        benchmark("auth_service.login", login, is_async=True, rounds=3)
+    
+    def test_refresh_token(self, benchmark, auth_service):
+        # Benchmarks drive their own event loop, so the test itself stays synchronous
+        tokens = asyncio.run(auth_service.login(LoginRequest(username="bench", password="password123")))
+        
+        async def refresh():
+            assert await auth_service.refresh_token(tokens.refresh_token) is not None
+        
+        benchmark("auth_service.refresh_token", refresh, is_async=True)
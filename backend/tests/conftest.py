@@ -12,11 +12,70 @@ def client():
 
 
 @pytest.fixture
-async def async_client():
-    """Asynchronous test client for FastAPI app"""
+async def async_client(monkeypatch, tmp_path):
+    """Asynchronous test client for FastAPI app (runs the app lifespan so the container exists)"""
     from httpx import ASGITransport
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        yield ac
+    from shared.config.settings import settings
+    monkeypatch.setattr(settings, "local_storage_path", str(tmp_path / "storage"))
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+
+
+@pytest.fixture
+def simulated_latency(monkeypatch):
+    """Remote-like, reproducible latency on the memory / local backends (request it before async_client)"""
+    from shared.config.settings import settings
+    monkeypatch.setattr(settings, "simulation_enabled", True)
+    monkeypatch.setattr(settings, "simulation_latency_ms", 2.0)
+    monkeypatch.setattr(settings, "simulation_jitter_ms", 1.0)
+    monkeypatch.setattr(settings, "simulation_seed", 1)
+    return settings
+
+
+@pytest.fixture
+def container(async_client):
+    """Application container of the running test app"""
+    return app.state.container
+
+
+@pytest.fixture
+def fast_password_hasher(monkeypatch):
+    """Low-cost bcrypt so auth flow tests do not spend seconds hashing"""
+    from shared.utils.jwt_manager import jwt_manager
+    from shared.utils.password_hasher import PasswordHasher
+    hasher = PasswordHasher(schemes=["bcrypt"], scheme_options={"bcrypt__rounds": 4})
+    monkeypatch.setattr(jwt_manager, "password_hasher", hasher)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+async def admin_headers(async_client, container, fast_password_hasher):
+    """Authorization header for a seeded admin user"""
+    from tests.api.test_auth_endpoints import create_user, login
+    await create_user(container, "admin", "password123", is_admin=True)
+    tokens = await login(async_client, "admin", "password123")
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+@pytest.fixture
+async def load_context(container, fast_password_hasher):
+    """Seeded admin and galleries so benchmarks.load_test scenarios can drive async_client"""
+    from benchmarks.load_test import DEFAULT_ADMIN_PASSWORD, DEFAULT_ADMIN_USERNAME, seed
+    return await seed(container, 5, DEFAULT_ADMIN_USERNAME, DEFAULT_ADMIN_PASSWORD)
+
+
+@pytest.fixture
+async def stored_image(container):
+    """Content hash of a small JPEG already in the app's content store"""
+    import io
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), (30, 60, 90)).save(buffer, format="JPEG")
+    await container.blob_storage.put("uploads/fixture.jpg", buffer.getvalue(), "image/jpeg")
+    blob = await container.content_service.ingest("uploads/fixture.jpg")
+    return blob.content_hash
 
 
 @pytest.fixture
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, Mock
 from datetime import datetime
 from core.services.auth_service import AuthService
-from core.models.auth import User, LoginRequest, LoginResponse, TokenResponse
+from core.models.auth import User, LoginRequest, LoginResponse, TokenResponse, Principal
 from core.interfaces.auth_repository import IAuthRepository
 
 
@@ -170,3 +170,44 @@ class TestAuthService:
         assert result is not None
         assert result.id == sample_user.id
         mock_auth_repository.create_user.assert_called_once_with(username, email, password)
+    
+    async def test_get_current_principal_stateless(self, auth_service, mock_auth_repository, sample_user):
+        """Test stateless principal is built from claims without a repository call"""
+        from shared.utils.jwt_manager import jwt_manager
+        access_token = jwt_manager.create_access_token(sample_user)
+        
+        # Execute
+        principal = await auth_service.get_current_principal(access_token, stateless=True)
+        
+        # Verify
+        assert isinstance(principal, Principal)
+        assert principal.id == sample_user.id
+        assert principal.username == sample_user.username
+        assert principal.is_admin == sample_user.is_admin
+        mock_auth_repository.get_user_by_id.assert_not_called()
+    
+    async def test_get_current_principal_stateful(self, auth_service, mock_auth_repository, sample_user):
+        """Test stateful principal reflects the repository copy of the user"""
+        from shared.utils.jwt_manager import jwt_manager
+        access_token = jwt_manager.create_access_token(sample_user)
+        
+        # Setup mock - user was promoted after the token was issued
+        mock_auth_repository.get_user_by_id.return_value = sample_user.model_copy(update={"is_admin": True})
+        
+        # Execute
+        principal = await auth_service.get_current_principal(access_token)
+        
+        # Verify
+        assert principal.is_admin is True
+        mock_auth_repository.get_user_by_id.assert_called_once_with(sample_user.id)
+    
+    async def test_get_current_principal_rejects_refresh_token(self, auth_service, mock_auth_repository, sample_user):
+        """Test refresh tokens cannot be used as access tokens"""
+        from shared.utils.jwt_manager import jwt_manager
+        refresh_token = jwt_manager.create_refresh_token(sample_user)
+        
+        # Execute
+        principal = await auth_service.get_current_principal(refresh_token, stateless=True)
+        
+        # Verify
+        assert principal is None
@@ -0,0 +1,90 @@
+import pytest
+from datetime import datetime
+from core.models.blog import BlogPost, BlogPostCreateRequest, BlogPostUpdateRequest
+from core.services import blog_service as blog_service_module
+from core.services.blog_service import BlogService
+from infrastructure.database.memory_blog_repository import InMemoryBlogRepository
+from shared.utils import markdown_renderer
+from shared.utils.markdown_renderer import render_key, render_markdown
+
+
+@pytest.fixture
+def repository():
+    """In-memory blog repository"""
+    return InMemoryBlogRepository()
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Records every markdown body the service renders"""
+    calls = []
+    
+    def counting_render(markdown_text):
+        calls.append(markdown_text)
+        return render_markdown(markdown_text)
+    
+    monkeypatch.setattr(blog_service_module, "render_markdown", counting_render)
+    return calls
+
+
+@pytest.mark.unit
+class TestMarkdownRenderer:
+    
+    def test_renders_and_sanitizes(self):
+        """Test markdown renders to HTML with scripts and event handlers stripped"""
+        html = render_markdown("# Title\n\n**bold** <script>alert(1)</script><img src=x onerror=alert(1)>")
+        
+        assert "<h1>Title</h1>" in html
+        assert "<strong>bold</strong>" in html
+        assert "<script" not in html and "onerror" not in html
+    
+    def test_render_key_includes_renderer_version(self, monkeypatch):
+        """Test bumping the renderer version changes every key"""
+        before = render_key("same text")
+        monkeypatch.setattr(markdown_renderer, "RENDERER_VERSION", markdown_renderer.RENDERER_VERSION + 1)
+        
+        assert render_key("same text") != before
+
+
+@pytest.mark.unit
+class TestBlogService:
+    
+    async def test_renders_once_on_write(self, repository, render_calls):
+        """Test posts are rendered on create and reads serve the stored HTML"""
+        service = BlogService(repository)
+        post = await service.create_post(BlogPostCreateRequest(title="Hello", body_markdown="*hi*"))
+        
+        for _ in range(3):
+            fetched = await service.get_post(post.id)
+        
+        assert fetched.body_html == "<p><em>hi</em></p>"
+        assert render_calls == ["*hi*"]
+    
+    async def test_update_rerenders_only_changed_bodies(self, repository, render_calls):
+        """Test title-only updates reuse the stored rendering"""
+        service = BlogService(repository)
+        post = await service.create_post(BlogPostCreateRequest(title="Hello", body_markdown="one"))
+        
+        await service.update_post(post.id, BlogPostUpdateRequest(title="Renamed"))
+        updated = await service.update_post(post.id, BlogPostUpdateRequest(body_markdown="two"))
+        
+        assert updated.body_html == "<p>two</p>"
+        assert updated.version == 3
+        assert render_calls == ["one", "two"]
+    
+    async def test_legacy_rows_render_lazily_through_cache(self, repository, render_calls):
+        """Test rows without a current render key are rendered once and then served from the LRU"""
+        now = datetime.utcnow()
+        await repository.save_post(BlogPost(id="legacy", title="Old", body_markdown="old", created_at=now, updated_at=now))
+        await repository.save_post(BlogPost(
+            id="stale", title="Stale", body_markdown="old", body_html="<p>outdated</p>",
+            render_key="0" * 64 + ":v0", created_at=now, updated_at=now
+        ))
+        service = BlogService(repository, render_cache_size=8)
+        
+        legacy = await service.get_post("legacy")
+        stale = await service.get_post("stale")
+        
+        assert legacy.body_html == stale.body_html == "<p>old</p>"
+        assert render_calls == ["old"]  # same content hash, one render
+        assert (await repository.get_post("legacy")).body_html is None  # reads never write
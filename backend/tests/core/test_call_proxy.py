@@ -0,0 +1,86 @@
+import pytest
+from shared.utils.call_proxy import CallHook, CallProxy, with_hooks
+
+
+class FakeStorage:
+    """Backend with a coroutine, an async iterator, a sync method and a private attribute"""
+    
+    def __init__(self):
+        self.calls = 0
+        self._secret = "s"
+    
+    async def get(self, key: str) -> str:
+        self.calls += 1
+        return key
+    
+    async def iter_chunks(self, key: str):
+        for chunk in ("a", "b"):
+            yield chunk
+    
+    def url(self, key: str) -> str:
+        return f"local://{key}"
+
+
+class RecordingHook(CallHook):
+    """Appends (name, operation) to a shared log on the way in"""
+    
+    def __init__(self, name: str, log: list, streams: bool = False):
+        self.name = name
+        self.log = log
+        self.streams = streams
+    
+    async def __call__(self, operation, call):
+        self.log.append((self.name, operation))
+        return await call()
+
+
+class RetryingHook(CallHook):
+    """Runs the rest of the stack twice and returns the second result"""
+    
+    async def __call__(self, operation, call):
+        await call()
+        return await call()
+
+
+@pytest.mark.unit
+class TestCallProxy:
+    
+    async def test_hooks_run_outermost_first(self):
+        """Test coroutine calls pass through every hook in order, other attributes pass straight through"""
+        log = []
+        storage = FakeStorage()
+        proxy = CallProxy(storage, [RecordingHook("outer", log), RecordingHook("inner", log)])
+        
+        assert await proxy.get("key") == "key"
+        assert log == [("outer", "get"), ("inner", "get")]
+        assert proxy.url("key") == "local://key"
+        assert proxy._secret == "s"
+        assert proxy.inner is storage
+        assert proxy.get is proxy.get  # wrapped once
+    
+    async def test_call_can_be_repeated(self):
+        """Test a hook calling the rest of the stack again starts a fresh attempt"""
+        log = []
+        storage = FakeStorage()
+        proxy = CallProxy(storage, [RetryingHook(), RecordingHook("inner", log)])
+        
+        assert await proxy.get("key") == "key"
+        assert storage.calls == 2
+        assert len(log) == 2
+    
+    async def test_only_streaming_hooks_run_for_iterators(self):
+        """Test async iterators run streams hooks before the first item, and skip the others"""
+        log = []
+        proxy = CallProxy(FakeStorage(), [RecordingHook("timing", log), RecordingHook("latency", log, streams=True)])
+        
+        assert [chunk async for chunk in proxy.iter_chunks("key")] == ["a", "b"]
+        assert log == [("latency", "iter_chunks")]
+    
+    def test_with_hooks_skips_empty_stacks(self):
+        """Test no proxy is added without hooks or without a target"""
+        storage = FakeStorage()
+        
+        assert with_hooks(storage, []) is storage
+        assert with_hooks(None, [CallHook()]) is None
+        assert isinstance(with_hooks(storage, [CallHook()]), CallProxy)
+        assert CallProxy(storage, [CallHook(), RetryingHook()]).hook(RetryingHook) is not None
@@ -0,0 +1,130 @@
+import hashlib
+import pytest
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+from core.interfaces.blob_storage import IBlobStorage
+from core.interfaces.derivative_generator import IDerivativeGenerator
+from core.services.content_service import ContentService, blob_key
+from infrastructure.database.memory_blob_reference_store import InMemoryBlobReferenceStore
+
+
+CONTENT = [b"first chunk ", b"second chunk"]
+CONTENT_HASH = hashlib.sha256(b"".join(CONTENT)).hexdigest()
+
+
+@pytest.fixture
+def mock_storage():
+    """Mock blob storage streaming CONTENT from any key"""
+    storage = AsyncMock(spec=IBlobStorage)
+    
+    async def iter_chunks(key, chunk_size):
+        for chunk in CONTENT:
+            yield chunk
+    
+    storage.iter_chunks = MagicMock(side_effect=iter_chunks)
+    storage.exists.return_value = False
+    return storage
+
+
+@pytest.fixture
+def content_service(mock_storage):
+    """Content service over mock storage and in-memory reference counts"""
+    generator = MagicMock(spec=IDerivativeGenerator)
+    generator.planned.side_effect = lambda content_hash: {"thumb.webp": f"derivatives/{content_hash}/thumb.webp"}
+    return ContentService(mock_storage, InMemoryBlobReferenceStore(), generator)
+
+
+@pytest.mark.unit
+class TestContentService:
+    
+    async def test_ingest_hashes_stream_and_copies(self, content_service, mock_storage):
+        """Test new content is hashed chunk by chunk and copied to its content address"""
+        blob = await content_service.ingest("uploads/a.jpg")
+        
+        assert blob.content_hash == CONTENT_HASH
+        assert blob.key == blob_key(CONTENT_HASH) == f"blobs/sha256/{CONTENT_HASH[:2]}/{CONTENT_HASH}"
+        assert blob.size == sum(len(chunk) for chunk in CONTENT)
+        assert blob.deduplicated is False
+        mock_storage.get.assert_not_called()
+        mock_storage.copy.assert_called_once_with("uploads/a.jpg", blob.key)
+        mock_storage.delete.assert_called_once_with("uploads/a.jpg")
+    
+    async def test_ingest_deduplicates(self, content_service, mock_storage):
+        """Test content that is already stored is not copied again"""
+        mock_storage.exists.return_value = True
+        
+        blob = await content_service.ingest("uploads/b.jpg")
+        
+        assert blob.deduplicated is True
+        mock_storage.copy.assert_not_called()
+        mock_storage.delete.assert_called_once_with("uploads/b.jpg")
+    
+    async def test_reference_counting(self, content_service, mock_storage):
+        """Test the blob and its renditions are deleted only with the last reference"""
+        await content_service.ingest("uploads/a.jpg")
+        mock_storage.delete.reset_mock()
+        assert await content_service.add_reference(CONTENT_HASH) == 1
+        assert await content_service.add_reference(CONTENT_HASH) == 2
+        
+        assert await content_service.release(CONTENT_HASH) == 1
+        mock_storage.delete.assert_not_called()
+        
+        assert await content_service.release(CONTENT_HASH) == 0
+        deleted = {call.args[0] for call in mock_storage.delete.call_args_list}
+        assert deleted == {blob_key(CONTENT_HASH), f"derivatives/{CONTENT_HASH}/thumb.webp"}
+        with pytest.raises(ValueError):
+            await content_service.add_reference(CONTENT_HASH)
+    
+    async def test_add_reference_requires_stored_blob(self, content_service):
+        """Test unknown hashes cannot be referenced"""
+        with pytest.raises(ValueError):
+            await content_service.add_reference("f" * 64)
+    
+    async def test_release_without_reference_deletes_nothing(self, content_service, mock_storage):
+        """Test an extra release is not mistaken for the last one"""
+        await content_service.ingest("uploads/a.jpg")
+        mock_storage.delete.reset_mock()
+        
+        assert await content_service.release(CONTENT_HASH) == 0
+        mock_storage.delete.assert_not_called()
+    
+    async def test_reingest_during_release_keeps_blob(self, content_service, mock_storage, monkeypatch):
+        """Test identical content uploaded between the last release and its delete survives"""
+        await content_service.ingest("uploads/a.jpg")
+        await content_service.add_reference(CONTENT_HASH)
+        store = content_service.reference_store
+        decrement = store.decrement
+        
+        async def decrement_then_upload(content_hash):
+            reference = await decrement(content_hash)
+            await content_service.ingest("uploads/b.jpg")
+            return reference
+        
+        monkeypatch.setattr(store, "decrement", decrement_then_upload)
+        mock_storage.delete.reset_mock()
+        
+        assert await content_service.release(CONTENT_HASH) == 0
+        mock_storage.delete.assert_called_once_with("uploads/b.jpg")
+        assert await content_service.add_reference(CONTENT_HASH) == 1
+    
+    async def test_sweep_deletes_content_never_referenced(self, content_service, mock_storage):
+        """Test unreferenced content is swept once it is older than the grace period"""
+        await content_service.ingest("uploads/a.jpg")
+        mock_storage.delete.reset_mock()
+        
+        assert await content_service.sweep_unreferenced() == 0
+        content_service.unreferenced_grace = timedelta(0)
+        assert await content_service.sweep_unreferenced() == 1
+        
+        deleted = {call.args[0] for call in mock_storage.delete.call_args_list}
+        assert deleted == {blob_key(CONTENT_HASH), f"derivatives/{CONTENT_HASH}/thumb.webp"}
+        assert await content_service.reference_store.list_unreferenced(float("inf")) == []
+    
+    async def test_sweep_keeps_referenced_content(self, content_service, mock_storage):
+        """Test the sweep never touches content in use"""
+        await content_service.ingest("uploads/a.jpg")
+        await content_service.add_reference(CONTENT_HASH)
+        content_service.unreferenced_grace = timedelta(0)
+        
+        assert await content_service.sweep_unreferenced() == 0
+        assert await content_service.add_reference(CONTENT_HASH) == 2
@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from infrastructure.simulated.simulated_backend import LatencyProfile
+from shared.utils.deadline import (
+    DeadlineExceededError, bound_by_deadline, check, end_deadline, remaining, start_deadline, within_deadline
+)
+
+
+class SlowRepository:
+    """Repository whose lookups take delay seconds"""
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+    
+    async def get(self, key: str) -> str:
+        await asyncio.sleep(self.delay)
+        return key
+
+
+@pytest.mark.unit
+class TestDeadline:
+    
+    def test_nested_deadlines_never_extend(self):
+        """Test an inner scope can shorten the budget but not lengthen it"""
+        assert remaining() is None
+        outer = start_deadline(1.0)
+        inner = start_deadline(60.0)
+        assert remaining() <= 1.0
+        end_deadline(inner)
+        shorter = start_deadline(0.1)
+        assert remaining() <= 0.1
+        end_deadline(shorter)
+        end_deadline(outer)
+        assert remaining() is None
+    
+    async def test_budget_is_shared_across_calls(self):
+        """Test successive awaits spend one budget and the call that overruns it is cancelled"""
+        repository = bound_by_deadline(SlowRepository(0.04), "gallery_repository")
+        token = start_deadline(0.1)
+        try:
+            assert await repository.get("a") == "a"
+            assert await repository.get("b") == "b"
+            with pytest.raises(DeadlineExceededError) as error:
+                await repository.get("c")
+            assert error.value.dependency == "gallery_repository"
+            with pytest.raises(DeadlineExceededError):
+                check()
+        finally:
+            end_deadline(token)
+    
+    async def test_unbounded_without_deadline(self):
+        """Test calls outside a request are not bounded"""
+        assert await within_deadline(asyncio.sleep(0.01, "done")) == "done"
+        assert await bound_by_deadline(SlowRepository(0.01), "blob_storage").get("x") == "x"
+
+
+@pytest.mark.integration
+class TestContainerDeadlines:
+    
+    async def test_repositories_honour_request_deadline(self, simulated_latency, async_client, container):
+        """Test a degraded backend is cut off at the deadline instead of holding the request"""
+        container.simulated["gallery_repository"].profile = LatencyProfile(latency_ms=2000)
+        token = start_deadline(0.05)
+        try:
+            with pytest.raises(DeadlineExceededError) as error:
+                await container.gallery_service.list_galleries()
+        finally:
+            end_deadline(token)
+        
+        assert error.value.dependency == "gallery_repository"
@@ -0,0 +1,50 @@
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from benchmarks import serialization
+from core.models.gallery import GalleryPage
+from shared.utils.json_response import FastJSONResponse
+
+
+@pytest.mark.unit
+class TestFastJSONResponse:
+    
+    def test_models_encode_like_model_dump_json(self):
+        """Test models passed directly are encoded by pydantic with the same output"""
+        page = serialization.make_payloads(galleries=3, images=1)["page[3]"]
+        
+        response = FastJSONResponse(page, headers={"ETag": '"abc"'})
+        
+        assert response.body == page.model_dump_json().encode()
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["content-type"] == "application/json"
+    
+    def test_plain_content_encodes_with_orjson(self):
+        """Test dicts with datetimes, decimals, models and non-string keys encode"""
+        page = GalleryPage(items=[])
+        content = {"at": datetime(2024, 1, 2, 3, 4, 5), "price": Decimal("1.5"), 1: "one", "page": page}
+        
+        body = json.loads(FastJSONResponse(content).body)
+        
+        assert body == {"at": "2024-01-02T03:04:05", "price": 1.5, "1": "one", "page": {"items": [], "next_cursor": None}}
+    
+    def test_unsupported_types_raise(self):
+        """Test unknown types fail loudly instead of encoding garbage"""
+        with pytest.raises(TypeError):
+            FastJSONResponse({"value": object()})
+
+
+@pytest.mark.unit
+class TestSerializationBenchmark:
+    
+    def test_strategies_agree(self):
+        """Test every encoder produces the same JSON for both payloads"""
+        results = serialization.measure(galleries=2, images=2, iterations=1)
+        
+        assert {(result.payload, result.strategy) for result in results} == {
+            (payload, strategy)
+            for payload in ("page[2]", "detail[2]")
+            for strategy in ("fastapi", "orjson", "model_dump_json")
+        }
+        assert len({result.body_bytes for result in results if result.payload == "page[2]"}) == 1
@@ -111,6 +111,25 @@ class TestJWTManager:
         assert payload is not None
         assert payload.is_admin == True
     
+    def test_verify_token_uses_cache(self, jwt_manager, sample_user):
+        """Test repeated verification of the same token is served from cache"""
+        token = jwt_manager.create_access_token(sample_user)
+        
+        first = jwt_manager.verify_token(token)
+        with patch('jose.jwt.decode') as mock_decode:
+            second = jwt_manager.verify_token(token)
+            mock_decode.assert_not_called()
+        
+        assert second is first
+        stats = jwt_manager.token_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+    
+    def test_invalid_token_not_cached(self, jwt_manager):
+        """Test failed verifications are never cached"""
+        assert jwt_manager.verify_token("invalid.jwt.token") is None
+        assert len(jwt_manager.token_cache) == 0
+    
     def test_password_hashing(self, jwt_manager):
         """Test password hashing and verification"""
         password = "test_password_123"
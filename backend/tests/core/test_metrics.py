@@ -0,0 +1,83 @@
+import pytest
+from shared.utils.metrics import Histogram, MetricsRegistry
+
+
+class FakeRepository:
+    """Minimal async repository for proxy tests"""
+    
+    table_name = "galleries"
+    
+    async def get_gallery(self, gallery_id: str) -> str:
+        return gallery_id
+
+
+@pytest.mark.unit
+class TestHistogram:
+    
+    def test_renders_cumulative_prometheus_buckets(self):
+        """Test buckets are cumulative with +Inf, _sum and _count per label set"""
+        histogram = Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "/items")
+        
+        lines = histogram.render()
+        
+        assert lines[:2] == ["# HELP latency_seconds Latency", "# TYPE latency_seconds histogram"]
+        assert 'latency_seconds_bucket{route="/items",le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{route="/items",le="1"} 3' in lines
+        assert 'latency_seconds_bucket{route="/items",le="+Inf"} 4' in lines
+        assert 'latency_seconds_count{route="/items"} 4' in lines
+        assert 'latency_seconds_sum{route="/items"} 3.650000' in lines
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    
+    async def test_timed_records_sync_and_async_calls(self):
+        """Test decorated functions feed the dependency histogram and the request's Server-Timing"""
+        registry = MetricsRegistry()
+        
+        @registry.timed("jwt_verify")
+        def verify():
+            return "ok"
+        
+        @registry.timed("repository")
+        async def load():
+            return "loaded"
+        
+        token = registry.begin_request()
+        try:
+            assert verify() == "ok"
+            assert await load() == "loaded"
+            assert await load() == "loaded"
+            header = registry.server_timing(0.0125)
+        finally:
+            registry.end_request(token)
+        
+        assert registry.dependencies.count("jwt_verify") == 1
+        assert registry.dependencies.count("repository") == 2
+        assert header.startswith("app;dur=12.5, jwt_verify;dur=")
+        assert 'repository;dur=' in header and 'desc="2 calls"' in header
+    
+    def test_disabled_registry_leaves_functions_untouched(self):
+        """Test switching metrics off removes the wrappers and proxies entirely"""
+        registry = MetricsRegistry(enabled=False)
+        repository = FakeRepository()
+        
+        def verify():
+            return "ok"
+        
+        assert registry.timed("jwt_verify")(verify) is verify
+        assert registry.instrument(repository, "gallery_repository") is repository
+        with registry.timer("serialization"):
+            pass
+        assert registry.dependencies.count("serialization") == 0
+    
+    async def test_instrument_times_coroutine_methods_only(self):
+        """Test proxies time async methods and forward everything else"""
+        registry = MetricsRegistry()
+        proxy = registry.instrument(FakeRepository(), "gallery_repository")
+        
+        assert await proxy.get_gallery("g1") == "g1"
+        assert proxy.table_name == "galleries"
+        assert registry.dependencies.count("gallery_repository") == 1
@@ -0,0 +1,35 @@
+import json
+import pytest
+from benchmarks.microbench import Baseline, BenchmarkResult
+
+
+def result(name: str, relative: float) -> BenchmarkResult:
+    return BenchmarkResult(name=name, median_us=relative * 100, min_us=relative * 100, iterations=1, rounds=1, relative=relative)
+
+
+@pytest.mark.unit
+class TestBaseline:
+    
+    def test_flags_regressions_past_threshold(self, tmp_path):
+        """Test results slower than baseline * (1 + max_regression) fail, others and new ones pass"""
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"results": {"jwt.verify": {"relative": 1.0, "min_us": 100.0}}}))
+        baseline = Baseline(path, max_regression=0.5)
+        
+        assert baseline.check(result("jwt.verify", 1.4)) is None
+        assert "jwt.verify regressed" in baseline.check(result("jwt.verify", 1.6))
+        assert baseline.check(result("brand.new", 99.0)) is None
+    
+    def test_run_and_save_merge_results(self, tmp_path):
+        """Test measured results are calibrated and merged over the stored baseline"""
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"results": {"old": {"relative": 2.0, "min_us": 1.0}}}))
+        baseline = Baseline(path)
+        
+        measured = baseline.run("sum", lambda: sum(range(100)), rounds=2, min_round_seconds=0.001)
+        baseline.save()
+        
+        saved = json.loads(path.read_text())
+        assert measured.relative > 0
+        assert set(saved["results"]) == {"old", "sum"}
+        assert saved["calibration_us"] > 0
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import pytest
+from shared.utils.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+@pytest.fixture
+def password_hasher():
+    """Fast bcrypt hasher for testing"""
+    hasher = PasswordHasher(schemes=["bcrypt"], scheme_options={"bcrypt__rounds": 4})
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.unit
+class TestPasswordHasher:
+    
+    async def test_async_hash_and_verify(self, password_hasher):
+        """Test async variants produce and verify hashes"""
+        hashed = await password_hasher.hash_async("secret")
+        
+        assert await password_hasher.verify_async("secret", hashed) is True
+        assert await password_hasher.verify_async("wrong", hashed) is False
+    
+    async def test_hashing_runs_off_the_event_loop(self, password_hasher):
+        """Test hashing work runs on the dedicated pool threads"""
+        thread_names = []
+        
+        def record_thread():
+            thread_names.append(threading.current_thread().name)
+        
+        await password_hasher._run(record_thread)
+        
+        assert thread_names[0].startswith("password-hasher")
+    
+    async def test_needs_update_after_cost_increase(self, password_hasher):
+        """Test hashes with outdated rounds are upgraded on verify"""
+        old_hash = password_hasher.hash("secret")
+        stronger = PasswordHasher(schemes=["bcrypt"], scheme_options={"bcrypt__rounds": 5})
+        
+        assert stronger.needs_update(old_hash) is True
+        
+        is_valid, new_hash = await stronger.verify_and_update_async("secret", old_hash)
+        
+        assert is_valid is True
+        assert new_hash is not None
+        assert stronger.needs_update(new_hash) is False
+        stronger.shutdown()
+    
+    async def test_current_hash_not_upgraded(self, password_hasher):
+        """Test verify_and_update returns no new hash for current parameters"""
+        current_hash = password_hasher.hash("secret")
+        
+        is_valid, new_hash = await password_hasher.verify_and_update_async("secret", current_hash)
+        
+        assert is_valid is True
+        assert new_hash is None
+    
+    async def test_rejects_when_queue_full(self):
+        """Test backpressure rejects work beyond max_pending"""
+        hasher = PasswordHasher(schemes=["bcrypt"], scheme_options={"bcrypt__rounds": 4}, max_workers=1, max_pending=1)
+        release = threading.Event()
+        
+        blocked = asyncio.create_task(hasher._run(release.wait))
+        await asyncio.sleep(0.01)
+        
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.hash_async("secret")
+        
+        release.set()
+        await blocked
+        assert hasher.pending == 0
+        hasher.shutdown()
@@ -0,0 +1,118 @@
+import pytest
+from core.services.rate_limit_service import RateLimitService
+from infrastructure.auth.memory_rate_limit_store import InMemoryRateLimitStore
+from shared.utils.metrics import metrics
+from shared.utils.token_bucket import RateLimit, parse_rate_limit, take
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    
+    @pytest.mark.parametrize("spec, expected", [
+        ("5/minute", RateLimit(5, 60)),
+        ("20/hours", RateLimit(20, 3600)),
+        ("10/30", RateLimit(10, 30)),
+        ("10/30s", RateLimit(10, 30)),
+    ])
+    def test_parse_rate_limit(self, spec, expected):
+        """Test named and numeric periods"""
+        assert parse_rate_limit(spec) == expected
+    
+    @pytest.mark.parametrize("spec", ["x/minute", "5/fortnight", "0/minute", "5"])
+    def test_parse_rate_limit_rejects_invalid(self, spec):
+        """Test malformed specs raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_rate_limit(spec)
+    
+    def test_take_refills_continuously(self):
+        """Test an empty bucket reports the wait for one token and refills at capacity / period"""
+        limit = RateLimit(capacity=2, period_seconds=10)
+        
+        assert take(0.0, 0.0, 0.0, limit) == (0.0, 5.0)
+        assert take(0.0, 0.0, 5.0, limit) == (0.0, 0.0)
+        assert take(2.0, 0.0, 100.0, limit) == (1.0, 0.0)  # never above capacity
+
+
+@pytest.mark.unit
+class TestRateLimitService:
+    
+    async def test_each_dimension_has_its_own_bucket(self):
+        """Test a full username bucket does not block other usernames, the IP bucket is shared"""
+        clock = FakeClock()
+        service = RateLimitService(
+            InMemoryRateLimitStore(clock=clock),
+            {"login": {"ip": RateLimit(3, 60), "username": RateLimit(2, 60)}}
+        )
+        
+        assert await service.check("login", ip="1.2.3.4", username="alice") == 0
+        assert await service.check("login", ip="1.2.3.4", username="alice") == 0
+        assert await service.check("login", ip="1.2.3.4", username="alice") == pytest.approx(30)
+        assert await service.check("login", ip="1.2.3.4", username="bob") == 0  # alice's rejection spent no IP token
+        assert await service.check("login", ip="1.2.3.4", username="carol") == pytest.approx(20)  # IP exhausted
+        
+        clock.now += 30
+        assert await service.check("login", ip="1.2.3.4", username="alice") == 0
+    
+    async def test_rejected_check_debits_no_bucket(self):
+        """Test a check rejected by one bucket leaves the others untouched"""
+        store = InMemoryRateLimitStore(clock=FakeClock())
+        service = RateLimitService(store, {"login": {"ip": RateLimit(1, 60), "username": RateLimit(1, 60)}})
+        
+        assert await service.check("login", ip="1.2.3.4", username="alice") == 0
+        for ip in ("5.6.7.8", "9.9.9.9"):
+            assert await service.check("login", ip=ip, username="alice") == pytest.approx(60)
+        
+        assert await store.consume("login:ip:5.6.7.8", RateLimit(1, 60)) == 0
+    
+    async def test_unconfigured_routes_and_missing_keys_pass(self):
+        """Test routes without limits and dimensions without a value are not limited"""
+        service = RateLimitService(InMemoryRateLimitStore(), {"login": {"ip": RateLimit(1, 60)}})
+        
+        for _ in range(3):
+            assert await service.check("refresh", ip="1.2.3.4") == 0
+            assert await service.check("login", username="alice") == 0
+    
+    async def test_rejections_are_counted(self):
+        """Test rejections show up in rate_limit_rejections_total"""
+        service = RateLimitService(InMemoryRateLimitStore(), {"counted": {"ip": RateLimit(1, 60)}})
+        before = metrics.rate_limit_rejections.value("counted", "ip")
+        
+        await service.check("counted", ip="1.2.3.4")
+        await service.check("counted", ip="1.2.3.4")
+        
+        assert metrics.rate_limit_rejections.value("counted", "ip") == before + 1
+
+
+@pytest.mark.unit
+class TestClientAddress:
+    
+    @pytest.mark.parametrize("hops, header, expected", [
+        (0, "6.6.6.6", "10.0.0.1"),
+        (1, "6.6.6.6, 1.2.3.4", "1.2.3.4"),
+        (2, "6.6.6.6, 1.2.3.4, 172.16.0.9", "1.2.3.4"),
+        (2, "1.2.3.4", "10.0.0.1"),
+        (1, "", "10.0.0.1"),
+    ])
+    def test_trusts_only_proxy_appended_entries(self, monkeypatch, hops, header, expected):
+        """Test spoofed leftmost X-Forwarded-For entries never pick the rate limit bucket"""
+        from starlette.requests import Request
+        from shared.config.settings import settings
+        from shared.dependencies.rate_limit import client_address
+        monkeypatch.setattr(settings, "rate_limit_trusted_proxy_hops", hops)
+        request = Request({
+            "type": "http",
+            "headers": [(b"x-forwarded-for", header.encode())],
+            "client": ("10.0.0.1", 1234),
+        })
+        
+        assert client_address(request) == expected
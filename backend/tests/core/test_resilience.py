@@ -0,0 +1,207 @@
+import asyncio
+import pytest
+from infrastructure.simulated.simulated_backend import LatencyProfile, SimulatedDependencyError
+from shared.utils.metrics import MetricsRegistry
+from shared.utils.call_proxy import CallProxy
+from shared.utils.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, ResilienceHook
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyRepository:
+    """Repository whose lookups fail while failing is set, and take delays[i] seconds on call i"""
+    
+    def __init__(self, delays=()):
+        self.failing = False
+        self.delays = list(delays)
+        self.calls = 0
+    
+    async def get_user_by_id(self, user_id: str) -> str:
+        self.calls += 1
+        if self.delays:
+            await asyncio.sleep(self.delays.pop(0))
+        if self.failing:
+            raise SimulatedDependencyError("auth_repository", "get_user_by_id")
+        return user_id
+    
+    async def missing(self) -> None:
+        raise LookupError("not found")
+
+
+@pytest.fixture
+def registry():
+    """Private metrics registry so counts start at zero"""
+    return MetricsRegistry()
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    
+    async def test_opens_fails_fast_and_recovers_through_half_open(self, registry):
+        """Test consecutive failures open the breaker, and a successful probe after reset closes it"""
+        clock = FakeClock()
+        repository = FlakyRepository()
+        breaker = CircuitBreaker("auth_repository", failure_threshold=3, reset_seconds=30, clock=clock, registry=registry)
+        
+        repository.failing = True
+        for _ in range(3):
+            with pytest.raises(SimulatedDependencyError):
+                await breaker.call(repository.get_user_by_id, "u1")
+        assert breaker.state == OPEN
+        
+        with pytest.raises(CircuitOpenError) as error:
+            await breaker.call(repository.get_user_by_id, "u1")
+        assert error.value.retry_after == pytest.approx(30)
+        assert repository.calls == 3
+        
+        clock.now += 30
+        repository.failing = False
+        assert await breaker.call(repository.get_user_by_id, "u1") == "u1"
+        assert breaker.state == CLOSED
+        assert registry.circuit_trips.value("auth_repository") == 1
+        assert registry.circuit_rejections.value("auth_repository") == 1
+        assert registry.circuit_state.value("auth_repository") == 0
+    
+    async def test_aws_client_errors_are_not_failures(self, registry):
+        """Test bad input rejected by DynamoDB never trips the breaker, while service errors still do"""
+        from botocore.exceptions import ClientError
+        breaker = CircuitBreaker("gallery_repository", failure_threshold=1, registry=registry)
+        
+        async def rejected(code):
+            raise ClientError({"Error": {"Code": code, "Message": "no"}}, "Query")
+        
+        for code in ("ValidationException", "ConditionalCheckFailedException"):
+            with pytest.raises(ClientError):
+                await breaker.call(rejected, code)
+        assert breaker.state == CLOSED
+        
+        with pytest.raises(ClientError):
+            await breaker.call(rejected, "InternalServerError")
+        assert breaker.state == OPEN
+    
+    async def test_failed_probe_reopens(self, registry):
+        """Test a failing half-open probe opens the breaker again and only one probe is admitted"""
+        clock = FakeClock()
+        breaker = CircuitBreaker("gallery_repository", failure_threshold=1, reset_seconds=10, clock=clock, registry=registry)
+        breaker.record_failure()
+        clock.now += 10
+        
+        breaker.before_call()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        
+        assert breaker.state == OPEN
+        assert registry.circuit_state.value("gallery_repository") == 2
+        assert breaker.trips == 2
+    
+    async def test_slow_calls_and_exclusions(self, registry):
+        """Test slow successes count as failures while excluded errors (not found) do not"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "blob_storage",
+            failure_threshold=2,
+            slow_call_seconds=1.0,
+            excluded=(LookupError,),
+            clock=clock,
+            registry=registry
+        )
+        
+        for _ in range(3):
+            with pytest.raises(LookupError):
+                await breaker.call(FlakyRepository().missing)
+        assert breaker.state == CLOSED
+        
+        breaker.record_success(2.0)
+        breaker.record_success(2.0)
+        assert breaker.state == OPEN
+
+
+@pytest.mark.unit
+class TestHedgedReads:
+    
+    async def test_slow_primary_is_hedged(self, registry):
+        """Test a read slower than the hedge delay is duplicated and the faster copy wins"""
+        repository = FlakyRepository(delays=[1.0, 0.0])
+        hook = ResilienceHook(
+            CircuitBreaker("auth_repository", registry=registry),
+            hedged_methods=["get_user_by_id"],
+            hedge_after=0.02,
+            max_hedge_ratio=1.0,
+            registry=registry
+        )
+        proxy = CallProxy(repository, [hook])
+        
+        started = asyncio.get_running_loop().time()
+        assert await proxy.get_user_by_id("u1") == "u1"
+        
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert repository.calls == 2
+        assert registry.hedged_reads.value("auth_repository", "hedge") == 1
+    
+    async def test_hedges_are_budgeted_and_adaptive(self, registry):
+        """Test no hedging before enough latency samples, and at most max_hedge_ratio of reads"""
+        hook = ResilienceHook(
+            CircuitBreaker("auth_repository", registry=registry),
+            hedged_methods=["get_user_by_id"],
+            hedge_min=0.005,
+            max_hedge_ratio=0.1,
+            registry=registry
+        )
+        proxy = CallProxy(FlakyRepository(), [hook])
+        assert hook.hedge_delay() is None
+        
+        for _ in range(30):
+            await proxy.get_user_by_id("u1")
+        assert hook.hedge_delay() == pytest.approx(0.005)  # fast reads - the floor applies
+        
+        hook.hedges = 3
+        assert hook.hedge_delay() is None
+    
+    async def test_writes_are_never_hedged(self, registry):
+        """Test methods outside hedged_methods run once through the breaker"""
+        repository = FlakyRepository(delays=[0.05])
+        hook = ResilienceHook(CircuitBreaker("auth_repository", registry=registry), hedge_after=0.001, registry=registry)
+        proxy = CallProxy(repository, [hook])
+        
+        await proxy.get_user_by_id("u1")
+        assert repository.calls == 1
+
+
+@pytest.mark.integration
+class TestContainerResilience:
+    
+    async def test_open_breaker_answers_503(self, simulated_latency, async_client, container):
+        """Test a failing gallery backend trips its breaker and requests then fail fast with 503"""
+        container.simulated["gallery_repository"].profile = LatencyProfile(error_rate=1.0)
+        for _ in range(container.settings.circuit_failure_threshold):
+            with pytest.raises(SimulatedDependencyError):
+                await container.gallery_service.list_galleries()
+        calls = container.simulated["gallery_repository"].calls
+        
+        response = await async_client.get("/api/v1/galleries")
+        
+        assert response.status_code == 503
+        assert int(response.headers["retry-after"]) >= 1
+        assert container.simulated["gallery_repository"].calls == calls
+        assert container.resilient["gallery_repository"].breaker.state == OPEN
+    
+    async def test_cached_users_survive_open_auth_breaker(self, simulated_latency, async_client, container):
+        """Test the auth breaker sits beneath the user cache"""
+        user = await container.auth_repository.create_user("cached", "cached@example.com", "password123")
+        await container.auth_repository.get_user_by_id(user.id)
+        for _ in range(container.settings.circuit_failure_threshold):
+            container.resilient["auth_repository"].breaker.record_failure()
+        
+        assert (await container.auth_repository.get_user_by_id(user.id)).id == user.id
+        with pytest.raises(CircuitOpenError):
+            await container.auth_repository.get_user_by_id("someone-else")
@@ -0,0 +1,170 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime, timedelta
+from core.interfaces.auth_repository import IAuthRepository
+from core.models.auth import User
+from core.services.auth_service import AuthService
+from core.services.revocation_service import RevocationService
+from infrastructure.auth.memory_revocation_store import InMemoryRevocationStore
+from shared.utils.bloom_filter import BloomFilter
+from shared.utils.deadline import bound_by_deadline, end_deadline, start_deadline
+from shared.utils.jwt_manager import jwt_manager
+
+
+@pytest.fixture
+def revocation_store():
+    """In-memory revocation store"""
+    return InMemoryRevocationStore()
+
+
+@pytest.fixture
+def revocation_service(revocation_store):
+    """Revocation service over the in-memory store"""
+    return RevocationService(revocation_store, bloom_capacity=1000)
+
+
+@pytest.fixture
+def mock_auth_repository():
+    """Mock auth repository for testing"""
+    return AsyncMock(spec=IAuthRepository)
+
+
+@pytest.fixture
+def auth_service(mock_auth_repository, revocation_service):
+    """Auth service with revocation enabled"""
+    return AuthService(mock_auth_repository, revocation_service)
+
+
+@pytest.fixture
+def sample_user():
+    """Sample user for testing"""
+    return User(
+        id="user123",
+        username="testuser",
+        email="test@example.com",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    
+    def test_no_false_negatives(self):
+        """Test every added item is reported as present"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        
+        assert all(item in bloom for item in items)
+    
+    def test_false_positive_rate_within_bounds(self):
+        """Test false positives stay near the configured rate"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+        
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        
+        assert false_positives < 300  # 1% expected, generous margin
+
+
+@pytest.mark.unit
+class TestRevocationService:
+    
+    async def test_unrevoked_check_skips_store(self, revocation_service, revocation_store):
+        """Test the common case is answered by the Bloom filter alone"""
+        await revocation_service.load()
+        revocation_store.is_revoked = AsyncMock(return_value=False)
+        
+        assert await revocation_service.is_revoked("never-revoked") is False
+        revocation_store.is_revoked.assert_not_called()
+    
+    async def test_revoked_token_confirmed_by_store(self, revocation_service):
+        """Test revoked IDs are reported as revoked"""
+        await revocation_service.revoke("jti-1", datetime.now() + timedelta(minutes=5))
+        
+        assert await revocation_service.is_revoked("jti-1") is True
+        assert revocation_service.stats()["store_lookups"] == 1
+    
+    async def test_revocation_expires_with_token(self, revocation_service):
+        """Test revocations end when the token would have expired anyway"""
+        await revocation_service.revoke("jti-1", datetime.now() - timedelta(seconds=1))
+        
+        assert await revocation_service.is_revoked("jti-1") is False
+    
+    async def test_load_picks_up_other_workers_revocations(self, revocation_service, revocation_store):
+        """Test revocations written straight to the store reach the filter on load/sync"""
+        await revocation_service.load()
+        await revocation_store.revoke("remote-jti", datetime.now() + timedelta(minutes=5))
+        
+        await revocation_service.sync()
+        
+        assert "remote-jti" in revocation_service.bloom
+        assert await revocation_service.is_revoked("remote-jti") is True
+    
+    async def test_sync_overlaps_for_clock_skew(self, revocation_service, revocation_store):
+        """Test a revocation stamped before the last sync (writer clock behind) still reaches the filter"""
+        await revocation_service.load()
+        await revocation_store.revoke("skewed-jti", datetime.now() + timedelta(minutes=5))
+        expires_at, _ = revocation_store._entries["skewed-jti"]
+        revocation_store._entries["skewed-jti"] = (expires_at, revocation_service._last_sync - 10)
+        
+        await revocation_service.sync()
+        count = revocation_service.bloom.count
+        await revocation_service.sync()
+        
+        assert "skewed-jti" in revocation_service.bloom
+        assert revocation_service.bloom.count == count
+    
+    async def test_sync_started_near_deadline_outlives_it(self):
+        """Test a background sync triggered by a request about to time out is not bound by its deadline"""
+        class SlowRevocationStore(InMemoryRevocationStore):
+            async def list_active(self, *args, **kwargs):
+                await asyncio.sleep(0.05)
+                return await super().list_active(*args, **kwargs)
+        
+        store = SlowRevocationStore()
+        service = RevocationService(bound_by_deadline(store, "revocation_store"), sync_interval_seconds=0)
+        await service.load()
+        await store.revoke("remote-jti", datetime.now() + timedelta(minutes=5))
+        
+        token = start_deadline(0.01)
+        try:
+            await service.is_revoked("some-jti")
+        finally:
+            end_deadline(token)
+        await service._sync_task
+        
+        assert "remote-jti" in service.bloom
+
+
+@pytest.mark.unit
+class TestLogoutRevocation:
+    
+    async def test_logout_revokes_access_and_refresh_tokens(self, auth_service, mock_auth_repository, sample_user):
+        """Test tokens presented at logout stop verifying"""
+        mock_auth_repository.get_user_by_id.return_value = sample_user
+        access_token = jwt_manager.create_access_token(sample_user)
+        refresh_token = jwt_manager.create_refresh_token(sample_user)
+        
+        assert await auth_service.logout(access_token, refresh_token) is True
+        
+        assert await auth_service.get_current_user(access_token) is None
+        assert await auth_service.refresh_token(refresh_token) is None
+    
+    async def test_logout_keeps_other_sessions(self, auth_service, mock_auth_repository, sample_user):
+        """Test only the presented tokens are revoked"""
+        mock_auth_repository.get_user_by_id.return_value = sample_user
+        revoked_token = jwt_manager.create_access_token(sample_user)
+        other_token = jwt_manager.create_access_token(sample_user)
+        
+        await auth_service.logout(revoked_token)
+        
+        assert await auth_service.get_current_user(other_token) == sample_user
+    
+    async def test_logout_with_invalid_token(self, auth_service):
+        """Test logout fails for unverifiable tokens"""
+        assert await auth_service.logout("invalid.jwt.token") is False
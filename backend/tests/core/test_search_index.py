@@ -0,0 +1,177 @@
+import asyncio
+import pytest
+from datetime import datetime
+from core.models.gallery import Gallery, GalleryCategory
+from core.services.search_service import SearchService
+from infrastructure.database.memory_gallery_repository import InMemoryGalleryRepository
+from shared.utils.deadline import bound_by_deadline, end_deadline, start_deadline
+from shared.utils.search_index import SearchIndex, tokenize
+
+
+@pytest.fixture
+def index():
+    """Small index with a title-heavy and a caption-only match for "koi\""""
+    index = SearchIndex()
+    index.add("gallery:1", [("Koi sleeve", 3.0), ("japanese, color", 2.0)], {"type": "gallery", "id": "1"})
+    index.add("gallery:2", [("Linework", 3.0), ("a koi in the corner", 1.0)], {"type": "gallery", "id": "2"})
+    index.add("post:3", [("Koi tattoo care", 3.0)], {"type": "post", "id": "3"})
+    return index
+
+
+@pytest.mark.unit
+class TestSearchIndex:
+    
+    def test_tokenize_folds_case_accents_and_stop_words(self):
+        """Test tokens are case-folded, accent-stripped and skip stop words"""
+        assert tokenize("The Café of Koi-Fish") == ["cafe", "koi", "fish"]
+    
+    def test_weighted_fields_rank_higher(self, index):
+        """Test a title match outranks a caption match"""
+        hits = index.search("koi")
+        
+        assert [doc_id for doc_id, _, _ in hits][-1] == "gallery:2"
+        assert len(hits) == 3
+    
+    def test_last_word_matches_as_prefix(self, index):
+        """Test partially typed last words match completions"""
+        assert [doc_id for doc_id, _, _ in index.search("line")] == ["gallery:2"]
+        assert [doc_id for doc_id, _, _ in index.search("koi tat")][0] == "post:3"
+    
+    def test_filters_on_stored_values(self, index):
+        """Test stored-value filters restrict hits"""
+        hits = index.search("koi", type="post")
+        
+        assert [(doc_id, stored["id"]) for doc_id, _, stored in hits] == [("post:3", "3")]
+    
+    def test_add_replaces_and_remove_drops(self, index):
+        """Test re-adding a document replaces its terms and removal forgets them"""
+        index.add("gallery:1", [("Dotwork", 3.0)], {"type": "gallery", "id": "1"})
+        assert "gallery:1" not in [doc_id for doc_id, _, _ in index.search("sleeve")]
+        assert index.remove("gallery:1")
+        assert not index.remove("gallery:1")
+        
+        assert index.search("dotwork") == []
+        assert len(index) == 2
+    
+    def test_snapshot_round_trip(self, index):
+        """Test a snapshot restores identical rankings after compaction"""
+        index.remove("gallery:2")
+        restored = SearchIndex.from_bytes(index.to_bytes())
+        
+        assert restored.search("koi") == index.search("koi")
+        assert "gallery:2" not in restored
+        restored.add("gallery:4", [("koi pond", 3.0)])
+        assert len(restored.search("koi")) == 3
+    
+    def test_rejects_corrupt_snapshot(self):
+        """Test unreadable snapshots raise ValueError"""
+        with pytest.raises(ValueError):
+            SearchIndex.from_bytes(b"FOSI not zlib")
+        with pytest.raises(ValueError):
+            SearchIndex.from_bytes(b"nope")
+
+
+@pytest.mark.unit
+class TestSearchService:
+    
+    async def test_start_builds_then_restores_snapshot(self, tmp_path):
+        """Test the first start writes a snapshot the next start restores without reading galleries"""
+        repository = InMemoryGalleryRepository()
+        now = datetime.utcnow()
+        await repository.save_gallery(Gallery(
+            id="g1", title="Blackwork", category=GalleryCategory.TATTOO, created_at=now, updated_at=now
+        ))
+        snapshot = tmp_path / "search.idx"
+        
+        service = SearchService(repository, snapshot_path=str(snapshot))
+        await service.start()
+        assert snapshot.exists()
+        
+        await repository.delete_gallery("g1")
+        restored = SearchService(repository, snapshot_path=str(snapshot))
+        await restored.start()
+        
+        hits = await restored.search("black")
+        assert [(hit.id, hit.type, hit.category) for hit in hits] == [("g1", "gallery", "tattoo")]
+    
+    async def test_stale_index_rebuilds_in_background(self):
+        """Test searches on a stale index schedule a rebuild that picks up other writers"""
+        repository = InMemoryGalleryRepository()
+        service = SearchService(repository, refresh_interval_seconds=0)
+        await service.start()
+        now = datetime.utcnow()
+        await repository.save_gallery(Gallery(
+            id="g1", title="Portraits", category=GalleryCategory.ILLUSTRATIONS, created_at=now, updated_at=now
+        ))
+        
+        assert await service.search("portraits") == []
+        await service._rebuild_task
+        
+        assert [hit.id for hit in await service.search("portraits")] == ["g1"]
+    
+    async def test_writes_during_rebuild_survive_the_swap(self):
+        """Test admin writes made while a rebuild reads the repository are replayed onto the new index"""
+        repository = InMemoryGalleryRepository()
+        now = datetime.utcnow()
+        old = Gallery(id="g0", title="Linework", category=GalleryCategory.TATTOO, created_at=now, updated_at=now)
+        await repository.save_gallery(old)
+        service = SearchService(repository)
+        await service.start()
+        original = repository.list_galleries
+        
+        async def list_then_write(*args, **kwargs):
+            page = await original(*args, **kwargs)  # the rebuild has read past these writes
+            new = Gallery(id="g1", title="Portraits", category=GalleryCategory.ILLUSTRATIONS, created_at=now, updated_at=now)
+            await repository.save_gallery(new)
+            service.index_gallery(new, [])
+            await repository.delete_gallery("g0")
+            service.remove_gallery("g0")
+            return page
+        
+        repository.list_galleries = list_then_write
+        await service.rebuild()
+        
+        assert [hit.id for hit in await service.search("portraits")] == ["g1"]
+        assert await service.search("linework") == []
+    
+    async def test_background_rebuild_refreshes_snapshot(self, tmp_path):
+        """Test a background rebuild writes a snapshot new instances restore from"""
+        repository = InMemoryGalleryRepository()
+        snapshot = tmp_path / "search.idx"
+        service = SearchService(repository, snapshot_path=str(snapshot), refresh_interval_seconds=0)
+        await service.start()
+        now = datetime.utcnow()
+        await repository.save_gallery(Gallery(
+            id="g1", title="Portraits", category=GalleryCategory.ILLUSTRATIONS, created_at=now, updated_at=now
+        ))
+        
+        await service.search("portraits")
+        await service._rebuild_task
+        restored = SearchService(InMemoryGalleryRepository(), snapshot_path=str(snapshot))
+        await restored.start()
+        
+        assert [hit.id for hit in await restored.search("portraits")] == ["g1"]
+    
+    async def test_rebuild_started_near_deadline_outlives_it(self):
+        """Test a refresh triggered by a request about to time out is not bound by its deadline"""
+        class SlowGalleryRepository(InMemoryGalleryRepository):
+            async def list_galleries(self, *args, **kwargs):
+                await asyncio.sleep(0.05)
+                return await super().list_galleries(*args, **kwargs)
+        
+        inner = SlowGalleryRepository()
+        service = SearchService(bound_by_deadline(inner, "gallery_repository"), refresh_interval_seconds=0)
+        await service.start()
+        now = datetime.utcnow()
+        await inner.save_gallery(Gallery(
+            id="g1", title="Portraits", category=GalleryCategory.ILLUSTRATIONS, created_at=now, updated_at=now
+        ))
+        
+        token = start_deadline(0.01)
+        try:
+            await service.search("portraits")
+        finally:
+            end_deadline(token)
+        await service._rebuild_task
+        
+        assert [hit.id for hit in await service.search("portraits")] == ["g1"]
@@ -0,0 +1,85 @@
+import pytest
+from shared.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests"""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    
+    def test_get_set_counts_hits_and_misses(self):
+        """Test basic get/set updates hit and miss counters"""
+        cache = TTLCache(max_size=10)
+        
+        assert cache.get("missing") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+    
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted when full"""
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+    
+    def test_entry_expires_at_absolute_time(self):
+        """Test entries expire at their own expires_at"""
+        clock = FakeClock()
+        cache = TTLCache(max_size=10, clock=clock)
+        cache.set("short", "x", expires_at=clock.now + 5)
+        cache.set("long", "y", expires_at=clock.now + 60)
+        
+        clock.now += 10
+        
+        assert cache.get("short") is None
+        assert cache.get("long") == "y"
+        assert cache.stats()["expirations"] == 1
+    
+    def test_default_ttl(self):
+        """Test default ttl applies when no expiry is given"""
+        clock = FakeClock()
+        cache = TTLCache(max_size=10, default_ttl=30, clock=clock)
+        cache.set("key", "value")
+        
+        clock.now += 31
+        
+        assert cache.get("key") is None
+    
+    def test_zero_size_disables_cache(self):
+        """Test max_size of 0 never stores entries"""
+        cache = TTLCache(max_size=0)
+        cache.set("key", "value")
+        
+        assert cache.get("key") is None
+        assert len(cache) == 0
+    
+    def test_pop_and_clear(self):
+        """Test explicit invalidation"""
+        cache = TTLCache(max_size=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        cache.pop("a")
+        assert cache.get("a") is None
+        
+        cache.clear()
+        assert len(cache) == 0
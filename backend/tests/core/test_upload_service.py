@@ -0,0 +1,180 @@
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+from core.interfaces.derivative_generator import IDerivativeGenerator
+from core.interfaces.upload_storage import IUploadStorage, UploadNotFoundError
+from core.models.content import StoredBlob
+from core.models.upload import PendingUpload, UploadCompleteRequest, UploadedPart, UploadStartRequest, UploadStatus
+from core.services.content_service import ContentService
+from core.services.upload_service import MIN_PART_SIZE, UploadService
+from infrastructure.database.memory_upload_record_store import InMemoryUploadRecordStore
+
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def mock_storage():
+    """Mock upload storage"""
+    storage = AsyncMock(spec=IUploadStorage)
+    storage.create_multipart_upload.return_value = "upload-1"
+    storage.presign_part.side_effect = lambda key, upload_id, part_number, expires_in: f"https://s3/{part_number}"
+    return storage
+
+
+@pytest.fixture
+def upload_service(mock_storage):
+    """Upload service with 8 MB parts"""
+    return UploadService(mock_storage, part_size=8 * MB, max_size=100 * MB)
+
+
+@pytest.mark.unit
+class TestUploadService:
+    
+    async def test_start_upload_presigns_every_part(self, upload_service, mock_storage):
+        """Test the session has one presigned URL per part and a server-chosen key"""
+        session = await upload_service.start_upload(
+            UploadStartRequest(filename="../../koi.jpg", content_type="image/jpeg", size=20 * MB)
+        )
+        
+        assert session.upload_id == "upload-1"
+        assert session.part_size == 8 * MB
+        assert [part.part_number for part in session.parts] == [1, 2, 3]
+        assert session.parts[2].url == "https://s3/3"
+        assert session.key.startswith("uploads/") and session.key.endswith(".jpg")
+        assert ".." not in session.key
+    
+    async def test_part_size_never_below_s3_minimum(self, mock_storage):
+        """Test configured part sizes are raised to the S3 minimum"""
+        assert UploadService(mock_storage, part_size=1).part_size == MIN_PART_SIZE
+    
+    async def test_start_upload_validates_request(self, upload_service):
+        """Test non-images and oversized uploads are rejected before touching storage"""
+        with pytest.raises(ValueError):
+            await upload_service.start_upload(UploadStartRequest(filename="a.exe", content_type="application/octet-stream", size=10))
+        with pytest.raises(ValueError):
+            await upload_service.start_upload(UploadStartRequest(filename="a.png", content_type="image/png", size=101 * MB))
+    
+    async def test_complete_uses_reported_etags(self, upload_service, mock_storage):
+        """Test client-reported part ETags are passed straight to storage"""
+        mock_storage.complete_multipart_upload.return_value = '"abc-1"'
+        parts = [UploadedPart(part_number=1, etag='"p1"')]
+        
+        result = await upload_service.complete_upload("upload-1", UploadCompleteRequest(key="uploads/a.jpg", parts=parts))
+        
+        assert result.etag == '"abc-1"'
+        mock_storage.list_parts.assert_not_called()
+        mock_storage.complete_multipart_upload.assert_called_once_with("uploads/a.jpg", "upload-1", parts)
+    
+    async def test_complete_falls_back_to_listed_parts(self, upload_service, mock_storage):
+        """Test completion without reported parts uses the stored part list"""
+        mock_storage.list_parts.return_value = [UploadedPart(part_number=1, etag='"p1"')]
+        mock_storage.complete_multipart_upload.return_value = '"abc-1"'
+        
+        await upload_service.complete_upload("upload-1", UploadCompleteRequest(key="uploads/a.jpg"))
+        
+        mock_storage.list_parts.assert_called_once_with("uploads/a.jpg", "upload-1")
+    
+    async def test_complete_rejects_foreign_keys(self, upload_service):
+        """Test only keys under the upload prefix can be completed"""
+        with pytest.raises(ValueError):
+            await upload_service.complete_upload("upload-1", UploadCompleteRequest(key="blobs/other.jpg"))
+    
+    async def test_cleanup_aborts_stale_uploads(self, upload_service, mock_storage):
+        """Test stale uploads are aborted, ignoring other prefixes and already-finished uploads"""
+        mock_storage.list_pending_uploads.return_value = [
+            PendingUpload(key="uploads/a.jpg", upload_id="u1", initiated_at=datetime(2024, 1, 1)),
+            PendingUpload(key="uploads/b.jpg", upload_id="u2", initiated_at=datetime(2024, 1, 1)),
+            PendingUpload(key="backups/c.tar", upload_id="u3", initiated_at=datetime(2024, 1, 1)),
+        ]
+        mock_storage.abort_multipart_upload.side_effect = [None, UploadNotFoundError("u2")]
+        
+        assert await upload_service.cleanup_stale_uploads() == 1
+        assert mock_storage.abort_multipart_upload.call_count == 2
+    
+    async def test_complete_only_records_the_upload(self, mock_storage):
+        """Test completion leaves hashing and renditions to process_upload"""
+        content_service = AsyncMock(spec=ContentService)
+        generator = AsyncMock(spec=IDerivativeGenerator)
+        records = InMemoryUploadRecordStore()
+        mock_storage.complete_multipart_upload.return_value = '"abc-1"'
+        upload_service = UploadService(
+            mock_storage,
+            derivative_generator=generator,
+            content_service=content_service,
+            record_store=records,
+            process_in_background=False
+        )
+        
+        result = await upload_service.complete_upload(
+            "upload-1",
+            UploadCompleteRequest(key="uploads/a.jpg", parts=[UploadedPart(part_number=1, etag='"p1"')])
+        )
+        
+        assert result.status == UploadStatus.PROCESSING
+        assert (await upload_service.get_upload("uploads/a.jpg")).status == UploadStatus.PROCESSING
+        content_service.ingest.assert_not_called()
+        generator.generate.assert_not_called()
+    
+    async def test_process_generates_derivatives(self, mock_storage):
+        """Test processing content-addresses the upload, renders it, and records the result once"""
+        content_service = AsyncMock(spec=ContentService)
+        content_service.ingest.return_value = StoredBlob(content_hash="abc", key="blobs/sha256/ab/abc", size=3)
+        generator = AsyncMock(spec=IDerivativeGenerator)
+        generator.generate.return_value = {"thumb.webp": "derivatives/abc/thumb.webp"}
+        upload_service = UploadService(
+            mock_storage,
+            derivative_generator=generator,
+            content_service=content_service,
+            record_store=InMemoryUploadRecordStore()
+        )
+        
+        result = await upload_service.process_upload("uploads/a.jpg", '"abc-1"')
+        again = await upload_service.process_upload("uploads/a.jpg", '"abc-1"')
+        
+        generator.generate.assert_called_once_with("blobs/sha256/ab/abc", "abc")
+        assert result.status == UploadStatus.READY
+        assert result.derivatives == {"thumb.webp": "derivatives/abc/thumb.webp"}
+        assert again == result == await upload_service.get_upload("uploads/a.jpg")
+        content_service.ingest.assert_called_once_with("uploads/a.jpg")
+    
+    async def test_process_failure_is_recorded(self, mock_storage):
+        """Test a failed upload is reported to the client and raised for a retry"""
+        content_service = AsyncMock(spec=ContentService)
+        content_service.ingest.side_effect = RuntimeError("boom")
+        upload_service = UploadService(
+            mock_storage,
+            content_service=content_service,
+            record_store=InMemoryUploadRecordStore()
+        )
+        
+        with pytest.raises(RuntimeError):
+            await upload_service.process_upload("uploads/a.jpg")
+        
+        recorded = await upload_service.get_upload("uploads/a.jpg")
+        assert recorded.status == UploadStatus.FAILED
+        assert recorded.error == "boom"
+    
+    async def test_retry_resumes_after_ingest(self, mock_storage):
+        """Test a retry after a rendition failure reuses the recorded content instead of the deleted staged key"""
+        content_service = AsyncMock(spec=ContentService)
+        content_service.ingest.return_value = StoredBlob(content_hash="abc", key="blobs/sha256/ab/abc", size=3)
+        generator = AsyncMock(spec=IDerivativeGenerator)
+        generator.generate.side_effect = [RuntimeError("boom"), {"thumb.webp": "derivatives/abc/thumb.webp"}]
+        upload_service = UploadService(
+            mock_storage,
+            derivative_generator=generator,
+            content_service=content_service,
+            record_store=InMemoryUploadRecordStore()
+        )
+        
+        with pytest.raises(RuntimeError):
+            await upload_service.process_upload("uploads/a.jpg", '"abc-1"')
+        failed = await upload_service.get_upload("uploads/a.jpg")
+        result = await upload_service.process_upload("uploads/a.jpg")
+        
+        assert failed.status == UploadStatus.FAILED and failed.content_hash == "abc"
+        content_service.ingest.assert_called_once_with("uploads/a.jpg")
+        assert result.status == UploadStatus.READY
+        assert result.content_hash == "abc" and result.etag == '"abc-1"'
+        assert result.derivatives == {"thumb.webp": "derivatives/abc/thumb.webp"}
@@ -0,0 +1,21 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+class ConditionalCheckFailedException(Exception):
+    pass
+
+
+class TransactionCanceledException(Exception):
+    pass
+
+
+@pytest.fixture
+def dynamodb_client():
+    """Mock aiobotocore DynamoDB client with its modeled exceptions"""
+    client = AsyncMock()
+    client.exceptions = MagicMock(
+        ConditionalCheckFailedException=ConditionalCheckFailedException,
+        TransactionCanceledException=TransactionCanceledException
+    )
+    return client
@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+from core.interfaces.auth_repository import IAuthRepository
+from core.models.auth import User
+from infrastructure.auth.cached_auth_repository import CachedAuthRepository
+
+
+@pytest.fixture
+def mock_auth_repository():
+    """Mock inner auth repository"""
+    return AsyncMock(spec=IAuthRepository)
+
+
+@pytest.fixture
+def cached_repository(mock_auth_repository):
+    """Caching decorator around the mock repository"""
+    return CachedAuthRepository(mock_auth_repository, ttl_seconds=60, max_size=10)
+
+
+@pytest.fixture
+def sample_user():
+    """Sample user for testing"""
+    return User(
+        id="user123",
+        username="testuser",
+        email="test@example.com",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+@pytest.mark.unit
+class TestCachedAuthRepository:
+    
+    async def test_get_user_by_id_read_through(self, cached_repository, mock_auth_repository, sample_user):
+        """Test second lookup is served from cache"""
+        mock_auth_repository.get_user_by_id.return_value = sample_user
+        
+        first = await cached_repository.get_user_by_id("user123")
+        second = await cached_repository.get_user_by_id("user123")
+        
+        assert first == sample_user
+        assert second == sample_user
+        mock_auth_repository.get_user_by_id.assert_called_once_with("user123")
+    
+    async def test_negative_caching(self, cached_repository, mock_auth_repository):
+        """Test unknown IDs are cached as misses"""
+        mock_auth_repository.get_user_by_id.return_value = None
+        
+        assert await cached_repository.get_user_by_id("ghost") is None
+        assert await cached_repository.get_user_by_id("ghost") is None
+        
+        mock_auth_repository.get_user_by_id.assert_called_once_with("ghost")
+    
+    async def test_update_invalidates(self, cached_repository, mock_auth_repository, sample_user):
+        """Test update_user drops the cached user"""
+        mock_auth_repository.get_user_by_id.return_value = sample_user
+        await cached_repository.get_user_by_id("user123")
+        
+        updated = sample_user.model_copy(update={"is_admin": True})
+        mock_auth_repository.update_user.return_value = updated
+        mock_auth_repository.get_user_by_id.return_value = updated
+        await cached_repository.update_user(updated)
+        
+        result = await cached_repository.get_user_by_id("user123")
+        
+        assert result.is_admin is True
+        assert mock_auth_repository.get_user_by_id.call_count == 2
+    
+    async def test_delete_invalidates(self, cached_repository, mock_auth_repository, sample_user):
+        """Test delete_user drops the cached user"""
+        mock_auth_repository.get_user_by_id.return_value = sample_user
+        await cached_repository.get_user_by_id("user123")
+        
+        mock_auth_repository.delete_user.return_value = True
+        mock_auth_repository.get_user_by_id.return_value = None
+        await cached_repository.delete_user("user123")
+        
+        assert await cached_repository.get_user_by_id("user123") is None
+    
+    async def test_create_replaces_negative_entry(self, cached_repository, mock_auth_repository, sample_user):
+        """Test create_user overrides a cached miss"""
+        mock_auth_repository.get_user_by_id.return_value = None
+        await cached_repository.get_user_by_id("user123")
+        
+        mock_auth_repository.create_user.return_value = sample_user
+        await cached_repository.create_user("testuser", "test@example.com", "password123")
+        
+        assert await cached_repository.get_user_by_id("user123") == sample_user
+        mock_auth_repository.get_user_by_id.assert_called_once()
+    
+    async def test_create_passes_is_admin_through(self, cached_repository, mock_auth_repository, sample_user):
+        """Test create_user forwards is_admin to the inner repository"""
+        mock_auth_repository.create_user.return_value = sample_user
+        
+        await cached_repository.create_user("testuser", "test@example.com", "password123", is_admin=True)
+        
+        mock_auth_repository.create_user.assert_called_once_with(
+            "testuser", "test@example.com", "password123", is_admin=True
+        )
+    
+    async def test_read_racing_update_does_not_refill_stale_user(
+        self, cached_repository, mock_auth_repository, sample_user
+    ):
+        """Test a read that started before an update finished does not cache what it read"""
+        updated = sample_user.model_copy(update={"is_admin": True})
+        
+        async def stale_read(user_id):
+            await cached_repository.update_user(updated)  # lands while the read is in flight
+            return sample_user
+        
+        mock_auth_repository.update_user.return_value = updated
+        mock_auth_repository.get_user_by_id.side_effect = stale_read
+        assert await cached_repository.get_user_by_id("user123") == sample_user
+        
+        mock_auth_repository.get_user_by_id.side_effect = None
+        mock_auth_repository.get_user_by_id.return_value = updated
+        assert (await cached_repository.get_user_by_id("user123")).is_admin is True
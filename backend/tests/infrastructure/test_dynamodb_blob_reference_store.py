@@ -0,0 +1,81 @@
+import pytest
+from core.models.content import BlobReference
+from infrastructure.database.dynamodb_blob_reference_store import DynamoDBBlobReferenceStore
+
+
+def blob_item(refs: int, generation: int = 1, **extra) -> dict:
+    """Blob reference item as DynamoDB returns it"""
+    return {
+        "pk": {"S": "BLOB#abc"},
+        "refs": {"N": str(refs)},
+        "generation": {"N": str(generation)},
+        "ingested_at": {"N": "100.5"},
+        **extra,
+    }
+
+
+@pytest.fixture
+def store(dynamodb_client):
+    """DynamoDB blob reference store over the mock client"""
+    return DynamoDBBlobReferenceStore(dynamodb_client, "galleries")
+
+
+@pytest.mark.unit
+class TestDynamoDBBlobReferenceStore:
+    
+    async def test_increment_requires_registered_content(self, store, dynamodb_client):
+        """Test a reference is one conditional ADD on content that exists and is not being deleted"""
+        dynamodb_client.update_item.return_value = {"Attributes": blob_item(3)}
+        
+        assert await store.increment("abc") == 3
+        kwargs = dynamodb_client.update_item.call_args.kwargs
+        assert kwargs["Key"] == {"pk": {"S": "BLOB#abc"}}
+        assert kwargs["UpdateExpression"] == "ADD refs :one"
+        assert kwargs["ConditionExpression"] == "attribute_exists(pk) AND attribute_not_exists(deleting)"
+        
+        dynamodb_client.update_item.side_effect = dynamodb_client.exceptions.ConditionalCheckFailedException()
+        assert await store.increment("abc") is None
+    
+    async def test_decrement_reports_missing_references(self, store, dynamodb_client):
+        """Test a decrement with nothing to drop is None, distinct from dropping the last reference"""
+        dynamodb_client.update_item.return_value = {"Attributes": blob_item(0, generation=4)}
+        
+        reference = await store.decrement("abc")
+        assert reference == BlobReference(content_hash="abc", refs=0, generation=4, ingested_at=100.5)
+        assert dynamodb_client.update_item.call_args.kwargs["ConditionExpression"] == "refs > :zero"
+        
+        dynamodb_client.update_item.side_effect = dynamodb_client.exceptions.ConditionalCheckFailedException()
+        assert await store.decrement("abc") is None
+    
+    async def test_claim_is_conditional_on_generation(self, store, dynamodb_client):
+        """Test a claim fails once the content was referenced or re-ingested after it was read"""
+        dynamodb_client.update_item.return_value = {"Attributes": blob_item(0, generation=4, deleting={"N": "1"})}
+        
+        assert await store.claim(BlobReference(content_hash="abc", refs=0, generation=4, ingested_at=1))
+        kwargs = dynamodb_client.update_item.call_args.kwargs
+        assert kwargs["ConditionExpression"] == (
+            "refs = :zero AND generation = :generation AND attribute_not_exists(deleting)"
+        )
+        assert kwargs["ExpressionAttributeValues"][":generation"] == {"N": "4"}
+        
+        dynamodb_client.update_item.side_effect = dynamodb_client.exceptions.ConditionalCheckFailedException()
+        assert not await store.claim(BlobReference(content_hash="abc", refs=0, generation=4, ingested_at=1))
+    
+    async def test_register_waits_out_deletes(self, store, dynamodb_client):
+        """Test content being deleted cannot be registered again until it is removed"""
+        dynamodb_client.update_item.side_effect = dynamodb_client.exceptions.ConditionalCheckFailedException()
+        
+        assert not await store.register("abc")
+        assert dynamodb_client.update_item.call_args.kwargs["ConditionExpression"] == "attribute_not_exists(deleting)"
+    
+    async def test_list_unreferenced_pages_through_scan(self, store, dynamodb_client):
+        """Test every page of unreferenced blobs is returned"""
+        dynamodb_client.scan.side_effect = [
+            {"Items": [blob_item(0)], "LastEvaluatedKey": {"pk": {"S": "BLOB#abc"}}},
+            {"Items": [blob_item(0, deleting={"N": "5"})]},
+        ]
+        
+        references = await store.list_unreferenced(200)
+        
+        assert [reference.deleting for reference in references] == [False, True]
+        assert dynamodb_client.scan.call_args.kwargs["ExclusiveStartKey"] == {"pk": {"S": "BLOB#abc"}}
@@ -0,0 +1,34 @@
+import pytest
+from infrastructure.database.dynamodb_blog_repository import DynamoDBBlogRepository
+from shared.utils.cursor import InvalidCursorError, encode_cursor
+
+
+@pytest.fixture
+def repository(dynamodb_client):
+    """DynamoDB blog repository over the mock client"""
+    return DynamoDBBlogRepository(dynamodb_client, "galleries")
+
+
+@pytest.mark.unit
+class TestDynamoDBBlogRepository:
+    
+    async def test_list_posts_round_trips_cursor(self, repository, dynamodb_client):
+        """Test a post listing's LastEvaluatedKey is accepted back as its cursor"""
+        last_key = {"pk": {"S": "POST#p1"}, "entity": {"S": "POST"}, "sort_key": {"S": "2024#p1"}}
+        dynamodb_client.query.return_value = {"Items": [], "LastEvaluatedKey": last_key}
+        
+        page = await repository.list_posts(limit=5)
+        await repository.list_posts(limit=5, cursor=page.next_cursor)
+        
+        assert dynamodb_client.query.call_args.kwargs["ExclusiveStartKey"] == last_key
+    
+    @pytest.mark.parametrize("position", [
+        {"entity": {"S": "POST"}, "sort_key": {"S": "2024#p1"}},
+        {"pk": {"S": "POST#p1"}, "entity": {"S": "GALLERY"}, "sort_key": {"S": "2024#p1"}},
+        {"pk": {"S": "POST#p1"}, "entity": {"S": "POST"}, "sort_key": {"N": "1"}},
+    ])
+    async def test_list_posts_rejects_malformed_cursor(self, repository, dynamodb_client, position):
+        """Test cursors that are not exactly the entity index's key never reach DynamoDB"""
+        with pytest.raises(InvalidCursorError):
+            await repository.list_posts(cursor=encode_cursor(position))
+        dynamodb_client.query.assert_not_called()
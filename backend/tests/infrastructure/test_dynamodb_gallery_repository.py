@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+from core.models.gallery import GalleryCategory, GalleryImage
+from infrastructure.database import dynamodb_gallery_repository
+from infrastructure.database.dynamodb_gallery_repository import DynamoDBGalleryRepository, _to_item
+from shared.utils.cursor import InvalidCursorError, encode_cursor
+
+
+def image_item(image_id: str) -> dict:
+    image = GalleryImage(id=image_id, content_hash="0" * 64, created_at=datetime(2024, 1, 1))
+    return _to_item(image, pk=f"IMAGE#{image_id}", entity="IMAGE")
+
+
+@pytest.fixture
+def repository(dynamodb_client):
+    """DynamoDB gallery repository over the mock client"""
+    return DynamoDBGalleryRepository(dynamodb_client, "galleries")
+
+
+@pytest.mark.unit
+class TestDynamoDBGalleryRepository:
+    
+    async def test_get_images_chunks_batch_requests(self, repository, dynamodb_client):
+        """Test image reads are split into BatchGetItem calls of at most 100 keys"""
+        image_ids = [f"img-{index}" for index in range(250)]
+        
+        async def batch_get_item(RequestItems):
+            keys = RequestItems["galleries"]["Keys"]
+            # Respond in reverse to prove ordering comes from the request, not the response
+            return {"Responses": {"galleries": [image_item(key["pk"]["S"][6:]) for key in reversed(keys)]}}
+        
+        dynamodb_client.batch_get_item.side_effect = batch_get_item
+        
+        images = await repository.get_images(image_ids)
+        
+        batch_sizes = [len(call.kwargs["RequestItems"]["galleries"]["Keys"]) for call in dynamodb_client.batch_get_item.call_args_list]
+        assert sorted(batch_sizes) == [50, 100, 100]
+        assert [image.id for image in images] == image_ids
+    
+    async def test_get_images_retries_unprocessed_keys(self, repository, dynamodb_client, monkeypatch):
+        """Test UnprocessedKeys are requested again until every image is read"""
+        monkeypatch.setattr(dynamodb_gallery_repository.asyncio, "sleep", AsyncMock())
+        unprocessed = {"galleries": {"Keys": [{"pk": {"S": "IMAGE#b"}}]}}
+        dynamodb_client.batch_get_item.side_effect = [
+            {"Responses": {"galleries": [image_item("a")]}, "UnprocessedKeys": unprocessed},
+            {"Responses": {"galleries": [image_item("b")]}, "UnprocessedKeys": {}},
+        ]
+        
+        images = await repository.get_images(["b", "a", "b"])
+        
+        assert [image.id for image in images] == ["b", "a", "b"]
+        assert dynamodb_client.batch_get_item.call_args.kwargs["RequestItems"] == unprocessed
+    
+    async def test_list_galleries_queries_index_with_cursor(self, repository, dynamodb_client):
+        """Test listings Query the category index newest first and round-trip LastEvaluatedKey"""
+        last_key = {"pk": {"S": "GALLERY#g1"}, "category": {"S": "tattoo"}, "sort_key": {"S": "2024#g1"}}
+        dynamodb_client.query.return_value = {"Items": [], "LastEvaluatedKey": last_key}
+        
+        page = await repository.list_galleries(GalleryCategory.TATTOO, limit=5)
+        await repository.list_galleries(GalleryCategory.TATTOO, limit=5, cursor=page.next_cursor)
+        
+        kwargs = dynamodb_client.query.call_args.kwargs
+        assert kwargs["IndexName"] == "category-index"
+        assert kwargs["ScanIndexForward"] is False
+        assert kwargs["Limit"] == 5
+        assert kwargs["ExclusiveStartKey"] == last_key
+        dynamodb_client.scan.assert_not_called()
+    
+    async def test_list_galleries_rejects_foreign_cursor(self, repository):
+        """Test a cursor from another category is rejected before querying"""
+        cursor = encode_cursor({"category": {"S": "coding"}, "sort_key": {"S": "2024#g1"}})
+        
+        with pytest.raises(InvalidCursorError):
+            await repository.list_galleries(GalleryCategory.TATTOO, cursor=cursor)
+    
+    @pytest.mark.parametrize("position", [
+        {"category": {"S": "tattoo"}, "sort_key": {"S": "2024#g1"}},
+        {"pk": {"S": "GALLERY#g1"}, "category": {"S": "tattoo"}, "sort_key": "2024#g1"},
+        {"pk": {"N": "1"}, "category": {"S": "tattoo"}, "sort_key": {"S": "2024#g1"}},
+        {"pk": {"S": "GALLERY#g1"}, "category": {"S": "tattoo"}, "sort_key": {"S": 5}},
+        {"pk": {"S": "GALLERY#g1"}, "category": {"S": "tattoo"}, "sort_key": {"S": "x"}, "extra": {"S": "x"}},
+        {"pk": {"S": "USER#u1"}, "category": {"S": "tattoo"}, "sort_key": {"S": "2024#g1"}},
+    ])
+    async def test_list_galleries_rejects_malformed_cursor(self, repository, dynamodb_client, position):
+        """Test cursors that are not exactly this index's key never reach DynamoDB"""
+        with pytest.raises(InvalidCursorError):
+            await repository.list_galleries(GalleryCategory.TATTOO, cursor=encode_cursor(position))
+        dynamodb_client.query.assert_not_called()
+    
+    async def test_get_gallery_version_projects_only_version(self, repository, dynamodb_client):
+        """Test version reads fetch a single attribute"""
+        dynamodb_client.get_item.return_value = {"Item": {"version": {"N": "4"}}}
+        
+        assert await repository.get_gallery_version("g1") == 4
+        assert dynamodb_client.get_item.call_args.kwargs["ProjectionExpression"] == "#version"
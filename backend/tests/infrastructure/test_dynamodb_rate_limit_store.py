@@ -0,0 +1,64 @@
+import time
+import pytest
+from infrastructure.database.dynamodb_rate_limit_store import DynamoDBRateLimitStore
+from shared.utils.token_bucket import RateLimit
+
+
+@pytest.fixture
+def store(dynamodb_client):
+    """DynamoDB rate limit store over the mock client"""
+    return DynamoDBRateLimitStore(dynamodb_client, "rate-limits")
+
+
+@pytest.mark.unit
+class TestDynamoDBRateLimitStore:
+    
+    async def test_new_bucket_written_conditionally(self, store, dynamodb_client):
+        """Test the first consume creates the bucket only if no other instance did"""
+        dynamodb_client.get_item.return_value = {}
+        
+        assert await store.consume("login:ip:1.2.3.4", RateLimit(5, 60)) == 0
+        
+        put = dynamodb_client.put_item.call_args.kwargs
+        assert put["Item"]["key"] == {"S": "login:ip:1.2.3.4"}
+        assert float(put["Item"]["tokens"]["N"]) == 4
+        assert put["ConditionExpression"] == "attribute_not_exists(#key)"
+    
+    async def test_empty_bucket_rejects_without_writing(self, store, dynamodb_client):
+        """Test an exhausted bucket returns the wait and leaves the item alone"""
+        now = str(time.time())
+        dynamodb_client.get_item.return_value = {"Item": {"tokens": {"N": "0"}, "updated_at": {"N": now}}}
+        
+        assert await store.consume("login:ip:1.2.3.4", RateLimit(5, 60)) == pytest.approx(12, abs=0.1)
+        dynamodb_client.put_item.assert_not_called()
+    
+    async def test_lost_race_is_retried_then_limited(self, store, dynamodb_client):
+        """Test a concurrent update is re-read, and persistent contention counts as limited"""
+        now = str(time.time())
+        dynamodb_client.get_item.return_value = {"Item": {"tokens": {"N": "3"}, "updated_at": {"N": now}}}
+        dynamodb_client.put_item.side_effect = [dynamodb_client.exceptions.ConditionalCheckFailedException(), None]
+        
+        assert await store.consume("k", RateLimit(5, 60)) == 0
+        assert dynamodb_client.put_item.call_args.kwargs["ExpressionAttributeValues"] == {":previous": {"N": now}}
+        
+        dynamodb_client.put_item.side_effect = dynamodb_client.exceptions.ConditionalCheckFailedException()
+        assert await store.consume("k", RateLimit(5, 60)) > 0
+        assert dynamodb_client.get_item.call_count == 2 + store.max_attempts
+    
+    async def test_several_buckets_written_in_one_transaction(self, store, dynamodb_client):
+        """Test consume_all debits every bucket together, and none when one is empty"""
+        now = str(time.time())
+        full = {"Item": {"tokens": {"N": "5"}, "updated_at": {"N": now}}}
+        empty = {"Item": {"tokens": {"N": "0"}, "updated_at": {"N": now}}}
+        dynamodb_client.get_item.side_effect = [full, full, full, empty]
+        buckets = {"login:ip:1.2.3.4": RateLimit(5, 60), "login:username:alice": RateLimit(5, 60)}
+        
+        assert await store.consume_all(buckets) == {}
+        puts = dynamodb_client.transact_write_items.call_args.kwargs["TransactItems"]
+        assert [put["Put"]["Item"]["key"]["S"] for put in puts] == list(buckets)
+        assert all(put["Put"]["ConditionExpression"] == "updated_at = :previous" for put in puts)
+        
+        waits = await store.consume_all(buckets)
+        assert list(waits) == ["login:username:alice"]
+        assert dynamodb_client.transact_write_items.call_count == 1
+        dynamodb_client.put_item.assert_not_called()
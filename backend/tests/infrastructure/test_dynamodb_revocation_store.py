@@ -0,0 +1,46 @@
+import time
+import pytest
+from datetime import datetime, timedelta
+from infrastructure.database.dynamodb_revocation_store import DynamoDBRevocationStore
+
+
+@pytest.fixture
+def store(dynamodb_client):
+    """DynamoDB revocation store over the mock client"""
+    return DynamoDBRevocationStore(dynamodb_client, "revocations")
+
+
+@pytest.mark.unit
+class TestDynamoDBRevocationStore:
+    
+    async def test_revoke_writes_ttl_attribute(self, store, dynamodb_client):
+        """Test revocations carry the token expiry as the TTL attribute"""
+        expires_at = datetime.now() + timedelta(minutes=5)
+        
+        await store.revoke("jti-1", expires_at)
+        
+        item = dynamodb_client.put_item.call_args.kwargs["Item"]
+        assert item["jti"] == {"S": "jti-1"}
+        assert item["expires_at"] == {"N": str(int(expires_at.timestamp()))}
+    
+    async def test_is_revoked_ignores_expired_items(self, store, dynamodb_client):
+        """Test items past expiry are treated as not revoked before TTL deletes them"""
+        dynamodb_client.get_item.return_value = {"Item": {"expires_at": {"N": str(int(time.time()) - 10)}}}
+        assert await store.is_revoked("jti-1") is False
+        
+        dynamodb_client.get_item.return_value = {"Item": {"expires_at": {"N": str(int(time.time()) + 60)}}}
+        assert await store.is_revoked("jti-1") is True
+        
+        dynamodb_client.get_item.return_value = {}
+        assert await store.is_revoked("jti-1") is False
+    
+    async def test_list_active_paginates(self, store, dynamodb_client):
+        """Test list_active follows LastEvaluatedKey"""
+        dynamodb_client.scan.side_effect = [
+            {"Items": [{"jti": {"S": "a"}}], "LastEvaluatedKey": {"jti": {"S": "a"}}},
+            {"Items": [{"jti": {"S": "b"}}]},
+        ]
+        
+        assert await store.list_active() == ["a", "b"]
+        assert dynamodb_client.scan.call_args.kwargs["ExclusiveStartKey"] == {"jti": {"S": "a"}}
+        assert dynamodb_client.scan.call_args.kwargs["ConsistentRead"] is True
@@ -0,0 +1,35 @@
+import time
+import pytest
+from core.models.upload import UploadResult, UploadStatus
+from infrastructure.database.dynamodb_upload_record_store import DynamoDBUploadRecordStore
+
+
+@pytest.fixture
+def store(dynamodb_client):
+    """DynamoDB upload record store over the mock client"""
+    return DynamoDBUploadRecordStore(dynamodb_client, "galleries", ttl_seconds=60)
+
+
+@pytest.mark.unit
+class TestDynamoDBUploadRecordStore:
+    
+    async def test_save_then_get_round_trips(self, store, dynamodb_client):
+        """Test the result is stored as JSON under the upload key with a TTL"""
+        result = UploadResult(key="blobs/sha256/ab/abc", etag='"e"', content_hash="abc", derivatives={"thumb.webp": "d/t"})
+        
+        await store.save("uploads/a.jpg", result)
+        item = dynamodb_client.put_item.call_args.kwargs["Item"]
+        dynamodb_client.get_item.return_value = {"Item": item}
+        
+        assert item["pk"] == {"S": "UPLOAD#uploads/a.jpg"}
+        assert float(item["expires_at"]["N"]) > time.time()
+        assert await store.get("uploads/a.jpg") == result
+    
+    async def test_expired_records_are_missing(self, store, dynamodb_client):
+        """Test records past their TTL read as unknown before DynamoDB deletes them"""
+        dynamodb_client.get_item.return_value = {"Item": {
+            "result": {"S": UploadResult(key="k", etag="", status=UploadStatus.PROCESSING).model_dump_json()},
+            "expires_at": {"N": str(int(time.time()) - 1)},
+        }}
+        
+        assert await store.get("uploads/a.jpg") is None
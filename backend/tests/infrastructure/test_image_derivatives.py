@@ -0,0 +1,101 @@
+import io
+import pytest
+from unittest.mock import AsyncMock
+from PIL import Image
+from infrastructure.storage.image_derivatives import DerivativeGenerator, DerivativeSpec, supported_formats
+from infrastructure.storage.local_blob_storage import LocalBlobStorage
+
+
+def jpeg_bytes(size=(1200, 900), orientation=None) -> bytes:
+    buffer = io.BytesIO()
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    Image.new("RGB", size, (200, 40, 40)).save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Local blob storage in a temporary directory"""
+    return LocalBlobStorage(tmp_path)
+
+
+@pytest.fixture
+def generator(storage):
+    """Thread-backed generator (process pools are covered separately)"""
+    generator = DerivativeGenerator(storage, max_workers=2, use_processes=False)
+    yield generator
+    generator.shutdown()
+
+
+@pytest.mark.unit
+class TestDerivativeGenerator:
+    
+    async def test_renders_all_renditions_upright(self, generator, storage):
+        """Test every rendition is written under the content hash, EXIF-rotated and bounded"""
+        await storage.put("uploads/a.jpg", jpeg_bytes(orientation=6), "image/jpeg")
+        
+        keys = await generator.generate("uploads/a.jpg")
+        
+        assert "thumb.webp" in keys and "full.webp" in keys
+        assert ("grid.avif" in keys) == ("AVIF" in supported_formats())
+        assert all(key.startswith("derivatives/") for key in keys.values())
+        with Image.open(io.BytesIO(await storage.get(keys["thumb.webp"]))) as thumb:
+            assert thumb.size == (240, 320)  # portrait after orientation 6
+        with Image.open(io.BytesIO(await storage.get(keys["full.webp"]))) as full:
+            assert full.size == (900, 1200)  # never upscaled
+    
+    async def test_skips_existing_renditions(self, generator, storage):
+        """Test a known content hash with all renditions present does no reads or rendering"""
+        await storage.put("uploads/a.jpg", jpeg_bytes(), "image/jpeg")
+        keys = await generator.generate("uploads/a.jpg")
+        content_hash = keys["thumb.webp"].split("/")[1]
+        
+        storage.get = AsyncMock(side_effect=AssertionError("source read"))
+        storage.put = AsyncMock(side_effect=AssertionError("rendition rewritten"))
+        
+        assert await generator.generate("uploads/a.jpg", content_hash) == keys
+    
+    async def test_stores_metadata_with_renditions(self, generator, storage):
+        """Test metadata is extracted in the same pass and re-extracted alone when missing"""
+        await storage.put("uploads/a.jpg", jpeg_bytes(orientation=6), "image/jpeg")
+        keys = await generator.generate("uploads/a.jpg")
+        content_hash = keys["thumb.webp"].split("/")[1]
+        
+        metadata = await generator.get_metadata(content_hash)
+        assert (metadata.width, metadata.height) == (900, 1200)
+        assert metadata.dominant_color.startswith("#")
+        
+        await storage.delete(keys["metadata.json"])
+        put = storage.put
+        written = []
+        
+        async def record_put(key, *args, **kwargs):
+            written.append(key)
+            await put(key, *args, **kwargs)
+        
+        storage.put = record_put
+        await generator.generate("uploads/a.jpg", content_hash)
+        
+        assert written == [keys["metadata.json"]]
+        assert await generator.get_metadata(content_hash) == metadata
+    
+    async def test_rejects_non_images(self, generator, storage):
+        """Test undecodable sources raise ValueError"""
+        await storage.put("uploads/a.jpg", b"not an image", "image/jpeg")
+        
+        with pytest.raises(ValueError):
+            await generator.generate("uploads/a.jpg")
+    
+    async def test_process_pool(self, storage):
+        """Test rendering works across process boundaries"""
+        generator = DerivativeGenerator(storage, specs=[DerivativeSpec("thumb", 64, "WEBP", 70)], max_workers=1)
+        await storage.put("uploads/a.jpg", jpeg_bytes((128, 96)), "image/jpeg")
+        try:
+            keys = await generator.generate("uploads/a.jpg")
+        finally:
+            generator.shutdown()
+        
+        with Image.open(io.BytesIO(await storage.get(keys["thumb.webp"]))) as thumb:
+            assert thumb.size == (64, 48)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from PIL import Image
+from infrastructure.storage.image_metadata import blurhash, dominant_color, extract_metadata
+
+
+@pytest.mark.unit
+class TestImageMetadata:
+    
+    def test_blurhash_matches_reference_encoder(self):
+        """Test the vectorized encoder reproduces the reference implementation's output"""
+        rng = np.random.default_rng(1)
+        pixels = (rng.random((24, 32, 3)) * 255).astype(np.uint8)
+        pixels[:, :5] = [200, 30, 30]
+        
+        assert blurhash(pixels, 4, 3) == "LFIXN?_P@X[S%MVzb;v}S0R+w5oM"
+    
+    def test_blurhash_of_flat_image(self):
+        """Test a single-component hash is just the average color"""
+        pixels = np.full((8, 8, 3), 255, dtype=np.uint8)
+        
+        assert blurhash(pixels, 1, 1) == "00TSUA"
+    
+    def test_dominant_color_picks_largest_region(self):
+        """Test the most common color wins over the mean"""
+        pixels = np.zeros((10, 10, 3), dtype=np.uint8)
+        pixels[:, :7] = [10, 120, 200]
+        pixels[:, 7:] = [250, 250, 250]
+        
+        assert dominant_color(pixels) == "#0a78c8"
+    
+    def test_dominant_color_ignores_transparent_pixels(self):
+        """Test masked-out pixels do not vote"""
+        pixels = np.zeros((4, 4, 3), dtype=np.uint8)
+        pixels[0, 0] = [255, 0, 0]
+        mask = np.zeros((4, 4), dtype=bool)
+        mask[0, 0] = True
+        
+        assert dominant_color(pixels, mask) == "#ff0000"
+    
+    def test_extract_metadata_is_orientation_corrected(self):
+        """Test rotated originals report their upright size and selected EXIF fields"""
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        exif[0x010F] = "Canon"
+        upright = Image.new("RGB", (30, 40), (90, 40, 20))
+        
+        metadata = extract_metadata(upright, (400, 300), exif)
+        
+        assert (metadata["width"], metadata["height"]) == (300, 400)
+        assert metadata["orientation"] == 6
+        assert metadata["dominant_color"] == "#5a2814"
+        assert metadata["exif"] == {"make": "Canon"}
+        assert len(metadata["blurhash"]) == 2 + 4 + 2 * (3 * 4 - 1)  # portrait uses 3x4 components
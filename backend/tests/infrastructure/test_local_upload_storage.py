@@ -0,0 +1,53 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from core.interfaces.upload_storage import UploadNotFoundError
+from core.models.upload import UploadedPart
+from infrastructure.storage.local_upload_storage import LocalUploadStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Local upload storage in a temporary directory"""
+    return LocalUploadStorage(tmp_path)
+
+
+@pytest.mark.unit
+class TestLocalUploadStorage:
+    
+    async def test_multipart_round_trip(self, storage):
+        """Test parts are assembled in part order with an S3-style ETag"""
+        upload_id = await storage.create_multipart_upload("uploads/a.bin", "image/png")
+        second = await storage.put_part(upload_id, 2, b"world")
+        first = await storage.put_part(upload_id, 1, b"hello ")
+        
+        etag = await storage.complete_multipart_upload("uploads/a.bin", upload_id, [
+            UploadedPart(part_number=2, etag=second),
+            UploadedPart(part_number=1, etag=first),
+        ])
+        
+        assert storage.object_path("uploads/a.bin").read_bytes() == b"hello world"
+        assert etag.endswith('-2"')
+        with pytest.raises(UploadNotFoundError):
+            await storage.list_parts("uploads/a.bin", upload_id)
+    
+    async def test_complete_rejects_wrong_etag(self, storage):
+        """Test completion fails when a reported ETag does not match the stored part"""
+        upload_id = await storage.create_multipart_upload("uploads/a.bin", "image/png")
+        await storage.put_part(upload_id, 1, b"data")
+        
+        with pytest.raises(ValueError):
+            await storage.complete_multipart_upload("uploads/a.bin", upload_id, [UploadedPart(part_number=1, etag='"nope"')])
+    
+    async def test_pending_and_abort(self, storage):
+        """Test incomplete uploads are listed by age and removed on abort"""
+        upload_id = await storage.create_multipart_upload("uploads/a.bin", "image/png")
+        
+        assert await storage.list_pending_uploads(datetime.now(timezone.utc) - timedelta(hours=1)) == []
+        pending = await storage.list_pending_uploads(datetime.now(timezone.utc) + timedelta(seconds=1))
+        assert [upload.upload_id for upload in pending] == [upload_id]
+        
+        await storage.abort_multipart_upload("uploads/a.bin", upload_id)
+        
+        assert await storage.list_pending_uploads(datetime.now(timezone.utc) + timedelta(seconds=1)) == []
+        with pytest.raises(UploadNotFoundError):
+            await storage.abort_multipart_upload("uploads/a.bin", upload_id)
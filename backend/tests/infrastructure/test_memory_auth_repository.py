@@ -0,0 +1,71 @@
+import pytest
+from core.models.auth import LoginRequest
+from infrastructure.auth.memory_auth_repository import InMemoryAuthRepository
+from shared.utils.jwt_manager import jwt_manager
+from shared.utils.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def fast_hasher(monkeypatch):
+    """Swap the global hasher for a low-cost one"""
+    hasher = PasswordHasher(schemes=["bcrypt"], scheme_options={"bcrypt__rounds": 4})
+    monkeypatch.setattr(jwt_manager, "password_hasher", hasher)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def repository(fast_hasher):
+    """Empty in-memory auth repository"""
+    return InMemoryAuthRepository()
+
+
+@pytest.mark.unit
+class TestInMemoryAuthRepository:
+    
+    async def test_create_and_authenticate(self, repository):
+        """Test created users can authenticate with their password"""
+        user = await repository.create_user("testuser", "test@example.com", "password123")
+        
+        result = await repository.authenticate_user(LoginRequest(username="testuser", password="password123"))
+        
+        assert result == user
+        assert await repository.get_user_by_id(user.id) == user
+        assert await repository.get_user_by_username("testuser") == user
+    
+    async def test_authenticate_wrong_password(self, repository):
+        """Test wrong password and unknown user both fail"""
+        await repository.create_user("testuser", "test@example.com", "password123")
+        
+        assert await repository.authenticate_user(LoginRequest(username="testuser", password="nope")) is None
+        assert await repository.authenticate_user(LoginRequest(username="ghost", password="nope")) is None
+    
+    async def test_login_upgrades_outdated_hash(self, repository, monkeypatch):
+        """Test stored hash is rewritten when cost parameters were raised"""
+        user = await repository.create_user("testuser", "test@example.com", "password123")
+        old_hash = repository.get_password_hash(user.id)
+        
+        stronger = PasswordHasher(schemes=["bcrypt"], scheme_options={"bcrypt__rounds": 5})
+        monkeypatch.setattr(jwt_manager, "password_hasher", stronger)
+        
+        await repository.authenticate_user(LoginRequest(username="testuser", password="password123"))
+        
+        new_hash = repository.get_password_hash(user.id)
+        assert new_hash != old_hash
+        assert stronger.needs_update(new_hash) is False
+        stronger.shutdown()
+    
+    async def test_duplicate_username_rejected(self, repository):
+        """Test usernames are unique"""
+        await repository.create_user("testuser", "test@example.com", "password123")
+        
+        with pytest.raises(ValueError):
+            await repository.create_user("testuser", "other@example.com", "password123")
+    
+    async def test_delete_user(self, repository):
+        """Test deleted users are gone"""
+        user = await repository.create_user("testuser", "test@example.com", "password123")
+        
+        assert await repository.delete_user(user.id) is True
+        assert await repository.get_user_by_id(user.id) is None
+        assert await repository.delete_user(user.id) is False
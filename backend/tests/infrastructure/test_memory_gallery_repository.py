@@ -0,0 +1,76 @@
+import pytest
+from datetime import datetime, timedelta
+from core.models.gallery import Gallery, GalleryCategory
+from infrastructure.database.memory_gallery_repository import InMemoryGalleryRepository
+from shared.utils.cursor import InvalidCursorError, encode_cursor
+
+
+def make_gallery(index: int, category: GalleryCategory = GalleryCategory.TATTOO) -> Gallery:
+    created_at = datetime(2024, 1, 1) + timedelta(minutes=index)
+    return Gallery(
+        id=f"gallery-{index:03d}",
+        title=f"Gallery {index}",
+        category=category,
+        created_at=created_at,
+        updated_at=created_at
+    )
+
+
+@pytest.fixture
+async def repository():
+    """Repository seeded with ten galleries across two categories"""
+    repo = InMemoryGalleryRepository()
+    for index in range(10):
+        category = GalleryCategory.TATTOO if index % 2 == 0 else GalleryCategory.CODING
+        await repo.save_gallery(make_gallery(index, category))
+    return repo
+
+
+@pytest.mark.unit
+class TestInMemoryGalleryRepository:
+    
+    async def test_pages_newest_first_without_overlap(self, repository):
+        """Test following next_cursor walks every gallery exactly once, newest first"""
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.list_galleries(limit=3, cursor=cursor)
+            seen.extend(gallery.id for gallery in page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        
+        assert seen == [f"gallery-{index:03d}" for index in reversed(range(10))]
+    
+    async def test_category_filter(self, repository):
+        """Test category listings only include that category"""
+        page = await repository.list_galleries(GalleryCategory.CODING, limit=10)
+        
+        assert [gallery.id for gallery in page.items] == ["gallery-009", "gallery-007", "gallery-005", "gallery-003", "gallery-001"]
+        assert page.next_cursor is None
+    
+    async def test_cursor_from_other_listing_rejected(self, repository):
+        """Test a cursor cannot be replayed against a different category"""
+        page = await repository.list_galleries(GalleryCategory.CODING, limit=2)
+        
+        with pytest.raises(InvalidCursorError):
+            await repository.list_galleries(GalleryCategory.TATTOO, cursor=page.next_cursor)
+        with pytest.raises(InvalidCursorError):
+            await repository.list_galleries(cursor=encode_cursor({"category": None}))
+        with pytest.raises(InvalidCursorError):
+            await repository.list_galleries(cursor="not a cursor!")
+    
+    async def test_update_and_delete_reindex(self, repository):
+        """Test category changes and deletes keep the indexes in sync"""
+        gallery = await repository.get_gallery("gallery-000")
+        await repository.save_gallery(gallery.model_copy(update={"category": GalleryCategory.CODING}))
+        assert await repository.delete_gallery("gallery-009") is True
+        assert await repository.delete_gallery("gallery-009") is False
+        
+        coding = await repository.list_galleries(GalleryCategory.CODING, limit=10)
+        tattoo = await repository.list_galleries(GalleryCategory.TATTOO, limit=10)
+        everything = await repository.list_galleries(limit=20)
+        
+        assert "gallery-000" in [gallery.id for gallery in coding.items]
+        assert "gallery-000" not in [gallery.id for gallery in tattoo.items]
+        assert len(everything.items) == 9
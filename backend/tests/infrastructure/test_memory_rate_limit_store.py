@@ -0,0 +1,25 @@
+import pytest
+from infrastructure.auth.memory_rate_limit_store import InMemoryRateLimitStore
+from shared.utils.token_bucket import RateLimit
+
+
+@pytest.mark.unit
+class TestInMemoryRateLimitStore:
+    
+    async def test_buckets_are_per_key(self):
+        """Test one key running dry does not affect another"""
+        store = InMemoryRateLimitStore(clock=lambda: 0.0)
+        limit = RateLimit(1, 60)
+        
+        assert await store.consume("a", limit) == 0
+        assert await store.consume("a", limit) == pytest.approx(60)
+        assert await store.consume("b", limit) == 0
+    
+    async def test_bounded_per_shard(self):
+        """Test each shard evicts its least recently used bucket past its share of max_keys"""
+        store = InMemoryRateLimitStore(shards=4, max_keys=8)
+        
+        for index in range(100):
+            await store.consume(f"key-{index}", RateLimit(5, 60))
+        
+        assert len(store) <= 8
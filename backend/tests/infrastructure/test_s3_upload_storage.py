@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone
+from botocore.exceptions import ClientError
+from core.interfaces.upload_storage import UploadNotFoundError
+from core.models.upload import UploadedPart
+from infrastructure.storage.s3_upload_storage import S3UploadStorage
+
+
+class NoSuchUpload(Exception):
+    pass
+
+
+@pytest.fixture
+def s3_client():
+    """Mock aiobotocore S3 client"""
+    client = AsyncMock()
+    client.exceptions = MagicMock(NoSuchUpload=NoSuchUpload)
+    return client
+
+
+@pytest.fixture
+def storage(s3_client):
+    """S3 upload storage over the mock client"""
+    return S3UploadStorage(s3_client, "images")
+
+
+@pytest.mark.unit
+class TestS3UploadStorage:
+    
+    async def test_presign_part_signs_upload_part(self, storage, s3_client):
+        """Test part URLs are presigned UploadPart requests"""
+        s3_client.generate_presigned_url.return_value = "https://signed"
+        
+        assert await storage.presign_part("uploads/a.jpg", "u1", 3, 900) == "https://signed"
+        s3_client.generate_presigned_url.assert_called_once_with(
+            "upload_part",
+            Params={"Bucket": "images", "Key": "uploads/a.jpg", "UploadId": "u1", "PartNumber": 3},
+            ExpiresIn=900
+        )
+    
+    async def test_list_parts_paginates(self, storage, s3_client):
+        """Test list_parts follows NextPartNumberMarker"""
+        s3_client.list_parts.side_effect = [
+            {"Parts": [{"PartNumber": 1, "ETag": '"a"'}], "IsTruncated": True, "NextPartNumberMarker": 1},
+            {"Parts": [{"PartNumber": 2, "ETag": '"b"'}], "IsTruncated": False},
+        ]
+        
+        parts = await storage.list_parts("uploads/a.jpg", "u1")
+        
+        assert [part.etag for part in parts] == ['"a"', '"b"']
+        assert s3_client.list_parts.call_args.kwargs["PartNumberMarker"] == 1
+    
+    async def test_complete_sorts_parts_and_maps_errors(self, storage, s3_client):
+        """Test parts are sent in order and S3 errors become domain errors"""
+        s3_client.complete_multipart_upload.return_value = {"ETag": '"x-2"'}
+        parts = [UploadedPart(part_number=2, etag='"b"'), UploadedPart(part_number=1, etag='"a"')]
+        
+        assert await storage.complete_multipart_upload("uploads/a.jpg", "u1", parts) == '"x-2"'
+        sent = s3_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert [part["PartNumber"] for part in sent] == [1, 2]
+        
+        s3_client.complete_multipart_upload.side_effect = ClientError(
+            {"Error": {"Code": "InvalidPart", "Message": "bad etag"}}, "CompleteMultipartUpload"
+        )
+        with pytest.raises(ValueError):
+            await storage.complete_multipart_upload("uploads/a.jpg", "u1", parts)
+        
+        s3_client.complete_multipart_upload.side_effect = NoSuchUpload()
+        with pytest.raises(UploadNotFoundError):
+            await storage.complete_multipart_upload("uploads/a.jpg", "u1", parts)
+    
+    async def test_list_pending_uploads_filters_by_age(self, storage, s3_client):
+        """Test only uploads initiated before the cutoff are returned"""
+        s3_client.list_multipart_uploads.return_value = {
+            "Uploads": [
+                {"Key": "uploads/old.jpg", "UploadId": "u1", "Initiated": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+                {"Key": "uploads/new.jpg", "UploadId": "u2", "Initiated": datetime(2024, 6, 1, tzinfo=timezone.utc)},
+            ],
+            "IsTruncated": False,
+        }
+        
+        pending = await storage.list_pending_uploads(datetime(2024, 3, 1))
+        
+        assert [upload.upload_id for upload in pending] == ["u1"]
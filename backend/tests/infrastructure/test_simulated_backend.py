@@ -0,0 +1,86 @@
+import time
+import pytest
+from infrastructure.auth.memory_auth_repository import InMemoryAuthRepository
+from infrastructure.simulated.simulated_backend import (
+    LatencyProfile, SimulatedDependencyError, SimulatedLatency, SimulatedThrottlingError
+)
+from shared.utils.call_proxy import CallProxy
+
+
+class FakeStorage:
+    """Minimal backend with a coroutine, an async iterator and a sync method"""
+    
+    async def get(self, key: str) -> str:
+        return key
+    
+    async def iter_chunks(self, key: str):
+        for chunk in ("a", "b"):
+            yield chunk
+    
+    def url(self, key: str) -> str:
+        return f"local://{key}"
+
+
+@pytest.mark.unit
+class TestSimulatedLatency:
+    
+    async def test_delays_coroutines_and_iterators(self):
+        """Test calls and async iterators wait for the profile latency, sync methods pass through"""
+        simulated = SimulatedLatency("blob_storage", LatencyProfile(latency_ms=20))
+        backend = CallProxy(FakeStorage(), [simulated])
+        
+        started = time.perf_counter()
+        assert await backend.get("key") == "key"
+        assert [chunk async for chunk in backend.iter_chunks("key")] == ["a", "b"]
+        assert time.perf_counter() - started >= 0.04
+        assert backend.url("key") == "local://key"
+        assert simulated.calls == 2
+    
+    async def test_throttling_and_errors(self):
+        """Test throttled and failing calls raise the simulated errors and are counted"""
+        simulated = SimulatedLatency("gallery_repository", LatencyProfile(throttle_rate=1.0))
+        backend = CallProxy(FakeStorage(), [simulated])
+        with pytest.raises(SimulatedThrottlingError):
+            await backend.get("key")
+        
+        simulated.profile = LatencyProfile(error_rate=1.0)
+        with pytest.raises(SimulatedDependencyError) as error:
+            await backend.get("key")
+        assert (error.value.dependency, error.value.operation) == ("gallery_repository", "get")
+        assert (simulated.throttled, simulated.failures) == (1, 1)
+    
+    def test_seed_makes_delays_reproducible(self):
+        """Test the same seed draws the same delays, including the slow tail"""
+        profile = LatencyProfile(latency_ms=5, jitter_ms=10, tail_rate=0.2, tail_ms=100)
+        first = SimulatedLatency("auth_repository", profile, seed=7)
+        second = SimulatedLatency("auth_repository", profile, seed=7)
+        
+        delays = [first.delay(profile) for _ in range(50)]
+        assert delays == [second.delay(profile) for _ in range(50)]
+        assert all(0.005 <= delay <= 0.115 for delay in delays)
+        assert any(delay >= 0.105 for delay in delays)
+    
+    def test_profile_overrides(self):
+        """Test per-dependency overrides replace only the named fields"""
+        profile = LatencyProfile(latency_ms=5, jitter_ms=2).with_overrides({"latency_ms": 80})
+        assert profile == LatencyProfile(latency_ms=80, jitter_ms=2)
+        with pytest.raises(TypeError):
+            profile.with_overrides({"latency": 1})
+
+
+@pytest.mark.integration
+class TestSimulatedContainer:
+    
+    async def test_container_wraps_memory_backends(self, simulated_latency, async_client, container):
+        """Test simulation wraps the local backends beneath the user cache"""
+        simulated = container.simulated["auth_repository"]
+        beneath_cache = container.auth_repository.inner.inner
+        assert isinstance(beneath_cache.inner, InMemoryAuthRepository)
+        assert beneath_cache.hook(SimulatedLatency) is simulated
+        assert set(container.simulated) >= {"gallery_repository", "blob_storage", "revocation_store"}
+        
+        user = await beneath_cache.create_user("slow", "slow@example.com", "password123")
+        calls = simulated.calls
+        await container.auth_repository.get_user_by_id(user.id)
+        await container.auth_repository.get_user_by_id(user.id)
+        assert simulated.calls == calls + 1